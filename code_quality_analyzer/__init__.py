@@ -4,7 +4,8 @@ This package provides tools for analyzing code quality according to SOLID, KISS,
 """
 
 from .unified_analyzer import UnifiedAnalyzer
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, FusedNodeVisitor
+from .analysis_cache import AnalysisCache
 
 # SOLID Principle Analyzers
 from .analyzers.srp_analyzer import SRPAnalyzer     # Single Responsibility Principle
@@ -19,7 +20,7 @@ from .analyzers.dry_analyzer import DRYAnalyzer      # Don't Repeat Yourself
 
 __version__ = '0.1.0'
 __all__ = [
-    'UnifiedAnalyzer', 'BaseAnalyzer',
+    'UnifiedAnalyzer', 'BaseAnalyzer', 'FusedNodeVisitor', 'AnalysisCache',
     # SOLID Principle Analyzers
     'SRPAnalyzer',   # Single Responsibility Principle
     'OCPAnalyzer',   # Open/Closed Principle
@@ -11,6 +11,7 @@ import json
 from typing import Dict, Any
 
 from .unified_analyzer import UnifiedAnalyzer
+from .incremental import git_changed_files, read_file_list
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -31,9 +32,9 @@ def parse_args():
                         default=['all'],
                         help='Analyzers to run (default: all)')
 
-    parser.add_argument('--format', choices=['text', 'json', 'html'],
+    parser.add_argument('--format', choices=['text', 'json', 'jsonl', 'html'],
                         default='text',
-                        help='Output format (default: text)')
+                        help='Output format; jsonl writes one JSON record per file result (default: text)')
 
     parser.add_argument('--output', '-o',
                         help='Output file path (default: stdout)')
@@ -41,6 +42,12 @@ def parse_args():
     parser.add_argument('--parallel', action='store_true',
                         help='Use parallel processing for directory analysis')
 
+    parser.add_argument('--workers', type=int,
+                        help='Number of worker processes for parallel processing (default: CPU count)')
+
+    parser.add_argument('--chunk-size', type=int,
+                        help='Number of files per worker task for parallel processing')
+
     parser.add_argument('--cache', action='store_true',
                         help='Cache analysis results')
 
@@ -48,6 +55,19 @@ def parse_args():
                         default='.code_analysis_cache',
                         help='Directory for caching analysis results')
 
+    parser.add_argument('--cache-max-size', type=int, default=256,
+                        help='Maximum size of the analysis cache in MB (default: 256)')
+
+    # Incremental analysis options
+    incremental = parser.add_mutually_exclusive_group()
+    incremental.add_argument('--since', metavar='REV',
+                             help='Incremental mode: re-analyze files changed since a git revision '
+                                  '(implies --cache)')
+
+    incremental.add_argument('--changed-files', metavar='FILE',
+                             help="Incremental mode: re-analyze the files listed in FILE, one per line "
+                                  "('-' for stdin, e.g. from git diff --name-only; implies --cache)")
+
     # SRP analyzer options
     parser.add_argument('--srp-max-responsibilities', type=int, default=1,
                         help='Maximum number of responsibilities per class (default: 1)')
@@ -75,6 +95,9 @@ def parse_args():
     parser.add_argument('--dry-min-duplicate-lines', type=int, default=3,
                         help='Minimum number of lines for a duplicate code block (default: 3)')
 
+    parser.add_argument('--dry-min-duplicate-tokens', type=int, default=30,
+                        help='Minimum number of tokens for a duplicate code block (default: 30)')
+
     parser.add_argument('--dry-similarity-threshold', type=float, default=0.8,
                         help='Minimum similarity threshold for duplicate code (default: 0.8)')
 
@@ -103,18 +126,23 @@ def build_config(args) -> Dict[str, Any]:
     else:
         enabled_analyzers = args.analyzers
 
+    # Cache settings, inherited by analyzers without their own
+    cache_config = {
+        'use_cache': args.cache,
+        'cache_dir': args.cache_dir,
+        'cache_max_size': args.cache_max_size * 1024 * 1024
+    }
+
     # Build configuration
     config = {
         'enabled_analyzers': enabled_analyzers,
-        'use_cache': args.cache,
-        'cache_dir': args.cache_dir,
+        **cache_config,
 
         # SRP analyzer config
         'srp_config': {
             'max_responsibilities': args.srp_max_responsibilities,
             'cohesion_threshold': args.srp_cohesion_threshold,
-            'use_cache': args.cache,
-            'cache_dir': args.cache_dir
+            **cache_config
         },
 
         # KISS analyzer config
@@ -124,18 +152,17 @@ def build_config(args) -> Dict[str, Any]:
             'max_cyclomatic_complexity': args.kiss_max_cyclomatic_complexity,
             'max_cognitive_complexity': args.kiss_max_cognitive_complexity,
             'max_parameters': args.kiss_max_parameters,
-            'use_cache': args.cache,
-            'cache_dir': args.cache_dir
+            **cache_config
         },
 
         # DRY analyzer config
         'dry_config': {
             'min_duplicate_lines': args.dry_min_duplicate_lines,
+            'min_duplicate_tokens': args.dry_min_duplicate_tokens,
             'similarity_threshold': args.dry_similarity_threshold,
             'min_string_length': args.dry_min_string_length,
             'min_string_occurrences': args.dry_min_string_occurrences,
-            'use_cache': args.cache,
-            'cache_dir': args.cache_dir
+            **cache_config
         }
     }
 
@@ -146,6 +173,10 @@ def main():
     # Parse command-line arguments
     args = parse_args()
 
+    # Incremental mode serves unchanged files from the cache
+    if args.since or args.changed_files:
+        args.cache = True
+
     # Build configuration
     config = build_config(args)
 
@@ -155,18 +186,28 @@ def main():
     # Run analysis
     if os.path.isfile(args.path):
         results = analyzer.analyze_file(args.path)
+    elif os.path.isdir(args.path) and (args.since or args.changed_files):
+        try:
+            if args.since:
+                changed_files = git_changed_files(args.since, args.path)
+            else:
+                changed_files = read_file_list(args.changed_files, args.path)
+        except (ValueError, OSError) as e:
+            logger.error(f"Could not determine changed files: {str(e)}")
+            sys.exit(1)
+        results = analyzer.analyze_changes(args.path, changed_files, args.parallel, args.workers, args.chunk_size)
     elif os.path.isdir(args.path):
-        results = analyzer.analyze_directory(args.path, args.parallel)
+        results = analyzer.analyze_directory(args.path, args.parallel, args.workers, args.chunk_size)
     else:
         logger.error(f"Path not found: {args.path}")
         sys.exit(1)
 
-    # Generate report
-    report = analyzer.generate_report(args.format, args.output)
-
-    # Print report if not writing to file
-    if not args.output:
-        print(report)
+    # Stream the report to the output file, or to stdout
+    if args.output:
+        analyzer.generate_report(args.format, args.output)
+    else:
+        analyzer.write_report(sys.stdout, args.format)
+        print()
 
 if __name__ == '__main__':
     main()
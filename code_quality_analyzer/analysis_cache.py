@@ -0,0 +1,310 @@
+"""Consolidated analysis cache.
+
+This module provides a single SQLite-backed store for per-file analysis
+results. Entries are keyed by the file's content hash together with the
+analyzer name, a hash of the analyzer configuration and the analyzer's
+cache version, so touching, moving or copying a file, switching branches
+or running from another directory does not invalidate results for
+unchanged content. Results record the path they were computed for;
+restamp_path points a result read from the cache at the file being
+analyzed. The store is bounded in size; the least recently used entries
+are evicted first.
+
+The store also remembers the content hash of each analyzed file along with
+its size and modification time, so incremental runs can skip hashing files
+that have not changed.
+"""
+
+import os
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import logging
+from typing import Dict, Any, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# Cache settings; they do not affect analysis results
+CACHE_CONFIG_KEYS = {'use_cache', 'cache_dir', 'cache_max_size'}
+
+def content_hash(content: str) -> str:
+    """Hash the content of a source file.
+
+    Args:
+        content: Content of the file
+
+    Returns:
+        Hex digest of the content
+    """
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Hash the parts of an analyzer configuration that affect its results.
+
+    Args:
+        config: Analyzer configuration
+
+    Returns:
+        Hex digest of the configuration
+    """
+    relevant = {k: v for k, v in config.items() if k not in CACHE_CONFIG_KEYS}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+def restamp_path(result: Any, file_path: str) -> Any:
+    """Point a cached result at the file it is now used for.
+
+    Every string equal to the result's recorded 'file_path' (in nested
+    dictionaries, lists and tuples too) is replaced by file_path.
+
+    Args:
+        result: A cached result, with the path it was computed for under 'file_path'
+        file_path: Path to the file being analyzed
+
+    Returns:
+        The result, copied if anything had to change
+    """
+    old_path = result.get('file_path') if isinstance(result, dict) else None
+    if old_path is None or old_path == file_path:
+        return result
+
+    def replace(value: Any) -> Any:
+        if isinstance(value, str):
+            return file_path if value == old_path else value
+        if isinstance(value, dict):
+            return {replace(k): replace(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(replace(v) for v in value)
+        return value
+
+    return replace(result)
+
+class AnalysisCache:
+    """Size-bounded SQLite store of analysis results.
+
+    Attributes:
+        path: Path to the SQLite database
+        max_size: Maximum total size of the cached results in bytes
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+    DATABASE_NAME = 'analysis_cache.sqlite'
+
+    # Minimum age (seconds) before a hit refreshes an entry's last-used time
+    TOUCH_INTERVAL = 3600
+
+    # Files modified more recently than this (seconds) do not get their hash recorded
+    RACY_SECONDS = 2
+
+    # Open caches of this process, by database path (see for_directory)
+    _instances = {}
+
+    def __init__(self, path: str, max_size: Optional[int] = None):
+        """Initialize a new AnalysisCache.
+
+        Args:
+            path: Path to the SQLite database
+            max_size: Maximum total size of the cached results in bytes
+        """
+        self.path = path
+        self.max_size = max_size or self.DEFAULT_MAX_SIZE
+        self._connection = None
+        self._pid = None
+        self._total_size = 0
+
+    @classmethod
+    def for_directory(cls, cache_dir: str, max_size: Optional[int] = None) -> 'AnalysisCache':
+        """Get the cache stored in a directory, shared by all analyzers of this process.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_size: Maximum total size of the cached results in bytes
+
+        Returns:
+            The cache for the directory
+        """
+        path = os.path.abspath(os.path.join(cache_dir, cls.DATABASE_NAME))
+        cache = cls._instances.get(path)
+        if cache is None:
+            cache = cls._instances[path] = cls(path, max_size)
+        elif max_size:
+            cache.max_size = max_size
+        return cache
+
+    @staticmethod
+    def make_key(file_hash: str, analyzer_name: str, analyzer_config_hash: str, version: Any) -> str:
+        """Build the cache key for an analyzer's result on some content.
+
+        Args:
+            file_hash: Content hash of the file
+            analyzer_name: Name of the analyzer
+            analyzer_config_hash: Hash of the analyzer configuration
+            version: Cache version of the analyzer
+
+        Returns:
+            The cache key
+        """
+        return f"{file_hash}:{analyzer_name}:{analyzer_config_hash}:{version}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached result, or None if not found
+        """
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            connection.execute("UPDATE entries SET last_used = ? WHERE key = ? AND last_used < ?",
+                               (now, key, now - self.TOUCH_INTERVAL))
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Error reading cache entry {key}: {str(e)}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a result, evicting least recently used entries if the cache is full.
+
+        Args:
+            key: The cache key
+            value: The result to cache
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                previous = connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                connection.execute("INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                                   (key, data, len(data), time.time()))
+            self._total_size += len(data) - (previous[0] if previous else 0)
+
+            if self._total_size > self.max_size:
+                self._evict()
+        except Exception as e:
+            logger.warning(f"Error caching entry {key}: {str(e)}")
+
+    def get_file_hash(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Get the content hash recorded for a file, if it has not changed since.
+
+        Args:
+            path: Absolute path to the file
+            stat: Current os.stat() of the file
+
+        Returns:
+            The recorded hash, or None if the file's size or modification time differ
+        """
+        try:
+            row = self._connect().execute("SELECT hash FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                                          (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.warning(f"Error reading file hash for {path}: {str(e)}")
+            return None
+
+    def put_file_hash(self, path: str, stat: os.stat_result, file_hash: str) -> None:
+        """Record the content hash of a file.
+
+        Files modified within RACY_SECONDS of now are not recorded: a later
+        write in the same timestamp granularity would not change their
+        modification time.
+
+        Args:
+            path: Absolute path to the file
+            stat: os.stat() of the file, taken before it was read
+            file_hash: Content hash of what was read
+        """
+        if time.time() - stat.st_mtime < self.RACY_SECONDS:
+            return
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                                   (path, stat.st_size, stat.st_mtime_ns, file_hash))
+        except Exception as e:
+            logger.warning(f"Error recording file hash for {path}: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM entries")
+            connection.execute("DELETE FROM file_hashes")
+        self._total_size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of entries and their total size.
+
+        Returns:
+            A dictionary with 'entries' and 'size' (bytes)
+        """
+        count, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": count, "size": size}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (and again in forked worker processes).
+
+        Returns:
+            The connection for this process
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("""CREATE TABLE IF NOT EXISTS entries (
+                                  key TEXT PRIMARY KEY,
+                                  value BLOB NOT NULL,
+                                  size INTEGER NOT NULL,
+                                  last_used REAL NOT NULL)""")
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        connection.execute("""CREATE TABLE IF NOT EXISTS file_hashes (
+                                  path TEXT PRIMARY KEY,
+                                  size INTEGER NOT NULL,
+                                  mtime_ns INTEGER NOT NULL,
+                                  hash TEXT NOT NULL)""")
+
+        self._connection = connection
+        self._pid = os.getpid()
+        self._total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        return connection
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is below 90% of its maximum size."""
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            # Other processes may have written too; start from the real size
+            self._total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            target = int(self.max_size * 0.9)
+            if self._total_size <= self.max_size:
+                return
+
+            evicted = 0
+            for key, size in connection.execute("SELECT key, size FROM entries ORDER BY last_used ASC").fetchall():
+                if self._total_size <= target:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total_size -= size
+                evicted += 1
+
+        logger.info(f"Evicted {evicted} entries from analysis cache {self.path}")
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, List, Set, Optional, Any
 from collections import defaultdict
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -48,6 +48,17 @@ class DIPAnalyzer(BaseAnalyzer):
         self.high_level_modules = set()
         self.low_level_modules = set()
 
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.ClassDef]:
+        """Collect the file's classes in the fused traversal.
+
+        Args:
+            visitor: The visitor that will traverse the file's AST
+
+        Returns:
+            The list of class nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.ClassDef)
+
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
         """Analyze a Python file for DIP violations.
 
@@ -102,15 +113,14 @@ class DIPAnalyzer(BaseAnalyzer):
         self.concrete_classes = set()
 
         # Find all classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
+        for node in self.traversal_state(tree):
+            class_name = node.name
 
-                # Check if this is an abstraction
-                if self._is_abstract_class(node):
-                    self.abstractions.add(class_name)
-                else:
-                    self.concrete_classes.add(class_name)
+            # Check if this is an abstraction
+            if self._is_abstract_class(node):
+                self.abstractions.add(class_name)
+            else:
+                self.concrete_classes.add(class_name)
 
     def _analyze_dependencies(self, tree: ast.AST) -> None:
         """Analyze dependencies between classes.
@@ -122,18 +132,17 @@ class DIPAnalyzer(BaseAnalyzer):
         self.dependencies = defaultdict(set)
 
         # Find all classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-
-                # Check for dependencies in base classes
-                for base in node.bases:
-                    base_name = self._get_name_from_node(base)
-                    if base_name:
-                        self.dependencies[class_name].add(base_name)
-
-                # Check for dependencies in class body
-                self._analyze_class_body_dependencies(node, class_name)
+        for node in self.traversal_state(tree):
+            class_name = node.name
+
+            # Check for dependencies in base classes
+            for base in node.bases:
+                base_name = self._get_name_from_node(base)
+                if base_name:
+                    self.dependencies[class_name].add(base_name)
+
+            # Check for dependencies in class body
+            self._analyze_class_body_dependencies(node, class_name)
 
     def _analyze_class_body_dependencies(self, cls_node: ast.ClassDef, class_name: str) -> None:
         """Analyze dependencies in class body.
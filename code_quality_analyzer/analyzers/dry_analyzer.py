@@ -5,19 +5,35 @@ It identifies code duplication and repeated patterns.
 """
 
 import os
+import io
 import ast
-import re
 import hashlib
 import logging
+import tokenize
+from array import array
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple, Any, Optional
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Tokens that do not take part in clone detection
+_IGNORED_TOKENS = {tokenize.COMMENT, tokenize.NL, tokenize.INDENT, tokenize.DEDENT,
+                   tokenize.ENCODING, tokenize.ENDMARKER}
+
+# Rolling hash parameters (polynomial hash modulo a Mersenne prime)
+_HASH_BASE = 1000003
+_HASH_MODULUS = (1 << 61) - 1
+
+@lru_cache(maxsize=65536)
+def _token_id(text: str) -> int:
+    """Stable 62-bit id for a normalized token (the same in every process)."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little') >> 2
+
 class DRYAnalyzer(BaseAnalyzer):
     """Analyzes Python code for DRY principle violations."""
     
@@ -29,9 +45,11 @@ class DRYAnalyzer(BaseAnalyzer):
         """
         default_config = {
             'min_duplicate_lines': 3,
+            'min_duplicate_tokens': 30,
             'similarity_threshold': 0.8,
             'min_string_length': 10,
-            'min_string_occurrences': 3
+            'min_string_occurrences': 3,
+            'max_candidates_per_hash': 32
         }
         
         if config:
@@ -44,12 +62,15 @@ class DRYAnalyzer(BaseAnalyzer):
         )
         
         self.min_duplicate_lines = self.config['min_duplicate_lines']
+        self.min_duplicate_tokens = self.config['min_duplicate_tokens']
         self.similarity_threshold = self.config['similarity_threshold']
         self.min_string_length = self.config['min_string_length']
         self.min_string_occurrences = self.config['min_string_occurrences']
+        self.max_candidates_per_hash = self.config['max_candidates_per_hash']
         
         # Storage for cross-file analysis
-        self.code_blocks = defaultdict(list)  # Maps code block hashes to their locations
+        self.code_blocks = defaultdict(list)  # Maps token window hashes to their first (file path, token index) occurrences
+        self.token_streams = {}  # Maps file paths to their normalized tokens, token lines and source lines
         self.string_literals = defaultdict(list)  # Maps string literals to their locations
         self.numeric_constants = defaultdict(list)  # Maps numeric constants to their locations
     
@@ -61,6 +82,93 @@ class DRYAnalyzer(BaseAnalyzer):
             content: Content of the file
             tree: AST of the file
             
+        Returns:
+            A dictionary containing analysis results
+        """
+        return self._merge_scan(file_path, self._scan_source(content, tree))
+    
+    def map_source(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
+        """Scan a file for the parts of the DRY analysis that need only the file.
+        
+        Tokenizing, window hashing and literal extraction happen here (in a
+        worker process for parallel runs); matching against other files is
+        left to reduce_file. The scan only depends on the file, so it is what
+        gets cached.
+        
+        Args:
+            file_path: Path to the file
+            content: Content of the file
+            tree: AST of the file
+            
+        Returns:
+            A partial result holding the file's scan, or an error result
+        """
+        try:
+            return {"file_path": file_path, "dry_scan": self._scan_source(content, tree)}
+        except Exception as e:
+            logger.error(f"Error analyzing file {file_path}: {str(e)}")
+            return {"file_path": file_path, "error": f"Analysis error: {str(e)}"}
+        finally:
+            self._traversal_state = None
+    
+    def reduce_file(self, partial: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a file's scan into the cross-file state and build its result.
+        
+        Args:
+            partial: The result of map_file or map_source
+            
+        Returns:
+            A dictionary containing analysis results
+        """
+        if "dry_scan" not in partial:
+            return partial  # Error result
+        
+        file_path = partial["file_path"]
+        try:
+            return self._merge_scan(file_path, partial["dry_scan"])
+        except Exception as e:
+            logger.error(f"Error analyzing file {file_path}: {str(e)}")
+            return {"file_path": file_path, "error": f"Analysis error: {str(e)}"}
+    
+    def _scan_source(self, content: str, tree: ast.AST) -> Dict[str, Any]:
+        """Extract what the DRY analysis needs from a single file.
+        
+        Args:
+            content: Content of the file
+            tree: AST of the file
+            
+        Returns:
+            The file's normalized tokens, their lines and window hashes, its
+            source lines, and its string and numeric literals with line numbers
+        """
+        tokens, token_lines = self._tokenize(content)
+        strings = []
+        constants = []
+        
+        # Literals gathered by the fused traversal, in ast.walk order
+        for node in self.traversal_state(tree):
+            if isinstance(node, ast.Str) and len(node.s) >= self.min_string_length:
+                strings.append((node.s, node.lineno))
+            # Skip common constants like 0, 1, -1
+            elif isinstance(node, ast.Num) and node.n not in (0, 1, -1):
+                constants.append((node.n, node.lineno))
+        
+        return {
+            "tokens": tokens,
+            "token_lines": token_lines,
+            "hashes": self._rolling_hashes(tokens, max(1, self.min_duplicate_tokens)),
+            "lines": content.splitlines(),
+            "strings": strings,
+            "constants": constants
+        }
+    
+    def _merge_scan(self, file_path: str, scan: Dict[str, Any]) -> Dict[str, Any]:
+        """Match a file's scan against the files analyzed before it.
+        
+        Args:
+            file_path: Path to the file
+            scan: The result of _scan_source for the file
+            
         Returns:
             A dictionary containing analysis results
         """
@@ -73,17 +181,19 @@ class DRYAnalyzer(BaseAnalyzer):
         }
         
         # Find duplicate code blocks
-        duplicate_blocks = self._find_duplicate_code_blocks(content, file_path)
+        duplicate_blocks = self._find_duplicate_code_blocks(file_path, scan)
         if duplicate_blocks:
             results["duplicate_code_blocks"] = duplicate_blocks
         
         # Find repeated string literals
-        repeated_strings = self._find_repeated_strings(tree, file_path)
+        repeated_strings = self._find_repeated_literals(
+            file_path, scan["strings"], self.string_literals, "string")
         if repeated_strings:
             results["repeated_strings"] = repeated_strings
         
         # Find repeated numeric constants
-        repeated_constants = self._find_repeated_constants(tree, file_path)
+        repeated_constants = self._find_repeated_literals(
+            file_path, scan["constants"], self.numeric_constants, "constant")
         if repeated_constants:
             results["repeated_constants"] = repeated_constants
         
@@ -99,51 +209,88 @@ class DRYAnalyzer(BaseAnalyzer):
         
         return results
     
-    def _find_duplicate_code_blocks(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.AST]:
+        """Collect the file's literals in the fused traversal.
+        
+        Args:
+            visitor: The visitor that will traverse the file's AST
+            
+        Returns:
+            The list of constant nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.Constant)
+    
+    def _find_duplicate_code_blocks(self, file_path: str, scan: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find duplicate code blocks in a file.
         
+        Token-based clone detection: the file is reduced to a normalized token
+        stream, every window of min_duplicate_tokens tokens gets a rolling hash,
+        and windows matching an earlier window (in this file or a previously
+        analyzed one) are extended to the longest common run. Each maximal
+        clone is reported once instead of once per overlapping line window.
+        
+        Repetitive code (long runs of identical statements) would make this
+        quadratic, so only the first max_candidates_per_hash occurrences of a
+        window are kept as match candidates, and windows inside a clone that
+        was already reported for this file are not matched again.
+        
         Args:
-            content: Content of the file
             file_path: Path to the file
+            scan: The result of _scan_source for the file
             
         Returns:
             A list of duplicate code blocks
         """
-        lines = content.splitlines()
-        line_count = len(lines)
-        duplicates = []
-        
-        # Generate hashes for all possible code blocks of minimum size
-        for i in range(line_count - self.min_duplicate_lines + 1):
-            for j in range(i + self.min_duplicate_lines, min(i + 30, line_count) + 1):  # Limit block size to 30 lines
-                block = "\n".join(lines[i:j])
-                # Normalize whitespace and comments
-                normalized_block = self._normalize_code_block(block)
-                if not normalized_block.strip():
+        tokens = scan["tokens"]
+        token_lines = scan["token_lines"]
+        self.token_streams[file_path] = (tokens, token_lines, scan["lines"])
+        
+        window = max(1, self.min_duplicate_tokens)
+        clones = {}  # (start token, token count) -> partner locations
+        covered_until = 0  # Token index up to which this file is already part of a reported clone
+        
+        for i, window_hash in enumerate(scan["hashes"]):
+            candidates = self.code_blocks[window_hash]
+            reach = 0
+            for other_path, j in (candidates if i >= covered_until else ()):
+                other_tokens = self.token_streams[other_path][0]
+                same_file = other_path == file_path
+                
+                # Matches within the file must not overlap
+                if same_file and j + window > i:
+                    continue
+                # Guard against hash collisions
+                if other_tokens[j:j + window] != tokens[i:i + window]:
+                    continue
+                # Only report a match from its first token (maximal on the left):
+                # either side starting its stream, or the preceding tokens differing
+                if i > 0 and j > 0 and other_tokens[j - 1] == tokens[i - 1]:
                     continue
-                    
-                block_hash = hashlib.md5(normalized_block.encode()).hexdigest()
                 
-                # Store block info
-                self.code_blocks[block_hash].append({
-                    "file_path": file_path,
-                    "start_line": i + 1,  # 1-indexed
-                    "end_line": j,
-                    "code": block
-                })
-        
-        # Find duplicates within this file
-        for block_hash, locations in self.code_blocks.items():
-            # Only consider blocks with multiple occurrences
-            if len(locations) < 2:
-                continue
+                # Extend the match as far as the token streams agree
+                length = window
+                limit = min(len(tokens) - i, len(other_tokens) - j)
+                if same_file:
+                    limit = min(limit, i - j)
+                while length < limit and tokens[i + length] == other_tokens[j + length]:
+                    length += 1
                 
-            # Only consider duplicates where at least one occurrence is in this file
-            file_locations = [loc for loc in locations if loc["file_path"] == file_path]
-            if not file_locations:
-                continue
+                if token_lines[i + length - 1][1] - token_lines[i][0] + 1 < self.min_duplicate_lines:
+                    continue
                 
-            # Create a duplicate entry
+                reach = max(reach, i + length)
+                partner = self._block_location(other_path, j, length)
+                partners = clones.setdefault((i, length), [])
+                if partner not in partners:
+                    partners.append(partner)
+            
+            covered_until = max(covered_until, reach)
+            if len(candidates) < self.max_candidates_per_hash:
+                candidates.append((file_path, i))
+        
+        duplicates = []
+        for (i, length), partners in clones.items():
+            locations = partners + [self._block_location(file_path, i, length)]
             duplicates.append({
                 "code": locations[0]["code"],
                 "occurrences": len(locations),
@@ -153,140 +300,135 @@ class DRYAnalyzer(BaseAnalyzer):
         
         return duplicates
     
-    def _normalize_code_block(self, block: str) -> str:
-        """Normalize a code block for comparison.
+    def _tokenize(self, content: str) -> Tuple[array, List[Tuple[int, int]]]:
+        """Reduce source code to a normalized token stream.
+        
+        Comments, indentation and blank lines are dropped and string literals
+        are replaced by a placeholder, so formatting and message text do not
+        hide duplication. Token ids are stable digests of the token text, so
+        streams produced in different worker processes can be compared.
         
         Args:
-            block: The code block
+            content: Content of the file
             
         Returns:
-            Normalized code block
+            A tuple of (token ids, (start line, end line) of each token)
         """
-        # Remove comments
-        block = re.sub(r'#.*$', '', block, flags=re.MULTILINE)
+        tokens = array('q')
+        token_lines = []
         
-        # Normalize whitespace
-        block = re.sub(r'\s+', ' ', block)
-        
-        # Remove string literals
-        block = re.sub(r'"[^"]*"', '""', block)
-        block = re.sub(r"'[^']*'", "''", block)
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(content).readline):
+                if token.type in _IGNORED_TOKENS:
+                    continue
+                tokens.append(_token_id('""' if token.type == tokenize.STRING else token.string))
+                token_lines.append((token.start[0], token.end[0]))
+        except (tokenize.TokenError, SyntaxError) as e:
+            logger.warning(f"Could not tokenize source for duplicate detection: {str(e)}")
         
-        return block.strip()
+        return tokens, token_lines
     
-    def _find_repeated_strings(self, tree: ast.AST, file_path: str) -> List[Dict[str, Any]]:
-        """Find repeated string literals in a file.
+    def _rolling_hashes(self, tokens: array, window: int) -> array:
+        """Compute the Rabin-Karp hash of every window of tokens.
         
         Args:
-            tree: AST of the file
-            file_path: Path to the file
+            tokens: Token ids
+            window: Number of tokens per window
             
         Returns:
-            A list of repeated string literals
+            The hash of the window starting at each position
         """
-        repeated_strings = []
-        string_occurrences = defaultdict(list)
+        hashes = array('q')
+        if len(tokens) < window:
+            return hashes
         
-        # Find all string literals
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Str) and len(node.s) >= self.min_string_length:
-                string_occurrences[node.s].append({
-                    "file_path": file_path,
-                    "line_number": node.lineno
-                })
-                
-                # Also store in global collection
-                self.string_literals[node.s].append({
-                    "file_path": file_path,
-                    "line_number": node.lineno
-                })
+        high_power = pow(_HASH_BASE, window - 1, _HASH_MODULUS)
+        window_hash = 0
+        for token in tokens[:window]:
+            window_hash = (window_hash * _HASH_BASE + token) % _HASH_MODULUS
         
-        # Find strings with multiple occurrences
-        for string, occurrences in string_occurrences.items():
-            if len(occurrences) >= self.min_string_occurrences:
-                repeated_strings.append({
-                    "string": string,
-                    "occurrences": len(occurrences),
-                    "locations": occurrences,
-                    "severity": min(1.0, (len(occurrences) - self.min_string_occurrences + 1) * 0.1)
-                })
+        hashes.append(window_hash)
+        for k in range(window, len(tokens)):
+            window_hash = ((window_hash - tokens[k - window] * high_power) * _HASH_BASE + tokens[k]) % _HASH_MODULUS
+            hashes.append(window_hash)
         
-        # Also check global collection for strings that appear in multiple files
-        for string, occurrences in self.string_literals.items():
-            # Skip strings already reported
-            if string in string_occurrences and len(string_occurrences[string]) >= self.min_string_occurrences:
-                continue
-                
-            # Check if this string appears in this file and others
-            file_occurrences = [o for o in occurrences if o["file_path"] == file_path]
-            if file_occurrences and len(occurrences) >= self.min_string_occurrences:
-                repeated_strings.append({
-                    "string": string,
-                    "occurrences": len(occurrences),
-                    "locations": occurrences,
-                    "severity": min(1.0, (len(occurrences) - self.min_string_occurrences + 1) * 0.1)
-                })
+        return hashes
+    
+    def _block_location(self, file_path: str, start: int, length: int) -> Dict[str, Any]:
+        """Describe where a run of tokens sits in its file.
         
-        return repeated_strings
+        Args:
+            file_path: Path to the file
+            start: Index of the first token
+            length: Number of tokens
+            
+        Returns:
+            A location dictionary with file path, line range and code
+        """
+        _, token_lines, lines = self.token_streams[file_path]
+        start_line = token_lines[start][0]
+        end_line = token_lines[start + length - 1][1]
+        return {
+            "file_path": file_path,
+            "start_line": start_line,
+            "end_line": end_line,
+            "code": "\n".join(lines[start_line - 1:end_line])
+        }
     
-    def _find_repeated_constants(self, tree: ast.AST, file_path: str) -> List[Dict[str, Any]]:
-        """Find repeated numeric constants in a file.
+    def _find_repeated_literals(self, file_path: str, literals: List[Tuple[Any, int]],
+                                global_literals: Dict[Any, List[Dict[str, Any]]], key: str) -> List[Dict[str, Any]]:
+        """Find string literals or numeric constants repeated in a file.
         
         Args:
-            tree: AST of the file
             file_path: Path to the file
+            literals: (value, line number) of each literal in the file
+            global_literals: Cross-file collection of literal locations to update
+            key: Name of the value field in the entries ('string' or 'constant')
             
         Returns:
-            A list of repeated numeric constants
+            A list of repeated literals
         """
-        repeated_constants = []
-        constant_occurrences = defaultdict(list)
-        
-        # Find all numeric constants
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Num):
-                # Skip common constants like 0, 1, -1
-                if node.n in (0, 1, -1):
-                    continue
-                    
-                constant_occurrences[node.n].append({
-                    "file_path": file_path,
-                    "line_number": node.lineno
-                })
-                
-                # Also store in global collection
-                self.numeric_constants[node.n].append({
-                    "file_path": file_path,
-                    "line_number": node.lineno
-                })
+        repeated = []
+        occurrences_in_file = defaultdict(list)
+        
+        for value, line_number in literals:
+            occurrences_in_file[value].append({
+                "file_path": file_path,
+                "line_number": line_number
+            })
+            
+            # Also store in global collection
+            global_literals[value].append({
+                "file_path": file_path,
+                "line_number": line_number
+            })
         
-        # Find constants with multiple occurrences
-        for constant, occurrences in constant_occurrences.items():
+        # Find literals with multiple occurrences
+        for value, occurrences in occurrences_in_file.items():
             if len(occurrences) >= self.min_string_occurrences:
-                repeated_constants.append({
-                    "constant": constant,
+                repeated.append({
+                    key: value,
                     "occurrences": len(occurrences),
                     "locations": occurrences,
                     "severity": min(1.0, (len(occurrences) - self.min_string_occurrences + 1) * 0.1)
                 })
         
-        # Also check global collection for constants that appear in multiple files
-        for constant, occurrences in self.numeric_constants.items():
-            # Skip constants already reported
-            if constant in constant_occurrences and len(constant_occurrences[constant]) >= self.min_string_occurrences:
+        # Also check the global collection for this file's literals that appear in other files too
+        for value, file_occurrences in occurrences_in_file.items():
+            # Skip literals already reported
+            if len(file_occurrences) >= self.min_string_occurrences:
                 continue
                 
-            # Check if this constant appears in this file and others
-            file_occurrences = [o for o in occurrences if o["file_path"] == file_path]
-            if file_occurrences and len(occurrences) >= self.min_string_occurrences:
-                repeated_constants.append({
-                    "constant": constant,
+            occurrences = global_literals[value]
+            if len(occurrences) >= self.min_string_occurrences:
+                repeated.append({
+                    key: value,
                     "occurrences": len(occurrences),
                     "locations": occurrences,
                     "severity": min(1.0, (len(occurrences) - self.min_string_occurrences + 1) * 0.1)
                 })
         
-        return repeated_constants
+        return repeated
     
     def _generate_recommendations(self, results: Dict[str, Any]) -> Dict[str, List[str]]:
         """Generate refactoring recommendations based on analysis.
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, List, Set, Optional, Any
 from collections import defaultdict
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -47,6 +47,17 @@ class ISPAnalyzer(BaseAnalyzer):
         # Configuration
         self.max_interface_methods = self.config.get('max_interface_methods', 5)  # Maximum number of methods an interface should have
 
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.ClassDef]:
+        """Collect the file's classes in the fused traversal.
+
+        Args:
+            visitor: The visitor that will traverse the file's AST
+
+        Returns:
+            The list of class nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.ClassDef)
+
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
         """Analyze a Python file for ISP violations.
 
@@ -98,25 +109,24 @@ class ISPAnalyzer(BaseAnalyzer):
         self.implementations = defaultdict(list)
 
         # Find all classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-
-                # Check if this is an interface
-                if self._is_interface(node):
-                    # Store interface methods
-                    methods = []
-                    for method in node.body:
-                        if isinstance(method, ast.FunctionDef):
-                            methods.append(method.name)
-
-                    self.interfaces[class_name] = methods
-                else:
-                    # Check if this class implements any interfaces
-                    for base in node.bases:
-                        base_name = self._get_name_from_node(base)
-                        if base_name:
-                            self.implementations[base_name].append(class_name)
+        for node in self.traversal_state(tree):
+            class_name = node.name
+
+            # Check if this is an interface
+            if self._is_interface(node):
+                # Store interface methods
+                methods = []
+                for method in node.body:
+                    if isinstance(method, ast.FunctionDef):
+                        methods.append(method.name)
+
+                self.interfaces[class_name] = methods
+            else:
+                # Check if this class implements any interfaces
+                for base in node.bases:
+                    base_name = self._get_name_from_node(base)
+                    if base_name:
+                        self.implementations[base_name].append(class_name)
 
     def _analyze_implementation(self, impl_name: str, interface_name: str, interface_methods: List[str]) -> Dict:
         """Analyze an implementation for ISP violations.
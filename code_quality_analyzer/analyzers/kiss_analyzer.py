@@ -10,7 +10,7 @@ import re
 import logging
 from typing import Dict, List, Set, Tuple, Any, Optional
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -19,6 +19,11 @@ logger = logging.getLogger(__name__)
 class KISSAnalyzer(BaseAnalyzer):
     """Analyzes Python code for KISS principle violations."""
     
+    # Node types counted by each metric
+    NESTING_NODES = (ast.If, ast.For, ast.While, ast.With, ast.Try)
+    CYCLOMATIC_NODES = (ast.If, ast.While, ast.For)
+    COGNITIVE_NODES = (ast.If, ast.For, ast.While, ast.With)
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize a new KISSAnalyzer.
         
@@ -59,11 +64,9 @@ class KISSAnalyzer(BaseAnalyzer):
         Returns:
             A dictionary containing analysis results
         """
-        # Find all functions and methods in the file
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                functions.append(node)
+        # Metrics for all functions and methods, gathered in one traversal
+        functions = self.traversal_state(tree)["functions"]
+        functions.sort(key=lambda metrics: metrics["order"])
         
         results = {
             "file_path": file_path,
@@ -71,8 +74,8 @@ class KISSAnalyzer(BaseAnalyzer):
             "overall_kiss_score": 1.0  # Will be updated based on method analyses
         }
         
-        for func in functions:
-            method_result = self._analyze_method(func, content)
+        for metrics in functions:
+            method_result = self._analyze_method(metrics["node"], content, metrics)
             results["method_analysis"].append(method_result)
         
         # Calculate overall KISS score for the file
@@ -82,12 +85,86 @@ class KISSAnalyzer(BaseAnalyzer):
         
         return results
     
-    def _analyze_method(self, func_node: ast.FunctionDef, file_content: str) -> Dict[str, Any]:
+    def register_visitors(self, visitor: FusedNodeVisitor) -> Dict[str, Any]:
+        """Subscribe the per-function metrics to the fused traversal.
+        
+        Every function tracks its own nesting depth, cyclomatic and cognitive
+        complexity and complex conditionals; nodes inside nested functions
+        count towards all enclosing functions, as with ast.walk(func_node).
+        
+        Args:
+            visitor: The visitor that will traverse the file's AST
+            
+        Returns:
+            The per-file state holding one metrics dictionary per function
+        """
+        state = {"functions": [], "open": []}
+        
+        def enter_function(node, visitor):
+            metrics = {
+                "node": node,
+                "order": (visitor.depth, visitor.index),
+                "depth": 0,
+                "max_depth": 0,
+                "cyclomatic_complexity": 1,
+                "cognitive_nodes": 0,
+                "cognitive_increments": 0,
+                "complex_conditionals": []
+            }
+            state["functions"].append(metrics)
+            state["open"].append(metrics)
+        
+        def exit_function(node, visitor):
+            metrics = state["open"].pop()
+            metrics["complex_conditionals"].sort(key=lambda item: item[0])
+            metrics["complex_conditionals"] = [description for _, description in metrics["complex_conditionals"]]
+        
+        def enter_control(node, visitor):
+            nesting = isinstance(node, self.NESTING_NODES)
+            cyclomatic = isinstance(node, self.CYCLOMATIC_NODES)
+            cognitive = isinstance(node, self.COGNITIVE_NODES)
+            else_branch = isinstance(node, ast.If) and bool(node.orelse)
+            for metrics in state["open"]:
+                if nesting:
+                    metrics["depth"] += 1
+                    metrics["max_depth"] = max(metrics["max_depth"], metrics["depth"])
+                if cyclomatic:
+                    metrics["cyclomatic_complexity"] += 1
+                if cognitive:
+                    metrics["cognitive_nodes"] += 1
+                if else_branch:
+                    metrics["cognitive_increments"] += 1
+        
+        def exit_control(node, visitor):
+            if isinstance(node, self.NESTING_NODES):
+                for metrics in state["open"]:
+                    metrics["depth"] -= 1
+        
+        def enter_condition(node, visitor):
+            if not state["open"]:
+                return
+            description = self._describe_complex_conditional(node)
+            extra_operands = len(node.values) - 1 if isinstance(node, ast.BoolOp) else 0
+            for metrics in state["open"]:
+                metrics["cyclomatic_complexity"] += extra_operands
+                metrics["cognitive_increments"] += extra_operands
+                if description:
+                    metrics["complex_conditionals"].append(((visitor.depth, visitor.index), description))
+        
+        visitor.subscribe((ast.FunctionDef, ast.AsyncFunctionDef), enter_function, exit_function)
+        visitor.subscribe(self.NESTING_NODES, enter_control, exit_control)
+        visitor.subscribe((ast.BoolOp, ast.Compare), enter_condition)
+        return state
+    
+    def _analyze_method(self, func_node: ast.FunctionDef, file_content: str,
+                        metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyze a method for KISS violations.
         
         Args:
             func_node: The function AST node
             file_content: The file content
+            metrics: Optional metrics gathered by the fused traversal; computed
+                from func_node when not given
             
         Returns:
             A dictionary containing analysis results for the method
@@ -107,8 +184,20 @@ class KISSAnalyzer(BaseAnalyzer):
                 "severity": min(1.0, (len(method_lines) - self.max_method_lines) / self.max_method_lines)
             })
         
+        if metrics is None:
+            max_depth = self._calculate_max_nesting_depth(func_node)
+            cyclomatic_complexity = self._calculate_cyclomatic_complexity(func_node)
+            cognitive_complexity = self._calculate_cognitive_complexity(func_node)
+            complex_conditionals = self._find_complex_conditionals(func_node)
+        else:
+            max_depth = metrics["max_depth"]
+            cyclomatic_complexity = metrics["cyclomatic_complexity"]
+            # Each counted node adds one more than the previous one (see _calculate_cognitive_complexity)
+            cognitive_nodes = metrics["cognitive_nodes"]
+            cognitive_complexity = cognitive_nodes * (cognitive_nodes + 1) // 2 + metrics["cognitive_increments"]
+            complex_conditionals = metrics["complex_conditionals"]
+        
         # Check nesting depth
-        max_depth = self._calculate_max_nesting_depth(func_node)
         if max_depth > self.max_nesting_depth:
             violations.append({
                 "type": "deep_nesting",
@@ -117,7 +206,6 @@ class KISSAnalyzer(BaseAnalyzer):
             })
         
         # Check cyclomatic complexity
-        cyclomatic_complexity = self._calculate_cyclomatic_complexity(func_node)
         if cyclomatic_complexity > self.max_cyclomatic_complexity:
             violations.append({
                 "type": "high_cyclomatic_complexity",
@@ -126,7 +214,6 @@ class KISSAnalyzer(BaseAnalyzer):
             })
         
         # Check cognitive complexity
-        cognitive_complexity = self._calculate_cognitive_complexity(func_node)
         if cognitive_complexity > self.max_cognitive_complexity:
             violations.append({
                 "type": "high_cognitive_complexity",
@@ -144,7 +231,6 @@ class KISSAnalyzer(BaseAnalyzer):
             })
         
         # Check for complex conditionals
-        complex_conditionals = self._find_complex_conditionals(func_node)
         if complex_conditionals:
             violations.append({
                 "type": "complex_conditionals",
@@ -267,23 +353,37 @@ class KISSAnalyzer(BaseAnalyzer):
         complex_conditionals = []
         
         for node in ast.walk(func_node):
-            # Check for boolean operations with multiple operands
-            if isinstance(node, ast.BoolOp) and len(node.values) > 2:
-                complex_conditionals.append(f"Boolean operation with {len(node.values)} operands at line {node.lineno}")
-            
-            # Check for nested boolean operations
-            elif isinstance(node, ast.BoolOp):
-                for value in node.values:
-                    if isinstance(value, ast.BoolOp):
-                        complex_conditionals.append(f"Nested boolean operation at line {node.lineno}")
-                        break
-            
-            # Check for complex comparisons
-            elif isinstance(node, ast.Compare) and len(node.ops) > 1:
-                complex_conditionals.append(f"Comparison with {len(node.ops)} operators at line {node.lineno}")
+            description = self._describe_complex_conditional(node)
+            if description:
+                complex_conditionals.append(description)
         
         return complex_conditionals
     
+    def _describe_complex_conditional(self, node: ast.AST) -> Optional[str]:
+        """Describe a node if it is a complex conditional expression.
+        
+        Args:
+            node: The AST node
+            
+        Returns:
+            A description of the complex conditional, or None
+        """
+        # Check for boolean operations with multiple operands
+        if isinstance(node, ast.BoolOp) and len(node.values) > 2:
+            return f"Boolean operation with {len(node.values)} operands at line {node.lineno}"
+        
+        # Check for nested boolean operations
+        elif isinstance(node, ast.BoolOp):
+            for value in node.values:
+                if isinstance(value, ast.BoolOp):
+                    return f"Nested boolean operation at line {node.lineno}"
+        
+        # Check for complex comparisons
+        elif isinstance(node, ast.Compare) and len(node.ops) > 1:
+            return f"Comparison with {len(node.ops)} operators at line {node.lineno}"
+        
+        return None
+    
     def _generate_method_recommendation(self, method_name: str, violations: List[Dict[str, Any]]) -> str:
         """Generate refactoring recommendations based on analysis.
         
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, List, Set, Optional, Any
 from collections import defaultdict
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -44,6 +44,17 @@ class LSPAnalyzer(BaseAnalyzer):
         self.class_hierarchy = {}
         self.method_signatures = {}
 
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.ClassDef]:
+        """Collect the file's classes in the fused traversal.
+
+        Args:
+            visitor: The visitor that will traverse the file's AST
+
+        Returns:
+            The list of class nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.ClassDef)
+
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
         """Analyze a Python file for LSP violations.
 
@@ -92,52 +103,51 @@ class LSPAnalyzer(BaseAnalyzer):
         self.method_signatures = {}
 
         # Find all classes and their base classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                bases = []
-
-                for base in node.bases:
-                    if isinstance(base, ast.Name):
-                        bases.append(base.id)
-                    elif isinstance(base, ast.Attribute):
-                        bases.append(base.attr)
-
-                self.class_hierarchy[class_name] = bases
-
-                # Store method signatures for this class
-                self.method_signatures[class_name] = {}
-
-                for method in node.body:
-                    if isinstance(method, ast.FunctionDef):
-                        method_name = method.name
-
-                        # Skip special methods
-                        if method_name.startswith("__") and method_name.endswith("__"):
-                            continue
-
-                        # Get parameter types
-                        param_types = []
-                        for arg in method.args.args:
-                            if arg.annotation:
-                                param_types.append(self._get_annotation_name(arg.annotation))
-                            else:
-                                param_types.append("unknown")
-
-                        # Get return type
-                        return_type = "unknown"
-                        if method.returns:
-                            return_type = self._get_annotation_name(method.returns)
-
-                        # Get exceptions raised
-                        exceptions = self._find_exceptions(method)
-
-                        # Store method signature
-                        self.method_signatures[class_name][method_name] = {
-                            "params": param_types,
-                            "return": return_type,
-                            "exceptions": exceptions
-                        }
+        for node in self.traversal_state(tree):
+            class_name = node.name
+            bases = []
+
+            for base in node.bases:
+                if isinstance(base, ast.Name):
+                    bases.append(base.id)
+                elif isinstance(base, ast.Attribute):
+                    bases.append(base.attr)
+
+            self.class_hierarchy[class_name] = bases
+
+            # Store method signatures for this class
+            self.method_signatures[class_name] = {}
+
+            for method in node.body:
+                if isinstance(method, ast.FunctionDef):
+                    method_name = method.name
+
+                    # Skip special methods
+                    if method_name.startswith("__") and method_name.endswith("__"):
+                        continue
+
+                    # Get parameter types
+                    param_types = []
+                    for arg in method.args.args:
+                        if arg.annotation:
+                            param_types.append(self._get_annotation_name(arg.annotation))
+                        else:
+                            param_types.append("unknown")
+
+                    # Get return type
+                    return_type = "unknown"
+                    if method.returns:
+                        return_type = self._get_annotation_name(method.returns)
+
+                    # Get exceptions raised
+                    exceptions = self._find_exceptions(method)
+
+                    # Store method signature
+                    self.method_signatures[class_name][method_name] = {
+                        "params": param_types,
+                        "return": return_type,
+                        "exceptions": exceptions
+                    }
 
     def _find_class_node(self, tree: ast.AST, class_name: str) -> Optional[ast.ClassDef]:
         """Find the AST node for a class.
@@ -149,8 +159,8 @@ class LSPAnalyzer(BaseAnalyzer):
         Returns:
             AST node for the class, or None if not found
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
+        for node in self.traversal_state(tree):
+            if node.name == class_name:
                 return node
         return None
 
@@ -10,7 +10,7 @@ import logging
 from typing import Dict, List, Set, Optional, Any
 from collections import defaultdict
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -43,6 +43,17 @@ class OCPAnalyzer(BaseAnalyzer):
         self.class_scores = {}
         self.overall_score = 1.0
 
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.ClassDef]:
+        """Collect the file's classes in the fused traversal.
+
+        Args:
+            visitor: The visitor that will traverse the file's AST
+
+        Returns:
+            The list of class nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.ClassDef)
+
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
         """Analyze a Python file for OCP violations.
 
@@ -62,10 +73,9 @@ class OCPAnalyzer(BaseAnalyzer):
         }
 
         # Analyze each class in the file
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_result = self._analyze_class(node, file_path)
-                results["class_analysis"].append(class_result)
+        for node in self.traversal_state(tree):
+            class_result = self._analyze_class(node, file_path)
+            results["class_analysis"].append(class_result)
 
         # Calculate overall score
         if results["class_analysis"]:
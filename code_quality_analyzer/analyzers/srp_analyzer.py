@@ -11,7 +11,7 @@ import logging
 from collections import defaultdict
 from typing import Dict, List, Set, Tuple, Any, Optional
 
-from ..base_analyzer import BaseAnalyzer
+from ..base_analyzer import BaseAnalyzer, FusedNodeVisitor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -57,6 +57,17 @@ class SRPAnalyzer(BaseAnalyzer):
         self.max_responsibilities = self.config['max_responsibilities']
         self.cohesion_threshold = self.config['cohesion_threshold']
     
+    def register_visitors(self, visitor: FusedNodeVisitor) -> List[ast.ClassDef]:
+        """Collect the file's classes in the fused traversal.
+        
+        Args:
+            visitor: The visitor that will traverse the file's AST
+        
+        Returns:
+            The list of class nodes, filled in ast.walk order
+        """
+        return visitor.collect(ast.ClassDef)
+    
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
         """Analyze a file for SRP violations.
         
@@ -69,7 +80,7 @@ class SRPAnalyzer(BaseAnalyzer):
             A dictionary containing analysis results
         """
         # Find all classes in the file
-        classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+        classes = self.traversal_state(tree)
         
         results = {
             "file_path": file_path,
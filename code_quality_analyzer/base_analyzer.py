@@ -7,15 +7,196 @@ functionality for file and directory analysis, caching, and reporting.
 import os
 import ast
 import logging
-import pickle
 import multiprocessing
-from typing import Dict, List, Any, Optional, Set, Callable
+from typing import Dict, List, Any, Optional, Set, Callable, Tuple, Iterator, TextIO
 from abc import ABC, abstractmethod
 
+from .analysis_cache import AnalysisCache, content_hash, config_hash, restamp_path
+from .report_stream import LineWriter, render, write_json, write_json_line
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Analyzer owned by a worker process during parallel runs (see map_files_in_parallel)
+_worker_analyzer = None
+
+def _init_map_worker(analyzer_class: type, config: Dict[str, Any]) -> None:
+    """Create the analyzer used by this worker process.
+    
+    Args:
+        analyzer_class: Class of the analyzer to create
+        config: Configuration for the analyzer
+    """
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class(config)
+
+def _map_file_in_worker(file_path: str) -> Any:
+    """Run the map phase for one file in a worker process.
+    
+    Args:
+        file_path: Path to the file to map
+        
+    Returns:
+        The partial result for the file
+    """
+    return _worker_analyzer.map_file(file_path)
+
+def map_files_in_parallel(analyzer_class: type, config: Dict[str, Any], file_paths: List[str],
+                          workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Iterator[Any]:
+    """Run the map phase of an analyzer over files in worker processes.
+    
+    Each worker builds its own analyzer from the class and configuration once,
+    instead of receiving a pickled copy of the caller's analyzer (and its
+    accumulated state) with every task. Files are submitted in chunks and the
+    partial results are yielded in file order as they arrive, so the caller
+    can reduce them while workers are still mapping.
+    
+    Args:
+        analyzer_class: Class of the analyzer; constructed as analyzer_class(config)
+        config: Configuration for the analyzer
+        file_paths: Paths of the files to map
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Files per task (default: about four tasks per worker)
+        
+    Yields:
+        The partial result of map_file for each file, in order
+    """
+    workers = workers or multiprocessing.cpu_count()
+    if chunk_size is None:
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+    
+    with multiprocessing.Pool(workers, initializer=_init_map_worker, initargs=(analyzer_class, config)) as pool:
+        for partial in pool.imap(_map_file_in_worker, file_paths, chunk_size):
+            yield partial
+
+class FusedNodeVisitor:
+    """Single-traversal AST visitor shared by several analyzers.
+    
+    Analyzers subscribe callbacks to the node types they care about (see
+    BaseAnalyzer.register_visitors); one depth-first walk of the tree then
+    feeds every subscriber, instead of each metric running its own ast.walk.
+    
+    Callbacks are called as ``callback(node, visitor)``. While a callback runs,
+    ``visitor.depth`` is the depth of the node below the root and
+    ``visitor.index`` its pre-order position; sorting by ``(depth, index)``
+    reproduces the order of ast.walk.
+    
+    Attributes:
+        depth: Depth of the node currently being visited
+        index: Pre-order index of the node currently being visited
+    """
+    
+    def __init__(self):
+        """Initialize a new FusedNodeVisitor with no subscriptions."""
+        self._subscriptions = []  # (node_types, on_enter, on_exit)
+        self._handlers = {}  # node class -> (enter callbacks, exit callbacks)
+        self._collections = {}  # node_types -> (collected list, [(depth, index, node)])
+        self.depth = 0
+        self.index = 0
+    
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether any callback or collection is registered."""
+        return bool(self._subscriptions)
+    
+    def subscribe(self, node_types: Any, on_enter: Optional[Callable] = None,
+                  on_exit: Optional[Callable] = None) -> None:
+        """Subscribe callbacks to a node type or tuple of node types.
+        
+        Args:
+            node_types: AST node class, or tuple of classes (subclasses match too)
+            on_enter: Called before the node's children are visited
+            on_exit: Called after all of the node's children have been visited
+        """
+        if not isinstance(node_types, tuple):
+            node_types = (node_types,)
+        self._subscriptions.append((node_types, on_enter, on_exit))
+        self._handlers.clear()
+    
+    def collect(self, node_types: Any) -> List[ast.AST]:
+        """Collect all nodes of the given types during the traversal.
+        
+        Analyzers asking for the same node types share one collection.
+        
+        Args:
+            node_types: AST node class, or tuple of classes
+            
+        Returns:
+            A list that is filled, in ast.walk order, when the traversal runs
+        """
+        if not isinstance(node_types, tuple):
+            node_types = (node_types,)
+        if node_types not in self._collections:
+            collected, found = [], []
+            self._collections[node_types] = (collected, found)
+            self.subscribe(node_types, lambda node, visitor: found.append((visitor.depth, visitor.index, node)))
+        return self._collections[node_types][0]
+    
+    def run(self, tree: ast.AST) -> None:
+        """Walk the tree once, dispatching every node to its subscribers.
+        
+        Args:
+            tree: The AST to traverse
+        """
+        if not self._subscriptions:
+            return
+        
+        handlers = self._handlers
+        stack = [(tree, 0, False)]
+        index = 0
+        
+        while stack:
+            node, depth, exiting = stack.pop()
+            node_class = type(node)
+            entry = handlers.get(node_class)
+            if entry is None:
+                entry = self._resolve_handlers(node_class)
+            enter_callbacks, exit_callbacks = entry
+            
+            if exiting:
+                for callback in exit_callbacks:
+                    callback(node, self)
+                continue
+            
+            self.depth = depth
+            self.index = index
+            index += 1
+            for callback in enter_callbacks:
+                callback(node, self)
+            
+            if exit_callbacks:
+                stack.append((node, depth, True))
+            children = list(ast.iter_child_nodes(node))
+            for child in reversed(children):
+                stack.append((child, depth + 1, False))
+        
+        for collected, found in self._collections.values():
+            found.sort(key=lambda item: (item[0], item[1]))
+            collected[:] = [item[2] for item in found]
+            found.clear()
+    
+    def _resolve_handlers(self, node_class: type) -> Tuple[List[Callable], List[Callable]]:
+        """Find the callbacks subscribed to a node class and cache them.
+        
+        Args:
+            node_class: The class of an AST node
+            
+        Returns:
+            A tuple of (enter callbacks, exit callbacks)
+        """
+        enter_callbacks = []
+        exit_callbacks = []
+        for node_types, on_enter, on_exit in self._subscriptions:
+            if issubclass(node_class, node_types):
+                if on_enter is not None:
+                    enter_callbacks.append(on_enter)
+                if on_exit is not None:
+                    exit_callbacks.append(on_exit)
+        entry = (enter_callbacks, exit_callbacks)
+        self._handlers[node_class] = entry
+        return entry
+
 class BaseAnalyzer(ABC):
     """Base class for all code quality analyzers.
     
@@ -29,6 +210,9 @@ class BaseAnalyzer(ABC):
         results: Dictionary of analysis results
     """
     
+    # Part of the cache key; bump when an analyzer's cached map results change shape
+    cache_version = 1
+    
     def __init__(self, name: str, description: str, config: Optional[Dict[str, Any]] = None):
         """Initialize a new BaseAnalyzer.
         
@@ -42,6 +226,8 @@ class BaseAnalyzer(ABC):
         self.config = config or {}
         self.cache_dir = self.config.get('cache_dir', '.code_analysis_cache')
         self.results = {}
+        self._traversal_state = None  # (tree, state) from the last fused traversal
+        self._config_hash = None
     
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
         """Analyze a single file.
@@ -52,44 +238,213 @@ class BaseAnalyzer(ABC):
         Returns:
             A dictionary containing analysis results
         """
+        return self.reduce_file(self.map_file(file_path))
+    
+    def map_file(self, file_path: str) -> Dict[str, Any]:
+        """Map phase of the analysis of a file.
+        
+        This is the part of the analysis that only needs the file itself, so
+        it can run in a worker process. The result is handed to reduce_file
+        in the parent process.
+        
+        Args:
+            file_path: Path to the file to analyze
+            
+        Returns:
+            The file's analysis result, or a partial result for reduce_file
+        """
+        content, error = self.read_source(file_path)
+        if error is not None:
+            return {"file_path": file_path, "error": error}
+        
         # Check cache first if enabled
+        cache_key = None
         if self.config.get('use_cache', False):
-            cached_result = self._get_cached_result(file_path)
+            cache_key, cached_result = self._lookup_cache(file_path, content_hash(content))
             if cached_result is not None:
                 return cached_result
         
+        tree, error = self.parse_source(file_path, content)
+        if error is not None:
+            return {"file_path": file_path, "error": error}
+        
+        return self.map_source_cached(file_path, content, tree, cache_key)
+    
+    def map_source_cached(self, file_path: str, content: str, tree: ast.AST,
+                          cache_key: Optional[str]) -> Dict[str, Any]:
+        """Run map_source and cache its result.
+        
+        Args:
+            file_path: Path to the file being analyzed
+            content: Content of the file
+            tree: AST of the file
+            cache_key: Key from _lookup_cache, or None when caching is disabled
+            
+        Returns:
+            The result of map_source
+        """
+        partial = self.map_source(file_path, content, tree)
+        
+        # Cache the result if caching is enabled
+        if cache_key is not None and "error" not in partial:
+            self._cache_result(cache_key, partial)
+        
+        return partial
+    
+    def map_source(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
+        """Map phase for a file that has already been read and parsed.
+        
+        Analyzers without cross-file state do the whole analysis here; those
+        with cross-file state override this to return a compact partial result
+        and merge it in reduce_file.
+        
+        Args:
+            file_path: Path to the file being analyzed
+            content: Content of the file
+            tree: AST of the file
+            
+        Returns:
+            The file's analysis result, or a partial result for reduce_file
+        """
+        return self.analyze_source(file_path, content, tree)
+    
+    def reduce_file(self, partial: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce phase: turn a map result into the file's analysis result.
+        
+        Called in the parent process, in file order, so cross-file state is
+        built exactly as in a sequential run.
+        
+        Args:
+            partial: The result of map_file or map_source
+            
+        Returns:
+            A dictionary containing analysis results
+        """
+        return partial
+    
+    @staticmethod
+    def load_source(file_path: str) -> Tuple[Optional[str], Optional[ast.AST], Optional[str]]:
+        """Read and parse a Python file.
+        
+        Args:
+            file_path: Path to the file to read
+            
+        Returns:
+            A (content, tree, error) tuple; error is None on success, otherwise
+            a message matching the error entries of analysis results
+        """
+        content, error = BaseAnalyzer.read_source(file_path)
+        if error is not None:
+            return None, None, error
+        
+        tree, error = BaseAnalyzer.parse_source(file_path, content)
+        return content, tree, error
+    
+    @staticmethod
+    def read_source(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """Read a Python file.
+        
+        This is shared by all analyzers so that a file can be read and parsed
+        once and handed to several analyzers (see UnifiedAnalyzer).
+        
+        Args:
+            file_path: Path to the file to read
+            
+        Returns:
+            A (content, error) tuple; error is None on success
+        """
         try:
             # Try to read the file with utf-8 encoding
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read(), None
         except UnicodeDecodeError:
             # Fall back to latin-1 encoding
             try:
                 with open(file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
+                    return f.read(), None
             except Exception as e:
                 logger.error(f"Error reading file {file_path}: {str(e)}")
-                return {"file_path": file_path, "error": f"File reading error: {str(e)}"}
+                return None, f"File reading error: {str(e)}"
+    
+    @staticmethod
+    def parse_source(file_path: str, content: str) -> Tuple[Optional[ast.AST], Optional[str]]:
+        """Parse the content of a Python file.
         
+        Args:
+            file_path: Path to the file, for error messages
+            content: Content of the file
+            
+        Returns:
+            A (tree, error) tuple; error is None on success
+        """
         try:
             # Parse the file into an AST
-            tree = ast.parse(content)
-            
-            # Call the implementation-specific analysis method
-            result = self._analyze_file_impl(file_path, content, tree)
-            
-            # Cache the result if caching is enabled
-            if self.config.get('use_cache', False):
-                self._cache_result(file_path, result)
-            
-            return result
-            
+            return ast.parse(content), None
         except SyntaxError as e:
             logger.error(f"Syntax error in file {file_path}: {str(e)}")
-            return {"file_path": file_path, "error": f"Syntax error: {str(e)}"}
+            return None, f"Syntax error: {str(e)}"
+    
+    def analyze_source(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
+        """Analyze a file that has already been read and parsed.
+        
+        Args:
+            file_path: Path to the file being analyzed
+            content: Content of the file
+            tree: AST of the file
+            
+        Returns:
+            A dictionary containing analysis results
+        """
+        try:
+            # Call the implementation-specific analysis method
+            return self._analyze_file_impl(file_path, content, tree)
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {str(e)}")
             return {"file_path": file_path, "error": f"Analysis error: {str(e)}"}
+        finally:
+            self._traversal_state = None
+    
+    def register_visitors(self, visitor: FusedNodeVisitor) -> Any:
+        """Subscribe to the node types this analyzer needs for one file.
+        
+        Subclasses override this to move their tree walks into the shared
+        traversal. Whatever is returned is handed back by traversal_state()
+        once the traversal has run.
+        
+        Args:
+            visitor: The visitor that will traverse the file's AST
+            
+        Returns:
+            Per-file state filled in by the traversal (None by default)
+        """
+        return None
+    
+    def prepare_traversal(self, visitor: FusedNodeVisitor, tree: ast.AST) -> None:
+        """Register this analyzer on a visitor shared with other analyzers.
+        
+        Args:
+            visitor: The shared visitor, run once after all analyzers registered
+            tree: AST of the file the visitor will traverse
+        """
+        self._traversal_state = (tree, self.register_visitors(visitor))
+    
+    def traversal_state(self, tree: ast.AST) -> Any:
+        """Get the state collected for a tree by the fused traversal.
+        
+        If no shared traversal was prepared for this tree, the analyzer runs
+        its own single traversal.
+        
+        Args:
+            tree: AST of the file being analyzed
+            
+        Returns:
+            The state returned by register_visitors, filled in
+        """
+        if self._traversal_state is None or self._traversal_state[0] is not tree:
+            visitor = FusedNodeVisitor()
+            self.prepare_traversal(visitor, tree)
+            visitor.run(tree)
+        return self._traversal_state[1]
     
     @abstractmethod
     def _analyze_file_impl(self, file_path: str, content: str, tree: ast.AST) -> Dict[str, Any]:
@@ -107,12 +462,15 @@ class BaseAnalyzer(ABC):
         """
         pass
     
-    def analyze_directory(self, directory_path: str, parallel: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    def analyze_directory(self, directory_path: str, parallel: bool = False, workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
         """Analyze all Python files in a directory.
         
         Args:
             directory_path: Path to the directory to analyze
             parallel: Whether to use parallel processing
+            workers: Number of worker processes for parallel processing (default: CPU count)
+            chunk_size: Files per worker task for parallel processing
             
         Returns:
             A dictionary containing analysis results for all files
@@ -125,11 +483,22 @@ class BaseAnalyzer(ABC):
         
         # Analyze files
         if parallel and len(python_files) > 1:
-            with multiprocessing.Pool() as pool:
-                file_results = pool.map(self.analyze_file, python_files)
+            partials = map_files_in_parallel(type(self), self.config, python_files, workers, chunk_size)
+            file_results = [self.reduce_file(partial) for partial in partials]
         else:
             file_results = [self.analyze_file(f) for f in python_files]
         
+        return self.collect_results(file_results)
+    
+    def collect_results(self, file_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize per-file results and store them as this analyzer's results.
+        
+        Args:
+            file_results: List of file analysis results
+            
+        Returns:
+            A dictionary containing the file results and their summary
+        """
         # Generate summary
         summary = self._generate_summary(file_results)
         
@@ -141,7 +510,8 @@ class BaseAnalyzer(ABC):
         
         return self.results
     
-    def _get_python_files(self, directory_path: str) -> List[str]:
+    @staticmethod
+    def _get_python_files(directory_path: str) -> List[str]:
         """Get all Python files in a directory.
         
         Args:
@@ -192,60 +562,55 @@ class BaseAnalyzer(ABC):
         """
         pass
     
-    def _get_cached_result(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Get cached analysis result for a file.
+    def _lookup_cache(self, file_path: str, file_hash: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Look up the cached map result for a file's content.
         
         Args:
             file_path: Path to the file
+            file_hash: Content hash of the file
             
         Returns:
-            Cached result, or None if not found
+            A (cache key, cached result) tuple; the key is None if caching is
+            disabled and the result is None on a cache miss. A cached result
+            computed for a copy of the file at another path is restamped with
+            file_path.
         """
-        cache_file = self._get_cache_file_path(file_path)
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    cached_result = pickle.load(f)
-                
-                # Check if the file has been modified since the cache was created
-                if os.path.getmtime(file_path) <= os.path.getmtime(cache_file):
-                    return cached_result
-            except Exception as e:
-                logger.warning(f"Error reading cache for {file_path}: {str(e)}")
-        
-        return None
+        if not self.config.get('use_cache', False):
+            return None, None
+        
+        if self._config_hash is None:
+            self._config_hash = config_hash(self.config)
+        cache_key = AnalysisCache.make_key(file_hash, self.name, self._config_hash, self.cache_version)
+        cached_result = self._get_cached_result(cache_key)
+        return cache_key, None if cached_result is None else restamp_path(cached_result, file_path)
     
-    def _cache_result(self, file_path: str, result: Dict[str, Any]) -> None:
-        """Cache analysis result for a file.
+    def _get_cache(self) -> AnalysisCache:
+        """Get the consolidated cache this analyzer uses.
         
-        Args:
-            file_path: Path to the file
-            result: Analysis result to cache
+        Returns:
+            The cache stored in cache_dir
         """
-        cache_file = self._get_cache_file_path(file_path)
-        
-        try:
-            # Create cache directory if it doesn't exist
-            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
-            
-            with open(cache_file, 'wb') as f:
-                pickle.dump(result, f)
-        except Exception as e:
-            logger.warning(f"Error caching result for {file_path}: {str(e)}")
+        return AnalysisCache.for_directory(self.cache_dir, self.config.get('cache_max_size'))
     
-    def _get_cache_file_path(self, file_path: str) -> str:
-        """Get the path to the cache file for a file.
+    def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached analysis result.
         
         Args:
-            file_path: Path to the file
+            cache_key: Key from _lookup_cache
             
         Returns:
-            Path to the cache file
+            Cached result, or None if not found
         """
-        rel_path = os.path.relpath(file_path)
-        cache_key = rel_path.replace(os.path.sep, '_')
-        return os.path.join(self.cache_dir, f"{self.name}_{cache_key}.cache")
+        return self._get_cache().get(cache_key)
+    
+    def _cache_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache an analysis result.
+        
+        Args:
+            cache_key: Key from _lookup_cache
+            result: Analysis result to cache
+        """
+        self._get_cache().put(cache_key, result)
     
     def get_node_source(self, node: ast.AST, content: str) -> str:
         """Get source code for an AST node.
@@ -270,7 +635,7 @@ class BaseAnalyzer(ABC):
         """Generate a report of analysis results.
         
         Args:
-            format: The format of the report ('text', 'json', or 'html')
+            format: The format of the report ('text', 'json', 'jsonl', or 'html')
             
         Returns:
             The report as a string
@@ -278,13 +643,36 @@ class BaseAnalyzer(ABC):
         if not self.results:
             return f"No analysis results available for {self.name}"
         
+        return render(self.write_report, format)
+    
+    def write_report(self, stream: TextIO, format: str = 'text') -> None:
+        """Write a report of analysis results to a stream as it is generated.
+        
+        Args:
+            stream: The text stream to write to
+            format: The format of the report ('text', 'json', 'jsonl', or 'html')
+        """
         if format == 'json':
-            import json
-            return json.dumps(self.results, indent=2)
+            write_json(self.results, stream)
+        elif format == 'jsonl':
+            self._write_jsonl_report(stream)
         elif format == 'html':
-            return self._generate_html_report()
+            self._write_html_report(LineWriter(stream))
         else:
-            return self._generate_text_report()
+            self._write_text_report(LineWriter(stream))
+    
+    def _write_jsonl_report(self, stream: TextIO, results: Optional[Dict[str, Any]] = None) -> None:
+        """Write a JSON Lines report: a summary record, then one record per file result.
+        
+        Args:
+            stream: The text stream to write to
+            results: Results with 'summary' and 'files' (default: this analyzer's results)
+        """
+        results = self.results if results is None else results
+        write_json_line({"type": "analyzer", "analyzer": self.name,
+                         "summary": results.get("summary", {})}, stream)
+        for file_result in results.get("files", []):
+            write_json_line({"type": "file", "analyzer": self.name, "result": file_result}, stream)
     
     def _generate_text_report(self) -> str:
         """Generate a text report of analysis results.
@@ -292,7 +680,15 @@ class BaseAnalyzer(ABC):
         Returns:
             The report as a string
         """
-        report = [f"===== {self.name} ====="]
+        return render(self.write_report, 'text')
+    
+    def _write_text_report(self, report: List[str]) -> None:
+        """Write a text report of analysis results.
+        
+        Args:
+            report: The report lines to add to (a list or a LineWriter)
+        """
+        report.append(f"===== {self.name} =====")
         report.append(f"Description: {self.description}")
         report.append("")
         
@@ -303,8 +699,6 @@ class BaseAnalyzer(ABC):
         
         # Let subclasses add to the report
         self._add_to_text_report(report)
-        
-        return "\n".join(report)
     
     def _add_to_text_report(self, report: List[str]) -> None:
         """Add analyzer-specific information to the text report.
@@ -329,8 +723,16 @@ class BaseAnalyzer(ABC):
         Returns:
             The report as an HTML string
         """
+        return render(self.write_report, 'html')
+    
+    def _write_html_report(self, html: List[str]) -> None:
+        """Write an HTML report of analysis results.
+        
+        Args:
+            html: The HTML lines to add to (a list or a LineWriter)
+        """
         # Basic HTML report
-        html = [
+        html.extend([
             "<!DOCTYPE html>",
             "<html>",
             "<head>",
@@ -356,7 +758,7 @@ class BaseAnalyzer(ABC):
             f"<p>{self.description}</p>",
             "<div class='summary'>",
             "<h2>Summary</h2>"
-        ]
+        ])
         
         summary = self.results.get("summary", {})
         html.append(f"<p>Files analyzed: {summary.get('analyzed_count', 0)}</p>")
@@ -374,8 +776,6 @@ class BaseAnalyzer(ABC):
             "</body>",
             "</html>"
         ])
-        
-        return "\n".join(html)
     
     def _add_to_html_summary(self, html: List[str]) -> None:
         """Add analyzer-specific information to the HTML summary.
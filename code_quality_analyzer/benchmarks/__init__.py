@@ -0,0 +1,9 @@
+"""Benchmarks for the Code Quality Analyzer.
+
+Run with ``python -m code_quality_analyzer.benchmarks --help``.
+"""
+
+from .synthetic_repo import generate_synthetic_repo, PRESETS
+from .analyzer_benchmark import run_benchmark, compare_results, measure
+
+__all__ = ['generate_synthetic_repo', 'PRESETS', 'run_benchmark', 'compare_results', 'measure']
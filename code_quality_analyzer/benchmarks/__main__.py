@@ -0,0 +1,8 @@
+"""Command-line entry point for the Code Quality Analyzer benchmarks."""
+
+import sys
+
+from .analyzer_benchmark import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""Benchmark harness for the code quality analyzers.
+
+Generates a synthetic tree (see synthetic_repo), then times the parse,
+analyze and report phases of each analyzer and of the unified pipeline,
+recording the best and median wall time over several runs and the peak
+Python memory of a separate run traced with tracemalloc. Results are
+stored as JSON so runs on different commits can be compared:
+
+    python -m code_quality_analyzer.benchmarks --preset medium --output before.json
+    python -m code_quality_analyzer.benchmarks --preset medium --compare before.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..base_analyzer import BaseAnalyzer
+from ..unified_analyzer import UnifiedAnalyzer
+from .synthetic_repo import PRESETS, generate_synthetic_repo
+
+# Report formats timed for each analyzer and the unified pipeline
+REPORT_FORMATS = ['text', 'html', 'json', 'jsonl']
+
+# Default slowdown ratio reported as a regression by --compare
+DEFAULT_THRESHOLD = 1.2
+
+# Measurements faster than this (seconds) are too noisy to flag as time regressions
+MIN_COMPARED_SECONDS = 0.001
+
+class _CountingStream:
+    """Text stream that discards what is written, counting the characters."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        self.size += len(text)
+        return len(text)
+
+def measure(run: Callable[[], Any], repeat: int, memory: bool = True) -> Dict[str, Any]:
+    """Time a callable and measure its peak memory.
+
+    Timing runs are not traced, since tracemalloc slows allocation-heavy
+    code considerably; peak memory comes from one extra traced run.
+
+    Args:
+        run: The callable to measure; it must do the same work on every call
+        repeat: Number of timed runs
+        memory: Whether to measure peak memory (None is recorded otherwise)
+
+    Returns:
+        Best and median wall time in seconds and peak traced memory in bytes
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "peak_memory_bytes": peak,
+    }
+
+def _load_sources(python_files: List[str]) -> List[Tuple[str, str, Any]]:
+    """Read and parse files.
+
+    Args:
+        python_files: Paths of the files
+
+    Returns:
+        (file_path, content, tree) for each file that parsed
+    """
+    sources = []
+    for file_path in python_files:
+        content, tree, error = BaseAnalyzer.load_source(file_path)
+        if error is None:
+            sources.append((file_path, content, tree))
+    return sources
+
+def _analyze_parsed(analyzer: BaseAnalyzer, sources: List[Tuple[str, str, Any]]) -> None:
+    """Run an analyzer's map and reduce phases on already parsed files.
+
+    Args:
+        analyzer: A fresh analyzer
+        sources: (file_path, content, tree) for each file
+    """
+    file_results = [analyzer.reduce_file(analyzer.map_source(file_path, content, tree))
+                    for file_path, content, tree in sources]
+    analyzer.collect_results(file_results)
+
+def _measure_reports(analyzer: Any, repeat: int, memory: bool) -> Dict[str, Dict[str, Any]]:
+    """Measure writing an analyzer's report in each format.
+
+    Args:
+        analyzer: An analyzer holding results
+        repeat: Number of timed runs
+        memory: Whether to measure peak memory
+
+    Returns:
+        Measurements by format, including the report size in characters
+    """
+    reports = {}
+    for format in REPORT_FORMATS:
+        def write_report(format=format):
+            stream = _CountingStream()
+            analyzer.write_report(stream, format)
+            return stream.size
+
+        reports[format] = measure(write_report, repeat, memory)
+        reports[format]["characters"] = write_report()
+    return reports
+
+def run_benchmark(directory_path: str, repeat: int = 3, enabled_analyzers: Optional[List[str]] = None,
+                  parallel: bool = False, memory: bool = True) -> Dict[str, Any]:
+    """Benchmark the analyzers on a tree.
+
+    Args:
+        directory_path: Path to the tree to analyze
+        repeat: Number of timed runs per measurement
+        enabled_analyzers: Analyzers to benchmark (default: all)
+        parallel: Whether to also benchmark the parallel unified pipeline
+        memory: Whether to measure peak memory
+
+    Returns:
+        Measurements for the 'parse' phase, each analyzer and the unified pipeline
+    """
+    config = {'enabled_analyzers': enabled_analyzers} if enabled_analyzers else {}
+    python_files = BaseAnalyzer._get_python_files(directory_path)
+    results: Dict[str, Any] = {"files": len(python_files)}
+
+    # Read and parse phase, shared by all analyzers
+    results["parse"] = measure(lambda: _load_sources(python_files), repeat, memory)
+    sources = _load_sources(python_files)
+
+    # Analyze and report phases of each analyzer, on already parsed files
+    results["analyzers"] = {}
+    for prototype in UnifiedAnalyzer(config).analyzers:
+        def make_analyzer(prototype=prototype):
+            return type(prototype)(prototype.config)
+
+        analyzer = make_analyzer()
+        _analyze_parsed(analyzer, sources)
+        results["analyzers"][analyzer.name] = {
+            "analyze": measure(lambda: _analyze_parsed(make_analyzer(), sources), repeat, memory),
+            "report": _measure_reports(analyzer, repeat, memory),
+        }
+
+    # The unified pipeline end to end (reading and parsing included)
+    unified = UnifiedAnalyzer(config)
+    unified.analyze_directory(directory_path)
+    results["unified"] = {
+        "analyze": measure(lambda: UnifiedAnalyzer(config).analyze_directory(directory_path), repeat, memory),
+        "report": _measure_reports(unified, repeat, memory),
+    }
+    if parallel:
+        results["unified"]["analyze_parallel"] = measure(
+            lambda: UnifiedAnalyzer(config).analyze_directory(directory_path, parallel=True), repeat, memory)
+
+    return results
+
+def _git_commit() -> Optional[str]:
+    """Get the current git commit of the analyzer sources.
+
+    Returns:
+        The commit hash (suffixed with '-dirty' for uncommitted changes), or None
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=directory,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--', '..'], cwd=directory,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status else commit
+
+def flatten_measurements(results: Dict[str, Any], prefix: str = "") -> Dict[str, Dict[str, Any]]:
+    """Flatten benchmark results into measurements keyed by a path.
+
+    Args:
+        results: Benchmark results (or a part of them)
+        prefix: Path of the results
+
+    Returns:
+        Measurements keyed by paths such as 'analyzers/DRY Analyzer/analyze'
+    """
+    flat = {}
+    for key, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        path = f"{prefix}/{key}" if prefix else key
+        if "seconds" in value:
+            flat[path] = value
+        else:
+            flat.update(flatten_measurements(value, path))
+    return flat
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> Tuple[List[str], List[str]]:
+    """Compare two benchmark runs.
+
+    Args:
+        baseline: The earlier benchmark output
+        current: The new benchmark output
+        threshold: Time or memory ratio above which a measurement counts as a regression
+
+    Returns:
+        The comparison table lines and the paths of regressed measurements
+    """
+    old = flatten_measurements(baseline["results"])
+    new = flatten_measurements(current["results"])
+
+    lines = [f"{'Measurement':<70} {'Before':>10} {'After':>10} {'Time':>7} {'Memory':>7}"]
+    regressions = []
+    for path in sorted(set(old) & set(new)):
+        before, after = old[path], new[path]
+        time_ratio = after["seconds"] / before["seconds"] if before["seconds"] else 1.0
+        memory_ratio = (after["peak_memory_bytes"] / before["peak_memory_bytes"]
+                        if before["peak_memory_bytes"] and after["peak_memory_bytes"] is not None else 1.0)
+        flag = ""
+        if (time_ratio > threshold and before["seconds"] >= MIN_COMPARED_SECONDS) or memory_ratio > threshold:
+            regressions.append(path)
+            flag = "  REGRESSION"
+        lines.append(f"{path:<70} {before['seconds']:>9.4f}s {after['seconds']:>9.4f}s "
+                     f"{time_ratio:>6.2f}x {memory_ratio:>6.2f}x{flag}")
+
+    if baseline["metadata"].get("repo") != current["metadata"].get("repo"):
+        lines.append("Warning: the runs used different synthetic trees")
+
+    return lines, regressions
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Code Quality Analyzer benchmarks')
+
+    parser.add_argument('--preset', choices=list(PRESETS), default='small',
+                        help='Size of the synthetic tree (default: small)')
+
+    parser.add_argument('--files', type=int,
+                        help='Number of modules (overrides the preset)')
+
+    parser.add_argument('--classes-per-file', type=int,
+                        help='Number of classes per module (overrides the preset)')
+
+    parser.add_argument('--methods-per-class', type=int,
+                        help='Number of methods per class (overrides the preset)')
+
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1,
+                        help='Fraction of methods with a duplicated body (default: 0.1)')
+
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed for the synthetic tree (default: 0)')
+
+    parser.add_argument('--path',
+                        help='Benchmark an existing tree instead of a synthetic one')
+
+    parser.add_argument('--analyzers', nargs='+',
+                        choices=['srp', 'ocp', 'lsp', 'isp', 'dip', 'kiss', 'dry'],
+                        help='Analyzers to benchmark (default: all)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of timed runs per measurement (default: 3)')
+
+    parser.add_argument('--parallel', action='store_true',
+                        help='Also benchmark the parallel unified pipeline')
+
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the (slow) traced runs that measure peak memory')
+
+    parser.add_argument('--output', '-o',
+                        help='Write the results as JSON to this file')
+
+    parser.add_argument('--compare',
+                        help='Compare against the JSON results of an earlier run')
+
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Ratio counted as a regression by --compare (default: {DEFAULT_THRESHOLD})')
+
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv)
+
+    Returns:
+        Exit status: 1 if --compare found a regression, 0 otherwise
+    """
+    args = parse_args(argv)
+
+    tree_directory = None
+    if args.path:
+        directory_path = args.path
+        repo = {"path": os.path.abspath(args.path)}
+    else:
+        params = dict(PRESETS[args.preset])
+        for option in ('files', 'classes_per_file', 'methods_per_class'):
+            if getattr(args, option) is not None:
+                params[option] = getattr(args, option)
+        tree_directory = tempfile.mkdtemp(prefix='cqa_benchmark_')
+        directory_path = tree_directory
+        repo = generate_synthetic_repo(directory_path, duplicate_ratio=args.duplicate_ratio,
+                                       seed=args.seed, **params)
+
+    try:
+        results = run_benchmark(directory_path, args.repeat, args.analyzers, args.parallel, not args.no_memory)
+    finally:
+        if tree_directory:
+            shutil.rmtree(tree_directory, ignore_errors=True)
+
+    output = {
+        "metadata": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "repo": repo,
+        },
+        "results": results,
+    }
+
+    for path, measurement in flatten_measurements(results).items():
+        peak = measurement['peak_memory_bytes']
+        memory = f"{peak / 1e6:>9.1f} MB" if peak is not None else ""
+        print(f"{path:<70} {measurement['seconds']:>9.4f}s {memory}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressions = compare_results(baseline, output, args.threshold)
+        print()
+        print("\n".join(lines))
+        if regressions:
+            print(f"{len(regressions)} measurements regressed by more than {args.threshold:.2f}x")
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
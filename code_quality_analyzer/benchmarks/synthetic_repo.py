@@ -0,0 +1,180 @@
+"""Synthetic Python trees for benchmarking the analyzers.
+
+The generated code exercises every analyzer: classes with several
+responsibilities (SRP), type switches (OCP), overriding subclasses (LSP),
+wide interfaces (ISP), concrete dependencies (DIP), nested control flow
+(KISS), and repeated strings, constants and method bodies (DRY). Generation
+is deterministic for a given seed.
+"""
+
+import os
+import random
+from typing import Any, Dict
+
+# Method bodies of increasing complexity; {n} is replaced with a per-method number
+_METHOD_TEMPLATES = [
+    """        return self.{attr} + {n}
+""",
+    """        total = 0
+        for item in self.{attr}:
+            if item > {n}:
+                total += item
+            else:
+                total -= 1
+        return total
+""",
+    """        result = []
+        for index, value in enumerate(self.{attr}):
+            if value is None:
+                continue
+            if index % 2 == 0:
+                for other in range(value):
+                    if other > {n} and other % 3 == 0:
+                        result.append(other)
+                    elif other < 0 or other > 1000:
+                        raise ValueError("value out of range for processing step")
+            else:
+                result.append(value * {n})
+        return result
+""",
+    """        if self.kind == "alpha":
+            return self.{attr} * {n}
+        elif self.kind == "beta":
+            return self.{attr} + {n}
+        elif self.kind == "gamma":
+            return self.{attr} - {n}
+        return None
+""",
+    """        with open("data_{n}.txt", "w") as handle:
+            handle.write(str(self.{attr}))
+        print("Saved data to the configured output location")
+        return True
+""",
+]
+
+# Shared method body copied between files to create duplicate code blocks
+_DUPLICATE_TEMPLATE = """        normalized = []
+        for entry in self.{attr}:
+            if entry is None:
+                continue
+            cleaned = str(entry).strip().lower()
+            if cleaned and cleaned not in normalized:
+                normalized.append(cleaned)
+        threshold = len(normalized) * 0.75
+        return [value for value in normalized if len(value) > threshold]
+"""
+
+def generate_module(rng: random.Random, module_index: int, classes_per_file: int,
+                    methods_per_class: int, duplicate_ratio: float) -> str:
+    """Generate the source of one synthetic module.
+
+    Args:
+        rng: Random number generator
+        module_index: Index of the module, used to make names unique
+        classes_per_file: Number of classes in the module
+        methods_per_class: Number of methods per class
+        duplicate_ratio: Fraction of methods that share an identical body
+
+    Returns:
+        The module source
+    """
+    lines = [
+        f'"""Synthetic module {module_index}."""',
+        "",
+        "import os",
+        "from abc import ABC, abstractmethod",
+        "",
+        "DEFAULT_TIMEOUT = 3600",
+        "",
+        "",
+        f"class BaseHandler{module_index}(ABC):",
+        '    """Abstract handler."""',
+        "",
+    ]
+    for method in range(methods_per_class):
+        lines.extend(["    @abstractmethod", f"    def step_{method}(self):", "        pass", ""])
+
+    for class_index in range(classes_per_file):
+        base = f"BaseHandler{module_index}" if class_index % 2 == 0 else "object"
+        lines.extend([
+            "",
+            f"class Handler{module_index}_{class_index}({base}):",
+            f'    """Synthetic handler {class_index}."""',
+            "",
+            "    def __init__(self, items, kind):",
+            "        self.items = items",
+            "        self.kind = kind",
+            "        self.store = FileStore()",
+            "        self.timeout = 3600",
+            "",
+        ])
+        for method in range(methods_per_class):
+            lines.append(f"    def step_{method}(self):")
+            if rng.random() < duplicate_ratio:
+                body = _DUPLICATE_TEMPLATE
+            else:
+                body = rng.choice(_METHOD_TEMPLATES)
+            lines.append(body.format(attr="items", n=rng.randint(1, 99)).rstrip("\n"))
+            lines.append("")
+
+    lines.extend([
+        "",
+        "class FileStore:",
+        '    """Concrete dependency."""',
+        "",
+        "    def save(self, path):",
+        "        return os.path.exists(path)",
+        "",
+    ])
+    return "\n".join(lines)
+
+def generate_synthetic_repo(path: str, files: int = 100, classes_per_file: int = 5,
+                            methods_per_class: int = 5, duplicate_ratio: float = 0.1,
+                            files_per_package: int = 20, seed: int = 0) -> Dict[str, Any]:
+    """Generate a synthetic Python tree.
+
+    Args:
+        path: Directory to create the tree in
+        files: Number of modules
+        classes_per_file: Number of classes per module
+        methods_per_class: Number of methods per class
+        duplicate_ratio: Fraction of methods that share an identical body
+        files_per_package: Number of modules per package directory
+        seed: Random seed
+
+    Returns:
+        The generation parameters, plus the total number of lines and bytes
+    """
+    rng = random.Random(seed)
+    total_lines = 0
+    total_bytes = 0
+
+    for module_index in range(files):
+        package = os.path.join(path, f"package_{module_index // files_per_package}")
+        if not os.path.isdir(package):
+            os.makedirs(package)
+            with open(os.path.join(package, "__init__.py"), "w", encoding="utf-8") as f:
+                f.write("")
+
+        source = generate_module(rng, module_index, classes_per_file, methods_per_class, duplicate_ratio)
+        with open(os.path.join(package, f"module_{module_index}.py"), "w", encoding="utf-8") as f:
+            f.write(source)
+        total_lines += source.count("\n") + 1
+        total_bytes += len(source.encode("utf-8"))
+
+    return {
+        "files": files,
+        "classes_per_file": classes_per_file,
+        "methods_per_class": methods_per_class,
+        "duplicate_ratio": duplicate_ratio,
+        "seed": seed,
+        "total_lines": total_lines,
+        "total_bytes": total_bytes,
+    }
+
+# Named tree sizes for the benchmark command line
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "small": {"files": 20, "classes_per_file": 3, "methods_per_class": 4},
+    "medium": {"files": 200, "classes_per_file": 5, "methods_per_class": 5},
+    "large": {"files": 1000, "classes_per_file": 8, "methods_per_class": 6},
+}
@@ -0,0 +1,243 @@
+"""Incremental analysis support.
+
+This module finds the files an incremental run should focus on: the files
+changed since a git revision (or listed explicitly, e.g. from
+``git diff --name-only``) and the files that depend on them through imports.
+Unchanged files are served from the analysis cache, so only the changed
+files are parsed and analyzed again; the content read for the import scan
+is reused for the cache lookup, and the content hash of files git reports
+unchanged is taken from the cache instead of being recomputed.
+"""
+
+import os
+import re
+import sys
+import logging
+import subprocess
+from typing import Callable, Iterable, List, Optional, Set
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# Import statements, found without parsing the file
+_FROM_IMPORT_RE = re.compile(r'^[ \t]*from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+(\([^)]*\)|[^\n#;]+)', re.MULTILINE)
+_IMPORT_RE = re.compile(r'^[ \t]*import[ \t]+([^\n#;]+)', re.MULTILINE)
+
+def git_toplevel(path: str) -> Optional[str]:
+    """Get the root of the git work tree containing a path.
+
+    Args:
+        path: A file or directory inside the work tree
+
+    Returns:
+        The work tree root, or None if the path is not in a git repository
+    """
+    directory = path if os.path.isdir(path) else os.path.dirname(os.path.abspath(path))
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--show-toplevel'], cwd=directory,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip() or None
+
+def git_changed_files(base_rev: str, path: str) -> List[str]:
+    """Get the files changed since a revision, including untracked files.
+
+    Args:
+        base_rev: The revision to compare the work tree against
+        path: A file or directory inside the work tree
+
+    Returns:
+        Absolute paths of changed files (deleted files included)
+
+    Raises:
+        ValueError: If the path is not in a git repository or the revision is unknown
+    """
+    root = git_toplevel(path)
+    if root is None:
+        raise ValueError(f"Not a git repository: {path}")
+
+    commands = [['git', 'diff', '--name-only', base_rev, '--'],
+                ['git', 'ls-files', '--others', '--exclude-standard']]
+    names = []
+    for command in commands:
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"git {command[1]} failed: {result.stderr.strip()}")
+        names.extend(result.stdout.splitlines())
+
+    return resolve_paths(names, root)
+
+def read_file_list(list_path: str, path: str) -> List[str]:
+    """Read a list of changed files, one per line ('-' reads standard input).
+
+    Relative paths are resolved against the current directory, or against the
+    git work tree root for paths that do not exist there (as printed by
+    ``git diff --name-only``).
+
+    Args:
+        list_path: Path to the file list, or '-'
+        path: A file or directory inside the work tree
+
+    Returns:
+        Absolute paths of the listed files
+    """
+    if list_path == '-':
+        names = sys.stdin.read().splitlines()
+    else:
+        with open(list_path, 'r', encoding='utf-8') as f:
+            names = f.read().splitlines()
+
+    names = [name.strip() for name in names if name.strip()]
+    root = git_toplevel(path)
+    paths = []
+    for name in names:
+        if root and not os.path.isabs(name) and not os.path.exists(name):
+            name = os.path.join(root, name)
+        paths.append(os.path.abspath(name))
+    return paths
+
+def resolve_paths(names: Iterable[str], root: str) -> List[str]:
+    """Resolve paths relative to a root directory, dropping duplicates.
+
+    Args:
+        names: Relative or absolute paths
+        root: Directory that relative paths are relative to
+
+    Returns:
+        Absolute paths, in order of first appearance
+    """
+    paths = []
+    seen = set()
+    for name in names:
+        path = os.path.abspath(os.path.join(root, name))
+        if path not in seen:
+            seen.add(path)
+            paths.append(path)
+    return paths
+
+def module_name(file_path: str, root: str) -> str:
+    """Get the dotted module name of a file relative to a root directory.
+
+    Args:
+        file_path: Path to the Python file
+        root: Directory that module names are relative to
+
+    Returns:
+        The module name (packages are named after their directory)
+    """
+    relative = os.path.splitext(os.path.relpath(file_path, root))[0]
+    parts = [part for part in relative.split(os.sep) if part not in ('', '.')]
+    if parts and parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+def imported_modules(content: str, module: str, is_package: bool = False) -> Set[str]:
+    """Get the modules a file may import.
+
+    ``from package import name`` yields both the package and
+    ``package.name``, since the name may be a submodule. Relative imports are
+    resolved against the importing module.
+
+    Args:
+        content: Content of the file
+        module: Dotted name of the importing module
+        is_package: Whether the file is a package's __init__.py
+
+    Returns:
+        Dotted names of the imported modules
+    """
+    imports = set()
+    package = module.split('.') if is_package else module.split('.')[:-1]
+
+    for match in _IMPORT_RE.finditer(content):
+        for name in match.group(1).split(','):
+            name = name.split(' as ')[0].strip()
+            if name:
+                imports.add(name)
+
+    for match in _FROM_IMPORT_RE.finditer(content):
+        target = match.group(1)
+        level = len(target) - len(target.lstrip('.'))
+        target = target[level:]
+        if level:
+            base = package[:len(package) - level + 1] if level <= len(package) + 1 else []
+            target = '.'.join(base + ([target] if target else []))
+        if target:
+            imports.add(target)
+
+        for name in match.group(2).strip('()').split(','):
+            name = name.split(' as ')[0].strip()
+            if name and name != '*':
+                imports.add(f"{target}.{name}" if target else name)
+
+    return imports
+
+def _matches(imported: str, module: str) -> bool:
+    """Check whether an imported name may refer to a module.
+
+    Names match when one is a dotted suffix of the other, since the analyzed
+    directory need not be the import root.
+
+    Args:
+        imported: Dotted name from an import statement
+        module: Dotted module name relative to the analyzed directory
+
+    Returns:
+        True if the import may refer to the module
+    """
+    return (imported == module or imported.endswith('.' + module)
+            or module.endswith('.' + imported))
+
+def _read_text(file_path: str) -> Optional[str]:
+    """Read a file for the import scan.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        The content, or None if the file cannot be read
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Could not read {file_path} for import scan: {str(e)}")
+        return None
+
+def find_dependents(changed_files: Iterable[str], python_files: Iterable[str], root: str,
+                    read: Optional[Callable[[str], Optional[str]]] = None) -> List[str]:
+    """Find the files that import any of the changed files.
+
+    Args:
+        changed_files: Absolute paths of the changed files (deleted files included)
+        python_files: Python files to search for dependents
+        root: Directory that module names are relative to
+        read: Reads a file, returning None if it cannot be read (lets the
+              caller keep the content for the analysis that follows)
+
+    Returns:
+        Paths of the dependent files, excluding the changed files themselves
+    """
+    changed = {os.path.abspath(path) for path in changed_files}
+    changed_modules = {module_name(path, root) for path in changed if path.endswith('.py')}
+    changed_modules.discard('')
+    if not changed_modules:
+        return []
+
+    dependents = []
+    for file_path in python_files:
+        if os.path.abspath(file_path) in changed:
+            continue
+        content = (read or _read_text)(file_path)
+        if content is None:
+            continue
+
+        module = module_name(file_path, root)
+        is_package = os.path.basename(file_path) == '__init__.py'
+        imports = imported_modules(content, module, is_package)
+        if any(_matches(imported, changed_module) for imported in imports for changed_module in changed_modules):
+            dependents.append(file_path)
+
+    return dependents
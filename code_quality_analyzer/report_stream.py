@@ -0,0 +1,177 @@
+"""Streaming report output.
+
+Reports are written to a text stream as they are generated rather than
+built up as one string. The JSON Lines format writes one record per file
+result, and JsonLinesReport reads such a report back page by page without
+loading it whole.
+"""
+
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+class LineWriter:
+    """List-like sink that writes report lines straight to a stream.
+
+    Report builders only ever ``append`` and ``extend`` their line lists, so
+    a LineWriter can take the place of the list. Lines are separated by
+    newlines exactly as ``"\\n".join(lines)`` would separate them.
+
+    Attributes:
+        stream: The text stream to write to
+    """
+
+    def __init__(self, stream: TextIO):
+        """Initialize a new LineWriter.
+
+        Args:
+            stream: The text stream to write to
+        """
+        self.stream = stream
+        self._started = False
+
+    def append(self, line: str) -> None:
+        """Write a line.
+
+        Args:
+            line: The line to write
+        """
+        if self._started:
+            self.stream.write("\n")
+        self._started = True
+        self.stream.write(line)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """Write several lines.
+
+        Args:
+            lines: The lines to write
+        """
+        for line in lines:
+            self.append(line)
+
+def render(write_report: Any, *args: Any) -> str:
+    """Run a streaming report writer into a string.
+
+    Args:
+        write_report: Callable taking a stream and any further arguments
+        *args: Further arguments for write_report
+
+    Returns:
+        Everything written to the stream
+    """
+    buffer = io.StringIO()
+    write_report(buffer, *args)
+    return buffer.getvalue()
+
+def write_json(data: Any, stream: TextIO) -> None:
+    """Write data as indented JSON, chunk by chunk.
+
+    The output is identical to ``json.dumps(data, indent=2)`` but the
+    document is never held in memory as a whole.
+
+    Args:
+        data: The data to write
+        stream: The text stream to write to
+    """
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        stream.write(chunk)
+
+def write_json_line(record: Dict[str, Any], stream: TextIO) -> None:
+    """Write one JSON Lines record.
+
+    Args:
+        record: The record to write
+        stream: The text stream to write to
+    """
+    stream.write(json.dumps(record, separators=(',', ':')))
+    stream.write("\n")
+
+# How write_json_line starts a file result record ("type" is always its first key)
+FILE_RECORD_PREFIX = b'{"type":"file",'
+
+class JsonLinesReport:
+    """Lazily loaded JSON Lines report.
+
+    Opening a report only indexes the byte offset of each file result (and
+    keeps the small summary records); file results are recognized by their
+    prefix without being parsed, and are read from disk and parsed a page at
+    a time when asked for, so large reports open quickly.
+
+    Attributes:
+        path: Path to the report
+        summaries: Records other than file results, in order
+    """
+
+    def __init__(self, path: str):
+        """Open a report and index its records.
+
+        Args:
+            path: Path to the report
+        """
+        self.path = path
+        self.summaries: List[Dict[str, Any]] = []
+        self._file_offsets: List[int] = []
+
+        with open(path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.startswith(FILE_RECORD_PREFIX):
+                    self._file_offsets.append(offset)
+                elif line.strip():
+                    # Summary records are small; records from other writers are checked after parsing
+                    record = json.loads(line)
+                    if record.get("type") == "file":
+                        self._file_offsets.append(offset)
+                    else:
+                        self.summaries.append(record)
+                offset += len(line)
+
+    def __len__(self) -> int:
+        """Get the number of file results in the report."""
+        return len(self._file_offsets)
+
+    def labels(self, start: int = 0, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the analyzer and file path of a page of file results.
+
+        The page is read from disk and parsed; nothing is kept afterwards.
+
+        Args:
+            start: Index of the first file result
+            count: Number of file results (default: all remaining)
+
+        Returns:
+            Dictionaries with 'analyzer' and 'file_path'
+        """
+        return [{"analyzer": record.get("analyzer"),
+                 "file_path": record.get("result", {}).get("file_path", "Unknown")}
+                for record in self.file_results(start, count)]
+
+    def file_result(self, index: int) -> Dict[str, Any]:
+        """Read one file result from disk.
+
+        Args:
+            index: Index of the file result
+
+        Returns:
+            The file result record
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self._file_offsets[index])
+            return json.loads(f.readline())
+
+    def file_results(self, start: int = 0, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Read a page of file results from disk.
+
+        Args:
+            start: Index of the first file result
+            count: Number of file results (default: all remaining)
+
+        Yields:
+            File result records
+        """
+        end = len(self) if count is None else start + count
+        with open(self.path, 'rb') as f:
+            for offset in self._file_offsets[start:end]:
+                f.seek(offset)
+                yield json.loads(f.readline())
@@ -1,14 +1,24 @@
 """Tests for the Code Quality Analyzer."""
 
 import os
+import time
+import ast
 import sys
+import json
 import unittest
 import tempfile
+import shutil
+from collections import defaultdict
+from unittest import mock
 
 # Add the parent directory to the path so we can import the package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from code_quality_analyzer import SRPAnalyzer, KISSAnalyzer, DRYAnalyzer, UnifiedAnalyzer
+from code_quality_analyzer import (SRPAnalyzer, KISSAnalyzer, DRYAnalyzer, UnifiedAnalyzer, FusedNodeVisitor,
+                                   AnalysisCache, BaseAnalyzer)
+from code_quality_analyzer.analysis_cache import content_hash
+from code_quality_analyzer.report_stream import JsonLinesReport
+from code_quality_analyzer.benchmarks import generate_synthetic_repo, run_benchmark, compare_results
 
 class TestAnalyzers(unittest.TestCase):
     """Tests for the Code Quality Analyzer."""
@@ -107,14 +117,76 @@ def validate_user(user):
     
     def test_dry_analyzer(self):
         """Test the DRY analyzer."""
+        duplicated = """
+    with open(path) as handle:
+        rows = [line.strip().split(",") for line in handle if line.strip()]
+    users = []
+    for row in rows:
+        users.append({"name": row[0], "email": row[1], "age": int(row[2])})
+"""
+        with open(self.temp_file.name, 'a') as f:
+            f.write("\ndef load_users(path):" + duplicated + "    return users\n")
+            f.write("\ndef load_admins(path):" + duplicated + "    return [u for u in users if u['age'] > 30]\n")
+        
         analyzer = DRYAnalyzer()
         result = analyzer.analyze_file(self.temp_file.name)
         
         # Check that the file was analyzed
         self.assertEqual(result['file_path'], self.temp_file.name)
         
-        # Check for duplicate code
-        self.assertGreaterEqual(len(result['duplicate_code_blocks']), 1)
+        # Check for duplicate code: one maximal clone, not one per overlapping window
+        self.assertEqual(len(result['duplicate_code_blocks']), 1)
+        block = result['duplicate_code_blocks'][0]
+        self.assertEqual(block['occurrences'], 2)
+        self.assertIn('users.append', block['code'])
+        first, second = block['locations']
+        self.assertEqual(second['start_line'] - first['start_line'], 8)
+    
+    def test_dry_analyzer_finds_duplicates_across_files(self):
+        """Test that the DRY analyzer reports clones of previously analyzed files."""
+        directory = tempfile.mkdtemp()
+        try:
+            body = "".join(f"    total += values[{i}] * weights[{i}]\n" for i in range(6))
+            for name in ('a.py', 'b.py'):
+                with open(os.path.join(directory, name), 'w') as f:
+                    f.write(f"def score_{name[0]}(values, weights):\n    total = 0\n{body}    return total\n")
+            
+            result = DRYAnalyzer().analyze_directory(directory)
+            
+            blocks = [b for r in result['files'] for b in r['duplicate_code_blocks']]
+            self.assertEqual(len(blocks), 1)
+            self.assertEqual({os.path.basename(l['file_path']) for l in blocks[0]['locations']}, {'a.py', 'b.py'})
+            self.assertEqual(result['summary']['duplicate_blocks_count'], 1)
+        finally:
+            shutil.rmtree(directory)
+    
+    def test_dry_analyzer_finds_literals_repeated_across_files(self):
+        """Test that a literal used once in each of several files is reported for the files using it."""
+        analyzer = DRYAnalyzer()
+        global_literals = defaultdict(list)
+        self.assertEqual(analyzer._find_repeated_literals('a.py', [("shared", 1), ("only_a", 2)], global_literals, 'string'), [])
+        analyzer._find_repeated_literals('b.py', [("shared", 1), ("other", 2)], global_literals, 'string')
+        repeated = analyzer._find_repeated_literals('c.py', [("shared", 3)], global_literals, 'string')
+        self.assertEqual([(r['string'], r['occurrences']) for r in repeated], [("shared", 3)])
+        self.assertEqual({l['file_path'] for l in repeated[0]['locations']}, {'a.py', 'b.py', 'c.py'})
+    
+    def test_dry_analyzer_repetitive_file_stays_linear(self):
+        """Test that highly repetitive code neither goes quadratic nor floods the report."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write("def accumulate(values):\n    total = 0\n" + "    total += values[0] * 2\n" * 4000 + "    return total\n")
+        
+        start = time.perf_counter()
+        result = DRYAnalyzer().analyze_file(self.temp_file.name)
+        elapsed = time.perf_counter() - start
+        
+        self.assertLess(elapsed, 5.0)
+        blocks = result['duplicate_code_blocks']
+        self.assertGreater(len(blocks), 0)
+        self.assertLessEqual(len(blocks), 20)
+        # Reported clones of the same file never start inside one another (token runs may share a boundary line)
+        spans = sorted((l['start_line'], l['end_line']) for b in blocks for l in b['locations'][-1:])
+        for (_, end), (next_start, _) in zip(spans, spans[1:]):
+            self.assertGreaterEqual(next_start, end)
     
     def test_unified_analyzer(self):
         """Test the unified analyzer."""
@@ -134,5 +206,292 @@ def validate_user(user):
         self.assertGreaterEqual(result['overall_quality_score'], 0.0)
         self.assertLessEqual(result['overall_quality_score'], 1.0)
 
+    def test_fused_visitor_collects_in_walk_order(self):
+        """Test that collected nodes come back in ast.walk order."""
+        with open(self.temp_file.name) as f:
+            tree = ast.parse(f.read())
+        visitor = FusedNodeVisitor()
+        names = visitor.collect(ast.Name)
+        constants = visitor.collect(ast.Constant)
+        visitor.run(tree)
+        
+        self.assertEqual(names, [n for n in ast.walk(tree) if isinstance(n, ast.Name)])
+        self.assertEqual(constants, [n for n in ast.walk(tree) if isinstance(n, ast.Constant)])
+    
+    def test_kiss_fused_metrics_match_per_function_walks(self):
+        """Test that the single-traversal KISS metrics match the per-function calculations."""
+        source = """
+def outer(a, b):
+    if a and b or a:
+        for x in b:
+            with open(x) as f:
+                while f:
+                    if 0 < a < 3:
+                        pass
+                    else:
+                        break
+
+    def inner(c):
+        try:
+            if c and (c or a):
+                return 1
+        except ValueError:
+            pass
+    return inner
+"""
+        tree = ast.parse(source)
+        analyzer = KISSAnalyzer()
+        fused = analyzer._analyze_file_impl('example.py', source, tree)
+        
+        functions = [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+        expected = [analyzer._analyze_method(func, source) for func in functions]
+        self.assertEqual(fused['method_analysis'], expected)
+
+    def test_unified_analyzer_parses_each_file_once(self):
+        """Test that the unified analyzer shares one parse per file across analyzers."""
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ('a.py', 'b.py'):
+                shutil.copy(self.temp_file.name, os.path.join(directory, name))
+            analyzer = UnifiedAnalyzer()
+            
+            with mock.patch('code_quality_analyzer.base_analyzer.ast.parse', wraps=ast.parse) as parse:
+                result = analyzer.analyze_directory(directory)
+            
+            # One parse per file, regardless of the number of analyzers
+            self.assertEqual(parse.call_count, 2)
+            self.assertEqual(len(analyzer.analyzers), 7)
+            for analyzer_result in result['analyzers'].values():
+                self.assertEqual(analyzer_result['summary']['file_count'], 2)
+            
+            # Results match running the analyzer on its own
+            kiss = KISSAnalyzer()
+            expected = kiss.analyze_directory(directory)
+            self.assertEqual(result['analyzers']['KISS Analyzer'], expected)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_parallel_directory_analysis_matches_sequential(self):
+        """Test that parallel runs merge cross-file state like sequential runs."""
+        directory = tempfile.mkdtemp()
+        try:
+            body = "".join(f"    total += values[{i}] * weights[{i}]\n" for i in range(6))
+            for name in ('a.py', 'b.py', 'c.py'):
+                with open(os.path.join(directory, name), 'w') as f:
+                    f.write(f"def score_{name[0]}(values, weights):\n    total = 0\n{body}    return total\n")
+            shutil.copy(self.temp_file.name, os.path.join(directory, 'd.py'))
+            
+            sequential = UnifiedAnalyzer().analyze_directory(directory)
+            parallel = UnifiedAnalyzer().analyze_directory(directory, parallel=True, workers=2, chunk_size=1)
+            
+            self.assertEqual(parallel['overall_quality_score'], sequential['overall_quality_score'])
+            self.assertEqual(parallel['analyzers']['DRY Analyzer'], sequential['analyzers']['DRY Analyzer'])
+            self.assertEqual(parallel['analyzers']['DRY Analyzer']['summary']['duplicate_blocks_count'], 2)
+            
+            dry_parallel = DRYAnalyzer().analyze_directory(directory, parallel=True, workers=2)
+            self.assertEqual(dry_parallel, sequential['analyzers']['DRY Analyzer'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_cache_is_keyed_by_content_and_config(self):
+        """Test that cached results survive touching a file but not content or config changes."""
+        directory = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(directory, 'module.py')
+            shutil.copy(self.temp_file.name, file_path)
+            config = {'use_cache': True, 'cache_dir': os.path.join(directory, 'cache')}
+            
+            def analyze(analyzer_config):
+                analyzer = KISSAnalyzer(analyzer_config)
+                with mock.patch('code_quality_analyzer.base_analyzer.ast.parse', wraps=ast.parse) as parse:
+                    result = analyzer.analyze_file(file_path)
+                return result, parse.call_count
+            
+            first, parses = analyze(config)
+            self.assertEqual(parses, 1)
+            
+            # Touching the file keeps the cached result
+            os.utime(file_path, (0, 0))
+            cached, parses = analyze(config)
+            self.assertEqual(parses, 0)
+            self.assertEqual(cached, first)
+            
+            # A different configuration is analyzed again
+            _, parses = analyze(dict(config, max_method_lines=5))
+            self.assertEqual(parses, 1)
+            
+            # So is changed content
+            with open(file_path, 'a') as f:
+                f.write("\nvalue = 1\n")
+            _, parses = analyze(config)
+            self.assertEqual(parses, 1)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_cache_is_shared_across_paths_and_working_directories(self):
+        """Test that a copy of a file, analyzed from another directory, hits the cache with its own path."""
+        directory = tempfile.mkdtemp()
+        cwd = os.getcwd()
+        try:
+            original = os.path.join(directory, 'module.py')
+            copy = os.path.join(directory, 'sub', 'copy.py')
+            os.makedirs(os.path.dirname(copy))
+            shutil.copy(self.temp_file.name, original)
+            shutil.copy(self.temp_file.name, copy)
+            config = {'use_cache': True, 'cache_dir': os.path.join(directory, 'cache')}
+
+            first = KISSAnalyzer(config).analyze_file(original)
+            os.chdir(os.path.dirname(copy))
+            with mock.patch('code_quality_analyzer.base_analyzer.ast.parse', wraps=ast.parse) as parse:
+                cached = KISSAnalyzer(config).analyze_file(copy)
+            self.assertEqual(parse.call_count, 0)
+            self.assertEqual(cached['file_path'], copy)
+            self.assertNotIn(original, json.dumps(cached))
+            self.assertEqual(json.dumps(cached).replace(copy, original), json.dumps(first))
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(directory)
+
+    def test_cache_evicts_least_recently_used_entries(self):
+        """Test that the cache stays within its size limit."""
+        directory = tempfile.mkdtemp()
+        try:
+            cache = AnalysisCache(os.path.join(directory, AnalysisCache.DATABASE_NAME), max_size=4096)
+            for i in range(10):
+                cache.put(f"key-{i}", "x" * 1000)
+            
+            stats = cache.get_stats()
+            self.assertLessEqual(stats['size'], 4096)
+            self.assertIsNone(cache.get("key-0"))
+            self.assertEqual(cache.get("key-9"), "x" * 1000)
+            cache.close()
+        finally:
+            shutil.rmtree(directory)
+
+    def test_incremental_analysis_reparses_only_changed_files(self):
+        """Test that incremental runs reuse cached results and report dependents."""
+        directory = tempfile.mkdtemp()
+        try:
+            package = os.path.join(directory, 'pkg')
+            os.makedirs(package)
+            open(os.path.join(package, '__init__.py'), 'w').close()
+            shutil.copy(self.temp_file.name, os.path.join(package, 'core.py'))
+            with open(os.path.join(package, 'user.py'), 'w') as f:
+                f.write("from .core import TooManyResponsibilities\n\nclass User(TooManyResponsibilities):\n    pass\n")
+            with open(os.path.join(package, 'other.py'), 'w') as f:
+                f.write("import os\n")
+            config = {'use_cache': True, 'cache_dir': os.path.join(directory, 'cache')}
+            full = UnifiedAnalyzer(config).analyze_directory(package)
+            
+            changed = os.path.join(package, 'core.py')
+            with open(changed, 'a') as f:
+                f.write("\nvalue = 1\n")
+            with mock.patch('code_quality_analyzer.base_analyzer.ast.parse', wraps=ast.parse) as parse:
+                result = UnifiedAnalyzer(config).analyze_changes(package, [changed])
+            
+            # Only the changed file is parsed again; the report still covers every file
+            self.assertEqual(parse.call_count, 1)
+            self.assertEqual(result['analyzers']['SRP Analyzer']['summary']['file_count'],
+                             full['analyzers']['SRP Analyzer']['summary']['file_count'])
+            self.assertEqual(result['incremental']['changed_files'], [changed])
+            self.assertEqual(result['incremental']['dependent_files'], [os.path.join(package, 'user.py')])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_incremental_analysis_reads_once_and_skips_hashing_unchanged_files(self):
+        """Test that incremental runs reuse the import scan's reads and recorded file hashes."""
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ('a.py', 'b.py', 'c.py'):
+                path = os.path.join(directory, name)
+                shutil.copy(self.temp_file.name, path)
+                # Files modified within the last seconds are hashed every run
+                os.utime(path, (time.time() - 60, time.time() - 60))
+            config = {'use_cache': True, 'cache_dir': os.path.join(directory, 'cache')}
+            UnifiedAnalyzer(config).analyze_directory(directory)
+
+            changed = os.path.join(directory, 'a.py')
+            with mock.patch('code_quality_analyzer.unified_analyzer.content_hash', wraps=content_hash) as hash_, \
+                 mock.patch.object(BaseAnalyzer, 'read_source', wraps=BaseAnalyzer.read_source) as read:
+                UnifiedAnalyzer(config).analyze_changes(directory, [changed])
+
+            self.assertEqual(hash_.call_count, 1)
+            self.assertEqual(sorted(os.path.basename(call.args[0]) for call in read.call_args_list),
+                             ['a.py', 'b.py', 'c.py'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_streamed_reports(self):
+        """Test that streamed reports match in-memory reports and JSON Lines reports load lazily."""
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ('a.py', 'b.py'):
+                shutil.copy(self.temp_file.name, os.path.join(directory, name))
+            analyzer = UnifiedAnalyzer()
+            results = analyzer.analyze_directory(directory)
+            
+            for format in ('text', 'html', 'json'):
+                output_path = os.path.join(directory, f'report.{format}')
+                self.assertEqual(analyzer.generate_report(format, output_path), "")
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    self.assertEqual(f.read(), analyzer.generate_report(format))
+            self.assertEqual(analyzer.generate_report('json'), json.dumps(results, indent=2))
+            
+            report_path = os.path.join(directory, 'report.jsonl')
+            analyzer.generate_report('jsonl', report_path)
+            with mock.patch('code_quality_analyzer.report_stream.json.loads', wraps=json.loads) as loads:
+                report = JsonLinesReport(report_path)
+            self.assertEqual(len(report), 2 * len(analyzer.analyzers))
+            # Only the summary records are parsed when the report is opened
+            self.assertEqual(loads.call_count, len(report.summaries))
+            self.assertEqual(report.labels(2, 2), [{'analyzer': r['analyzer'], 'file_path': r['result']['file_path']}
+                                                   for r in report.file_results(2, 2)])
+            self.assertEqual(report.summaries[0]['overall_quality_score'], results['overall_quality_score'])
+            
+            kiss_results = results['analyzers']['KISS Analyzer']['files']
+            kiss_records = [r for r in report.file_results() if r['analyzer'] == 'KISS Analyzer']
+            self.assertEqual([r['result'] for r in kiss_records], kiss_results)
+            self.assertEqual(report.file_result(3), list(report.file_results(3, 1))[0])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_single_file_jsonl_report(self):
+        """Test that a JSON Lines report of a single file has a file record per analyzer."""
+        analyzer = UnifiedAnalyzer()
+        results = analyzer.analyze_file(self.temp_file.name)
+        report_path = self.temp_file.name + '.jsonl'
+        try:
+            analyzer.generate_report('jsonl', report_path)
+            report = JsonLinesReport(report_path)
+            self.assertEqual(len(report), len(analyzer.analyzers))
+            self.assertEqual([r['result'] for r in report.file_results()],
+                             [results['analyzers'][a.name] for a in analyzer.analyzers])
+            self.assertEqual({r['summary']['file_count'] for r in report.summaries if r['type'] == 'analyzer'}, {1})
+        finally:
+            os.unlink(report_path)
+
+    def test_benchmark_on_synthetic_repo(self):
+        """Test that the benchmark harness measures every phase and flags regressions."""
+        directory = tempfile.mkdtemp()
+        try:
+            repo = generate_synthetic_repo(directory, files=3, classes_per_file=2, methods_per_class=3,
+                                           duplicate_ratio=0.5, files_per_package=2)
+            self.assertEqual(repo['files'], 3)
+            self.assertEqual(len(BaseAnalyzer._get_python_files(directory)), 5)  # Plus 2 package __init__.py
+            
+            results = run_benchmark(directory, repeat=1, enabled_analyzers=['kiss', 'dry'])
+            self.assertEqual(set(results['analyzers']), {'KISS Analyzer', 'DRY Analyzer'})
+            self.assertGreater(results['analyzers']['DRY Analyzer']['analyze']['peak_memory_bytes'], 0)
+            self.assertGreater(results['unified']['report']['html']['characters'], 0)
+            
+            results['unified']['analyze']['seconds'] = 1.0
+            slower = json.loads(json.dumps(results))
+            slower['unified']['analyze']['seconds'] = 2.0
+            baseline = {"metadata": {"repo": repo}, "results": results}
+            _, regressions = compare_results(baseline, {"metadata": {"repo": repo}, "results": slower})
+            self.assertIn('unified/analyze', regressions)
+        finally:
+            shutil.rmtree(directory)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for paging results in the Code Quality Dashboard."""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add the repository root to the path so we can import the dashboard
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from code_quality_analyzer.report_stream import write_json_line, JsonLinesReport
+
+try:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    import code_quality_dashboard as dashboard
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+@unittest.skipUnless(PYQT_AVAILABLE, "PyQt5 (with QtChart) not installed")
+class TestDashboardPaging(unittest.TestCase):
+    """Tests for creating details tree items a page at a time."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the application the widgets need."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Create a results viewer with small pages."""
+        patcher = mock.patch.object(dashboard, 'TREE_PAGE_SIZE', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.viewer = dashboard.ResultsViewer()
+        self.tree = self.viewer.details_tree
+
+    def _texts(self, parent=None):
+        if parent is None:
+            return [self.tree.topLevelItem(i).text(0) for i in range(self.tree.topLevelItemCount())]
+        return [parent.child(i).text(0) for i in range(parent.childCount())]
+
+    def test_values_are_added_a_page_at_a_time(self):
+        """Each "Load more" click adds the next page in place of the "Load more" item."""
+        self.viewer._populate_details_tree({f"key{n}": n for n in range(5)})
+        self.assertEqual(self._texts(), ["key0", "key1", "Load more... (3 remaining)"])
+
+        self.viewer._load_more(self.tree.topLevelItem(2))
+        self.assertEqual(self._texts(), ["key0", "key1", "key2", "key3", "Load more... (1 remaining)"])
+
+        self.viewer._load_more(self.tree.topLevelItem(4))
+        self.assertEqual(self._texts(), [f"key{n}" for n in range(5)])
+
+        # Clicking an ordinary item does nothing
+        self.viewer._load_more(self.tree.topLevelItem(0))
+        self.assertEqual(self.tree.topLevelItemCount(), 5)
+
+    def test_report_files_are_read_on_expand(self):
+        """File results of a JSON Lines report are listed a page at a time and read when expanded."""
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'report.jsonl')
+            with open(path, 'w', encoding='utf-8') as f:
+                write_json_line({"type": "analyzer", "analyzer": "KISS Analyzer", "summary": {"file_count": 3}}, f)
+                for name in ('a.py', 'b.py', 'c.py'):
+                    write_json_line({"type": "file", "analyzer": "KISS Analyzer",
+                                     "result": {"file_path": name, "violations": [name]}}, f)
+            report = JsonLinesReport(path)
+
+            with mock.patch.object(report, 'file_result', wraps=report.file_result) as file_result:
+                self.viewer.display_report_file(report)
+                files_item = self.tree.topLevelItem(0)
+                self.assertEqual(self._texts(files_item), ["Loading..."])
+
+                files_item.setExpanded(True)
+                self.assertEqual(self._texts(files_item), ["a.py", "b.py", "Load more... (1 remaining)"])
+                self.viewer._load_more(files_item.child(2))
+                self.assertEqual(self._texts(files_item), ["a.py", "b.py", "c.py"])
+                file_result.assert_not_called()
+
+                files_item.child(1).setExpanded(True)
+                file_result.assert_called_once_with(1)
+                self.assertEqual(self._texts(files_item.child(1)), ["file_path", "violations"])
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,16 @@
 This module provides a unified interface for running multiple code quality analyzers.
 """
 
+import io
 import os
-import json
 import logging
-from typing import Dict, List, Any, Optional, Set
+import contextlib
+from typing import Dict, List, Any, Optional, Set, TextIO, Tuple
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, FusedNodeVisitor, map_files_in_parallel
+from .analysis_cache import CACHE_CONFIG_KEYS, AnalysisCache, content_hash
+from .incremental import find_dependents
+from .report_stream import LineWriter, render, write_json, write_json_line
 
 # SOLID Principle Analyzers
 from .analyzers.srp_analyzer import SRPAnalyzer     # Single Responsibility Principle
@@ -46,6 +50,11 @@ class UnifiedAnalyzer:
         self.analyzers = []
         self.results = {}
 
+        # Set during analyze_changes: files read by the import scan, as (stat, content)
+        # by absolute path, and the files git reports unchanged
+        self._sources: Dict[str, Tuple[Optional[os.stat_result], str]] = {}
+        self._unchanged: Set[str] = set()
+
         # Initialize analyzers
         self._initialize_analyzers()
 
@@ -57,26 +66,39 @@ class UnifiedAnalyzer:
 
         # Initialize SOLID principle analyzers
         if 'srp' in enabled_analyzers:  # Single Responsibility Principle
-            self.analyzers.append(SRPAnalyzer(self.config.get('srp_config')))
+            self.analyzers.append(SRPAnalyzer(self._analyzer_config('srp_config')))
 
         if 'ocp' in enabled_analyzers:  # Open/Closed Principle
-            self.analyzers.append(OCPAnalyzer(self.config.get('ocp_config')))
+            self.analyzers.append(OCPAnalyzer(self._analyzer_config('ocp_config')))
 
         if 'lsp' in enabled_analyzers:  # Liskov Substitution Principle
-            self.analyzers.append(LSPAnalyzer(self.config.get('lsp_config')))
+            self.analyzers.append(LSPAnalyzer(self._analyzer_config('lsp_config')))
 
         if 'isp' in enabled_analyzers:  # Interface Segregation Principle
-            self.analyzers.append(ISPAnalyzer(self.config.get('isp_config')))
+            self.analyzers.append(ISPAnalyzer(self._analyzer_config('isp_config')))
 
         if 'dip' in enabled_analyzers:  # Dependency Inversion Principle
-            self.analyzers.append(DIPAnalyzer(self.config.get('dip_config')))
+            self.analyzers.append(DIPAnalyzer(self._analyzer_config('dip_config')))
 
         # Initialize other code quality analyzers
         if 'kiss' in enabled_analyzers:  # Keep It Simple, Stupid
-            self.analyzers.append(KISSAnalyzer(self.config.get('kiss_config')))
+            self.analyzers.append(KISSAnalyzer(self._analyzer_config('kiss_config')))
 
         if 'dry' in enabled_analyzers:  # Don't Repeat Yourself
-            self.analyzers.append(DRYAnalyzer(self.config.get('dry_config')))
+            self.analyzers.append(DRYAnalyzer(self._analyzer_config('dry_config')))
+
+    def _analyzer_config(self, key: str) -> Dict[str, Any]:
+        """Get an analyzer's configuration, inheriting the top-level cache settings.
+
+        Args:
+            key: Configuration key of the analyzer (e.g. 'srp_config')
+
+        Returns:
+            The analyzer configuration
+        """
+        config = {k: self.config[k] for k in CACHE_CONFIG_KEYS if k in self.config}
+        config.update(self.config.get(key) or {})
+        return config
 
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
         """Analyze a single file with all analyzers.
@@ -89,14 +111,9 @@ class UnifiedAnalyzer:
         """
         results = {
             "file_path": file_path,
-            "analyzers": {}
+            "analyzers": self._analyze_file_with_all(file_path)
         }
 
-        # Run each analyzer
-        for analyzer in self.analyzers:
-            analyzer_result = analyzer.analyze_file(file_path)
-            results["analyzers"][analyzer.name] = analyzer_result
-
         # Calculate overall quality score
         self._calculate_overall_score(results)
 
@@ -105,12 +122,20 @@ class UnifiedAnalyzer:
 
         return results
 
-    def analyze_directory(self, directory_path: str, parallel: bool = False) -> Dict[str, Any]:
+    def analyze_directory(self, directory_path: str, parallel: bool = False, workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None) -> Dict[str, Any]:
         """Analyze all Python files in a directory with all analyzers.
 
+        In parallel mode, worker processes run the map phase (reading, parsing
+        and per-file analysis) and the results are reduced here in file order,
+        so cross-file state such as DRY's clone index is the same as in a
+        sequential run.
+
         Args:
             directory_path: Path to the directory to analyze
             parallel: Whether to use parallel processing
+            workers: Number of worker processes for parallel processing (default: CPU count)
+            chunk_size: Files per worker task for parallel processing
 
         Returns:
             A dictionary containing combined analysis results
@@ -120,10 +145,23 @@ class UnifiedAnalyzer:
             "analyzers": {}
         }
 
-        # Run each analyzer
-        for analyzer in self.analyzers:
-            analyzer_result = analyzer.analyze_directory(directory_path, parallel)
-            results["analyzers"][analyzer.name] = analyzer_result
+        python_files = BaseAnalyzer._get_python_files(directory_path)
+
+        if not python_files:
+            logger.warning(f"No Python files found in {directory_path}")
+            for analyzer in self.analyzers:
+                results["analyzers"][analyzer.name] = {"files": [], "summary": {"file_count": 0}}
+        else:
+            # Walk the files once; each file is read and parsed once for all analyzers
+            if parallel and len(python_files) > 1:
+                partials = map_files_in_parallel(UnifiedAnalyzer, self.config, python_files, workers, chunk_size)
+                per_file_results = [self.reduce_file(partial) for partial in partials]
+            else:
+                per_file_results = [self._analyze_file_with_all(f) for f in python_files]
+
+            for analyzer in self.analyzers:
+                file_results = [file_result[analyzer.name] for file_result in per_file_results]
+                results["analyzers"][analyzer.name] = analyzer.collect_results(file_results)
 
         # Calculate overall quality score
         self._calculate_overall_score(results)
@@ -133,6 +171,201 @@ class UnifiedAnalyzer:
 
         return results
 
+    def analyze_changes(self, directory_path: str, changed_files: List[str], parallel: bool = False,
+                        workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """Analyze a directory incrementally after some of its files changed.
+
+        The report covers the whole directory: with caching enabled, unchanged
+        files are served from the cache and only the changed files are parsed
+        and analyzed again. Cross-file results (DRY clones) are recomputed from
+        the cached scans. The results also list the changed files and their
+        dependents: files importing a changed module and files sharing a
+        duplicate code block with a changed file.
+
+        Args:
+            directory_path: Path to the directory to analyze
+            changed_files: Absolute paths of the changed files (deleted files included)
+            parallel: Whether to use parallel processing
+            workers: Number of worker processes for parallel processing (default: CPU count)
+            chunk_size: Files per worker task for parallel processing
+
+        Returns:
+            A dictionary containing combined analysis results
+        """
+        if not self.config.get('use_cache', False):
+            logger.warning("Incremental analysis without --cache re-analyzes every file")
+
+        python_files = BaseAnalyzer._get_python_files(directory_path)
+        in_directory = {os.path.abspath(f): f for f in python_files}
+        changed = [in_directory[path] for path in map(os.path.abspath, changed_files) if path in in_directory]
+
+        # The content read by the import scan is analyzed without reading it again
+        # (in this process; parallel workers read their own files), and files git
+        # reports unchanged reuse their recorded content hash
+        self._unchanged = set(in_directory) - set(map(os.path.abspath, changed_files))
+        try:
+            dependents = find_dependents(changed_files, python_files, directory_path,
+                                         read=None if parallel else self._read_for_import_scan)
+            results = self.analyze_directory(directory_path, parallel, workers, chunk_size)
+        finally:
+            self._sources.clear()
+            self._unchanged = set()
+
+        # Files sharing a duplicate block with a changed file depend on it too
+        changed_set = set(changed)
+        for analyzer_results in results["analyzers"].values():
+            for file_result in analyzer_results.get("files", []):
+                for block in file_result.get("duplicate_code_blocks", []):
+                    block_files = [location["file_path"] for location in block["locations"]]
+                    if changed_set.intersection(block_files):
+                        dependents.extend(f for f in block_files if f not in changed_set and f not in dependents)
+
+        results["incremental"] = {
+            "changed_files": changed,
+            "dependent_files": dependents,
+            "unchanged_file_count": len(python_files) - len(changed) - len(dependents)
+        }
+        self.results = results
+
+        return results
+
+    def _analyze_file_with_all(self, file_path: str) -> Dict[str, Dict[str, Any]]:
+        """Run every analyzer on a file, reading, parsing and traversing it only once.
+
+        Args:
+            file_path: Path to the file to analyze
+
+        Returns:
+            A dictionary mapping analyzer names to their results for the file
+        """
+        return self.reduce_file(self.map_file(file_path))
+
+    def map_file(self, file_path: str) -> Dict[str, Dict[str, Any]]:
+        """Run the map phase of every analyzer on a file.
+
+        Analyzers with a cached result for the file are served from their cache;
+        the file is only parsed if at least one analyzer needs it.
+
+        Args:
+            file_path: Path to the file to analyze
+
+        Returns:
+            A dictionary mapping analyzer names to their partial results for the file
+        """
+        results = {}
+        pending = []
+
+        use_cache = any(analyzer.config.get('use_cache', False) for analyzer in self.analyzers)
+        source = self._sources.pop(os.path.abspath(file_path), None)
+        if source is not None:
+            stat, content = source
+        else:
+            stat = self._stat(file_path) if use_cache else None
+            content, error = BaseAnalyzer.read_source(file_path)
+            if error is not None:
+                return {analyzer.name: {"file_path": file_path, "error": error} for analyzer in self.analyzers}
+
+        # Hash the content once for every analyzer's cache lookup
+        file_hash = None
+        for analyzer in self.analyzers:
+            cache_key, cached_result = None, None
+            if analyzer.config.get('use_cache', False):
+                if file_hash is None:
+                    file_hash = self._content_hash(file_path, content, stat)
+                cache_key, cached_result = analyzer._lookup_cache(file_path, file_hash)
+            if cached_result is not None:
+                results[analyzer.name] = cached_result
+            else:
+                pending.append((analyzer, cache_key))
+
+        if pending:
+            tree, error = BaseAnalyzer.parse_source(file_path, content)
+            if error is None:
+                # One fused traversal feeds the node subscriptions of every analyzer
+                visitor = FusedNodeVisitor()
+                for analyzer, _ in pending:
+                    analyzer.prepare_traversal(visitor, tree)
+                visitor.run(tree)
+            for analyzer, cache_key in pending:
+                if error is not None:
+                    results[analyzer.name] = {"file_path": file_path, "error": error}
+                else:
+                    results[analyzer.name] = analyzer.map_source_cached(file_path, content, tree, cache_key)
+
+        return {analyzer.name: results[analyzer.name] for analyzer in self.analyzers}
+
+    def _read_for_import_scan(self, file_path: str) -> Optional[str]:
+        """Read a file for the import scan, keeping it for the analysis.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            The content, or None if the file cannot be read
+        """
+        stat = self._stat(file_path)
+        content, error = BaseAnalyzer.read_source(file_path)
+        if error is not None:
+            return None
+        self._sources[os.path.abspath(file_path)] = (stat, content)
+        return content
+
+    @staticmethod
+    def _stat(file_path: str) -> Optional[os.stat_result]:
+        """Stat a file before reading it, for the cache's file hash records.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            The stat result, or None if the file cannot be stat'ed
+        """
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+
+    def _content_hash(self, file_path: str, content: str, stat: Optional[os.stat_result]) -> str:
+        """Get the content hash of a file for cache lookups.
+
+        The hash recorded in the cache is reused for files git reports
+        unchanged if their size and modification time still match; other
+        files are hashed and the hash recorded for later runs.
+
+        Args:
+            file_path: Path to the file
+            content: Content of the file
+            stat: os.stat() of the file taken before it was read, if known
+
+        Returns:
+            Hex digest of the content
+        """
+        if stat is None:
+            return content_hash(content)
+
+        path = os.path.abspath(file_path)
+        cache = AnalysisCache.for_directory(self.config.get('cache_dir', '.code_analysis_cache'),
+                                            self.config.get('cache_max_size'))
+        if path in self._unchanged:
+            file_hash = cache.get_file_hash(path, stat)
+            if file_hash is not None:
+                return file_hash
+
+        file_hash = content_hash(content)
+        cache.put_file_hash(path, stat, file_hash)
+        return file_hash
+
+    def reduce_file(self, partials: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Run the reduce phase of every analyzer on a file's partial results.
+
+        Args:
+            partials: The result of map_file for the file
+
+        Returns:
+            A dictionary mapping analyzer names to their results for the file
+        """
+        return {analyzer.name: analyzer.reduce_file(partials[analyzer.name]) for analyzer in self.analyzers}
+
     def _calculate_overall_score(self, results: Dict[str, Any]) -> None:
         """Calculate an overall code quality score.
 
@@ -178,33 +411,66 @@ class UnifiedAnalyzer:
     def generate_report(self, format: str = 'text', output_path: Optional[str] = None) -> str:
         """Generate a combined report of analysis results.
 
+        When an output path is given, the report is streamed to the file as it
+        is generated instead of being built in memory.
+
         Args:
-            format: The format of the report ('text', 'json', or 'html')
+            format: The format of the report ('text', 'json', 'jsonl', or 'html')
             output_path: Optional path to write the report to
 
         Returns:
-            The report as a string
+            The report as a string, or an empty string if it was written to output_path
         """
         if not self.results:
             return "No analysis results available"
 
+        if not output_path:
+            return render(self.write_report, format)
+
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                self.write_report(f, format)
+            logger.info(f"Report written to {output_path}")
+        except Exception as e:
+            logger.error(f"Error writing report to {output_path}: {str(e)}")
+
+        return ""
+
+    def write_report(self, stream: TextIO, format: str = 'text') -> None:
+        """Write a combined report of analysis results to a stream as it is generated.
+
+        The text and HTML reports are written section by section, the JSON
+        report chunk by chunk, and the JSON Lines report ('jsonl') as one
+        record per file result after a record with the overall results.
+
+        Args:
+            stream: The text stream to write to
+            format: The format of the report ('text', 'json', 'jsonl', or 'html')
+        """
         if format == 'json':
-            report = json.dumps(self.results, indent=2)
+            write_json(self.results, stream)
+        elif format == 'jsonl':
+            self._write_jsonl_report(stream)
         elif format == 'html':
-            report = self._generate_html_report()
+            self._write_html_report(LineWriter(stream))
         else:
-            report = self._generate_text_report()
+            self._write_text_report(LineWriter(stream))
 
-        # Write report to file if output path is provided
-        if output_path:
-            try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(report)
-                logger.info(f"Report written to {output_path}")
-            except Exception as e:
-                logger.error(f"Error writing report to {output_path}: {str(e)}")
+    def _write_jsonl_report(self, stream: TextIO) -> None:
+        """Write a JSON Lines report of analysis results.
 
-        return report
+        Args:
+            stream: The text stream to write to
+        """
+        overall = {key: value for key, value in self.results.items() if key != "analyzers"}
+        write_json_line(dict(overall, type="report"), stream)
+        for analyzer in self.analyzers:
+            analyzer_results = self.results.get("analyzers", {}).get(analyzer.name, {})
+            if "files" not in analyzer_results:
+                # analyze_file stores each analyzer's result for the one file
+                files = [analyzer_results] if analyzer_results else []
+                analyzer_results = {"files": files, "summary": {"file_count": len(files)}}
+            analyzer._write_jsonl_report(stream, analyzer_results)
 
     def _generate_text_report(self) -> str:
         """Generate a text report of analysis results.
@@ -212,28 +478,43 @@ class UnifiedAnalyzer:
         Returns:
             The report as a string
         """
-        report = ["===== CODE QUALITY ANALYSIS REPORT ====="]
+        return render(self.write_report, 'text')
+
+    def _write_text_report(self, report: List[str]) -> None:
+        """Write a text report of analysis results.
+
+        Args:
+            report: The report lines to add to (a list or a LineWriter)
+        """
+        report.append("===== CODE QUALITY ANALYSIS REPORT =====")
 
         # Add overall score
         overall_score = self.results.get("overall_quality_score", 0.0)
         report.append(f"Overall Quality Score: {overall_score:.2f}/1.00")
         report.append("")
 
-        # Add analyzer reports
+        # Add incremental analysis summary
+        incremental = self.results.get("incremental")
+        if incremental:
+            report.append(f"Changed Files: {len(incremental['changed_files'])}")
+            for file_path in incremental["changed_files"]:
+                report.append(f"  {file_path}")
+            report.append(f"Dependent Files: {len(incremental['dependent_files'])}")
+            for file_path in incremental["dependent_files"]:
+                report.append(f"  {file_path}")
+            report.append("")
+
+        # Add analyzer reports, one section at a time
         for analyzer in self.analyzers:
             try:
-                if hasattr(analyzer, '_generate_text_report'):
-                    report.append(analyzer._generate_text_report())
+                if hasattr(analyzer, '_write_text_report'):
+                    analyzer._write_text_report(report)
                 elif hasattr(analyzer, 'print_results'):
                     # Capture the output of print_results
-                    import io
-                    import sys
-                    old_stdout = sys.stdout
-                    new_stdout = io.StringIO()
-                    sys.stdout = new_stdout
-                    analyzer.print_results(analyzer.results)
-                    sys.stdout = old_stdout
-                    report.append(new_stdout.getvalue())
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        analyzer.print_results(analyzer.results)
+                    report.append(output.getvalue())
                 else:
                     report.append(f"No report available for {analyzer.name}")
                 report.append("")
@@ -241,16 +522,22 @@ class UnifiedAnalyzer:
                 report.append(f"Error generating report for {analyzer.name}: {str(e)}")
                 report.append("")
 
-        return "\n".join(report)
-
     def _generate_html_report(self) -> str:
         """Generate an HTML report of analysis results.
 
         Returns:
             The report as an HTML string
         """
+        return render(self.write_report, 'html')
+
+    def _write_html_report(self, html: List[str]) -> None:
+        """Write an HTML report of analysis results.
+
+        Args:
+            html: The HTML lines to add to (a list or a LineWriter)
+        """
         # Basic HTML report
-        html = [
+        html.extend([
             "<!DOCTYPE html>",
             "<html>",
             "<head>",
@@ -281,7 +568,7 @@ class UnifiedAnalyzer:
             "<h1>Code Quality Analysis Report</h1>",
             "<div class='summary'>",
             "<h2>Summary</h2>"
-        ]
+        ])
 
         # Add overall score with color coding
         overall_score = self.results.get("overall_quality_score", 0.0)
@@ -293,12 +580,10 @@ class UnifiedAnalyzer:
         # Add analyzer reports
         for analyzer in self.analyzers:
             html.append("<div class='analyzer'>")
-            html.append(analyzer._generate_html_report())
+            analyzer._write_html_report(html)
             html.append("</div>")
 
         html.extend([
             "</body>",
             "</html>"
         ])
-
-        return "\n".join(html)
@@ -27,10 +27,21 @@ from PyQt5.QtChart import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, Q
 # Try to import the unified analyzer
 try:
     from code_quality_analyzer.unified_analyzer import UnifiedAnalyzer
+    from code_quality_analyzer.report_stream import JsonLinesReport
     UNIFIED_ANALYZER_AVAILABLE = True
 except ImportError:
     UNIFIED_ANALYZER_AVAILABLE = False
 
+# Tree items are created a page at a time, when their parent is expanded
+TREE_PAGE_SIZE = 200
+
+# Longest raw output shown, in characters
+RAW_OUTPUT_LIMIT = 1_000_000
+
+# Item data roles for lazily loaded tree items
+ITEM_DATA_ROLE = Qt.UserRole
+ITEM_PENDING_ROLE = Qt.UserRole + 1
+
 # Define color scheme
 COLORS = {
     "background": "#1E1E1E",
@@ -263,6 +274,8 @@ class ResultsViewer(QWidget):
         self.details_tree = QTreeWidget()
         self.details_tree.setHeaderLabels(["Property", "Value"])
         self.details_tree.setAlternatingRowColors(True)
+        self.details_tree.itemExpanded.connect(self._load_children)
+        self.details_tree.itemClicked.connect(self._load_more)
         self.details_layout.addWidget(self.details_tree)
         self.tabs.addTab(self.details_tab, "Details")
         
@@ -295,9 +308,9 @@ class ResultsViewer(QWidget):
         
         # Set raw output
         if isinstance(results, dict):
-            self.raw_text.setText(json.dumps(results, indent=2))
+            self._set_raw_text(json.dumps(results, indent=2))
         else:
-            self.raw_text.setText(str(results))
+            self._set_raw_text(str(results))
         
         # Generate summary
         summary = self._generate_summary(results)
@@ -341,7 +354,7 @@ class ResultsViewer(QWidget):
             files = results["files"]
             if isinstance(files, dict):
                 total_files = len(files)
-                files_with_issues = sum(bool(isinstance(f, dict) and f.get("issues", []))
+                files_with_issues = sum(bool(isinstance(f, dict) and f.get("issues", [])) for f in files.values())
                 
                 summary += f"<p>Analyzed {total_files} files, found issues in {files_with_issues} files.</p>"
                 
@@ -385,43 +398,123 @@ class ResultsViewer(QWidget):
         
         return summary
     
+    def display_report_file(self, report):
+        """Display a JSON Lines report, loading file results from disk on expand."""
+        self.summary_text.clear()
+        self.details_tree.clear()
+        self.raw_text.clear()
+        
+        overall = next((r for r in report.summaries if r.get("type") == "report"), {})
+        summary = "<h2>Analysis Summary</h2>"
+        if "overall_quality_score" in overall:
+            summary += f"<p>Overall Quality Score: {overall['overall_quality_score']:.2f}/1.00</p>"
+        summary += "<ul>"
+        for record in report.summaries:
+            if record.get("type") == "analyzer":
+                file_count = record.get("summary", {}).get("file_count", 0)
+                summary += f"<li>{record['analyzer']}: {file_count} files</li>"
+        summary += "</ul>"
+        summary += f"<p>{len(report)} file results in {report.path}. See the Details tab.</p>"
+        self.summary_text.setText(summary)
+        
+        self._set_raw_text("\n".join(json.dumps(record) for record in report.summaries))
+        
+        # File results are loaded one page at a time, and read from disk on expand
+        files_item = QTreeWidgetItem([f"File results ({len(report)})", ""])
+        self.details_tree.addTopLevelItem(files_item)
+        self._set_pending(files_item, ("report", report, 0))
+        
+        for record in report.summaries:
+            item = QTreeWidgetItem([record.get("analyzer") or record.get("type", "summary"), ""])
+            self.details_tree.addTopLevelItem(item)
+            self._set_pending(item, ("value", record, 0))
+        
+        self._create_visualization({})
+    
+    def _set_raw_text(self, text):
+        """Show raw output, truncated to RAW_OUTPUT_LIMIT characters."""
+        if len(text) > RAW_OUTPUT_LIMIT:
+            text = text[:RAW_OUTPUT_LIMIT] + f"\n... truncated ({len(text) - RAW_OUTPUT_LIMIT} more characters)"
+        self.raw_text.setPlainText(text)
+    
     def _populate_details_tree(self, results):
-        """Populate the details tree with the analysis results."""
+        """Populate the details tree with the analysis results.
+        
+        Only the top level is created here; children are created a page at a
+        time when their parent is expanded.
+        """
         if not isinstance(results, dict):
             item = QTreeWidgetItem(["Results", str(results)])
             self.details_tree.addTopLevelItem(item)
             return
         
-        def add_dict_to_tree(parent_item, data):
-            """Recursively add dictionary data to the tree."""
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    if isinstance(value, (dict, list)):
-                        item = QTreeWidgetItem([str(key), ""])
-                        if parent_item is None:
-                            self.details_tree.addTopLevelItem(item)
-                        else:
-                            parent_item.addChild(item)
-                        
-                        if isinstance(value, dict):
-                            add_dict_to_tree(item, value)
-                        elif isinstance(value, list):
-                            for i, list_item in enumerate(value):
-                                if isinstance(list_item, (dict, list)):
-                                    list_item_widget = QTreeWidgetItem([f"Item {i}", ""])
-                                    item.addChild(list_item_widget)
-                                    add_dict_to_tree(list_item_widget, list_item)
-                                else:
-                                    item.addChild(QTreeWidgetItem(["", str(list_item)]))
-                    else:
-                        if parent_item is None:
-                            self.details_tree.addTopLevelItem(QTreeWidgetItem([str(key), str(value)]))
-                        else:
-                            parent_item.addChild(QTreeWidgetItem([str(key), str(value)]))
-        
-        add_dict_to_tree(None, results)
+        self._add_children(None, ("value", results, 0))
         self.details_tree.expandToDepth(0)
     
+    def _set_pending(self, item, source):
+        """Give an item a placeholder child so it can be expanded before its children exist."""
+        item.setData(0, ITEM_DATA_ROLE, source)
+        item.setData(0, ITEM_PENDING_ROLE, True)
+        item.addChild(QTreeWidgetItem(["Loading...", ""]))
+    
+    def _load_children(self, item):
+        """Create the first page of an item's children when it is expanded."""
+        if not item.data(0, ITEM_PENDING_ROLE):
+            return
+        item.setData(0, ITEM_PENDING_ROLE, False)
+        item.takeChildren()
+        self._add_children(item, item.data(0, ITEM_DATA_ROLE))
+    
+    def _load_more(self, item, column=0):
+        """Create the next page of children when a "Load more" item is clicked."""
+        source = item.data(0, ITEM_DATA_ROLE)
+        parent = item.parent()
+        if item.data(0, ITEM_PENDING_ROLE) is not None or not source:
+            return
+        if parent is None:
+            self.details_tree.takeTopLevelItem(self.details_tree.indexOfTopLevelItem(item))
+        else:
+            parent.removeChild(item)
+        self._add_children(parent, source)
+    
+    def _add_item(self, parent_item, item):
+        """Add an item to the tree, at the top level if it has no parent."""
+        if parent_item is None:
+            self.details_tree.addTopLevelItem(item)
+        else:
+            parent_item.addChild(item)
+    
+    def _add_children(self, parent_item, source):
+        """Add one page of children for a value or a JSON Lines report."""
+        kind, data, start = source
+        end = start + TREE_PAGE_SIZE
+        
+        if kind == "report":
+            total = len(data)
+            for index, label in enumerate(data.labels(start, TREE_PAGE_SIZE), start):
+                item = QTreeWidgetItem([label["file_path"], label["analyzer"] or ""])
+                self._add_item(parent_item, item)
+                self._set_pending(item, ("record", data, index))
+        elif kind == "record":
+            total = 0
+            self._add_children(parent_item, ("value", data.file_result(start).get("result", {}), 0))
+        else:
+            entries = list(data.items()) if isinstance(data, dict) else [(f"Item {i}", v) for i, v in enumerate(data)]
+            total = len(entries)
+            for key, value in entries[start:end]:
+                if isinstance(value, (dict, list)):
+                    item = QTreeWidgetItem([str(key), f"{len(value)} entries"])
+                    self._add_item(parent_item, item)
+                    if value:
+                        self._set_pending(item, ("value", value, 0))
+                else:
+                    self._add_item(parent_item, QTreeWidgetItem([str(key) if isinstance(data, dict) else "", str(value)]))
+        
+        if end < total:
+            more = QTreeWidgetItem([f"Load more... ({total - end} remaining)", ""])
+            more.setData(0, ITEM_DATA_ROLE, (kind, data, end))
+            self._add_item(parent_item, more)
+    
     def _create_visualization(self, results):
         """Create a visualization of the analysis results."""
         chart = QChart()
@@ -571,6 +664,12 @@ class CodeQualityDashboard(QMainWindow):
         browse_button.clicked.connect(self.browse_target)
         header_layout.addWidget(browse_button)
         
+        # Open a saved report (JSON Lines reports are loaded page by page)
+        if UNIFIED_ANALYZER_AVAILABLE:
+            open_report_button = QPushButton("Open Report")
+            open_report_button.clicked.connect(self.open_report)
+            header_layout.addWidget(open_report_button)
+        
         main_layout.addLayout(header_layout)
         
         # Splitter for cards and results
@@ -668,6 +767,23 @@ class CodeQualityDashboard(QMainWindow):
             if selected_files:
                 self.target_path.setText(selected_files[0])
     
+    def open_report(self):
+        """Open a report written with --format jsonl (or json) and display it."""
+        path, _ = QFileDialog.getOpenFileName(self, "Open Report", "",
+                                              "JSON Lines Reports (*.jsonl);;JSON Reports (*.json)")
+        if not path:
+            return
+        
+        try:
+            if path.endswith(".jsonl"):
+                self.results_viewer.display_report_file(JsonLinesReport(path))
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.results_viewer.display_results(json.load(f))
+            self.status_label.setText(f"Loaded report: {os.path.basename(path)}")
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Invalid Report", f"Could not load report '{path}': {e}")
+    
     def run_analyzer(self, analyzer_type):
         """Run the selected analyzer on the target path."""
         target_path = self.target_path.text()
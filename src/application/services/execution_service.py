@@ -13,10 +13,14 @@ from src.core.interfaces import IWorkflowRepository, ICredentialRepository, IWeb
 from src.core.workflow.workflow_entity import Workflow
 from src.core.credentials import Credential
 from src.core.workflow.runner import WorkflowRunner
+from src.core.workflow.run_queue import RunQueue, QueuedRun, PRIORITY_INTERACTIVE, workflow_site
 from src.core.action_result import ActionResult
 from src.infrastructure.webdrivers.webdriver_factory import WebDriverFactory
 from src.application.interfaces.service_interfaces import IExecutionService
+from src.core.interfaces.service import IReportingService
 from src.core.exceptions import RepositoryError, ValidationError, ServiceError, WebDriverError
+from src.infrastructure.common.metrics import MetricsRegistry
+from src.infrastructure.common.service_metrics import ServiceMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -27,17 +31,34 @@ class ExecutionService(IExecutionService):
         self,
         workflow_repository: IWorkflowRepository,
         credential_repository: ICredentialRepository,
-        webdriver_factory: WebDriverFactory
+        webdriver_factory: WebDriverFactory,
+        metrics: Optional[MetricsRegistry] = None,
+        profile: bool = False,
+        reporting_service: Optional[IReportingService] = None,
+        run_queue: Optional[RunQueue] = None
     ):
-        """Initialize with repository and factory dependencies."""
+        """
+        Initialize with repository and factory dependencies; metrics go to the shared REGISTRY by default.
+
+        With `profile`, runs are sampled by the runner's profiler and the per-action summary is
+        added to the execution status under "profile". Execution logs are saved through
+        `reporting_service` when one is given (with the profile's collapsed stacks beside them).
+        With a shared `run_queue`, runs are queued at interactive priority (ahead of scheduled
+        runs, within its per-site limits) instead of starting on a thread of their own.
+        """
         self.workflow_repository = workflow_repository
         self.credential_repository = credential_repository
         self.webdriver_factory = webdriver_factory
+        self.metrics = ServiceMetrics(metrics)
+        self.profile = profile
+        self.reporting_service = reporting_service
+        self.run_queue = run_queue
 
         # Execution state
         self._execution_lock = threading.RLock()
         self._current_execution = None
         self._execution_thread = None
+        self._queued_run: Optional[QueuedRun] = None
         self._stop_event = threading.Event()
         self._execution_results = []
         self._execution_status = {
@@ -62,7 +83,7 @@ class ExecutionService(IExecutionService):
 
         with self._execution_lock:
             # Check if already executing
-            if self._execution_thread and self._execution_thread.is_alive():
+            if self._is_executing():
                 msg = "Cannot start execution: another workflow is already running"
                 logger.error(msg)
                 raise ServiceError(msg)
@@ -73,14 +94,16 @@ class ExecutionService(IExecutionService):
                 self._execution_results = []
 
                 # Get workflow
-                workflow = self.workflow_repository.get(workflow_id)
+                with self.metrics.repository_seconds.labels(repository="workflow", operation="get").time():
+                    workflow = self.workflow_repository.get(workflow_id)
                 if not workflow:
                     raise ValidationError(f"Workflow not found: {workflow_id}")
 
                 # Get credential if specified
                 credential = None
                 if credential_name:
-                    credential = self.credential_repository.get(credential_name)
+                    with self.metrics.repository_seconds.labels(repository="credential", operation="get").time():
+                        credential = self.credential_repository.get(credential_name)
                     if not credential:
                         raise ValidationError(f"Credential not found: {credential_name}")
 
@@ -94,13 +117,21 @@ class ExecutionService(IExecutionService):
                     "error": None
                 }
 
-                # Start execution in background thread
-                self._execution_thread = threading.Thread(
-                    target=self._execute_workflow_thread,
-                    args=(workflow, credential),
-                    daemon=True
-                )
-                self._execution_thread.start()
+                # Start execution in background thread, or queue it behind other runs
+                if self.run_queue:
+                    self._execution_status["status"] = "queued"
+                    self._queued_run = self.run_queue.submit(
+                        workflow.name, lambda: self._execute_workflow_thread(workflow, credential),
+                        priority=PRIORITY_INTERACTIVE, tenant=credential_name,
+                        site=workflow_site(workflow.actions), source="manual"
+                    )
+                else:
+                    self._execution_thread = threading.Thread(
+                        target=self._execute_workflow_thread,
+                        args=(workflow, credential),
+                        daemon=True
+                    )
+                    self._execution_thread.start()
 
                 logger.info(f"Started execution of workflow: {workflow.name}")
                 return self._execution_status
@@ -135,13 +166,28 @@ class ExecutionService(IExecutionService):
         """
         driver = None
         total_actions = len(workflow.actions)
+        metrics = self.metrics
+        metrics.runs_in_progress.labels(source="manual").inc()
+        run_started = time.perf_counter()
+        final_status: Optional[str] = None # Set once the runner returns
 
         try:
-            # Create WebDriver
-            driver = self.webdriver_factory.create_driver()
+            # Create WebDriver, honouring a page load profile from workflow metadata
+            metadata = getattr(workflow, "metadata", None) or {}
+            load_profile = metadata.get("load_profile")
+            try:
+                with metrics.driver_launch_seconds.time():
+                    driver = self.webdriver_factory.create_driver(load_profile=load_profile) if load_profile else self.webdriver_factory.create_driver()
+            except Exception:
+                metrics.driver_launches.labels(result="failure").inc()
+                raise
+            metrics.driver_launches.labels(result="success").inc()
+            metrics.drivers_active.inc()
 
             # Create WorkflowRunner
-            runner = WorkflowRunner(driver, self.credential_repository, stop_event=self._stop_event)
+            runner = WorkflowRunner(driver, self.credential_repository, stop_event=self._stop_event, profile=self.profile,
+                                    batch_operations=bool(metadata.get("batch_operations")),
+                                    script_typing=bool(metadata.get("script_typing")))
 
             # Update status
             with self._execution_lock:
@@ -149,6 +195,14 @@ class ExecutionService(IExecutionService):
 
             # Execute workflow
             execution_log = runner.run(workflow.actions, workflow_name=workflow.name)
+            final_status = execution_log.get("final_status", "UNKNOWN")
+            metrics.record_run("manual", final_status, time.perf_counter() - run_started,
+                               [result.get("status") for result in execution_log.get("action_results", [])])
+            if self.reporting_service:
+                try:
+                    self.reporting_service.save_execution_log(execution_log)
+                except Exception as e:
+                    logger.error(f"Failed to save execution log for {workflow.name}: {e}")
 
             # Store results
             with self._execution_lock:
@@ -164,10 +218,13 @@ class ExecutionService(IExecutionService):
                     "error": None,
                     "final_status": execution_log.get("final_status")
                 }
+                if "profile" in execution_log:
+                    self._execution_status["profile"] = {key: value for key, value in execution_log["profile"].items() if key != "collapsed"}
 
             logger.info(f"Workflow execution completed: {workflow.name}")
         except Exception as e:
             logger.exception(f"Error executing workflow: {workflow.name}")
+            if final_status is None: metrics.record_run("manual", "ERROR", time.perf_counter() - run_started)
             with self._execution_lock:
                 self._execution_status = {
                     "status": "failed",
@@ -178,8 +235,10 @@ class ExecutionService(IExecutionService):
                     "final_status": "FAILED"
                 }
         finally:
+            metrics.runs_in_progress.labels(source="manual").dec()
             # Clean up WebDriver
             if driver:
+                metrics.drivers_active.dec()
                 try:
                     driver.quit()
                 except Exception as e:
@@ -194,7 +253,12 @@ class ExecutionService(IExecutionService):
         """
         logger.info("Requesting workflow execution stop")
         with self._execution_lock:
-            if self._execution_thread and self._execution_thread.is_alive():
+            if self.run_queue and self._queued_run and self.run_queue.cancel(self._queued_run):
+                self._execution_status["status"] = "stopped"
+                self._execution_status["final_status"] = "STOPPED"
+                logger.info("Queued workflow execution cancelled before it started")
+                return True
+            if self._is_executing():
                 self._stop_event.set()
                 self._execution_status["status"] = "stopping"
                 logger.info("Stop request sent to workflow execution")
@@ -203,6 +267,11 @@ class ExecutionService(IExecutionService):
                 logger.info("No workflow execution to stop")
                 return False
 
+    def _is_executing(self) -> bool:
+        """Whether a run is queued or executing (caller holds the execution lock)."""
+        if self._queued_run and not self._queued_run.future.done(): return True
+        return bool(self._execution_thread and self._execution_thread.is_alive())
+
     def get_execution_status(self) -> Dict[str, Any]:
         """
         Get the current execution status.
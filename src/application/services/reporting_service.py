@@ -14,6 +14,8 @@ from src.core.exceptions import AutoQliqError, RepositoryError # Use RepositoryE
 
 # Common utilities
 from src.infrastructure.common.logging_utils import log_method_call
+from src.core.workflow.profiling import write_collapsed_stacks
+from src.core.workflow.tracing import write_chrome_trace
 # Configuration needed for log path? Or hardcode? Let's hardcode 'logs/' for now.
 # from src.config import config
 
@@ -80,7 +82,14 @@ class ReportingService(IReportingService):
 
     @log_method_call(logger)
     def save_execution_log(self, execution_log: Dict[str, Any]) -> None:
-        """Saves the full execution log data to a unique JSON file."""
+        """
+        Saves the full execution log data to a unique JSON file.
+
+        A profile's collapsed stacks (from WorkflowRunner(profile=True)) are written to a
+        `.folded` file next to it, named in the log under profile["collapsed_file"]. A trace
+        (from WorkflowRunner(trace=True)) is written as a Chrome trace to a `.trace.json` file
+        next to it, named in the log under trace["chrome_trace_file"]; the log keeps its summary.
+        """
         if not isinstance(execution_log, dict) or not execution_log.get('workflow_name') or not execution_log.get('start_time_iso'):
             logger.error("Attempted to save invalid execution log data (missing required keys).")
             raise ValueError("Invalid execution log data provided.")
@@ -92,6 +101,18 @@ class ReportingService(IReportingService):
             logger.info(f"Saving execution log to: {filepath}")
             try:
                 self._ensure_log_directory() # Ensure dir exists just before write
+                profile = execution_log.get("profile")
+                if isinstance(profile, dict) and "collapsed" in profile:
+                    profile_filename = os.path.splitext(filename)[0] + ".folded"
+                    write_collapsed_stacks(profile, os.path.join(LOG_DIRECTORY, profile_filename))
+                    summary = {key: value for key, value in profile.items() if key != "collapsed"}
+                    execution_log = dict(execution_log, profile=dict(summary, collapsed_file=profile_filename))
+                trace = execution_log.get("trace")
+                if isinstance(trace, dict) and trace.get("spans"):
+                    trace_filename = os.path.splitext(filename)[0] + ".trace.json"
+                    write_chrome_trace(trace, os.path.join(LOG_DIRECTORY, trace_filename))
+                    summary = {key: value for key, value in trace.items() if key != "spans"}
+                    execution_log = dict(execution_log, trace=dict(summary, chrome_trace_file=trace_filename))
                 with open(filepath, 'w', encoding='utf-8') as f:
                     json.dump(execution_log, f, indent=2)
                 logger.debug(f"Successfully saved execution log: {filename}")
@@ -3,6 +3,7 @@
 
 import logging
 import time # For job ID generation example
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
 # Core interfaces
@@ -10,6 +11,7 @@ from src.core.interfaces.service import ISchedulerService, IWorkflowService # Ne
 from src.core.exceptions import AutoQliqError, ConfigError, WorkflowError # Use specific errors
 # Need BrowserType for run call
 from src.infrastructure.webdrivers.base import BrowserType
+from src.core.workflow.run_queue import RunQueue, PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITY_NORMAL, workflow_site
 
 # External libraries (optional import)
 try:
@@ -18,26 +20,50 @@ try:
     from apscheduler.triggers.interval import IntervalTrigger
     from apscheduler.jobstores.base import JobLookupError
     from apscheduler.jobstores.memory import MemoryJobStore
-    # Add other stores like SQLAlchemyJobStore if needed
+    from apscheduler.events import EVENT_JOB_MISSED
     APS_AVAILABLE = True
 except ImportError:
     logging.getLogger(__name__).warning("APScheduler not found. Scheduling functionality disabled. Install using: pip install apscheduler")
     APS_AVAILABLE = False
     # Define dummy classes if not available
     class BackgroundScheduler: # type: ignore
-        def add_job(self,*a,**kw): pass; def get_jobs(self,*a,**kw): return []; def remove_job(self,*a,**kw): raise JobLookupError(); def start(self): pass; def shutdown(self): pass
+        def add_job(self,*a,**kw): pass
+        def get_jobs(self,*a,**kw): return []
+        def remove_job(self,*a,**kw): raise JobLookupError()
+        def add_listener(self,*a,**kw): pass
+        def start(self): pass
+        def shutdown(self): pass
     class CronTrigger: pass # type: ignore
     class IntervalTrigger: pass # type: ignore
     class JobLookupError(Exception): pass # type: ignore
     class MemoryJobStore: pass # type: ignore
+    EVENT_JOB_MISSED = 0
 
 # Common utilities
 from src.infrastructure.common.logging_utils import log_method_call
+from src.infrastructure.common.metrics import MetricsRegistry
+from src.infrastructure.common.job_store import (
+    JobLeases, LeasedThreadPoolExecutor, SQLiteJobStore, MISFIRE_POLICIES, misfire_job_options
+)
+from src.infrastructure.common.service_metrics import ServiceMetrics
 # Need WorkflowService instance to run jobs
 # Ideally injected, but passed via method for now if needed? No, init.
 
 logger = logging.getLogger(__name__)
 
+# The SchedulerService whose workflow service runs scheduled jobs in this process
+_active_service: Optional["SchedulerService"] = None
+
+
+# Run queue priority of scheduled runs, by schedule config 'priority'
+SCHEDULE_PRIORITIES = {"interactive": PRIORITY_INTERACTIVE, "normal": PRIORITY_NORMAL, "batch": PRIORITY_BATCH}
+
+
+def run_scheduled_workflow(job_id: str, workflow_name: str, credential_name: Optional[str], priority: int = PRIORITY_BATCH) -> None:
+    """Job entry point. A module-level function, so jobs can be stored by reference in a persistent job store."""
+    if _active_service is None: raise AutoQliqError(f"No SchedulerService is running to execute job '{job_id}'.")
+    _active_service._run_scheduled_workflow(job_id, workflow_name, credential_name, priority)
+
 
 class SchedulerService(ISchedulerService):
     """
@@ -45,27 +71,75 @@ class SchedulerService(ISchedulerService):
 
     Manages scheduled workflow runs using a background scheduler.
     Requires WorkflowService instance to execute the actual workflows.
-    Uses MemoryJobStore by default (jobs lost on restart).
+    Uses MemoryJobStore by default (jobs lost on restart). With `job_store_path`,
+    jobs are kept in an SQLite database instead, and several scheduler processes
+    on one host may share it: each run is claimed through a lease in the same
+    database, so a job runs once per occurrence and never concurrently with itself.
+    Since every job drives a browser, `max_workers` bounds the browsers open at once.
+    With a `run_queue` (shared with ExecutionService), each job queues its run, at
+    batch priority by default, and waits for it: interactive runs go first and the
+    queue's per-site and per-workflow limits apply to scheduled runs too.
+    Job counts, executor size, missed runs and scheduled run outcomes are
+    recorded in a MetricsRegistry (the shared REGISTRY by default).
     """
 
-    def __init__(self, workflow_service: IWorkflowService):
-        """Initialize the SchedulerService."""
+    def __init__(self, workflow_service: IWorkflowService, metrics: Optional[MetricsRegistry] = None,
+                 job_store_path: Optional[str] = None, max_workers: int = 5, misfire_policy: str = "run_once",
+                 misfire_grace_seconds: int = 60, lease_seconds: float = 60.0, poll_seconds: float = 10.0,
+                 run_queue: Optional[RunQueue] = None):
+        """
+        Initialize the SchedulerService.
+
+        Args:
+            workflow_service: Runs the scheduled workflows.
+            metrics: Registry for scheduler metrics (default: the shared REGISTRY).
+            job_store_path: SQLite database for persistent, shareable jobs (default: in memory).
+            max_workers: Jobs (and so browsers) running at once in this process.
+            misfire_policy: Default handling of missed runs: 'skip', 'run_once' or 'run_all'
+                            (see MISFIRE_POLICIES); schedule configs may override it.
+            misfire_grace_seconds: How late a run may start under the 'skip' policy.
+            lease_seconds: Lease length for shared job stores; a crashed process holds a job at most this long.
+            poll_seconds: How often a shared job store is checked for jobs added by other processes.
+            run_queue: Queue through which scheduled runs are executed (default: run directly).
+                       Under the 'skip' policy, queued runs are dropped once misfire_grace_seconds late.
+        """
+        global _active_service
         self.scheduler: Optional[BackgroundScheduler] = None
         if workflow_service is None:
              raise ValueError("WorkflowService instance is required for SchedulerService.")
+        if max_workers < 1: raise ConfigError("Scheduler max_workers must be at least 1.")
+        if misfire_policy not in MISFIRE_POLICIES: raise ConfigError(f"Unknown scheduler misfire policy '{misfire_policy}'.")
         self.workflow_service = workflow_service # Store injected service
+        self.misfire_policy = misfire_policy
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self.job_store_path = job_store_path
+        self.run_queue = run_queue
+        self.metrics = ServiceMetrics(metrics)
+        self.metrics.registry.register_collector(self._collect_metrics)
 
         if APS_AVAILABLE:
             try:
-                # TODO: Configure persistent job store (e.g., SQLAlchemyJobStore) via config
-                jobstores = {'default': MemoryJobStore()}
-                executors = {'default': {'type': 'threadpool', 'max_workers': 5}} # Basic thread pool
-                job_defaults = {'coalesce': False, 'max_instances': 1} # Prevent concurrent runs of same job
+                job_defaults = dict(misfire_job_options(misfire_policy, misfire_grace_seconds), max_instances=1) # Prevent concurrent runs of same job
+                if job_store_path:
+                    leases = JobLeases(job_store_path, lease_seconds=lease_seconds)
+                    jobstores = {'default': SQLiteJobStore(job_store_path), 'internal': MemoryJobStore()}
+                    executors = {'default': LeasedThreadPoolExecutor(leases, max_workers=max_workers),
+                                 'internal': {'type': 'threadpool', 'max_workers': 1}}
+                else:
+                    jobstores = {'default': MemoryJobStore()}
+                    executors = {'default': {'type': 'threadpool', 'max_workers': max_workers}} # Basic thread pool
 
                 self.scheduler = BackgroundScheduler( # type: ignore
                     jobstores=jobstores, executors=executors, job_defaults=job_defaults, timezone='UTC' # Or local timezone
                 )
+                self.scheduler.add_listener(self._on_job_missed, EVENT_JOB_MISSED)
+                _active_service = self
                 self.scheduler.start()
+                if job_store_path:
+                    # The scheduler only wakes for its own jobs; poll so jobs added by other processes are seen.
+                    self.scheduler.add_job(self._poll_job_store, 'interval', seconds=poll_seconds, id='poll_job_store',
+                                           jobstore='internal', executor='internal', coalesce=True, misfire_grace_time=None)
+                self.metrics.scheduler_workers.set(max_workers)
                 logger.info("SchedulerService initialized with APScheduler BackgroundScheduler.")
             except Exception as e:
                 logger.error(f"Failed to initialize APScheduler: {e}. Scheduling disabled.", exc_info=True)
@@ -73,9 +147,32 @@ class SchedulerService(ISchedulerService):
         else:
             logger.warning("SchedulerService initialized (APScheduler not available). Scheduling disabled.")
 
-    def _run_scheduled_workflow(self, job_id: str, workflow_name: str, credential_name: Optional[str]):
+    @staticmethod
+    def _poll_job_store() -> None:
+         """No-op job; running it makes the scheduler re-read its job stores."""
+
+
+    def _collect_metrics(self) -> None:
+         """Updates the job gauges at scrape time."""
+         jobs = self.scheduler.get_jobs(jobstore='default') if self.scheduler else []
+         now = datetime.now(timezone.utc)
+         self.metrics.scheduler_jobs.set(len(jobs))
+         self.metrics.scheduler_jobs_due.set(sum(1 for job in jobs if getattr(job, "next_run_time", None) and job.next_run_time <= now))
+
+
+    def _on_job_missed(self, event: Any) -> None:
+         """APScheduler listener for runs skipped past their misfire grace time."""
+         logger.warning(f"SCHEDULER: Job '{getattr(event, 'job_id', '?')}' missed its run time {getattr(event, 'scheduled_run_time', '?')}.")
+         self.metrics.scheduler_missed.inc()
+
+
+    def _run_scheduled_workflow(self, job_id: str, workflow_name: str, credential_name: Optional[str], priority: int = PRIORITY_BATCH):
          """Internal function called by the scheduler to run a workflow."""
          logger.info(f"SCHEDULER: Triggering run for job '{job_id}' (Workflow: {workflow_name})")
+         self.metrics.runs_in_progress.labels(source="scheduled").inc()
+         run_started = time.perf_counter()
+         final_status = "ERROR" # Unless run_workflow returns a log
+         execution_log: Dict[str, Any] = {}
          try:
               # Use the injected WorkflowService instance
               from src.config import config # Import config locally if needed for browser type
@@ -83,13 +180,20 @@ class SchedulerService(ISchedulerService):
 
               # WorkflowService.run_workflow handles its own logging and error reporting (via ReportingService)
               # It also handles its own exceptions internally now, returning a log dict.
-              execution_log = self.workflow_service.run_workflow(
+              run = lambda: self.workflow_service.run_workflow(
                    name=workflow_name,
                    credential_name=credential_name,
                    browser_type=browser_type
                    # Pass stop_event? Not applicable for scheduled runs.
                    # Pass log_callback? Could integrate with APScheduler logging.
               )
+              if self.run_queue:
+                   deadline = time.time() + self.misfire_grace_seconds if self.misfire_policy == "skip" else None
+                   queued = self.run_queue.submit(workflow_name, run, priority=priority, tenant=credential_name,
+                                                  site=self._workflow_site(workflow_name), deadline=deadline, source="scheduled")
+                   execution_log = queued.future.result() # Hold the job (and its lease) until the run ends
+              else:
+                   execution_log = run()
               # Log success/failure based on returned status
               final_status = execution_log.get("final_status", "UNKNOWN")
               logger.info(f"SCHEDULER: Scheduled job '{job_id}' completed with status: {final_status}")
@@ -99,6 +203,19 @@ class SchedulerService(ISchedulerService):
               # This catches errors if run_workflow itself fails unexpectedly or raises something new
               logger.error(f"SCHEDULER: Error running scheduled job '{job_id}' for workflow '{workflow_name}': {e}", exc_info=True)
               # TODO: Add logic for handling repeated failures (e.g., disable job)
+         finally:
+              self.metrics.runs_in_progress.labels(source="scheduled").dec()
+              self.metrics.record_run("scheduled", final_status, time.perf_counter() - run_started,
+                                      [result.get("status") for result in execution_log.get("action_results", [])])
+
+
+    def _workflow_site(self, workflow_name: str) -> Optional[str]:
+         """The site a workflow targets, for the run queue's per-site limits (None if unknown)."""
+         try:
+              return workflow_site(self.workflow_service.get_workflow(workflow_name))
+         except Exception as e:
+              logger.debug(f"SCHEDULER: Could not determine the site of workflow '{workflow_name}': {e}")
+              return None
 
 
     @log_method_call(logger)
@@ -114,7 +231,10 @@ class SchedulerService(ISchedulerService):
         try:
             trigger_type = schedule_config.get("trigger", "interval")
             # Filter out non-trigger args before passing to trigger constructor
-            trigger_args = {k:v for k,v in schedule_config.items() if k not in ['trigger', 'id', 'name']}
+            trigger_args = {k:v for k,v in schedule_config.items() if k not in ['trigger', 'id', 'name', 'misfire_policy', 'priority']}
+            priority_name = schedule_config.get('priority', 'batch')
+            if priority_name not in SCHEDULE_PRIORITIES: raise ValueError(f"Unknown priority '{priority_name}'")
+            misfire_options = misfire_job_options(schedule_config.get('misfire_policy', self.misfire_policy), self.misfire_grace_seconds)
 
             # Convert numeric args from string if needed (APScheduler might handle this)
             for k, v in trigger_args.items():
@@ -130,14 +250,17 @@ class SchedulerService(ISchedulerService):
 
             if trigger is None: raise ValueError(f"Unsupported trigger type: {trigger_type}")
 
-            # Add the job - use self._run_scheduled_workflow as the target function
+            # Add the job - by reference, so persistent job stores can save it
             added_job = self.scheduler.add_job(
-                 func=self._run_scheduled_workflow,
+                 func=f"{__name__}:run_scheduled_workflow",
                  trigger=trigger,
                  args=[job_id, workflow_name, credential_name], # Args passed to _run_scheduled_workflow
+                 kwargs={'priority': SCHEDULE_PRIORITIES[priority_name]},
                  id=job_id,
                  name=schedule_config.get('name', f"Run '{workflow_name}' ({trigger_type})"),
-                 replace_existing=True # Update if job with same ID exists
+                 jobstore='default',
+                 replace_existing=True, # Update if job with same ID exists
+                 **misfire_options
             )
             if added_job is None: # Should not happen with replace_existing=True unless error
                  raise AutoQliqError(f"Scheduler returned None for job '{job_id}'. Scheduling might have failed silently.")
@@ -159,7 +282,7 @@ class SchedulerService(ISchedulerService):
         if not self.scheduler: return []
         logger.debug("Listing scheduled jobs.")
         try:
-            jobs = self.scheduler.get_jobs()
+            jobs = self.scheduler.get_jobs(jobstore='default')
             job_list = []
             for job in jobs:
                  # Extract args safely
@@ -188,7 +311,8 @@ class SchedulerService(ISchedulerService):
         if not self.scheduler: return False
         logger.info(f"Attempting cancel scheduled job '{job_id}'.")
         try:
-            self.scheduler.remove_job(job_id)
+            if self.scheduler.get_job(job_id, jobstore='default') is None: raise JobLookupError(job_id)
+            self.scheduler.remove_job(job_id, jobstore='default')
             logger.info(f"Successfully cancelled scheduled job '{job_id}'.")
             return True
         except JobLookupError:
@@ -201,6 +325,9 @@ class SchedulerService(ISchedulerService):
 
     def shutdown(self):
         """Shutdown the scheduler."""
+        global _active_service
+        self.metrics.registry.unregister_collector(self._collect_metrics)
+        if _active_service is self: _active_service = None
         if self.scheduler and hasattr(self.scheduler, 'running') and self.scheduler.running:
             try:
                  self.scheduler.shutdown()
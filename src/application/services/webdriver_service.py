@@ -53,7 +53,8 @@ class WebDriverService(IWebDriverService):
             selenium_options: Specific Selenium options object (e.g., ChromeOptions).
             playwright_options: Specific Playwright launch options dictionary.
             driver_type: The driver backend ('selenium' or 'playwright').
-            **kwargs: Additional arguments passed to the factory (e.g., `implicit_wait_seconds`, `webdriver_path`).
+            **kwargs: Additional arguments passed to the factory (e.g., `implicit_wait_seconds`, `webdriver_path`,
+                      `load_profile`, `metrics`).
 
         Returns:
             A configured web driver instance conforming to IWebDriver.
@@ -72,6 +73,11 @@ class WebDriverService(IWebDriverService):
         factory_args = {}
         factory_args['implicit_wait_seconds'] = kwargs.get('implicit_wait_seconds', config.implicit_wait)
 
+        if kwargs.get('load_profile') is not None:
+             factory_args['load_profile'] = kwargs['load_profile']
+        if kwargs.get('metrics') is not None:
+             factory_args['metrics'] = kwargs['metrics']
+
         webdriver_path_kwarg = kwargs.get('webdriver_path')
         if webdriver_path_kwarg:
              factory_args['webdriver_path'] = webdriver_path_kwarg
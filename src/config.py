@@ -3,7 +3,7 @@
 import configparser
 import os
 import logging
-from typing import Literal, Optional, List
+from typing import Any, Dict, Literal, Optional, List
 
 # Define allowed repository types
 RepositoryType = Literal["file_system", "database"]
@@ -33,6 +33,30 @@ DEFAULT_CONFIG = {
     'Security': {
         'password_hash_method': 'pbkdf2:sha256:600000',
         'password_salt_length': '16'
+    },
+    'Metrics': {
+        'enabled': 'false',
+        'host': '127.0.0.1',
+        'port': '9464',
+    },
+    'Scheduler': {
+        'job_store_path': '',
+        'max_workers': '5',
+        'misfire_policy': 'run_once',
+        'misfire_grace_seconds': '60',
+        'lease_seconds': '60',
+    },
+    'RunQueue': {
+        'max_workers': '4',
+        'workflow_limit': '1',
+        'site_limit': '2',
+    },
+    'Runner': {
+        'batch_operations': 'false',
+        'script_typing': 'false',
+        'load_profile': '',
+        'trace': 'false',
+        'profile': 'false',
     }
 }
 
@@ -238,6 +262,92 @@ class AppConfig:
              self.logger.warning(f"Invalid integer value for 'password_salt_length'. Using default: {fallback_len}.")
              return fallback_len
 
+    @property
+    def metrics_enabled(self) -> bool:
+        try:
+            return self.config.getboolean('Metrics', 'enabled', fallback=False)
+        except ValueError:
+            self.logger.warning("Invalid boolean value for 'Metrics.enabled'. Metrics endpoint disabled.")
+            return False
+
+    @property
+    def metrics_host(self) -> str:
+        return self._get_value('Metrics', 'host', DEFAULT_CONFIG['Metrics']['host']) or DEFAULT_CONFIG['Metrics']['host']
+
+    @property
+    def metrics_port(self) -> int:
+        try:
+            port = int(self._get_value('Metrics', 'port', DEFAULT_CONFIG['Metrics']['port']) or '0')
+            if not 0 <= port <= 65535: raise ValueError(port)
+            return port
+        except (ValueError, TypeError):
+            fallback_port = int(DEFAULT_CONFIG['Metrics']['port'])
+            self.logger.warning(f"Invalid value for 'Metrics.port'. Using default: {fallback_port}.")
+            return fallback_port
+
+    @property
+    def scheduler_job_store_path(self) -> Optional[str]:
+        """SQLite database for scheduled jobs, or None to keep them in memory."""
+        return self._get_value('Scheduler', 'job_store_path', DEFAULT_CONFIG['Scheduler']['job_store_path']) or None
+
+    @property
+    def scheduler_max_workers(self) -> int:
+        return self._get_int('Scheduler', 'max_workers', minimum=1)
+
+    @property
+    def scheduler_misfire_policy(self) -> str:
+        policy = (self._get_value('Scheduler', 'misfire_policy', DEFAULT_CONFIG['Scheduler']['misfire_policy']) or '').lower()
+        if policy not in ('skip', 'run_once', 'run_all'):
+            default_policy = DEFAULT_CONFIG['Scheduler']['misfire_policy']
+            self.logger.warning(f"Invalid scheduler misfire policy '{policy}'. Defaulting to '{default_policy}'.")
+            return default_policy
+        return policy
+
+    @property
+    def scheduler_misfire_grace_seconds(self) -> int:
+        return self._get_int('Scheduler', 'misfire_grace_seconds', minimum=1)
+
+    @property
+    def scheduler_lease_seconds(self) -> int:
+        return self._get_int('Scheduler', 'lease_seconds', minimum=1)
+
+    @property
+    def run_queue_max_workers(self) -> int:
+        return self._get_int('RunQueue', 'max_workers', minimum=1)
+
+    @property
+    def run_queue_workflow_limit(self) -> int:
+        return self._get_int('RunQueue', 'workflow_limit', minimum=1)
+
+    @property
+    def run_queue_site_limit(self) -> int:
+        return self._get_int('RunQueue', 'site_limit', minimum=1)
+
+    @property
+    def runner_options(self) -> Dict[str, Any]:
+        """WorkflowRunner options for manual runs; a workflow's metadata may override them."""
+        options = {key: self._get_bool('Runner', key) for key in ('batch_operations', 'script_typing', 'trace', 'profile')}
+        options['load_profile'] = self._get_value('Runner', 'load_profile', DEFAULT_CONFIG['Runner']['load_profile']) or None
+        return options
+
+    def _get_bool(self, section: str, key: str) -> bool:
+        try:
+            return self.config.getboolean(section, key, fallback=DEFAULT_CONFIG[section][key] == 'true')
+        except ValueError:
+            fallback = DEFAULT_CONFIG[section][key] == 'true'
+            self.logger.warning(f"Invalid boolean value for '{section}.{key}'. Using default: {fallback}.")
+            return fallback
+
+    def _get_int(self, section: str, key: str, minimum: int) -> int:
+        try:
+            value = int(self._get_value(section, key, DEFAULT_CONFIG[section][key]) or '0')
+            if value < minimum: raise ValueError(value)
+            return value
+        except (ValueError, TypeError):
+            fallback = int(DEFAULT_CONFIG[section][key])
+            self.logger.warning(f"Invalid value for '{section}.{key}'. Using default: {fallback}.")
+            return fallback
+
 
 # --- Global Singleton Instance ---
 try:
@@ -36,12 +36,17 @@ class ClickAction(ActionBase):
             raise ValidationError("Selector must be a non-empty string.", field_name="selector")
         return True
 
-    def execute(self, driver: IWebDriver) -> ActionResult:
+    def execute(
+        self,
+        driver: IWebDriver,
+        credential_repo: Optional[ICredentialRepository] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> ActionResult:
         """Execute the click action using the web driver."""
         logger.info(f"Executing {self.action_type} '{self.name}' -> {self.selector}")
         try:
             self.validate()
-            driver.click(self.selector)
+            driver.click_element(self.selector)
             return ActionResult.success(f"Clicked element '{self.selector}'")
         except (ValidationError, WebDriverError) as e:
             logger.error(f"Click failed ({e})")
@@ -157,6 +162,15 @@ class TypeAction(ActionBase):
             logger.error(str(error), exc_info=True)
             return ActionResult.failure(str(error))
 
+    def to_batch_operation(self, credential_repo: Optional[ICredentialRepository] = None) -> Dict[str, Any]:
+        """Return this action as an IWebDriver batch 'type' operation.
+
+        Raises:
+            ValidationError, CredentialError: If the action is invalid or its text cannot be resolved.
+        """
+        self.validate()
+        return {"op": "type", "selector": self.selector, "text": self._resolve_text(credential_repo)}
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the action to a dictionary."""
         base_dict = super().to_dict()
@@ -107,6 +107,16 @@ class ScreenshotAction(ActionBase):
                 except OSError as e:
                      raise ActionError(f"Failed directory '{directory}': {e}", action_name=self.name, action_type=self.action_type, cause=e) from e
 
+            writer = (context or {}).get("screenshot_writer")
+            if writer is not None and getattr(driver, "SUPPORTS_SCREENSHOT_BYTES", False):
+                data = driver.get_screenshot_bytes() # Raises WebDriverError
+                writer.submit(data, self.file_path) # Blocks only while the writer queue is full
+                msg = f"Queued screenshot for writing to: {self.file_path}"
+                logger.debug(msg)
+                return ActionResult.success(msg)
+            if writer is not None:
+                logger.debug(f"{type(driver).__name__} cannot capture to memory; saving screenshot synchronously.")
+
             driver.take_screenshot(self.file_path) # Raises WebDriverError
             msg = f"Successfully saved screenshot to: {self.file_path}"
             logger.debug(msg)
@@ -100,4 +100,107 @@ class IWebDriver(abc.ABC):
     def get_alert_text(self) -> str:
         """Get the text content of an alert, confirm, or prompt dialog."""
         pass
+
+    # --- Screenshot Options ---
+
+    SCREENSHOT_FORMATS = ("png", "jpeg", "webp")
+    SUPPORTS_SCREENSHOT_BYTES = False # True if get_screenshot_bytes is implemented
+
+    def capture_screenshot(self,
+                           file_path: str,
+                           image_format: str = "png",
+                           quality: Optional[int] = None,
+                           selector: Optional[str] = None,
+                           clip: Optional[Dict[str, float]] = None,
+                           full_page: bool = False) -> None:
+        """Take a screenshot with encoding and region options and save it to file_path.
+
+        Args:
+            file_path: Destination file.
+            image_format: One of SCREENSHOT_FORMATS.
+            quality: Compression quality (0-100) for 'jpeg' and 'webp'.
+            selector: Capture only the element matching this CSS selector.
+            clip: Capture only this page region ({'x', 'y', 'width', 'height'} in CSS pixels).
+            full_page: Capture the whole scrollable page instead of the viewport.
+
+        Drivers without native support only handle a plain viewport PNG, which
+        is delegated to take_screenshot.
+
+        Raises:
+            WebDriverError: If the requested options are not supported by this driver.
+        """
+        from src.core.exceptions import WebDriverError
+        if image_format != "png" or quality is not None or selector or clip or full_page:
+            raise WebDriverError(f"{type(self).__name__} does not support screenshot options.")
+        self.take_screenshot(file_path)
+
+    def get_screenshot_bytes(self, image_format: str = "png", quality: Optional[int] = None) -> bytes:
+        """Capture the viewport and return the encoded image without writing it to disk.
+
+        Only available when SUPPORTS_SCREENSHOT_BYTES is True; check it before calling.
+
+        Raises:
+            WebDriverError: If the driver can only save screenshots to files, or the capture fails.
+        """
+        from src.core.exceptions import WebDriverError
+        raise WebDriverError(f"{type(self).__name__} does not support in-memory screenshots.")
+
+    # --- Batched Operations ---
+
+    BATCH_OPERATIONS = ("click", "type", "get_attribute", "get_text", "is_present")
+
+    def run_batch(self, operations: List[Dict[str, Any]], script_typing: bool = False) -> List[Any]:
+        """Execute a sequence of independent element operations.
+
+        Each operation is a dict with an ``op`` key (one of BATCH_OPERATIONS)
+        and a ``selector`` key, plus ``text`` for 'type' and ``name`` for
+        'get_attribute'. Implementations may coalesce the whole batch into a
+        single driver round trip; this default executes the operations one by
+        one through the regular interface methods.
+
+        'type' has the same semantics as type_text (clear, then key presses)
+        unless the caller opts in to script_typing, which lets implementations
+        set the value from a script and fire only 'input'/'change' events.
+        Pages that react to key events (autocomplete, masked inputs) need the
+        default.
+
+        Args:
+            operations: The operations to execute, in order.
+            script_typing: Whether 'type' operations may set values from a script.
+
+        Returns:
+            One result per operation (None for 'click' and 'type').
+
+        Raises:
+            ValidationError: If an operation is malformed. Nothing has been
+                             executed.
+            WebDriverError: If any operation fails. Operations before the
+                            failing one have already been applied.
+        """
+        from src.core.exceptions import ValidationError
+        if not isinstance(operations, list): raise ValidationError("Operations must be a list.", field_name="operations")
+        for operation in operations: self._check_batch_operation(operation)
+        return [self._run_batch_operation(op) for op in operations]
+
+    def _check_batch_operation(self, operation: Any) -> None:
+        """Raise ValidationError if operation is not a well-formed batch operation."""
+        from src.core.exceptions import ValidationError
+        if not isinstance(operation, dict) or operation.get("op") not in self.BATCH_OPERATIONS:
+            raise ValidationError(f"Invalid batch operation: {operation!r}", field_name="op")
+        if not isinstance(operation.get("selector"), str) or not operation["selector"]:
+            raise ValidationError("Selector must be non-empty string.", field_name="selector")
+        if operation["op"] == "type" and not isinstance(operation.get("text", ""), str):
+            raise ValidationError("Text must be string.", field_name="text")
+        if operation["op"] == "get_attribute" and (not isinstance(operation.get("name"), str) or not operation["name"]):
+            raise ValidationError("Attribute name must be non-empty string.", field_name="name")
+
+    def _run_batch_operation(self, operation: Dict[str, Any]) -> Any:
+        """Execute a single (checked) batch operation using the per-call interface methods."""
+        op, selector = operation["op"], operation.get("selector")
+        if op == "click": return self.click_element(selector)
+        if op == "type": return self.type_text(selector, operation.get("text", ""))
+        if op == "is_present": return self.is_element_present(selector)
+        element = self.find_element(selector)
+        if op == "get_text": return element.text
+        return element.get_attribute(operation.get("name"))
 ################################################################################
\ No newline at end of file
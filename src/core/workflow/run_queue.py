@@ -0,0 +1,243 @@
+"""Priority- and fairness-aware queue of workflow runs.
+
+RunQueue executes submitted runs on a fixed set of worker threads. When a
+worker is free, the run it takes is chosen as follows:
+
+1. Only runs whose workflow and target site are below their concurrency
+   limits are eligible, so one site never sees more than its limit of
+   sessions, whatever is queued.
+2. Runs past their deadline (the latest time they are still useful) are
+   failed with WorkflowError instead of being started.
+3. The most urgent priority wins (PRIORITY_INTERACTIVE before
+   PRIORITY_NORMAL before PRIORITY_BATCH), so a manual run never waits
+   behind a nightly batch.
+4. Within a priority, tenants (e.g. credentials) share the workers by
+   weighted fair queueing: the tenant that has started the fewest runs
+   relative to its weight goes next.
+5. Within a tenant, the earliest deadline goes first, then the oldest run.
+
+Selection scans the pending runs, which is cheap for the queue sizes a
+desktop scheduler sees (hundreds of runs).
+"""
+
+import time
+import logging
+import itertools
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from src.core.exceptions import WorkflowError
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BATCH = 20
+DEFAULT_TENANT = "default"
+
+
+def workflow_site(actions: Iterable[Any]) -> Optional[str]:
+    """The host of the first URL a workflow navigates to (searching nested actions), or None."""
+    for action in actions or ():
+        url = getattr(action, "url", None)
+        if isinstance(url, str) and url:
+            host = urlparse(url).hostname
+            if host: return host.lower()
+        for attribute in ("true_branch", "false_branch", "loop_actions", "try_actions", "catch_actions"):
+            nested = getattr(action, attribute, None)
+            if isinstance(nested, list):
+                host = workflow_site(nested)
+                if host: return host
+    return None
+
+
+class QueuedRun:
+    """
+    A run waiting in, or taken from, a RunQueue.
+
+    Attributes:
+        run_id (int): Submission sequence number.
+        workflow_name (str): Workflow to run (the per-workflow limit key).
+        func (Callable[[], Any]): Performs the run; its return value is the future's result.
+        priority (int): Lower runs first (see PRIORITY_*).
+        tenant (str): Fair-sharing key, e.g. the credential name.
+        site (Optional[str]): Target host (the per-site limit key), if known.
+        deadline (Optional[float]): time.time() after which the run is no longer worth starting.
+        source (str): Who submitted it, e.g. 'manual' or 'scheduled'.
+        future (Future): Completed with func's result or exception.
+    """
+    __slots__ = ("run_id", "workflow_name", "func", "priority", "tenant", "site", "deadline", "source",
+                 "future", "submitted_at", "started_at")
+
+    def __init__(self, run_id: int, workflow_name: str, func: Callable[[], Any], priority: int, tenant: str,
+                 site: Optional[str], deadline: Optional[float], source: str):
+        self.run_id = run_id
+        self.workflow_name = workflow_name
+        self.func = func
+        self.priority = priority
+        self.tenant = tenant
+        self.site = site
+        self.deadline = deadline
+        self.source = source
+        self.future: Future = Future()
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<QueuedRun {self.run_id} '{self.workflow_name}' priority={self.priority} tenant={self.tenant!r} site={self.site!r}>"
+
+
+class RunQueue:
+    """
+    Runs workflow runs on `max_workers` threads in priority, fairness and deadline order.
+
+    Attributes:
+        max_workers (int): Runs (and so browsers) executing at once.
+        workflow_limit (int): Default concurrent runs per workflow.
+        site_limit (int): Default concurrent runs per target site.
+        workflow_limits (Dict[str, int]): Per-workflow overrides.
+        site_limits (Dict[str, int]): Per-site overrides.
+        tenant_weights (Dict[str, float]): Relative worker shares (default 1 each).
+    """
+
+    def __init__(self, max_workers: int = 4, workflow_limit: int = 1, site_limit: int = 2,
+                 workflow_limits: Optional[Dict[str, int]] = None, site_limits: Optional[Dict[str, int]] = None,
+                 tenant_weights: Optional[Dict[str, float]] = None):
+        if max_workers < 1: raise ValueError("max_workers must be at least 1.")
+        if workflow_limit < 1 or site_limit < 1: raise ValueError("Concurrency limits must be at least 1.")
+        self.max_workers = max_workers
+        self.workflow_limit = workflow_limit
+        self.site_limit = site_limit
+        self.workflow_limits = dict(workflow_limits or {})
+        self.site_limits = dict(site_limits or {})
+        self.tenant_weights = dict(tenant_weights or {})
+        self._condition = threading.Condition()
+        self._pending: List[QueuedRun] = []
+        self._running: List[QueuedRun] = []
+        self._workflow_counts: Dict[str, int] = {}
+        self._site_counts: Dict[str, int] = {}
+        self._tenant_vtime: Dict[str, float] = {}
+        self._ids = itertools.count(1)
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+        self._expired = 0
+
+    def submit(self, workflow_name: str, func: Callable[[], Any], priority: int = PRIORITY_NORMAL,
+               tenant: Optional[str] = None, site: Optional[str] = None, deadline: Optional[float] = None,
+               source: str = "manual") -> QueuedRun:
+        """Queue a run; returns it (wait on `.future` for the result). Starts the workers if needed."""
+        with self._condition:
+            if self._shutdown: raise WorkflowError("Run queue is shut down.", workflow_name)
+            run = QueuedRun(next(self._ids), workflow_name, func, priority, tenant or DEFAULT_TENANT,
+                            site.lower() if site else None, deadline, source)
+            self._pending.append(run)
+            if len(self._workers) < self.max_workers: self._start_worker()
+            self._condition.notify()
+        logger.debug(f"Queued {run} ({len(self._pending)} pending).")
+        return run
+
+    def cancel(self, run: QueuedRun) -> bool:
+        """Remove a run that has not started yet; returns False if it already started or finished."""
+        with self._condition:
+            if run not in self._pending: return False
+            self._pending.remove(run)
+        run.future.cancel()
+        return True
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop accepting runs; workers exit once the queue is drained (or emptied with cancel_pending)."""
+        with self._condition:
+            self._shutdown = True
+            cancelled, self._pending = (self._pending, []) if cancel_pending else ([], self._pending)
+            self._condition.notify_all()
+        for run in cancelled: run.future.cancel()
+        if wait:
+            for worker in list(self._workers): worker.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of pending and running runs, by priority, site and tenant."""
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "running": len(self._running),
+                "expired": self._expired,
+                "pending_by_priority": self._count(self._pending, "priority"),
+                "running_by_site": dict(self._site_counts),
+                "running_by_tenant": self._count(self._running, "tenant"),
+            }
+
+    @staticmethod
+    def _count(runs: List[QueuedRun], attribute: str) -> Dict[Any, int]:
+        counts: Dict[Any, int] = {}
+        for run in runs: counts[getattr(run, attribute)] = counts.get(getattr(run, attribute), 0) + 1
+        return counts
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._work, name=f"RunQueueWorker-{len(self._workers) + 1}", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                run = self._take()
+                while run is None:
+                    if self._shutdown and not self._pending: return
+                    deadlines = [run.deadline for run in self._pending if run.deadline is not None]
+                    self._condition.wait(max(0.0, min(deadlines) - time.time()) + 0.001 if deadlines else None)
+                    run = self._take()
+            self._execute(run)
+
+    def _execute(self, run: QueuedRun) -> None:
+        if run.future.set_running_or_notify_cancel():
+            try:
+                run.future.set_result(run.func())
+            except BaseException as e:
+                logger.error(f"Queued run of '{run.workflow_name}' failed: {e}")
+                run.future.set_exception(e)
+        with self._condition:
+            self._running.remove(run)
+            self._decrement(self._workflow_counts, run.workflow_name)
+            if run.site: self._decrement(self._site_counts, run.site)
+            self._condition.notify_all() # Limits freed: any waiting worker may now find an eligible run
+
+    @staticmethod
+    def _decrement(counts: Dict[str, int], key: str) -> None:
+        counts[key] -= 1
+        if not counts[key]: del counts[key]
+
+    def _take(self) -> Optional[QueuedRun]:
+        """Pick and claim the next eligible run (caller holds the condition)."""
+        if not self._pending: return None
+        now = time.time()
+        expired = [run for run in self._pending if run.deadline is not None and run.deadline < now]
+        for run in expired: self._expire(run)
+        best: Optional[QueuedRun] = None
+        best_key = None
+        active_vtime = min((self._tenant_vtime.get(run.tenant, 0.0) for run in self._pending), default=0.0)
+        for run in self._pending:
+            if self._workflow_counts.get(run.workflow_name, 0) >= self.workflow_limits.get(run.workflow_name, self.workflow_limit): continue
+            if run.site and self._site_counts.get(run.site, 0) >= self.site_limits.get(run.site, self.site_limit): continue
+            key = (run.priority, max(self._tenant_vtime.get(run.tenant, 0.0), active_vtime),
+                   run.deadline if run.deadline is not None else float("inf"), run.run_id)
+            if best_key is None or key < best_key: best, best_key = run, key
+        if best is None: return None
+        self._pending.remove(best)
+        self._running.append(best)
+        self._workflow_counts[best.workflow_name] = self._workflow_counts.get(best.workflow_name, 0) + 1
+        if best.site: self._site_counts[best.site] = self._site_counts.get(best.site, 0) + 1
+        # A tenant's virtual time only advances from the current minimum, so idle tenants don't bank credit.
+        start_vtime = max(self._tenant_vtime.get(best.tenant, 0.0), active_vtime)
+        self._tenant_vtime[best.tenant] = start_vtime + 1.0 / self.tenant_weights.get(best.tenant, 1.0)
+        best.started_at = now
+        logger.debug(f"Starting {best} after {now - best.submitted_at:.2f}s in queue.")
+        return best
+
+    def _expire(self, run: QueuedRun) -> None:
+        self._pending.remove(run)
+        self._expired += 1
+        logger.warning(f"Dropping queued run of '{run.workflow_name}' ({run.source}): deadline passed before it could start.")
+        if run.future.set_running_or_notify_cancel():
+            run.future.set_exception(WorkflowError("Run deadline passed before it could start.", run.workflow_name))
@@ -7,7 +7,8 @@ and ErrorHandling, plus Template expansion.
 
 import logging
 import time # For timing execution
-from typing import List, Optional, Dict, Any
+from contextlib import nullcontext
+from typing import List, Optional, Dict, Any, Callable, ContextManager
 import threading # For stop event checking
 from datetime import datetime # For timestamps in log
 from enum import Enum, auto
@@ -15,15 +16,19 @@ from enum import Enum, auto
 # Core components
 from src.core.interfaces import IWebDriver, IAction, ICredentialRepository, IWorkflowRepository # Added IWorkflowRepository
 from src.core.action_result import ActionResult, ActionStatus
-from src.core.exceptions import WorkflowError, ActionError, AutoQliqError, ValidationError, RepositoryError, SerializationError
+from src.core.exceptions import WorkflowError, ActionError, AutoQliqError, ValidationError, RepositoryError, SerializationError, WebDriverError, CredentialError
 
 # Import control flow actions to check types
 from src.core.actions.conditional_action import ConditionalAction
 from src.core.actions.loop_action import LoopAction
 from src.core.actions.error_handling_action import ErrorHandlingAction
 from src.core.actions.template_action import TemplateAction # Added
+from src.core.actions.interaction import TypeAction
 # Need factory for deserializing templates
 from src.core.actions.factory import ActionFactory
+from src.core.workflow.screenshot_writer import ScreenshotRun, ScreenshotWriter
+from src.core.workflow.tracing import Span, Tracer, TracingWebDriver
+from src.core.workflow.profiling import DEFAULT_INTERVAL_SECONDS, SamplingProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,23 @@ class WorkflowRunner:
         credential_repo (Optional[ICredentialRepository]): Repository for credentials.
         workflow_repo (Optional[IWorkflowRepository]): Repository for workflows/templates (needed for template expansion).
         stop_event (Optional[threading.Event]): Event to signal graceful stop request.
+        batch_operations (bool): Whether consecutive TypeActions are sent to the driver
+                                 as a single `run_batch` call (opt-in; the runner presenter
+                                 sets it from [Runner] config or the workflow metadata key
+                                 of the same name).
+        script_typing (bool): Whether batched TypeActions may set values from a script instead
+                              of clear()+send_keys() (see IWebDriver.run_batch).
+        screenshot_writer (Optional[ScreenshotWriter]): Background writer used by ScreenshotActions
+                                 (may be shared by concurrent runs); `run` waits for its own
+                                 screenshots before returning.
+        trace (bool): Whether `run` records a span tree (blocks, iterations, actions and
+                      driver calls) and adds it to the execution log under "trace".
+        profile (bool): Whether `run` samples its own stack every `profile_interval` seconds and
+                        adds the profile (per-action samples and collapsed stacks, see
+                        SamplingProfiler.to_dict) to the execution log under "profile".
+
+    If the driver supports metric tags (e.g. InstrumentedWebDriver), driver calls are
+    tagged with the workflow name and the name of the action making them.
     """
 
     def __init__(
@@ -55,7 +77,13 @@ class WorkflowRunner:
         driver: IWebDriver,
         credential_repo: Optional[ICredentialRepository] = None,
         workflow_repo: Optional[IWorkflowRepository] = None, # Added repo for templates
-        stop_event: Optional[threading.Event] = None # Added stop event
+        stop_event: Optional[threading.Event] = None, # Added stop event
+        batch_operations: bool = False,
+        script_typing: bool = False,
+        screenshot_writer: Optional[ScreenshotWriter] = None,
+        trace: bool = False,
+        profile: bool = False,
+        profile_interval: float = DEFAULT_INTERVAL_SECONDS
     ):
         """Initialize the WorkflowRunner."""
         if driver is None: raise ValueError("WebDriver instance cannot be None.")
@@ -63,6 +91,14 @@ class WorkflowRunner:
         self.credential_repo = credential_repo
         self.workflow_repo = workflow_repo # Store workflow repo reference
         self.stop_event = stop_event # Store stop event
+        self.batch_operations = batch_operations
+        self.script_typing = script_typing
+        self.screenshot_writer = screenshot_writer
+        self.trace = trace
+        self.profile = profile
+        self.profile_interval = profile_interval
+        self._tracer: Optional[Tracer] = None # Set only while a traced run is in progress
+        self._metric_tags: Optional[Callable[..., ContextManager[Any]]] = None # Set while running on a tagging driver
         logger.info("WorkflowRunner initialized.")
         if credential_repo: logger.debug(f"Using credential repository: {type(credential_repo).__name__}")
         if workflow_repo: logger.debug(f"Using workflow repository: {type(workflow_repo).__name__}")
@@ -119,8 +155,28 @@ class WorkflowRunner:
              raise ActionError(f"Unexpected error expanding template '{template_name}': {e}", action_name=template_action.name, cause=e) from e
 
 
-    def _execute_actions(self, actions: List[IAction], context: Dict[str, Any], workflow_name: str, log_prefix: str = "") -> List[ActionResult]:
+    def _span(self, name: str, kind: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+        """Returns a tracing span context for a traced run, or a no-op context yielding None."""
+        if self._tracer is None: return nullcontext()
+        return self._tracer.span(name, kind, **attributes)
+
+
+    def _tagged(self, action_name: str) -> ContextManager[Any]:
+        """Returns a context attributing driver calls to an action, or a no-op context."""
+        if self._metric_tags is None: return nullcontext()
+        return self._metric_tags(action=action_name)
+
+
+    def _execute_actions(self, actions: List[IAction], context: Dict[str, Any], workflow_name: str, log_prefix: str = "",
+                         span_kind: str = "block") -> List[ActionResult]:
         """Internal helper to execute actions, handling control flow, context, templates, stop events."""
+        if self._tracer is None: return self._execute_block(actions, context, workflow_name, log_prefix)
+        with self._tracer.span(log_prefix.rstrip(": ") or "main", span_kind, actions=len(actions)):
+            return self._execute_block(actions, context, workflow_name, log_prefix)
+
+
+    def _execute_block(self, actions: List[IAction], context: Dict[str, Any], workflow_name: str, log_prefix: str) -> List[ActionResult]:
+        """Executes a block of actions; see _execute_actions."""
         block_results: List[ActionResult] = []
         current_action_index = 0
         action_list_copy = list(actions) # Operate on a copy
@@ -140,17 +196,34 @@ class WorkflowRunner:
                 # --- Expand TemplateAction ---
                 if isinstance(action, TemplateAction):
                     logger.debug(f"Runner expanding template action: {action_display}")
-                    expanded_actions = self._expand_template(action, context) # Raises ActionError
+                    with self._span(action.name, "action", action_type=action.action_type, template=action.template_name):
+                        expanded_actions = self._expand_template(action, context) # Raises ActionError
                     action_list_copy = action_list_copy[:current_action_index] + expanded_actions + action_list_copy[current_action_index+1:]
                     logger.debug(f"Replaced template with {len(expanded_actions)} actions. New total: {len(action_list_copy)}")
                     continue # Restart loop for first expanded action
 
+                # --- Coalesce consecutive TypeActions into one driver batch ---
+                elif self.batch_operations and len(batch := self._collect_type_batch(action_list_copy, current_action_index)) > 1:
+                    with self._span(f"{len(batch)} type actions", "action", action_type="TypeBatch"), self._tagged(batch[0].name):
+                        batch_results = self._execute_type_batch(batch, context, f"{log_prefix}Step {step_num}")
+                    for batched_action, batched_result in zip(batch, batch_results):
+                        block_results.append(batched_result)
+                        if not batched_result.is_success():
+                            logger.error(f"Action '{batched_action.name}' failed. Stopping block.")
+                            raise ActionError(batched_result.message or f"Action '{batched_action.name}' failed.", action_name=batched_action.name, action_type=batched_action.action_type)
+                    current_action_index += len(batch)
+                    continue
+
                 # --- Execute Action ---
-                elif isinstance(action, ConditionalAction): result = self._execute_conditional(action, context, workflow_name, f"{log_prefix}Cond {step_num}: ")
-                elif isinstance(action, LoopAction): result = self._execute_loop(action, context, workflow_name, f"{log_prefix}Loop {step_num}: ")
-                elif isinstance(action, ErrorHandlingAction): result = self._execute_error_handler(action, context, workflow_name, f"{log_prefix}ErrH {step_num}: ")
-                elif isinstance(action, IAction): result = self.run_single_action(action, context) # Handles internal errors -> ActionResult
-                else: raise WorkflowError(f"Invalid item at {log_prefix}Step {step_num}: {type(action).__name__}.")
+                else:
+                    with self._span(getattr(action, "name", "?"), "action", action_type=getattr(action, "action_type", type(action).__name__)) as span, \
+                         self._tagged(getattr(action, "name", "?")):
+                        if isinstance(action, ConditionalAction): result = self._execute_conditional(action, context, workflow_name, f"{log_prefix}Cond {step_num}: ")
+                        elif isinstance(action, LoopAction): result = self._execute_loop(action, context, workflow_name, f"{log_prefix}Loop {step_num}: ")
+                        elif isinstance(action, ErrorHandlingAction): result = self._execute_error_handler(action, context, workflow_name, f"{log_prefix}ErrH {step_num}: ")
+                        elif isinstance(action, IAction): result = self.run_single_action(action, context) # Handles internal errors -> ActionResult
+                        else: raise WorkflowError(f"Invalid item at {log_prefix}Step {step_num}: {type(action).__name__}.")
+                        if span is not None and result is not None: span.attributes["status"] = result.status.value
 
             except ActionError as e:
                  logger.error(f"ActionError during execution of {action_display}: {e}")
@@ -174,6 +247,40 @@ class WorkflowRunner:
         return block_results
 
 
+    @staticmethod
+    def _collect_type_batch(actions: List[IAction], start_index: int) -> List[TypeAction]:
+        """Returns the run of consecutive TypeActions starting at start_index."""
+        end_index = start_index
+        while end_index < len(actions) and isinstance(actions[end_index], TypeAction): end_index += 1
+        return actions[start_index:end_index]
+
+
+    def _execute_type_batch(self, batch: List[TypeAction], context: Dict[str, Any], log_label: str) -> List[ActionResult]:
+         """Executes consecutive TypeActions with a single IWebDriver.run_batch call.
+
+         Typing is idempotent, so if the batch cannot be built or fails part-way,
+         the actions are simply re-run one at a time to get per-action results,
+         checking for a stop request before each one.
+         """
+         try:
+              operations = [action.to_batch_operation(self.credential_repo) for action in batch]
+              logger.debug(f"Runner batching {len(operations)} type actions at {log_label}.")
+              if self.script_typing: self.driver.run_batch(operations, script_typing=True) # Raises WebDriverError
+              else: self.driver.run_batch(operations)
+              return [ActionResult.success(f"Successfully typed text into element: {action.selector}") for action in batch]
+         except (ValidationError, CredentialError, WebDriverError) as e:
+              logger.warning(f"Batch at {log_label} failed ({e}); executing actions individually.")
+              results: List[ActionResult] = []
+              for action in batch:
+                   if self.stop_event and self.stop_event.is_set():
+                        logger.info(f"Stop requested during batch at {log_label}.")
+                        raise WorkflowError("Workflow execution stopped by request.")
+                   result = self.run_single_action(action, context)
+                   results.append(result)
+                   if not result.is_success(): break
+              return results
+
+
     def _execute_conditional(self, action: ConditionalAction, context: Dict[str, Any], workflow_name: str, log_prefix: str) -> ActionResult:
          """Executes a ConditionalAction's appropriate branch."""
          try:
@@ -204,7 +311,7 @@ class WorkflowRunner:
                      iteration_num = i + 1; iter_log_prefix = f"{log_prefix}Iter {iteration_num}: "
                      logger.info(f"{iter_log_prefix}Starting.")
                      iter_context = context.copy(); iter_context.update({'loop_index': i, 'loop_iteration': iteration_num, 'loop_total': iterations_total})
-                     self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix) # Raises ActionError
+                     self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix, span_kind="iteration") # Raises ActionError
                      iterations_executed = iteration_num
              elif action.loop_type == "for_each":
                  if not action.list_variable_name: raise ActionError("list_variable_name missing", action.name)
@@ -216,7 +323,7 @@ class WorkflowRunner:
                       iteration_num = i + 1; iter_log_prefix = f"{log_prefix}Item {iteration_num}: "
                       logger.info(f"{iter_log_prefix}Starting.")
                       iter_context = context.copy(); iter_context.update({'loop_index': i, 'loop_iteration': iteration_num, 'loop_total': iterations_total, 'loop_item': item})
-                      self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix) # Raises ActionError
+                      self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix, span_kind="iteration") # Raises ActionError
                       iterations_executed = iteration_num
              elif action.loop_type == "while":
                   logger.info(f"{log_prefix}Starting 'while' loop.")
@@ -230,7 +337,7 @@ class WorkflowRunner:
                        if not condition_met: logger.info(f"{iter_log_prefix}Condition false. Exiting loop."); break
                        logger.info(f"{iter_log_prefix}Condition true. Starting iteration.")
                        iter_context = context.copy(); iter_context.update({'loop_index': i, 'loop_iteration': iteration_num})
-                       self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix) # Raises ActionError
+                       self._execute_actions(action.loop_actions, iter_context, workflow_name, iter_log_prefix, span_kind="iteration") # Raises ActionError
                        iterations_executed = iteration_num
                        i += 1
                   else: raise ActionError(f"While loop exceeded max iterations ({max_while}).", action.name)
@@ -277,6 +384,16 @@ class WorkflowRunner:
                                           action_name=action.name, cause=catch_error) from catch_error
 
 
+    def _flush_screenshots(self, workflow_name: str, screenshot_run: Optional[ScreenshotRun]) -> Optional[Dict[str, Any]]:
+        """Waits for this run's queued screenshots to be written and returns their stats (None without a writer)."""
+        if screenshot_run is None: return None
+        stats = screenshot_run.flush()
+        del stats["pending"]
+        logger.info(f"RUNNER: Workflow '{workflow_name}' screenshots flushed: {stats['written']} written, "
+                    f"{stats['deduplicated']} deduplicated, {stats['failed']} failed.")
+        return stats
+
+
     def run(self, actions: List[IAction], workflow_name: str = "Unnamed Workflow") -> Dict[str, Any]:
         """
         Execute actions sequentially, returning detailed log data.
@@ -292,10 +409,24 @@ class WorkflowRunner:
 
         logger.info(f"RUNNER: Starting workflow '{workflow_name}' with {len(actions)} top-level actions.")
         execution_context: Dict[str, Any] = {}
+        screenshot_run: Optional[ScreenshotRun] = None
+        if self.screenshot_writer:
+            # Track this run's screenshots apart from other runs sharing the writer
+            screenshot_run = self.screenshot_writer.open_run()
+            execution_context["screenshot_writer"] = screenshot_run
         all_action_results: List[ActionResult] = []
         start_time = time.time()
         final_status = "UNKNOWN"
         error_message: Optional[str] = None
+        workflow_tags = self.driver.metric_tags(workflow=workflow_name) if hasattr(type(self.driver), "metric_tags") else None
+        if workflow_tags is not None:
+            self._metric_tags = self.driver.metric_tags; workflow_tags.__enter__()
+        tracer = Tracer() if self.trace else None
+        if tracer:
+            untraced_driver = self.driver
+            self._tracer = tracer; self.driver = TracingWebDriver(untraced_driver, tracer)
+            workflow_span = tracer.start_span(workflow_name, "workflow")
+        profiler = SamplingProfiler(self.profile_interval, action_of=_profiled_action).start() if self.profile else None
 
         try:
             # Check stop event *before* starting the main loop
@@ -317,6 +448,16 @@ class WorkflowRunner:
              final_status = "FAILED"; error_message = f"Unexpected runner error: {e}"
              logger.exception(f"RUNNER: Unexpected error during workflow '{workflow_name}' execution.")
         finally:
+            if profiler: profiler.stop()
+            screenshot_stats = self._flush_screenshots(workflow_name, screenshot_run)
+            if screenshot_stats and screenshot_stats["failed"] and final_status == "SUCCESS":
+                 final_status = "FAILED"; error_message = f"{screenshot_stats['failed']} screenshot(s) could not be written."
+            if tracer:
+                workflow_span.attributes["status"] = final_status
+                tracer.end_span(workflow_span)
+                self._tracer = None; self.driver = untraced_driver
+            if workflow_tags is not None:
+                workflow_tags.__exit__(None, None, None); self._metric_tags = None
             end_time = time.time(); duration = end_time - start_time
             logger.info(f"RUNNER: Workflow '{workflow_name}' finished. Status: {final_status}, Duration: {duration:.2f}s")
             execution_log = {
@@ -328,4 +469,17 @@ class WorkflowRunner:
                  "error_message": error_message,
                  "action_results": [{"status": res.status.value, "message": res.message} for res in all_action_results]
             }
+            if screenshot_stats is not None: execution_log["screenshots"] = screenshot_stats
+            if tracer: execution_log["trace"] = tracer.to_dict()
+            if profiler: execution_log["profile"] = profiler.to_dict()
             return execution_log
+
+
+_EXECUTE_BLOCK_CODE = WorkflowRunner._execute_block.__code__
+
+
+def _profiled_action(frame: Any) -> Optional[str]:
+    """Profiler attribution: the action an _execute_block frame is executing (read from the frame, so the run itself does no extra work)."""
+    if frame.f_code is not _EXECUTE_BLOCK_CODE: return None
+    action = frame.f_locals.get("action")
+    return getattr(action, "name", None) if action is not None else None
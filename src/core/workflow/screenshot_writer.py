@@ -0,0 +1,285 @@
+"""Background screenshot writer for AutoQliq workflow runs.
+
+ScreenshotAction hands raw image bytes to a ScreenshotWriter so the browser can
+move on while worker threads optionally re-encode/downscale and write the
+files. The queue is bounded, so a slow disk applies backpressure to the
+workflow instead of growing memory without limit. Identical frames (by
+content hash) are linked or copied instead of being encoded again; the hashes
+of the most recently written files are kept in a bounded LRU, and a hash is
+forgotten as soon as its file is overwritten.
+
+One writer can be shared by concurrent workflow runs: each run submits through
+its own ScreenshotRun, whose flush waits only for that run's screenshots and
+returns only its stats.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    from PIL import Image  # Optional: only needed for re-encoding/downscaling
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ScreenshotRun:
+    """
+    The screenshots of one workflow run on a shared ScreenshotWriter.
+
+    Has the writer's `submit`/`flush`/`get_stats` interface, so it can be handed to
+    ScreenshotAction in place of the writer.
+    """
+
+    def __init__(self, writer: "ScreenshotWriter"):
+        self._writer = writer
+        self._stats = {"submitted": 0, "written": 0, "deduplicated": 0, "failed": 0, "bytes_written": 0}
+        self._errors: List[Dict[str, str]] = []
+        self._pending = 0 # Submitted and not yet written (guarded by the writer's lock)
+
+    def submit(self, data: bytes, file_path: str) -> None:
+        """Queue screenshot bytes for writing; blocks while the writer's queue is full."""
+        self._writer.submit(data, file_path, run=self)
+
+    def flush(self) -> Dict[str, Any]:
+        """Block until every screenshot of this run is written, then return this run's stats."""
+        with self._writer._run_done:
+            while self._pending: self._writer._run_done.wait()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return this run's counters plus per-file errors."""
+        with self._writer._lock:
+            return dict(self._stats, pending=self._pending, errors=list(self._errors))
+
+
+class ScreenshotWriter:
+    """
+    Writes screenshots on background threads.
+
+    Attributes:
+        max_workers (int): Number of writer threads.
+        max_pending (int): Maximum queued screenshots before `submit` blocks.
+        dedupe (bool): Whether identical frames are linked/copied rather than re-encoded.
+        image_format (Optional[str]): Re-encode to this Pillow format (e.g. 'JPEG', 'WEBP'); None writes bytes as-is.
+        quality (Optional[int]): Encoder quality used when re-encoding.
+        max_width (Optional[int]): Downscale frames wider than this (aspect ratio preserved).
+        dedupe_cache_size (int): Written frames remembered for deduplication (least recently used dropped).
+    """
+
+    def __init__(self,
+                 max_workers: int = 2,
+                 max_pending: int = 16,
+                 dedupe: bool = True,
+                 image_format: Optional[str] = None,
+                 quality: Optional[int] = None,
+                 max_width: Optional[int] = None,
+                 dedupe_cache_size: int = 1024):
+        """Initialize the writer and start its worker threads."""
+        if max_workers < 1: raise ValueError("max_workers must be at least 1.")
+        if max_pending < 1: raise ValueError("max_pending must be at least 1.")
+        if dedupe_cache_size < 1: raise ValueError("dedupe_cache_size must be at least 1.")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.dedupe = dedupe
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self.dedupe_cache_size = dedupe_cache_size
+        if (image_format or max_width) and Image is None:
+            logger.warning("Pillow not installed; screenshots will be written without re-encoding or downscaling.")
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._written_by_hash: "OrderedDict[str, str]" = OrderedDict() # digest -> file holding it (LRU)
+        self._hash_by_path: Dict[str, str] = {} # Inverse of _written_by_hash
+        self._in_progress: Dict[str, threading.Event] = {} # Digests being encoded right now
+        self._path_locks = [threading.Lock() for _ in range(64)]
+        self._stats = {"submitted": 0, "written": 0, "deduplicated": 0, "failed": 0, "bytes_written": 0}
+        self._errors: List[Dict[str, str]] = []
+        self._run_done = threading.Condition(self._lock) # Notified when a run's last screenshot is written
+        self._current = threading.local() # The run whose screenshot a worker is writing
+        self._closed = False
+        self._workers = [threading.Thread(target=self._worker, name=f"ScreenshotWriter-{i}", daemon=True)
+                         for i in range(max_workers)]
+        for worker in self._workers: worker.start()
+        logger.debug(f"ScreenshotWriter started with {max_workers} workers (max pending {max_pending}).")
+
+    def open_run(self) -> ScreenshotRun:
+        """Start tracking the screenshots of one workflow run separately."""
+        return ScreenshotRun(self)
+
+    def submit(self, data: bytes, file_path: str, run: Optional[ScreenshotRun] = None) -> None:
+        """Queue screenshot bytes for writing (counted for `run` too, if given); blocks while the queue is full."""
+        if self._closed: raise RuntimeError("ScreenshotWriter is closed.")
+        if not isinstance(data, (bytes, bytearray)): raise TypeError("Screenshot data must be bytes.")
+        if not isinstance(file_path, str) or not file_path: raise ValueError("File path must be non-empty string.")
+        with self._lock:
+            self._stats["submitted"] += 1
+            if run is not None: run._stats["submitted"] += 1; run._pending += 1
+        self._queue.put((bytes(data), file_path, run))
+
+    def flush(self) -> Dict[str, Any]:
+        """Block until every submitted screenshot is written, then return the stats."""
+        self._queue.join()
+        return self.get_stats()
+
+    def close(self) -> Dict[str, Any]:
+        """Flush pending screenshots and stop the worker threads."""
+        if self._closed: return self.get_stats()
+        stats = self.flush()
+        self._closed = True
+        for _ in self._workers: self._queue.put(_STOP)
+        for worker in self._workers: worker.join()
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return counters plus per-file errors for the execution log."""
+        with self._lock:
+            return dict(self._stats, pending=self._queue.unfinished_tasks, errors=list(self._errors))
+
+    def _worker(self) -> None:
+        """Worker loop: take queued screenshots and write them until told to stop."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP: return
+                data, file_path, run = item
+                self._current.run = run
+                try:
+                    self._write(data, file_path)
+                except Exception as e:
+                    logger.error(f"Failed writing screenshot to '{file_path}': {e}")
+                    error = {"file_path": file_path, "error": str(e)}
+                    with self._lock:
+                        self._count("failed")
+                        self._errors.append(error)
+                        if run is not None: run._errors.append(error)
+                finally:
+                    self._current.run = None
+                    if run is not None:
+                        with self._lock:
+                            run._pending -= 1
+                            if not run._pending: self._run_done.notify_all()
+            finally:
+                self._queue.task_done()
+
+    def _write(self, data: bytes, file_path: str) -> None:
+        """Write one frame, reusing an earlier identical frame when possible."""
+        directory = os.path.dirname(file_path)
+        if directory: os.makedirs(directory, exist_ok=True)
+
+        digest, owner = None, True
+        if self.dedupe:
+            digest = hashlib.sha256(data).hexdigest()
+            while True:
+                with self._lock:
+                    source = self._written_by_hash.get(digest)
+                    done = None if source else self._in_progress.get(digest)
+                    if source: self._written_by_hash.move_to_end(digest)
+                    elif done is None: self._in_progress[digest] = threading.Event()
+                if done is None: break
+                done.wait() # Another worker is encoding the same frame; then look again
+            if source:
+                owner = False
+                with self._path_lock(file_path):
+                    with self._lock: self._forget_path(file_path)
+                    copied = self._link_or_copy(source, file_path)
+                if copied:
+                    with self._lock:
+                        # The source may have been overwritten while we linked; only trust the link if not
+                        linked = self._hash_by_path.get(os.path.abspath(source)) == digest
+                        if linked: self._count("deduplicated")
+                    if linked: return
+                # The original was overwritten, failed or vanished; encode this frame.
+
+        try:
+            encoded = self._encode(data)
+            fd, temp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle: handle.write(encoded)
+                # Forget, replace and remember as one step per path, so the hash map never names stale content
+                with self._path_lock(file_path):
+                    with self._lock: self._forget_path(file_path)
+                    os.replace(temp_path, file_path)
+                    with self._lock:
+                        self._count("written")
+                        self._count("bytes_written", len(encoded))
+                        if digest: self._remember(digest, file_path)
+            except BaseException:
+                if os.path.exists(temp_path): os.remove(temp_path)
+                raise
+        finally:
+            if digest and owner:
+                with self._lock: event = self._in_progress.pop(digest)
+                event.set()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        """Add to a counter, and to the same counter of the run being written (caller holds the lock)."""
+        self._stats[key] += amount
+        run = getattr(self._current, "run", None)
+        if run is not None: run._stats[key] += amount
+
+    def _path_lock(self, file_path: str) -> threading.Lock:
+        """Lock serializing writes to one path (striped, so memory stays fixed)."""
+        return self._path_locks[hash(os.path.abspath(file_path)) % len(self._path_locks)]
+
+    def _remember(self, digest: str, file_path: str) -> None:
+        """Record that file_path holds digest, evicting the least recently used entries (caller holds the lock)."""
+        path = os.path.abspath(file_path)
+        previous = self._written_by_hash.pop(digest, None)
+        if previous: self._hash_by_path.pop(previous, None)
+        self._written_by_hash[digest] = path
+        self._hash_by_path[path] = digest
+        while len(self._written_by_hash) > self.dedupe_cache_size:
+            _, evicted = self._written_by_hash.popitem(last=False)
+            self._hash_by_path.pop(evicted, None)
+
+    def _forget_path(self, file_path: str) -> None:
+        """Drop the hash entry of a file that is being overwritten (caller holds the lock)."""
+        digest = self._hash_by_path.pop(os.path.abspath(file_path), None)
+        if digest: self._written_by_hash.pop(digest, None)
+
+    def _encode(self, data: bytes) -> bytes:
+        """Optionally downscale and re-encode a frame with Pillow."""
+        if Image is None or not (self.image_format or self.max_width): return data
+        with Image.open(io.BytesIO(data)) as image:
+            target_format = self.image_format or image.format or "PNG"
+            if self.max_width and image.width > self.max_width:
+                height = max(1, round(image.height * self.max_width / image.width))
+                image = image.resize((self.max_width, height))
+            if target_format.upper() in ("JPEG", "JPG") and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            save_kwargs: Dict[str, Any] = {"quality": self.quality} if self.quality is not None else {}
+            image.save(output, format=target_format, **save_kwargs)
+            return output.getvalue()
+
+    @staticmethod
+    def _link_or_copy(source: str, destination: str) -> bool:
+        """Hard-link destination to source, falling back to a copy. Returns False if source is gone."""
+        if os.path.abspath(source) == os.path.abspath(destination): return True
+        if not os.path.exists(source): return False
+        try:
+            if os.path.exists(destination): os.remove(destination)
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
+        return True
+
+    def __enter__(self) -> "ScreenshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
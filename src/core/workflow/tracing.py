@@ -0,0 +1,212 @@
+"""Execution tracing for WorkflowRunner.
+
+A Tracer records a tree of timed spans while a workflow runs:
+workflow -> block -> action -> iteration -> block -> ... -> driver call.
+Timestamps come from the monotonic performance counter. The finished trace
+is a plain dict, stored in the execution log under "trace", with a summary
+that splits the run into driver time and engine time and totals driver
+time per selector. It can be converted to the Chrome trace-event format
+(chrome://tracing, Perfetto) with `write_chrome_trace`.
+"""
+
+import json
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Positional argument recorded for driver calls, by method name (default: 'selector').
+_DRIVER_ARGUMENT_NAMES = {
+    "get": "url", "navigate": "url", "execute_script": "script",
+    "take_screenshot": "file_path", "capture_screenshot": "file_path",
+    "switch_to_frame": "frame", "run_batch": None,
+}
+_MAX_ATTRIBUTE_LENGTH = 200
+
+
+class Span:
+    """
+    A timed operation in a trace.
+
+    Attributes:
+        name (str): Display name (action name, block label, driver method).
+        kind (str): 'workflow', 'block', 'iteration', 'action' or 'driver'.
+        attributes (Dict[str, Any]): Extra details (action type, selector, status, error).
+        start_ns (int): Monotonic start time in nanoseconds.
+        end_ns (Optional[int]): Monotonic end time in nanoseconds (None while open).
+        children (List[Span]): Nested spans, in start order.
+    """
+    __slots__ = ("name", "kind", "attributes", "start_ns", "end_ns", "children")
+
+    def __init__(self, name: str, kind: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.children: List["Span"] = []
+
+    def to_dict(self, origin_ns: int) -> Dict[str, Any]:
+        """Serialize the span tree with microsecond times relative to origin_ns."""
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "start_us": (self.start_ns - origin_ns) // 1000,
+            "duration_us": (end_ns - self.start_ns) // 1000,
+        }
+        if self.attributes: data["attributes"] = self.attributes
+        if self.children: data["children"] = [child.to_dict(origin_ns) for child in self.children]
+        return data
+
+
+class Tracer:
+    """
+    Records spans for one workflow run.
+
+    Spans nest by call order, so a Tracer must only be used from the thread
+    running the workflow. Once max_spans spans have been recorded, further
+    spans are timed but dropped from the tree (and counted).
+    """
+
+    def __init__(self, max_spans: int = 100_000):
+        self.max_spans = max_spans
+        self.root: Optional[Span] = None
+        self._stack: List[Span] = []
+        self._span_count = 0
+        self._dropped = 0
+
+    def start_span(self, name: str, kind: str, **attributes: Any) -> Span:
+        """Open a span as a child of the innermost open span."""
+        span = Span(name, kind, attributes)
+        if self._stack:
+            if self._span_count < self.max_spans: self._stack[-1].children.append(span); self._span_count += 1
+            else: self._dropped += 1
+        elif self.root is None:
+            self.root = span; self._span_count += 1
+        self._stack.append(span)
+        return span
+
+    def end_span(self, span: Span) -> None:
+        """Close a span (and any spans left open inside it)."""
+        span.end_ns = time.perf_counter_ns()
+        while self._stack:
+            if self._stack.pop() is span: break
+
+    def span(self, name: str, kind: str, **attributes: Any) -> "_SpanScope":
+        """Context manager around start_span/end_span; records the error of a failing span."""
+        return _SpanScope(self, name, kind, attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the span tree and its summary."""
+        if self.root is None: return {"spans": None, "summary": {}, "dropped_spans": self._dropped}
+        return {"spans": self.root.to_dict(self.root.start_ns), "summary": summarize(self.root),
+                "dropped_spans": self._dropped}
+
+
+class _SpanScope:
+    """Context manager returned by Tracer.span (a plain class, being cheaper than a generator)."""
+    __slots__ = ("tracer", "name", "kind", "attributes", "span")
+
+    def __init__(self, tracer: Tracer, name: str, kind: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        self.span = self.tracer.start_span(self.name, self.kind, **self.attributes)
+        return self.span
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_value is not None: self.span.attributes["error"] = _truncate(str(exc_value))
+        self.tracer.end_span(self.span)
+
+
+class TracingWebDriver:
+    """Proxy that records a 'driver' span around every public method call of the wrapped IWebDriver."""
+
+    def __init__(self, driver: Any, tracer: Tracer):
+        self._driver = driver
+        self._tracer = tracer
+
+    @property
+    def wrapped_driver(self) -> Any:
+        return self._driver
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._driver, name)
+        if name.startswith("_") or not callable(attribute): return attribute
+        tracer = self._tracer
+        argument_name = _DRIVER_ARGUMENT_NAMES.get(name, "selector")
+
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            attributes: Dict[str, Any] = {}
+            if argument_name and args and isinstance(args[0], (str, int)): attributes[argument_name] = _truncate(args[0])
+            elif name == "run_batch" and args and isinstance(args[0], list): attributes["operations"] = len(args[0])
+            with tracer.span(name, "driver", **attributes):
+                return attribute(*args, **kwargs)
+        self.__dict__[name] = traced # Later lookups skip __getattr__
+        return traced
+
+
+def _truncate(value: Any) -> Any:
+    if isinstance(value, str) and len(value) > _MAX_ATTRIBUTE_LENGTH: return value[:_MAX_ATTRIBUTE_LENGTH] + "..."
+    return value
+
+
+def summarize(root: Span, slowest: int = 10) -> Dict[str, Any]:
+    """Split a trace into driver and engine time, with driver time per selector and the slowest actions."""
+    driver_ns = 0
+    driver_calls = 0
+    by_selector: Dict[str, Dict[str, int]] = {}
+    actions: List[Span] = []
+    stack = [root]
+    while stack:
+        span = stack.pop()
+        duration_ns = (span.end_ns or span.start_ns) - span.start_ns
+        if span.kind == "driver":
+            driver_ns += duration_ns; driver_calls += 1
+            target = span.attributes.get("selector") or span.attributes.get("url")
+            if target is not None:
+                entry = by_selector.setdefault(str(target), {"calls": 0, "total_us": 0})
+                entry["calls"] += 1; entry["total_us"] += duration_ns // 1000
+            continue # Driver calls do not nest
+        if span.kind == "action": actions.append(span)
+        stack.extend(span.children)
+
+    total_ns = (root.end_ns or root.start_ns) - root.start_ns
+    actions.sort(key=lambda span: span.start_ns - (span.end_ns or span.start_ns))
+    return {
+        "total_us": total_ns // 1000,
+        "driver_us": driver_ns // 1000,
+        "engine_us": max(0, total_ns // 1000 - driver_ns // 1000),
+        "driver_calls": driver_calls,
+        "by_selector": dict(sorted(by_selector.items(), key=lambda item: -item[1]["total_us"])),
+        "slowest_actions": [{"name": span.name, "type": span.attributes.get("action_type"),
+                             "duration_us": ((span.end_ns or span.start_ns) - span.start_ns) // 1000}
+                            for span in actions[:slowest]],
+    }
+
+
+def chrome_trace_events(trace: Dict[str, Any], pid: int = 1, tid: int = 1) -> List[Dict[str, Any]]:
+    """Convert an exported trace (the execution log's "trace") to Chrome trace-event 'complete' events."""
+    events: List[Dict[str, Any]] = []
+    root = trace.get("spans")
+    if not root: return events
+    events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": root["name"]}})
+    stack = [root]
+    while stack:
+        span = stack.pop()
+        events.append({"name": span["name"], "cat": span["kind"], "ph": "X", "ts": span["start_us"],
+                       "dur": span["duration_us"], "pid": pid, "tid": tid, "args": span.get("attributes", {})})
+        stack.extend(reversed(span.get("children", [])))
+    return events
+
+
+def write_chrome_trace(trace: Dict[str, Any], file_path: str) -> None:
+    """Write an exported trace as a Chrome trace-event JSON file."""
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": chrome_trace_events(trace), "displayTimeUnit": "ms"}, f)
+    logger.info(f"Wrote Chrome trace to {file_path}")
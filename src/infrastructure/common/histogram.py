@@ -0,0 +1,150 @@
+"""Fixed-memory latency histogram for AutoQliq metrics.
+
+LatencyHistogram is a log-linear ("HDR-style") histogram of integer values,
+typically microseconds. Values below 2**precision_bits are counted exactly;
+above that, each power-of-two range is split into 2**(precision_bits - 1)
+equal buckets, so every recorded value is reported to within a relative
+error of 2**-(precision_bits - 1) (1.6% at the default of 7 bits). The
+bucket array (8 bytes per bucket) only extends up to the highest bucket
+recorded so far, never past the one for max_value: memory does not grow
+with the number of recorded values, and a histogram of millisecond-range
+latencies stays well below the full ~14 KB of the default one-hour range.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of non-negative integer values.
+
+    Not thread-safe; callers recording from several threads must hold a lock.
+
+    Attributes:
+        precision_bits (int): Bits of precision kept per value (2-16).
+        max_value (int): Largest trackable value; larger values are counted as max_value.
+        count (int): Number of recorded values.
+        total (int): Sum of recorded values (before clamping to max_value).
+        min (Optional[int]): Smallest recorded value.
+        max (Optional[int]): Largest recorded value (before clamping to max_value).
+    """
+    __slots__ = ("precision_bits", "max_value", "_sub_count", "_half", "_counts",
+                 "count", "total", "min", "max")
+
+    def __init__(self, max_value: int = 3_600_000_000, precision_bits: int = 7):
+        """Allocate buckets for values up to max_value (default: one hour in microseconds)."""
+        if not 2 <= precision_bits <= 16: raise ValueError("precision_bits must be between 2 and 16.")
+        if max_value < 1: raise ValueError("max_value must be positive.")
+        self.precision_bits = precision_bits
+        self.max_value = max_value
+        self._sub_count = 1 << precision_bits
+        self._half = self._sub_count >> 1
+        self._counts = array("q") # Extended on demand, up to bucket_count
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    @property
+    def bucket_count(self) -> int:
+        """Buckets needed to cover values up to max_value (the most ever allocated)."""
+        return self._index(self.max_value) + 1
+
+    def _grow(self, size: int) -> None:
+        if size > len(self._counts): self._counts.frombytes(bytes(self._counts.itemsize * (size - len(self._counts))))
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count: return value
+        shift = value.bit_length() - self.precision_bits
+        return self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest value counted in a bucket."""
+        if index < self._sub_count: return index, index
+        shift = (index - self._sub_count) // self._half + 1
+        low = ((index - self._sub_count) % self._half + self._half) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Record a value (negative values count as 0) `count` times."""
+        value = max(0, int(value))
+        index = self._index(min(value, self.max_value))
+        if index >= len(self._counts): self._grow(index + 1)
+        self._counts[index] += count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min: self.min = value
+        if self.max is None or value > self.max: self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """The value below or at which `percentile` percent of recorded values fall (0 if empty)."""
+        if not self.count: return 0
+        rank = max(1, min(self.count, int(percentile / 100.0 * self.count + 0.5)))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._bucket_bounds(index)[1], self.max if self.max is not None else 0)
+        return self.max or 0
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, int]:
+        """Values at several percentiles in one pass, keyed 'p50', 'p99', 'p99.9', ..."""
+        wanted = sorted(percentiles)
+        result: Dict[str, int] = {}
+        if not wanted: return result
+        if not self.count: return {_percentile_key(p): 0 for p in wanted}
+        ranks = [max(1, min(self.count, int(p / 100.0 * self.count + 0.5))) for p in wanted]
+        position = 0
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count: continue
+            seen += bucket_count
+            while position < len(ranks) and seen >= ranks[position]:
+                result[_percentile_key(wanted[position])] = min(self._bucket_bounds(index)[1], self.max)
+                position += 1
+            if position == len(ranks): break
+        return result
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the values recorded by another histogram with the same layout."""
+        if (other.precision_bits, other.max_value) != (self.precision_bits, self.max_value):
+            raise ValueError("Cannot merge histograms with different precision or range.")
+        self._grow(len(other._counts))
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count: self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min): self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max): self.max = other.max
+
+    def copy(self) -> "LatencyHistogram":
+        """An independent histogram with the same contents."""
+        clone = LatencyHistogram(self.max_value, self.precision_bits)
+        clone.merge(self)
+        return clone
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        self._counts = array("q")
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def to_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """Count, min, max, mean and percentile values."""
+        data: Dict[str, Any] = {"count": self.count, "min": self.min or 0, "max": self.max or 0,
+                                "mean": round(self.mean, 1)}
+        data.update(self.percentiles(percentiles))
+        return data
+
+
+def _percentile_key(percentile: float) -> str:
+    return f"p{percentile:g}"
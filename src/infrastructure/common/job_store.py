@@ -0,0 +1,304 @@
+"""Persistent, multi-process-safe job storage for the APScheduler scheduler.
+
+SQLiteJobStore keeps scheduled jobs in an SQLite table (the same layout as
+APScheduler's SQLAlchemyJobStore, without needing SQLAlchemy), so schedules
+survive restarts. JobLeases and LeasedThreadPoolExecutor let several
+scheduler processes on one host share that store: before a job runs, its
+executor claims a lease row for the job in the same database. A process only
+runs an occurrence if no other process has claimed it or a later one, and
+no unexpired lease for the job is held elsewhere. Leases are renewed while
+the job runs and released when it finishes, so a crashed process blocks a job
+for at most `lease_seconds`.
+"""
+
+import os
+import uuid
+import time
+import pickle
+import socket
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Optional
+
+try:
+    from apscheduler.job import Job
+    from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError
+    from apscheduler.executors.pool import ThreadPoolExecutor
+    from apscheduler.util import datetime_to_utc_timestamp, utc_timestamp_to_datetime
+    APS_AVAILABLE = True
+except ImportError:
+    APS_AVAILABLE = False
+    BaseJobStore = ThreadPoolExecutor = object # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# What happens to runs missed while no scheduler was running (or all workers were busy):
+#   skip     - drop runs more than `misfire_grace_seconds` late
+#   run_once - run once to catch up, however late (missed runs are coalesced)
+#   run_all  - run every missed occurrence
+MISFIRE_POLICIES = ("skip", "run_once", "run_all")
+
+
+def misfire_job_options(policy: str, grace_seconds: int = 60) -> Dict[str, Any]:
+    """APScheduler job options (coalesce, misfire_grace_time) implementing a misfire policy."""
+    if policy == "skip": return {"coalesce": True, "misfire_grace_time": grace_seconds}
+    if policy == "run_once": return {"coalesce": True, "misfire_grace_time": None}
+    if policy == "run_all": return {"coalesce": False, "misfire_grace_time": None}
+    raise ValueError(f"Unknown misfire policy '{policy}'. Expected one of: {', '.join(MISFIRE_POLICIES)}.")
+
+
+def _connect(db_path: str, timeout: float) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL") # Readers don't block the writer across processes
+    return conn
+
+
+@contextmanager
+def _immediate_transaction(db_path: str, timeout: float) -> Generator[sqlite3.Connection, None, None]:
+    conn = _connect(db_path, timeout)
+    try:
+        conn.execute("BEGIN IMMEDIATE") # Take the write lock up front: read-then-write must be atomic
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction: conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+class SQLiteJobStore(BaseJobStore):
+    """
+    APScheduler job store persisting jobs in an SQLite database.
+
+    Job functions must be importable by reference (module-level functions), as with
+    any persistent APScheduler job store. Since other processes sharing the database
+    may remove jobs at any time, updating or removing a job that no longer exists is
+    logged rather than raised (the scheduler's loop does not survive JobLookupError).
+    """
+
+    def __init__(self, db_path: str, table_name: str = "apscheduler_jobs",
+                 pickle_protocol: int = pickle.HIGHEST_PROTOCOL, timeout: float = 30.0):
+        super().__init__()
+        if not db_path: raise ValueError("Job store database path cannot be empty.")
+        self.db_path = db_path
+        self.table_name = table_name
+        self.pickle_protocol = pickle_protocol
+        self.timeout = timeout
+
+    def start(self, scheduler: Any, alias: str) -> None:
+        super().start(scheduler, alias)
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                         "(id TEXT PRIMARY KEY, next_run_time REAL, job_state BLOB NOT NULL)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{self.table_name}_next_run_time ON {self.table_name} (next_run_time)")
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = _connect(self.db_path, self.timeout)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def lookup_job(self, job_id: str) -> Optional["Job"]:
+        with self._connection() as conn:
+            row = conn.execute(f"SELECT job_state FROM {self.table_name} WHERE id = ?", (job_id,)).fetchone()
+        return self._reconstitute_job(row[0]) if row else None
+
+    def get_due_jobs(self, now: Any) -> List["Job"]:
+        return self._get_jobs("next_run_time <= ?", (datetime_to_utc_timestamp(now),))
+
+    def get_next_run_time(self) -> Any:
+        with self._connection() as conn:
+            row = conn.execute(f"SELECT next_run_time FROM {self.table_name} WHERE next_run_time IS NOT NULL "
+                               "ORDER BY next_run_time LIMIT 1").fetchone()
+        return utc_timestamp_to_datetime(row[0]) if row else None
+
+    def get_all_jobs(self) -> List["Job"]:
+        jobs = self._get_jobs()
+        self._fix_paused_jobs_sorting(jobs)
+        return jobs
+
+    def add_job(self, job: "Job") -> None:
+        try:
+            with self._connection() as conn:
+                conn.execute(f"INSERT INTO {self.table_name} (id, next_run_time, job_state) VALUES (?, ?, ?)",
+                             (job.id, datetime_to_utc_timestamp(job.next_run_time), self._job_state(job)))
+        except sqlite3.IntegrityError:
+            raise ConflictingIdError(job.id)
+
+    def update_job(self, job: "Job") -> None:
+        with self._connection() as conn:
+            cursor = conn.execute(f"UPDATE {self.table_name} SET next_run_time = ?, job_state = ? WHERE id = ?",
+                                  (datetime_to_utc_timestamp(job.next_run_time), self._job_state(job), job.id))
+        if cursor.rowcount == 0: logger.info(f"Job '{job.id}' was removed from {self.db_path} by another scheduler.")
+
+    def remove_job(self, job_id: str) -> None:
+        with self._connection() as conn:
+            cursor = conn.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (job_id,))
+        if cursor.rowcount == 0: logger.info(f"Job '{job_id}' was already removed from {self.db_path}.")
+
+    def remove_all_jobs(self) -> None:
+        with self._connection() as conn:
+            conn.execute(f"DELETE FROM {self.table_name}")
+
+    def _job_state(self, job: "Job") -> bytes:
+        return pickle.dumps(job.__getstate__(), self.pickle_protocol)
+
+    def _reconstitute_job(self, job_state: bytes) -> "Job":
+        state = pickle.loads(job_state)
+        state["jobstore"] = self
+        job = Job.__new__(Job)
+        job.__setstate__(state)
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _get_jobs(self, where: Optional[str] = None, params: tuple = ()) -> List["Job"]:
+        query = f"SELECT id, job_state FROM {self.table_name}"
+        if where: query += f" WHERE {where}"
+        with self._connection() as conn:
+            rows = conn.execute(query + " ORDER BY next_run_time IS NULL, next_run_time", params).fetchall()
+        jobs, failed_job_ids = [], []
+        for job_id, job_state in rows:
+            try:
+                jobs.append(self._reconstitute_job(job_state))
+            except Exception:
+                logger.exception(f"Unable to restore job '{job_id}' -- removing it")
+                failed_job_ids.append(job_id)
+        if failed_job_ids:
+            with self._connection() as conn:
+                conn.executemany(f"DELETE FROM {self.table_name} WHERE id = ?", [(job_id,) for job_id in failed_job_ids])
+        return jobs
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} (db_path={self.db_path!r})>"
+
+
+class JobLeases:
+    """
+    Per-job leases shared by the scheduler processes using one SQLite database.
+
+    Attributes:
+        db_path (str): SQLite database holding the lease table.
+        lease_seconds (float): How long a lease lasts without renewal.
+        owner (str): This process's owner id (host:pid:random).
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 60.0, owner: Optional[str] = None,
+                 table_name: str = "scheduler_leases", timeout: float = 30.0):
+        if lease_seconds <= 0: raise ValueError("lease_seconds must be positive.")
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.table_name = table_name
+        self.timeout = timeout
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        with _immediate_transaction(self.db_path, self.timeout) as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                         "(job_id TEXT PRIMARY KEY, owner TEXT NOT NULL, run_time REAL NOT NULL, expires_at REAL NOT NULL)")
+
+    def try_acquire(self, job_id: str, run_time: float) -> bool:
+        """
+        Claim the occurrence of `job_id` scheduled at `run_time` (a UTC timestamp).
+
+        Returns False if this or a later occurrence was already claimed, or if the job is
+        still running under an unexpired lease (in any process, including this one).
+        """
+        now = time.time()
+        with _immediate_transaction(self.db_path, self.timeout) as conn:
+            row = conn.execute(f"SELECT owner, run_time, expires_at FROM {self.table_name} WHERE job_id = ?",
+                               (job_id,)).fetchone()
+            if row is not None:
+                owner, claimed_run_time, expires_at = row
+                if claimed_run_time >= run_time: return False
+                if expires_at > now:
+                    logger.info(f"Job '{job_id}' is still running under a lease held by {owner}; skipping this run.")
+                    return False
+            conn.execute(f"INSERT OR REPLACE INTO {self.table_name} (job_id, owner, run_time, expires_at) VALUES (?, ?, ?, ?)",
+                         (job_id, self.owner, run_time, now + self.lease_seconds))
+        return True
+
+    def release(self, job_id: str) -> None:
+        """End this process's lease on `job_id` (the claimed occurrence stays claimed)."""
+        with _immediate_transaction(self.db_path, self.timeout) as conn:
+            conn.execute(f"UPDATE {self.table_name} SET expires_at = 0 WHERE job_id = ? AND owner = ?", (job_id, self.owner))
+
+    def renew(self) -> int:
+        """Extend every lease this process holds; returns how many were renewed."""
+        with _immediate_transaction(self.db_path, self.timeout) as conn:
+            cursor = conn.execute(f"UPDATE {self.table_name} SET expires_at = ? WHERE owner = ? AND expires_at > 0",
+                                  (time.time() + self.lease_seconds, self.owner))
+        return cursor.rowcount
+
+    def start(self) -> None:
+        """Start renewing held leases in the background, every third of `lease_seconds`."""
+        if self._thread is not None: return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._renew_loop, name="JobLeaseRenewer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop renewing leases."""
+        if self._thread is None: return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _renew_loop(self) -> None:
+        while not self._stop_event.wait(self.lease_seconds / 3):
+            try:
+                self.renew()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to renew scheduler job leases: {e}")
+
+
+class LeasedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    APScheduler thread pool executor that only runs jobs whose lease it acquires.
+
+    Occurrences claimed by another process are skipped silently; leases are released
+    when the job finishes.
+    """
+
+    def __init__(self, leases: JobLeases, max_workers: int = 10):
+        super().__init__(max_workers)
+        self.leases = leases
+
+    def start(self, scheduler: Any, alias: str) -> None:
+        super().start(scheduler, alias)
+        self.leases.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        super().shutdown(wait)
+        self.leases.stop()
+
+    def submit_job(self, job: "Job", run_times: List[Any]) -> None:
+        if not self.leases.try_acquire(job.id, datetime_to_utc_timestamp(max(run_times))):
+            self._logger.debug(f"Job '{job.id}' run at {max(run_times)} is claimed elsewhere; not submitting.")
+            return
+        try:
+            super().submit_job(job, run_times)
+        except BaseException:
+            self.leases.release(job.id)
+            raise
+
+    def _run_job_success(self, job_id: str, events: List[Any]) -> None:
+        self._release(job_id)
+        super()._run_job_success(job_id, events)
+
+    def _run_job_error(self, job_id: str, exc: BaseException, traceback: Any = None) -> None:
+        self._release(job_id)
+        super()._run_job_error(job_id, exc, traceback)
+
+    def _release(self, job_id: str) -> None:
+        try:
+            self.leases.release(job_id)
+        except sqlite3.Error as e: # The lease expires on its own
+            self._logger.error(f"Failed to release lease for job '{job_id}': {e}")
@@ -1,15 +1,76 @@
 """Logging utilities for infrastructure layer."""
 import functools
+import inspect
 import logging
-from typing import Any, Callable, TypeVar
+import random
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 # Type variables for better type hinting
 T = TypeVar('T') # Represents the return type of the decorated function
 
-def log_method_call(logger: logging.Logger, level: int = logging.DEBUG, log_result: bool = True, log_args: bool = True) -> Callable[[Callable[..., T]], Callable[..., T]]:
+MAX_SIGNATURE_LENGTH = 250
+MAX_RESULT_LENGTH = 200
+# Values from these packages are logged as <TypeName>: their repr() can issue driver commands.
+OPAQUE_MODULE_PREFIXES: Tuple[str, ...] = ("selenium.", "playwright.")
+
+
+def _safe_repr(value: Any) -> str:
+    if type(value).__module__.startswith(OPAQUE_MODULE_PREFIXES): return f"<{type(value).__name__}>"
+    try:
+        return repr(value)
+    except Exception:
+        return "<error representing value>"
+
+
+def _truncate(text: str, limit: int) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+class _LazySignature:
+    """Call arguments, formatted only if a handler actually emits the record."""
+    __slots__ = ("args", "kwargs")
+
+    def __init__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        parts = [_safe_repr(a) for a in self.args] + [f"{k}={_safe_repr(v)}" for k, v in self.kwargs.items()]
+        return _truncate(", ".join(parts), MAX_SIGNATURE_LENGTH)
+
+
+class _LazyResult:
+    """A return value, formatted only if a handler actually emits the record."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return _truncate(_safe_repr(self.value), MAX_RESULT_LENGTH)
+
+
+def _takes_self(func: Callable[..., Any]) -> bool:
+    try:
+        parameters = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(parameters) and parameters[0] in ("self", "cls")
+
+
+def log_method_call(logger: logging.Logger, level: int = logging.DEBUG, log_result: bool = True, log_args: bool = True,
+                    sample_rate: float = 1.0, structured: bool = False) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to log method calls, arguments, and optionally results.
 
+    When `level` is not enabled on the logger (or the call is not sampled) the
+    wrapped function is called directly: nothing is formatted. When it is,
+    arguments and results are passed to the logger as lazy values, so repr()
+    only runs if a handler emits the record. Selenium/Playwright objects are
+    logged by type name only. Exceptions are always logged (at ERROR or
+    `level`, whichever is higher), whether or not the call was sampled.
+
     Args:
         logger (logging.Logger): The logger instance to use.
         level (int): The logging level for call/return messages (e.g., logging.DEBUG).
@@ -18,78 +79,72 @@ def log_method_call(logger: logging.Logger, level: int = logging.DEBUG, log_resu
                            Defaults to True. Be cautious with sensitive data.
         log_args (bool): Whether to log the arguments passed to the method.
                          Defaults to True. Be cautious with sensitive data.
+        sample_rate (float): Fraction of calls (0-1] whose call/return messages are logged.
+                             Defaults to 1.0 (every call).
+        structured (bool): Whether records also carry `call_method`, `call_event`
+                           ('call', 'return' or 'error'), `call_duration_ms`, `call_arguments`
+                           and `call_result` attributes, for structured (e.g. JSON) handlers.
+                           Defaults to False.
 
     Returns:
         Callable[[Callable[..., T]], Callable[..., T]]: A decorator function.
     """
+    if not 0.0 < sample_rate <= 1.0: raise ValueError("sample_rate must be greater than 0 and at most 1.")
+    exception_level = logging.ERROR if level < logging.ERROR else level
+    sampled = sample_rate < 1.0
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        func_name = func.__name__
+        takes_self = _takes_self(func)
+
+        def full_name(args: Tuple[Any, ...]) -> str:
+            if not (takes_self and args): return func_name
+            owner = args[0]
+            return f"{owner.__name__ if isinstance(owner, type) else type(owner).__name__}.{func_name}"
+
+        def extra(name: str, event: str, **fields: Any) -> Optional[Dict[str, Any]]:
+            if not structured: return None
+            return dict({"call_method": name, "call_event": event}, **fields)
+
+        def log_exception(e: Exception, args: Tuple[Any, ...], start: Optional[float]) -> None:
+            name = full_name(args)
+            duration = None if start is None else round((time.perf_counter() - start) * 1000, 3)
+            logger.log(exception_level, "Exception in %s: %s - %s", name, type(e).__name__, e, exc_info=True,
+                       extra=extra(name, "error", call_duration_ms=duration))
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            # --- Format Call Info ---
-            func_name = func.__name__
-            # Check if it's a method (first arg is likely 'self' or 'cls')
-            is_method = args and hasattr(args[0], func_name) and callable(getattr(args[0], func_name))
-            class_name = args[0].__class__.__name__ if is_method else ""
-            full_name = f"{class_name}.{func_name}" if class_name else func_name
-
-            # --- Format Arguments (if requested) ---
-            signature = ""
-            if log_args:
-                start_index = 1 if is_method else 0
+            # --- Fast path: level disabled or call not sampled ---
+            if not logger.isEnabledFor(level) or (sampled and random.random() >= sample_rate):
                 try:
-                    # Represent args, handle potential large objects or sensitive data if needed
-                    # Be very careful logging args in production if they contain sensitive info
-                    args_repr = [repr(a) for a in args[start_index:]]
-                except Exception:
-                    args_repr = ["<error representing args>"]
-
-                try:
-                    kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
-                except Exception:
-                    kwargs_repr = ["<error representing kwargs>"]
-
-                # Combine args and kwargs
-                signature_parts = args_repr + kwargs_repr
-                # Truncate long signatures
-                max_sig_len = 250
-                temp_signature = ", ".join(signature_parts)
-                if len(temp_signature) > max_sig_len:
-                    signature = temp_signature[:max_sig_len] + "..."
-                else:
-                    signature = temp_signature
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log_exception(e, args, None)
+                    raise
 
             # --- Log Entry ---
-            if log_args:
-                logger.log(level, f"Calling: {full_name}({signature})")
-            else:
-                logger.log(level, f"Calling: {full_name}(...)")
-
+            name = full_name(args)
+            signature = _LazySignature(args[1:] if takes_self else args, kwargs) if log_args else "..."
+            logger.log(level, "Calling: %s(%s)", name, signature, extra=extra(name, "call", call_arguments=signature))
 
             # --- Execute Original Function ---
+            start = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                # --- Log Exit/Result ---
-                result_repr = ""
-                if log_result:
-                    try:
-                        # Represent result, handle potential large objects or sensitive data
-                        result_repr = repr(result)
-                        # Truncate long results if necessary
-                        max_repr_len = 200
-                        if len(result_repr) > max_repr_len:
-                            result_repr = result_repr[:max_repr_len] + "..."
-                        result_repr = f" -> {result_repr}" # Add arrow only if logging result
-                    except Exception:
-                        result_repr = " -> <error representing result>"
-
-                logger.log(level, f"Finished: {full_name}{result_repr}")
-                return result
             except Exception as e:
-                # --- Log Exception ---
-                # Log full traceback for errors
-                log_level_exc = logging.ERROR if level < logging.ERROR else level
-                logger.log(log_level_exc, f"Exception in {full_name}: {type(e).__name__} - {e}", exc_info=True)
+                # --- Log Exception (full traceback) ---
+                log_exception(e, args, start)
                 raise # Re-raise the exception after logging
+
+            # --- Log Exit/Result ---
+            duration = round((time.perf_counter() - start) * 1000, 3) if structured else None
+            if log_result:
+                lazy_result = _LazyResult(result)
+                logger.log(level, "Finished: %s -> %s", name, lazy_result,
+                           extra=extra(name, "return", call_duration_ms=duration, call_result=lazy_result))
+            else:
+                logger.log(level, "Finished: %s", name, extra=extra(name, "return", call_duration_ms=duration))
+            return result
         return wrapper
     return decorator
 
@@ -103,5 +158,9 @@ def log_method_call(logger: logging.Logger, level: int = logging.DEBUG, log_resu
 #         # ... processing ...
 #         return f"Processed {len(data)} items with factor {factor}"
 #
+#     @log_method_call(logger, sample_rate=0.01) # Hot path: log 1% of calls
+#     def poll(self) -> bool:
+#         ...
+#
 # instance = MyClass()
-# instance.process_data({"a": 1, "b": 2}, factor=3)
\ No newline at end of file
+# instance.process_data({"a": 1, "b": 2}, factor=3)
@@ -0,0 +1,419 @@
+"""Lightweight Prometheus-style metrics for AutoQliq services.
+
+A MetricsRegistry holds counters, gauges and histograms, optionally with
+labels, and renders them in the Prometheus text exposition format. Values
+that are cheaper to read on demand (queue depths, job counts) are supplied
+by collector callbacks run at scrape time. MetricsServer serves a registry
+on a local HTTP endpoint using only the standard library:
+
+    registry = MetricsRegistry()
+    runs = registry.counter("autoqliq_workflow_runs_total", "Workflow runs", ["status"])
+    runs.labels(status="SUCCESS").inc()
+    MetricsServer(registry, port=9464).start()   # curl http://127.0.0.1:9464/metrics
+
+Services default to the module-level REGISTRY.
+"""
+
+import time
+import math
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.workflow.run_queue import PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITY_NORMAL
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets (seconds), from 5 ms to 10 minutes.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                                      10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+_LabelValues = Tuple[str, ...]
+
+
+class _Timer:
+    """Context manager observing its elapsed time (seconds) on a histogram child."""
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: "_HistogramChild"):
+        self.histogram = histogram
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0: raise ValueError("Counters can only increase.")
+        with self._lock: self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value", "_function")
+
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        with self._lock: self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock: self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock: self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the gauge's value from `function` at scrape time."""
+        self._function = function
+
+    def get(self) -> float:
+        if self._function is not None:
+            try: return float(self._function())
+            except Exception as e: logger.debug(f"Gauge function failed: {e}"); return math.nan
+        return self.value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "buckets", "counts", "sum", "count")
+
+    def __init__(self, lock: threading.Lock, buckets: Tuple[float, ...]):
+        self._lock = lock
+        self.buckets = buckets
+        self.counts = [0] * len(buckets) # Non-cumulative; made cumulative when rendered
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            for index, bound in enumerate(self.buckets):
+                if value <= bound: self.counts[index] += 1; break
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> _Timer:
+        """Context manager observing the duration of its block."""
+        return _Timer(self)
+
+
+class _Metric:
+    """Base class of metric families: a name, help text, label names and one child per label value set."""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[_LabelValues, Any] = {}
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """The child for a set of label values (created on first use)."""
+        if labels:
+            if values: raise ValueError("Pass label values positionally or by name, not both.")
+            if set(labels) != set(self.labelnames):
+                raise ValueError(f"Metric '{self.name}' expects labels {list(self.labelnames)}, got {sorted(labels)}")
+            values = tuple(labels[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects {len(self.labelnames)} label values, got {len(values)}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock: child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self) -> Any:
+        if self.labelnames: raise ValueError(f"Metric '{self.name}' has labels; use .labels(...) first.")
+        return self.labels()
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Prometheus text format lines for this metric family."""
+        lines = [f"# HELP {self.name} {_escape_help(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for sample_name, labels, value in self._samples():
+            lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    def _labelled_children(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock: items = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+
+class Counter(_Metric):
+    """A monotonically increasing value."""
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(threading.Lock())
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._labelled_children(): yield self.name, labels, child.value
+
+
+class Gauge(_Metric):
+    """A value that can go up and down, or be read from a function at scrape time."""
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(threading.Lock())
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default().set_function(function)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._labelled_children(): yield self.name, labels, child.get()
+
+
+class Histogram(_Metric):
+    """Observations counted in cumulative buckets, with their sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        if list(buckets) != sorted(buckets) or not buckets: raise ValueError("Histogram buckets must be sorted and non-empty.")
+        self.buckets = tuple(float(bound) for bound in buckets if bound != math.inf)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(threading.Lock(), self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self) -> _Timer:
+        return self._default().time()
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._labelled_children():
+            with child._lock: counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", dict(labels, le=_format_value(bound)), cumulative
+            yield f"{self.name}_bucket", dict(labels, le="+Inf"), count
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class MetricsRegistry:
+    """
+    A named set of metrics plus collector callbacks, rendered together.
+
+    Metric constructors are get-or-create: asking twice for the same name
+    returns the same metric, so independent components (and repeated service
+    instances) can share a registry. Asking for an existing name with a
+    different type or labels raises ValueError.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, documentation: str, labelnames: Sequence[str], **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.kind} with labels {list(metric.labelnames)}.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """A registered metric by name, or None."""
+        return self._metrics.get(name)
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback run before each render, typically to update gauges."""
+        with self._lock: self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Callable[[], None]) -> None:
+        with self._lock:
+            if collector in self._collectors: self._collectors.remove(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock: collectors, metrics = list(self._collectors), list(self._metrics.values())
+        for collector in collectors:
+            try: collector()
+            except Exception as e: logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+        lines: List[str] = []
+        for metric in sorted(metrics, key=lambda m: m.name): lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def register_driver_metrics(registry: MetricsRegistry, driver_metrics: Any, prefix: str = "autoqliq_driver") -> Callable[[], None]:
+    """
+    Export a DriverMetrics registry (see InstrumentedWebDriver) as per-method gauges.
+
+    Returns:
+        The registered collector (pass it to unregister_collector to stop exporting).
+    """
+    calls = registry.gauge(f"{prefix}_calls", "WebDriver calls recorded, by method", ["method"])
+    errors = registry.gauge(f"{prefix}_call_errors", "Failed WebDriver calls, by method", ["method"])
+    seconds = registry.gauge(f"{prefix}_call_seconds_total", "Time spent in WebDriver calls, by method", ["method"])
+    quantiles = registry.gauge(f"{prefix}_call_latency_seconds", "WebDriver call latency quantiles, by method",
+                               ["method", "quantile"])
+
+    def collect() -> None:
+        for method, stats in driver_metrics.get_method_stats().items():
+            calls.labels(method=method).set(stats["calls"])
+            errors.labels(method=method).set(stats["errors"])
+            seconds.labels(method=method).set(stats["total_us"] / 1e6)
+            for quantile in ("0.5", "0.9", "0.99"):
+                key = f"p{float(quantile) * 100:g}"
+                quantiles.labels(method=method, quantile=quantile).set(stats["latency_us"][key] / 1e6)
+
+    registry.register_collector(collect)
+    return collect
+
+
+def register_run_queue_metrics(registry: MetricsRegistry, run_queue: Any, prefix: str = "autoqliq_run_queue") -> Callable[[], None]:
+    """
+    Export a RunQueue's pending and running counts (see RunQueue.stats) as gauges.
+
+    Returns:
+        The registered collector (pass it to unregister_collector to stop exporting).
+    """
+    pending = registry.gauge(f"{prefix}_pending", "Runs waiting in the run queue, by priority", ["priority"])
+    running = registry.gauge(f"{prefix}_running", "Runs executing from the run queue")
+    expired = registry.gauge(f"{prefix}_expired", "Queued runs dropped because their deadline passed")
+    priorities = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_NORMAL: "normal", PRIORITY_BATCH: "batch"}
+
+    def collect() -> None:
+        stats = run_queue.stats()
+        by_priority = stats["pending_by_priority"]
+        for priority in set(priorities) | set(by_priority):
+            pending.labels(priority=priorities.get(priority, str(priority))).set(by_priority.get(priority, 0))
+        running.set(stats["running"])
+        expired.set(stats["expired"])
+
+    registry.register_collector(collect)
+    return collect
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry # Set on the per-server subclass
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404, "Not Found"); return
+        try:
+            body = self.registry.render().encode("utf-8")
+        except Exception as e:
+            logger.error(f"Failed to render metrics: {e}", exc_info=True)
+            self.send_error(500, "Failed to render metrics"); return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Metrics endpoint: {format % args}")
+
+
+class MetricsServer:
+    """
+    Serves a registry at http://host:port/metrics from a daemon thread.
+
+    Binds to localhost by default; port 0 picks a free port (see `port` after start()).
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry or REGISTRY
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        """Start serving (no-op if already running). Raises OSError if the port is unavailable."""
+        if self._server is not None: return self
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": self.registry})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is None: return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None: self._thread.join(5)
+        self._server = None; self._thread = None
+        logger.info("Metrics server stopped.")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels: return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, str): return value
+    if math.isnan(value): return "NaN"
+    if math.isinf(value): return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer(): return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
@@ -0,0 +1,52 @@
+"""Metric definitions shared by the AutoQliq run paths.
+
+The workflow runner presenter (manual runs), ExecutionService and
+SchedulerService record into the same metric families (labelled by run
+source), so one MetricsServer shows the state of all of them.
+"""
+
+from typing import Optional
+
+from src.infrastructure.common.metrics import MetricsRegistry, REGISTRY
+
+# Repository calls are fast; use finer buckets than the run-oriented defaults.
+REPOSITORY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class ServiceMetrics:
+    """
+    The metric families recorded by the run paths.
+
+    Creating several ServiceMetrics on one registry returns the same families.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or REGISTRY
+        r = self.registry
+        self.runs = r.counter("autoqliq_workflow_runs_total", "Workflow runs by source and final status",
+                              ["source", "status"])
+        self.run_seconds = r.histogram("autoqliq_workflow_run_duration_seconds", "Workflow run duration",
+                                       ["source"])
+        self.runs_in_progress = r.gauge("autoqliq_workflow_runs_in_progress", "Workflow runs executing now",
+                                        ["source"])
+        self.actions = r.counter("autoqliq_actions_total", "Executed actions by result status", ["status"])
+        self.driver_launches = r.counter("autoqliq_driver_launches_total", "WebDriver launches by result",
+                                         ["result"])
+        self.driver_launch_seconds = r.histogram("autoqliq_driver_launch_duration_seconds",
+                                                 "Time to launch a WebDriver")
+        self.drivers_active = r.gauge("autoqliq_drivers_active", "WebDrivers currently open")
+        self.repository_seconds = r.histogram("autoqliq_repository_operation_duration_seconds",
+                                              "Repository call duration", ["repository", "operation"],
+                                              buckets=REPOSITORY_BUCKETS)
+        self.scheduler_jobs = r.gauge("autoqliq_scheduler_jobs", "Scheduled jobs")
+        self.scheduler_jobs_due = r.gauge("autoqliq_scheduler_jobs_due",
+                                          "Scheduled jobs whose next run time has passed (waiting for a worker)")
+        self.scheduler_workers = r.gauge("autoqliq_scheduler_workers", "Scheduler executor threads")
+        self.scheduler_missed = r.counter("autoqliq_scheduler_missed_runs_total",
+                                          "Scheduled runs skipped because they missed their misfire grace time")
+
+    def record_run(self, source: str, status: str, duration_seconds: float, action_statuses=()) -> None:
+        """Record a finished run and the statuses of its actions."""
+        self.runs.labels(source=source, status=status).inc()
+        self.run_seconds.labels(source=source).observe(duration_seconds)
+        for action_status in action_statuses: self.actions.labels(status=action_status).inc()
@@ -9,20 +9,43 @@ Exports:
     WebDriverFactory: Factory for creating WebDriver instances.
     SeleniumWebDriver: WebDriver implementation using Selenium.
     PlaywrightDriver: WebDriver implementation using Playwright (placeholder).
+    SimulatedWebDriver: Simulated browser with injected latency and failures, for load testing.
+    InstrumentedWebDriver: Wrapper recording driver call counts and latency histograms.
+    DriverMetrics: Registry of driver call metrics, shared by InstrumentedWebDrivers.
     handle_driver_exceptions: Decorator for consistent WebDriver error handling.
     # IWebDriver interface is likely defined in src.core.interfaces
 """
 
+from importlib import import_module
+
 from .base import BrowserType
 from .factory import WebDriverFactory
-from .selenium_driver import SeleniumWebDriver
-from .playwright_driver import PlaywrightDriver # Assuming it implements IWebDriver
+from .simulated_driver import SimulatedWebDriver
+from .instrumented_driver import InstrumentedWebDriver, DriverMetrics
 from .error_handler import handle_driver_exceptions
 
+# Importing Selenium/Playwright takes a noticeable part of app startup, so these
+# are imported on first use (PEP 562) rather than with the package.
+_LAZY_EXPORTS = {
+    "SeleniumWebDriver": ".selenium_driver",
+    "PlaywrightDriver": ".playwright_driver", # Assuming it implements IWebDriver
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "BrowserType",
     "WebDriverFactory",
     "SeleniumWebDriver",
     "PlaywrightDriver",
+    "SimulatedWebDriver",
+    "InstrumentedWebDriver",
+    "DriverMetrics",
     "handle_driver_exceptions",
 ]
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""Chrome DevTools Protocol helpers for AutoQliq WebDrivers.
+
+Chromium-based Selenium drivers (Chrome, Edge) expose `execute_cdp_cmd`, which
+gives access to faster or more flexible variants of some WebDriver operations.
+This module keeps the CDP payload details out of the driver classes.
+"""
+
+import base64
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from src.core.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Base64 characters decoded per write; a multiple of 4 so each chunk decodes on its own.
+_BASE64_CHUNK_SIZE = 4 * 256 * 1024
+
+
+def supports_cdp(driver: Any) -> bool:
+    """Return True if the underlying Selenium driver can execute CDP commands."""
+    return callable(getattr(driver, "execute_cdp_cmd", None))
+
+
+def build_screenshot_params(image_format: str,
+                            quality: Optional[int] = None,
+                            clip: Optional[Dict[str, float]] = None,
+                            full_page: bool = False) -> Dict[str, Any]:
+    """Build the parameters for a `Page.captureScreenshot` command."""
+    params: Dict[str, Any] = {"format": image_format, "captureBeyondViewport": bool(full_page or clip)}
+    if quality is not None:
+        if image_format == "png":
+            raise ValidationError("Quality is only supported for 'jpeg' and 'webp' screenshots.", field_name="quality")
+        params["quality"] = quality
+    if clip:
+        missing = {"x", "y", "width", "height"} - set(clip)
+        if missing: raise ValidationError(f"Screenshot clip is missing keys: {sorted(missing)}", field_name="clip")
+        params["clip"] = {"x": clip["x"], "y": clip["y"], "width": clip["width"], "height": clip["height"],
+                          "scale": clip.get("scale", 1)}
+    return params
+
+
+def full_page_clip(layout_metrics: Dict[str, Any]) -> Dict[str, float]:
+    """Build a clip covering the whole page from a `Page.getLayoutMetrics` result.
+
+    `captureBeyondViewport` alone still captures only the viewport; the clip sets the size.
+    Older Chromium versions report `contentSize` instead of `cssContentSize`.
+    """
+    size = layout_metrics.get("cssContentSize") or layout_metrics["contentSize"]
+    return {"x": 0, "y": 0, "width": size["width"], "height": size["height"], "scale": 1}
+
+
+def write_base64_file(data: str, file_path: str, chunk_size: int = _BASE64_CHUNK_SIZE) -> int:
+    """Decode base64 data to file_path chunk by chunk, replacing the file atomically.
+
+    Avoids holding a second, decoded copy of large full-page captures in memory.
+
+    Returns:
+        The number of bytes written.
+    """
+    if chunk_size <= 0 or chunk_size % 4: raise ValueError("chunk_size must be a positive multiple of 4.")
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    written = 0
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for start in range(0, len(data), chunk_size):
+                chunk = base64.b64decode(data[start:start + chunk_size])
+                handle.write(chunk)
+                written += len(chunk)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try: os.remove(temp_path)
+        except OSError: pass
+        raise
+    logger.debug(f"Wrote {written} bytes to {file_path}")
+    return written
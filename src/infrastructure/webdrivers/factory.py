@@ -1,13 +1,14 @@
 """Factory module for creating WebDriver instances."""
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 # Assuming IWebDriver is defined in core interfaces
 from src.core.interfaces import IWebDriver
 from src.core.exceptions import WebDriverError, ConfigError
 from src.infrastructure.webdrivers.base import BrowserType
-from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+from src.infrastructure.webdrivers.load_profile import LoadProfile
+from src.infrastructure.webdrivers.instrumented_driver import DriverMetrics, InstrumentedWebDriver
 # from src.infrastructure.webdrivers.playwright_driver import PlaywrightDriver # Keep commented if not implemented
 
 # Import Selenium options classes if used directly here (or handled within SeleniumWebDriver)
@@ -16,6 +17,20 @@ from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name):
+    # SeleniumWebDriver imports selenium.webdriver (slow); load it when a driver is first created
+    if name == "SeleniumWebDriver":
+        from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+        globals()[name] = SeleniumWebDriver
+        return SeleniumWebDriver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _selenium_driver_class() -> type:
+    """SeleniumWebDriver, imported on first call (or the module attribute a test patched in)."""
+    return globals().get("SeleniumWebDriver") or __getattr__("SeleniumWebDriver")
+
+
 class WebDriverFactory:
     """
     Factory class for creating instances of IWebDriver implementations.
@@ -32,20 +47,33 @@ class WebDriverFactory:
         selenium_options: Optional[Any] = None, # e.g., ChromeOptions instance
         playwright_options: Optional[Dict[str, Any]] = None, # Options for Playwright launch
         webdriver_path: Optional[str] = None, # Optional path to the webdriver executable
-        headless: bool = False # Whether to run in headless mode
+        headless: bool = False, # Whether to run in headless mode
+        cache_elements: bool = False, # Selenium only: cache located elements per page
+        load_profile: Optional[Union[str, Dict[str, Any], LoadProfile]] = None, # Resource blocking profile
+        simulation_options: Optional[Dict[str, Any]] = None, # Options for the simulated driver
+        metrics: Optional[DriverMetrics] = None # Record driver call counts and latencies here
     ) -> IWebDriver:
         """
         Creates an IWebDriver implementation instance.
 
         Args:
             browser_type (BrowserType): The target browser (e.g., CHROME, FIREFOX). Defaults to CHROME.
-            driver_type (str): The underlying driver library ('selenium' or 'playwright'). Defaults to 'selenium'.
+            driver_type (str): The underlying driver library ('selenium', 'playwright' or 'simulated'). Defaults to 'selenium'.
             implicit_wait_seconds (int): Implicit wait time in seconds. Defaults to 0.
             selenium_options (Optional[Any]): Specific options object for Selenium (e.g., ChromeOptions).
             playwright_options (Optional[Dict[str, Any]]): Dictionary of options for Playwright launch.
             webdriver_path (Optional[str]): Explicit path to the WebDriver executable (e.g., chromedriver).
                                             If None, Selenium Manager or system PATH is used.
             headless (bool): Whether to run the browser in headless mode (no GUI). Defaults to False.
+            cache_elements (bool): Whether Selenium drivers cache located elements by selector until
+                                   navigation or a frame switch. Defaults to False.
+            load_profile (Optional[Union[str, Dict[str, Any], LoadProfile]]): Page load profile - a name from
+                                   LOAD_PROFILES (e.g. 'minimal'), a profile dict (as stored in workflow
+                                   metadata) or a LoadProfile. Selenium only. Defaults to None.
+            simulation_options (Optional[Dict[str, Any]]): Keyword arguments for SimulatedWebDriver
+                                   ('fixtures', 'profile', 'seed', 'start_url'). Simulated only.
+            metrics (Optional[DriverMetrics]): If given, the driver is wrapped in an InstrumentedWebDriver
+                                   recording every call in this registry. Defaults to None.
 
         Returns:
             IWebDriver: An instance conforming to the IWebDriver interface.
@@ -58,14 +86,17 @@ class WebDriverFactory:
         logger.info(f"Requesting {driver_type} driver for {browser_type.value} with implicit wait {implicit_wait_seconds}s in {headless_str}")
 
         try:
+            profile = LoadProfile.resolve(load_profile) # Raises ConfigError
             if driver_type.lower() == "selenium":
                 # SeleniumWebDriver now handles driver creation internally
-                return SeleniumWebDriver(
+                driver = _selenium_driver_class()(
                     browser_type=browser_type,
                     implicit_wait_seconds=implicit_wait_seconds,
                     selenium_options=selenium_options,
                     webdriver_path=webdriver_path,
-                    headless=headless
+                    headless=headless,
+                    cache_elements=cache_elements,
+                    load_profile=profile
                 )
             elif driver_type.lower() == "playwright":
                 # Ensure Playwright is installed before attempting to use
@@ -77,8 +108,10 @@ class WebDriverFactory:
                         playwright_options = {}
                     if headless and 'headless' not in playwright_options:
                         playwright_options['headless'] = True
+                    if profile:
+                        logger.warning(f"Load profile '{profile.name}' is not supported by the Playwright driver; ignored.")
 
-                    return PlaywrightDriver(
+                    driver = PlaywrightDriver(
                         browser_type=browser_type,
                         launch_options=playwright_options,
                         implicit_wait_seconds=implicit_wait_seconds
@@ -90,8 +123,14 @@ class WebDriverFactory:
                     err_msg = f"Failed to create Playwright {browser_type.value} WebDriver: {e}"
                     logger.error(err_msg, exc_info=True)
                     raise WebDriverError(err_msg, driver_type="playwright") from e
+            elif driver_type.lower() == "simulated":
+                from src.infrastructure.webdrivers.simulated_driver import SimulatedWebDriver
+                if profile:
+                    logger.warning(f"Load profile '{profile.name}' is not supported by the simulated driver; ignored.")
+                driver = SimulatedWebDriver(**(simulation_options or {}))
             else:
-                raise ConfigError(f"Unsupported driver type: {driver_type}. Choose 'selenium' or 'playwright'.")
+                raise ConfigError(f"Unsupported driver type: {driver_type}. Choose 'selenium', 'playwright' or 'simulated'.")
+            return InstrumentedWebDriver(driver, metrics) if metrics is not None else driver
         except Exception as e:
              # Catch potential errors during instantiation
              error_msg = f"Failed to create {driver_type} driver for {browser_type.value}: {e}"
@@ -0,0 +1,262 @@
+"""Driver-call instrumentation for AutoQliq WebDrivers.
+
+InstrumentedWebDriver wraps any IWebDriver (Selenium, Playwright, simulated,
+mocks) and records, for every public method call, the call count, the
+failure count and a fixed-memory latency histogram in a DriverMetrics
+registry. Calls are tagged with the workflow and action being executed
+(WorkflowRunner sets the tags through `metric_tags`), so the metrics show
+how much of a run is WebDriver round-trip time, and where. A MetricsDumper
+writes periodic snapshots to a JSON file and/or the log.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.interfaces import IWebDriver
+from src.infrastructure.common.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+OTHER_TAG = "(other)" # Workflow/action tag used once max_series is reached
+
+_SeriesKey = Tuple[str, Optional[str], Optional[str]] # (method, workflow, action)
+
+
+class _Series:
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self, precision_bits: int):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram(precision_bits=precision_bits)
+
+
+class DriverMetrics:
+    """
+    Thread-safe registry of driver call counts and latency histograms (microseconds).
+
+    One series is kept per (method, workflow, action). Once max_series series
+    exist, calls for new workflow/action combinations are recorded under the
+    OTHER_TAG workflow and action, so memory stays bounded however many
+    distinct actions are run: each series' histogram holds at most ~14 KB of
+    buckets (precision_bits=7, one-hour range), so the default of 1,000
+    series is capped at ~15 MB. Buckets are only allocated up to the slowest
+    call seen, so series of sub-second calls need about half of that.
+    """
+
+    def __init__(self, max_series: int = 1_000, precision_bits: int = 7):
+        self.max_series = max_series
+        self.precision_bits = precision_bits
+        self._series: Dict[_SeriesKey, _Series] = {}
+        self._lock = threading.Lock()
+        self._since = time.time()
+
+    def record(self, method: str, duration_us: int, failed: bool = False,
+               workflow: Optional[str] = None, action: Optional[str] = None) -> None:
+        """Record one driver call."""
+        key = (method, workflow, action)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                if len(self._series) >= self.max_series: key = (method, OTHER_TAG, OTHER_TAG); series = self._series.get(key)
+                if series is None: series = self._series[key] = _Series(self.precision_bits)
+            series.calls += 1
+            if failed: series.errors += 1
+            series.latency.record(duration_us)
+
+    def get_method_stats(self, workflow: Optional[str] = None, action: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Calls, errors, total time and latency percentiles per driver method.
+
+        Args:
+            workflow: Only include calls made while running this workflow.
+            action: Only include calls made by actions with this name.
+
+        Returns:
+            {method: {"calls", "errors", "total_us", "latency_us": {count, min, max, mean, p50, ...}}},
+            most total time first.
+        """
+        merged: Dict[str, _Series] = {}
+        with self._lock:
+            for (method, series_workflow, series_action), series in self._series.items():
+                if workflow is not None and series_workflow != workflow: continue
+                if action is not None and series_action != action: continue
+                target = merged.get(method)
+                if target is None: target = merged[method] = _Series(self.precision_bits)
+                target.calls += series.calls; target.errors += series.errors
+                target.latency.merge(series.latency)
+        ordered = sorted(merged.items(), key=lambda item: -item[1].latency.total)
+        return {method: _series_dict(series) for method, series in ordered}
+
+    def get_action_stats(self, workflow: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Driver calls and time per (workflow, action), most total time first, with per-method counts."""
+        grouped: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        with self._lock:
+            for (method, series_workflow, series_action), series in self._series.items():
+                if workflow is not None and series_workflow != workflow: continue
+                entry = grouped.setdefault((series_workflow, series_action),
+                                           {"workflow": series_workflow, "action": series_action,
+                                            "calls": 0, "errors": 0, "total_us": 0, "methods": {}})
+                entry["calls"] += series.calls; entry["errors"] += series.errors
+                entry["total_us"] += series.latency.total
+                entry["methods"][method] = series.calls
+        return sorted(grouped.values(), key=lambda entry: -entry["total_us"])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as a JSON-serializable dict."""
+        methods = self.get_method_stats()
+        return {
+            "since": datetime.fromtimestamp(self._since).isoformat(),
+            "elapsed_seconds": round(time.time() - self._since, 3),
+            "total": {"calls": sum(m["calls"] for m in methods.values()),
+                      "errors": sum(m["errors"] for m in methods.values()),
+                      "total_us": sum(m["total_us"] for m in methods.values())},
+            "methods": methods,
+            "actions": self.get_action_stats(),
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._series.clear()
+            self._since = time.time()
+
+
+def _series_dict(series: _Series) -> Dict[str, Any]:
+    return {"calls": series.calls, "errors": series.errors, "total_us": series.latency.total,
+            "latency_us": series.latency.to_dict()}
+
+
+class _TagScope:
+    """Context manager returned by InstrumentedWebDriver.metric_tags; restores the previous tags on exit."""
+    __slots__ = ("driver", "workflow", "action", "previous")
+
+    def __init__(self, driver: "InstrumentedWebDriver", workflow: Optional[str], action: Optional[str]):
+        self.driver = driver
+        self.workflow = workflow
+        self.action = action
+
+    def __enter__(self) -> "_TagScope":
+        driver = self.driver
+        self.previous = (driver.workflow_tag, driver.action_tag)
+        if self.workflow is not None: driver.workflow_tag = self.workflow
+        if self.action is not None: driver.action_tag = self.action
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.driver.workflow_tag, self.driver.action_tag = self.previous
+
+
+class InstrumentedWebDriver:
+    """
+    IWebDriver proxy that records every public method call in a DriverMetrics registry.
+
+    Attributes:
+        metrics (DriverMetrics): Registry the calls are recorded in (may be shared between drivers).
+        workflow_tag (Optional[str]): Workflow the next calls are attributed to.
+        action_tag (Optional[str]): Action the next calls are attributed to.
+    """
+
+    def __init__(self, driver: IWebDriver, metrics: Optional[DriverMetrics] = None):
+        """Wrap a driver; a new DriverMetrics is created if none is given."""
+        if driver is None: raise ValueError("WebDriver instance cannot be None.")
+        self._driver = driver
+        self.metrics = metrics if metrics is not None else DriverMetrics()
+        self.workflow_tag: Optional[str] = None
+        self.action_tag: Optional[str] = None
+
+    @property
+    def wrapped_driver(self) -> IWebDriver:
+        return self._driver
+
+    def metric_tags(self, workflow: Optional[str] = None, action: Optional[str] = None) -> _TagScope:
+        """Context manager attributing the calls made inside it to a workflow and/or action."""
+        return _TagScope(self, workflow, action)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._driver, name)
+        if name.startswith("_") or not callable(attribute): return attribute
+        record = self.metrics.record
+        perf_counter_ns = time.perf_counter_ns
+
+        def instrumented(*args: Any, **kwargs: Any) -> Any:
+            failed = False
+            start = perf_counter_ns()
+            try:
+                return attribute(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                record(name, (perf_counter_ns() - start) // 1000, failed, self.workflow_tag, self.action_tag)
+        self.__dict__[name] = instrumented # Later lookups skip __getattr__
+        return instrumented
+
+
+class MetricsDumper:
+    """
+    Background thread writing a DriverMetrics snapshot every `interval_seconds`.
+
+    The snapshot is written atomically to `file_path` as JSON and/or logged at
+    INFO level as one line per driver method. A final dump is made on stop().
+    """
+
+    def __init__(self, metrics: DriverMetrics, interval_seconds: float = 60.0,
+                 file_path: Optional[str] = None, log: bool = True):
+        if interval_seconds <= 0: raise ValueError("interval_seconds must be positive.")
+        self.metrics = metrics
+        self.interval_seconds = interval_seconds
+        self.file_path = file_path
+        self.log = log
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsDumper":
+        """Start the dump thread (no-op if already running)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="DriverMetricsDumper", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the dump thread after a final dump."""
+        self._stop_event.set()
+        if self._thread is not None: self._thread.join(timeout); self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.dump()
+        self.dump()
+
+    def dump(self) -> Dict[str, Any]:
+        """Write one snapshot now; errors are logged, not raised."""
+        snapshot = self.metrics.snapshot()
+        try:
+            if self.file_path: _write_json_atomic(snapshot, self.file_path)
+            if self.log:
+                for method, stats in snapshot["methods"].items():
+                    latency = stats["latency_us"]
+                    logger.info(f"Driver metrics: {method} calls={stats['calls']} errors={stats['errors']} "
+                                f"p50={latency['p50']}us p99={latency['p99']}us max={latency['max']}us")
+        except Exception as e:
+            logger.error(f"Failed to dump driver metrics: {e}")
+        return snapshot
+
+
+def _write_json_atomic(data: Dict[str, Any], file_path: str) -> None:
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f: json.dump(data, f, indent=2)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path): os.remove(temp_path)
+        raise
@@ -0,0 +1,169 @@
+"""Page load profiles for AutoQliq WebDrivers.
+
+A load profile describes which resources a browser should skip while loading
+pages (images, fonts, media, stylesheets, tracker scripts), whether the HTTP
+cache is used and, optionally, network throttling. Profiles are applied to
+Selenium browser options before launch and, for Chromium browsers, through CDP
+`Network.*` commands once the driver exists.
+
+Resource types are blocked by URL (`Network.setBlockedURLs`), matching the file
+extension with or without a query string (`*.png`, `*.png?*`). Assets served
+without an extension (e.g. `/image?id=42`, CDN resize endpoints) are not
+recognised; block them with `blocked_url_patterns`. Filtering on the real
+resource type needs `Fetch.enable` request interception, which requires a CDP
+event connection that Selenium's `execute_cdp_cmd` does not provide. Chrome's
+image content setting (applied at launch) blocks images regardless of URL.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.core.exceptions import ConfigError
+from src.infrastructure.webdrivers.base import BrowserType
+
+logger = logging.getLogger(__name__)
+
+# File extensions of each resource type.
+RESOURCE_TYPE_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp", "avif"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a", "mov"),
+    "stylesheet": ("css",),
+}
+
+# URL patterns (CDP wildcard syntax) used to block each resource type: the extension
+# at the end of the URL or followed by a query string (cache busters, signed URLs).
+RESOURCE_TYPE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    resource_type: tuple(pattern for extension in extensions for pattern in (f"*.{extension}", f"*.{extension}?*"))
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()
+}
+
+TRACKER_PATTERNS: Tuple[str, ...] = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*connect.facebook.com*",
+    "*hotjar.com*", "*segment.io*", "*cdn.segment.com*", "*newrelic.com*", "*nr-data.net*",
+)
+
+
+class LoadProfile:
+    """
+    Describes how a browser should load pages.
+
+    Blocked resource types are matched by file extension (query strings
+    allowed); extensionless asset URLs need explicit blocked_url_patterns.
+
+    Attributes:
+        name (str): Profile name, used in logs and workflow metadata.
+        block_resource_types (Tuple[str, ...]): Resource types to block (keys of RESOURCE_TYPE_PATTERNS).
+        blocked_url_patterns (Tuple[str, ...]): Additional URL patterns to block ('*' wildcards).
+        disable_cache (bool): Whether the browser HTTP cache is disabled.
+        throttling (Optional[Dict[str, Any]]): CDP `Network.emulateNetworkConditions` parameters
+                                               (latency in ms, download/upload throughput in bytes/s).
+    """
+
+    def __init__(self,
+                 name: str,
+                 block_resource_types: Optional[List[str]] = None,
+                 blocked_url_patterns: Optional[List[str]] = None,
+                 disable_cache: bool = False,
+                 throttling: Optional[Dict[str, Any]] = None):
+        """Initialize a LoadProfile, validating resource types and throttling settings."""
+        unknown = set(block_resource_types or []) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ConfigError(f"Unknown resource types in load profile '{name}': {sorted(unknown)}. "
+                              f"Choose from {sorted(RESOURCE_TYPE_PATTERNS)}")
+        if throttling is not None:
+            missing = {"latency", "download_throughput", "upload_throughput"} - set(throttling)
+            if missing: raise ConfigError(f"Throttling for load profile '{name}' is missing: {sorted(missing)}")
+        self.name = name
+        self.block_resource_types = tuple(block_resource_types or ())
+        self.blocked_url_patterns = tuple(blocked_url_patterns or ())
+        self.disable_cache = disable_cache
+        self.throttling = dict(throttling) if throttling else None
+
+    @property
+    def url_patterns(self) -> List[str]:
+        """All URL patterns blocked by this profile."""
+        patterns: List[str] = []
+        for resource_type in self.block_resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        patterns.extend(self.blocked_url_patterns)
+        return patterns
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadProfile":
+        """Create a profile from workflow metadata / configuration data."""
+        if not isinstance(data, dict): raise ConfigError(f"Load profile must be a dict, got {type(data).__name__}")
+        block_trackers = data.get("block_trackers", False)
+        patterns = list(data.get("blocked_url_patterns", [])) + (list(TRACKER_PATTERNS) if block_trackers else [])
+        return cls(name=data.get("name", "custom"),
+                   block_resource_types=data.get("block_resource_types"),
+                   blocked_url_patterns=patterns,
+                   disable_cache=bool(data.get("disable_cache", False)),
+                   throttling=data.get("throttling"))
+
+    @classmethod
+    def resolve(cls, value: Union[None, str, Dict[str, Any], "LoadProfile"]) -> Optional["LoadProfile"]:
+        """Resolve a profile name, dict or LoadProfile into a LoadProfile (None stays None)."""
+        if value is None or isinstance(value, LoadProfile): return value
+        if isinstance(value, dict): return cls.from_dict(value)
+        if isinstance(value, str):
+            profile = LOAD_PROFILES.get(value.lower())
+            if profile is None: raise ConfigError(f"Unknown load profile: '{value}'. Choose from {sorted(LOAD_PROFILES)}")
+            return profile
+        raise ConfigError(f"Invalid load profile: {value!r}")
+
+    def apply_to_options(self, options: Any, browser_type: BrowserType) -> None:
+        """Apply the parts of the profile that browser launch options support."""
+        if options is None: return
+        if browser_type in (BrowserType.CHROME, BrowserType.EDGE):
+            if "image" in self.block_resource_types:
+                prefs = dict(options.experimental_options.get("prefs", {}))
+                prefs["profile.managed_default_content_settings.images"] = 2
+                options.add_experimental_option("prefs", prefs)
+            if self.disable_cache:
+                options.add_argument("--disk-cache-size=0")
+        elif browser_type == BrowserType.FIREFOX:
+            if "image" in self.block_resource_types: options.set_preference("permissions.default.image", 2)
+            if "font" in self.block_resource_types: options.set_preference("browser.display.use_document_fonts", 0)
+            if "media" in self.block_resource_types: options.set_preference("media.autoplay.default", 5)
+            if self.disable_cache:
+                options.set_preference("browser.cache.disk.enable", False)
+                options.set_preference("browser.cache.memory.enable", False)
+            if self.blocked_url_patterns or {"stylesheet"} & set(self.block_resource_types) or self.throttling:
+                logger.warning(f"Load profile '{self.name}': URL blocking, stylesheet blocking and throttling require CDP; ignored for Firefox.")
+        else:
+            logger.warning(f"Load profile '{self.name}' is not supported for {browser_type.value}; ignored.")
+
+    def apply_to_driver(self, driver: Any, browser_type: BrowserType) -> None:
+        """Apply URL blocking, cache policy and throttling through CDP (Chromium browsers only)."""
+        if browser_type not in (BrowserType.CHROME, BrowserType.EDGE) or not callable(getattr(driver, "execute_cdp_cmd", None)):
+            return
+        patterns = self.url_patterns
+        if not patterns and not self.disable_cache and not self.throttling: return
+        driver.execute_cdp_cmd("Network.enable", {})
+        if patterns: driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if self.disable_cache: driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        if self.throttling:
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+                "offline": bool(self.throttling.get("offline", False)),
+                "latency": self.throttling["latency"],
+                "downloadThroughput": self.throttling["download_throughput"],
+                "uploadThroughput": self.throttling["upload_throughput"],
+            })
+        logger.info(f"Applied load profile '{self.name}' via CDP ({len(patterns)} blocked URL patterns).")
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(name='{self.name}', block_resource_types={list(self.block_resource_types)}, "
+                f"blocked_url_patterns={len(self.blocked_url_patterns)}, disable_cache={self.disable_cache})")
+
+
+LOAD_PROFILES: Dict[str, LoadProfile] = {
+    "default": LoadProfile("default"),
+    "no_trackers": LoadProfile("no_trackers", blocked_url_patterns=list(TRACKER_PATTERNS)),
+    "text_only": LoadProfile("text_only", block_resource_types=["image", "font", "media"],
+                             blocked_url_patterns=list(TRACKER_PATTERNS)),
+    "minimal": LoadProfile("minimal", block_resource_types=["image", "font", "media", "stylesheet"],
+                           blocked_url_patterns=list(TRACKER_PATTERNS)),
+    "slow_3g": LoadProfile("slow_3g", throttling={"latency": 400, "download_throughput": 50_000, "upload_throughput": 50_000}),
+}
@@ -1,5 +1,7 @@
 """Mock WebDriver implementation for testing."""
 
+from typing import Any, Union
+
 from src.core.interfaces import IWebDriver
 
 
@@ -8,7 +10,9 @@ class MockWebDriver(IWebDriver):
     A mock implementation of IWebDriver for testing purposes.
     
     This driver doesn't actually interact with a browser but simulates
-    the interface for testing workflows without a real browser.
+    the interface for testing workflows without a real browser. Every
+    operation returns immediately, so it also serves as a zero-latency
+    driver for measuring workflow runner overhead.
     """
     
     def __init__(self):
@@ -18,6 +22,8 @@ class MockWebDriver(IWebDriver):
         self.page_source = "<html><body>Mock page</body></html>"
         self.title = "Mock Browser"
         self.is_open = False
+        self.current_frame = None
+        self.alert_text = "Mock alert"
     
     def open(self) -> None:
         """Open the mock browser."""
@@ -31,6 +37,14 @@ class MockWebDriver(IWebDriver):
         """Navigate to a URL."""
         self.current_url = url
     
+    def get(self, url: str) -> None:
+        """Navigate to a URL."""
+        self.current_url = url
+    
+    def quit(self) -> None:
+        """Quit the mock browser."""
+        self.is_open = False
+    
     def get_current_url(self) -> str:
         """Get the current URL."""
         return self.current_url
@@ -51,6 +65,18 @@ class MockWebDriver(IWebDriver):
         """Find elements by selector."""
         return [MockElement(selector)]
     
+    def click_element(self, selector: str) -> None:
+        """Click an element."""
+        pass
+    
+    def type_text(self, selector: str, text: str) -> None:
+        """Type text into an element."""
+        pass
+    
+    def is_element_present(self, selector: str) -> bool:
+        """Check if an element is present."""
+        return True
+    
     def execute_script(self, script: str, *args) -> any:
         """Execute JavaScript."""
         return None
@@ -70,6 +96,26 @@ class MockWebDriver(IWebDriver):
     def wait_for_element_clickable(self, selector: str, timeout: int = 10) -> object:
         """Wait for an element to be clickable."""
         return MockElement(selector)
+    
+    def switch_to_frame(self, frame_reference: Union[str, int, Any]) -> None:
+        """Switch to a frame."""
+        self.current_frame = frame_reference
+    
+    def switch_to_default_content(self) -> None:
+        """Switch back to the main document."""
+        self.current_frame = None
+    
+    def accept_alert(self) -> None:
+        """Accept an alert."""
+        pass
+    
+    def dismiss_alert(self) -> None:
+        """Dismiss an alert."""
+        pass
+    
+    def get_alert_text(self) -> str:
+        """Get the text of an alert."""
+        return self.alert_text
 
 
 class MockElement:
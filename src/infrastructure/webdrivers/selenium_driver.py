@@ -1,7 +1,8 @@
 """Selenium WebDriver implementation for AutoQliq."""
+import base64
 import logging
 import os
-from typing import Any, Optional, Union, List
+from typing import Any, Dict, Optional, Union, List
 
 # Selenium imports
 from selenium import webdriver
@@ -10,7 +11,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException, NoSuchElementException, JavascriptException
+from selenium.common.exceptions import WebDriverException, TimeoutException, NoSuchElementException, JavascriptException, StaleElementReferenceException
 
 # Core imports
 from src.core.interfaces import IWebDriver
@@ -20,6 +21,8 @@ from src.core.exceptions import WebDriverError, ConfigError, ValidationError
 from src.infrastructure.common.logging_utils import log_method_call
 from src.infrastructure.webdrivers.error_handler import handle_driver_exceptions, map_webdriver_exception
 from src.infrastructure.webdrivers.base import BrowserType
+from src.infrastructure.webdrivers import cdp
+from src.infrastructure.webdrivers.load_profile import LoadProfile
 
 # Import Selenium options classes
 from selenium.webdriver import ChromeOptions, FirefoxOptions, EdgeOptions, SafariOptions
@@ -33,13 +36,16 @@ class SeleniumWebDriver(IWebDriver):
     Handles driver initialization and wraps Selenium methods.
     """
     _DEFAULT_WAIT_TIMEOUT = 10 # Default explicit wait timeout in seconds
+    SUPPORTS_SCREENSHOT_BYTES = True
 
     def __init__(self,
                  browser_type: BrowserType = BrowserType.CHROME,
                  implicit_wait_seconds: int = 0,
                  selenium_options: Optional[Any] = None,
                  webdriver_path: Optional[str] = None,
-                 headless: bool = False):
+                 headless: bool = False,
+                 cache_elements: bool = False,
+                 load_profile: Optional[LoadProfile] = None):
         """Initialize SeleniumWebDriver and the underlying Selenium driver.
 
         Args:
@@ -48,11 +54,18 @@ class SeleniumWebDriver(IWebDriver):
             selenium_options: Browser-specific options object (ChromeOptions, FirefoxOptions, etc.).
             webdriver_path: Path to the WebDriver executable (chromedriver, geckodriver, etc.).
             headless: Whether to run the browser in headless mode (no GUI).
+            cache_elements: Whether to cache located elements by selector until the page changes.
+            load_profile: Resource blocking / cache / throttling profile applied at launch.
         """
         self.browser_type = browser_type
         self.implicit_wait_seconds = implicit_wait_seconds
         self.headless = headless
+        self.cache_elements = cache_elements
+        self.load_profile = load_profile
         self.driver: Optional[RemoteWebDriver] = None
+        self._element_cache: Dict[str, WebElement] = {}
+        self._cache_url: Optional[str] = None # URL of the document the cached elements belong to
+        self._cache_stats = {"hits": 0, "misses": 0, "stale": 0, "invalidations": 0}
         logger.info(f"Initializing SeleniumWebDriver for: {self.browser_type.value}")
 
         try:
@@ -72,6 +85,7 @@ class SeleniumWebDriver(IWebDriver):
                  self.driver = driver_class(service=service_instance, options=options_instance)
 
             logger.info(f"Successfully created Selenium {browser_type.value} WebDriver instance.")
+            if self.load_profile: self.load_profile.apply_to_driver(self.driver, self.browser_type)
             if self.implicit_wait_seconds > 0:
                 self.driver.implicitly_wait(self.implicit_wait_seconds)
                 logger.debug(f"Set implicit wait to {self.implicit_wait_seconds} seconds")
@@ -124,6 +138,10 @@ class SeleniumWebDriver(IWebDriver):
              elif self.browser_type == BrowserType.SAFARI:
                  options = SafariOptions()
 
+        if options and self.load_profile:
+            logger.info(f"Applying load profile '{self.load_profile.name}' to {self.browser_type.value} options")
+            self.load_profile.apply_to_options(options, self.browser_type)
+
         # Apply headless mode if requested (for browsers that support it)
         if options and self.headless:
             if self.browser_type in [BrowserType.CHROME, BrowserType.EDGE]:
@@ -188,11 +206,68 @@ class SeleniumWebDriver(IWebDriver):
         if self.driver is None: raise WebDriverError("WebDriver not initialized or has been quit.")
         return self.driver
 
+    # --- Element Cache ---
+
+    def invalidate_element_cache(self) -> None:
+        """Drops all cached elements (called whenever the current document may change)."""
+        self._cache_url = None
+        if self._element_cache:
+            self._element_cache.clear()
+            self._cache_stats["invalidations"] += 1
+
+    def get_element_cache_stats(self) -> Dict[str, int]:
+        """Returns element cache counters: hits, misses, stale evictions, invalidations and current size."""
+        return dict(self._cache_stats, size=len(self._element_cache))
+
+    def _with_element(self, selector: str, operation: Any) -> Any:
+        """Runs operation(element), re-locating the element once if a cached reference has gone stale."""
+        element = self._locate(selector)
+        try:
+            return operation(element)
+        except StaleElementReferenceException:
+            if not self._evict_stale(selector): raise
+            return operation(self._locate(selector))
+
+    def _evict_stale(self, selector: str) -> bool:
+        """Drops a stale cached element; returns False if the element was not a cached one."""
+        if self._element_cache.pop(selector, None) is None: return False
+        self._cache_stats["stale"] += 1
+        logger.debug(f"Cached element for '{selector}' was stale; locating it again.")
+        self._invalidate_if_navigated()
+        return True
+
+    def _locate(self, selector: str, use_cache: bool = True) -> WebElement:
+        """
+        Returns the element matching selector, from the cache if possible.
+
+        Cached elements are returned without a round trip, so callers must
+        retry on StaleElementReferenceException (see _with_element). Without
+        use_cache the element is always located again and the cache refreshed.
+        """
+        driver = self._ensure_driver()
+        if self.cache_elements and use_cache:
+            cached = self._element_cache.get(selector)
+            if cached is not None:
+                self._cache_stats["hits"] += 1
+                return cached
+            self._cache_stats["misses"] += 1
+        try: element = driver.find_element(By.CSS_SELECTOR, selector)
+        except NoSuchElementException as e: raise WebDriverError(f"Element not found for selector: {selector}", cause=e) from e
+        if self.cache_elements:
+            if not self._element_cache: self._cache_url = driver.current_url
+            self._element_cache[selector] = element
+        return element
+
+    def _invalidate_if_navigated(self) -> None:
+        """Drops the whole cache if the current URL no longer matches the document the cached elements came from."""
+        if self._element_cache and self._ensure_driver().current_url != self._cache_url:
+            self.invalidate_element_cache()
+
     @log_method_call(logger)
     @handle_driver_exceptions("Failed to navigate to URL: {url}")
     def get(self, url: str) -> None:
         if not isinstance(url, str) or not url: raise ValidationError("URL must be non-empty string.", field_name="url")
-        driver = self._ensure_driver(); driver.get(url)
+        driver = self._ensure_driver(); self.invalidate_element_cache(); driver.get(url)
 
     @log_method_call(logger, log_result=False)
     def quit(self) -> None:
@@ -200,26 +275,25 @@ class SeleniumWebDriver(IWebDriver):
         if driver:
             try: driver.quit(); logger.info(f"Selenium WebDriver ({self.browser_type.value}) quit.")
             except Exception as e: logger.error(f"Error quitting Selenium WebDriver: {e}", exc_info=False)
-            finally: self.driver = None
+            finally: self.driver = None; self._element_cache.clear()
 
     @log_method_call(logger)
     @handle_driver_exceptions("Failed to find element with selector: {selector}")
     def find_element(self, selector: str) -> WebElement:
         if not isinstance(selector, str) or not selector: raise ValidationError("Selector must be non-empty string.", field_name="selector")
-        driver = self._ensure_driver()
-        try: return driver.find_element(By.CSS_SELECTOR, selector)
-        except NoSuchElementException as e: raise WebDriverError(f"Element not found for selector: {selector}", cause=e) from e
+        return self._locate(selector, use_cache=False) # Callers cannot retry on a stale element
 
     @log_method_call(logger, log_args=True)
     @handle_driver_exceptions("Failed to click element with selector: {selector}")
     def click_element(self, selector: str) -> None:
-        element = self.find_element(selector); element.click()
+        self._with_element(selector, lambda element: element.click())
 
     @log_method_call(logger, log_args=False)
     @handle_driver_exceptions("Failed to type text into element with selector: {selector}")
     def type_text(self, selector: str, text: str) -> None:
         if not isinstance(text, str): raise ValidationError("Text must be string.", field_name="text")
-        element = self.find_element(selector); element.clear(); element.send_keys(text)
+        def _type(element: WebElement) -> None: element.clear(); element.send_keys(text)
+        self._with_element(selector, _type)
         logger.debug(f"Typed text (length {len(text)}) into element: {selector}")
 
     @log_method_call(logger)
@@ -233,6 +307,71 @@ class SeleniumWebDriver(IWebDriver):
             if not driver.save_screenshot(file_path): raise WebDriverError(f"WebDriver failed saving screenshot to {file_path}")
         except (IOError, OSError) as e: raise WebDriverError(f"File system error saving screenshot to {file_path}: {e}") from e
 
+    @log_method_call(logger)
+    @handle_driver_exceptions("Failed to capture screenshot to file: {file_path}")
+    def capture_screenshot(self,
+                           file_path: str,
+                           image_format: str = "png",
+                           quality: Optional[int] = None,
+                           selector: Optional[str] = None,
+                           clip: Optional[Dict[str, float]] = None,
+                           full_page: bool = False) -> None:
+        """Take a screenshot with encoding and region options.
+
+        Chrome and Edge use CDP `Page.captureScreenshot`, which supports JPEG/WebP,
+        clipping and full-page capture, and the result is streamed to disk.
+        Other browsers support PNG only (element and Firefox full-page captures included).
+        """
+        if not isinstance(file_path, str) or not file_path: raise ValidationError("File path must be non-empty string.", field_name="file_path")
+        if image_format not in self.SCREENSHOT_FORMATS: raise ValidationError(f"Unsupported screenshot format: {image_format}", field_name="image_format")
+        if quality is not None and (not isinstance(quality, int) or not 0 <= quality <= 100): raise ValidationError("Quality must be an integer 0-100.", field_name="quality")
+        driver = self._ensure_driver()
+
+        if self.browser_type in (BrowserType.CHROME, BrowserType.EDGE) and cdp.supports_cdp(driver):
+            if selector: clip = self._element_clip(selector)
+            elif full_page and not clip: clip = cdp.full_page_clip(driver.execute_cdp_cmd("Page.getLayoutMetrics", {}))
+            params = cdp.build_screenshot_params(image_format, quality, clip, full_page)
+            data = driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+            written = cdp.write_base64_file(data, file_path)
+            logger.debug(f"Captured {image_format} screenshot via CDP ({written} bytes): {file_path}")
+            return
+
+        if image_format != "png" or quality is not None or clip:
+            raise WebDriverError(f"Screenshot format/quality/clip options require CDP, unavailable for {self.browser_type.value}.")
+        if selector:
+            directory = os.path.dirname(file_path)
+            if directory: os.makedirs(directory, exist_ok=True)
+            element = self.find_element(selector)
+            if not element.screenshot(file_path): raise WebDriverError(f"WebDriver failed saving element screenshot to {file_path}")
+        elif full_page:
+            if not hasattr(driver, "get_full_page_screenshot_as_file"):
+                raise WebDriverError(f"Full-page screenshots are not supported for {self.browser_type.value}.")
+            directory = os.path.dirname(file_path)
+            if directory: os.makedirs(directory, exist_ok=True)
+            if not driver.get_full_page_screenshot_as_file(file_path): raise WebDriverError(f"WebDriver failed saving screenshot to {file_path}")
+        else:
+            self.take_screenshot(file_path)
+
+    @log_method_call(logger, log_result=False)
+    @handle_driver_exceptions("Failed to capture screenshot")
+    def get_screenshot_bytes(self, image_format: str = "png", quality: Optional[int] = None) -> bytes:
+        """Capture the viewport as encoded bytes (JPEG/WebP via CDP on Chrome and Edge)."""
+        if image_format not in self.SCREENSHOT_FORMATS: raise ValidationError(f"Unsupported screenshot format: {image_format}", field_name="image_format")
+        driver = self._ensure_driver()
+        if image_format == "png" and quality is None: return driver.get_screenshot_as_png()
+        if self.browser_type not in (BrowserType.CHROME, BrowserType.EDGE) or not cdp.supports_cdp(driver):
+            raise WebDriverError(f"Screenshot format/quality options require CDP, unavailable for {self.browser_type.value}.")
+        params = cdp.build_screenshot_params(image_format, quality)
+        return base64.b64decode(driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"])
+
+    def _element_clip(self, selector: str) -> Dict[str, float]:
+        """Returns the page-relative bounding box of the element matching selector."""
+        element = self.find_element(selector)
+        return self._ensure_driver().execute_script(
+            "var r = arguments[0].getBoundingClientRect();"
+            "return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};",
+            element)
+
     def is_element_present(self, selector: str) -> bool:
         if not isinstance(selector, str) or not selector: logger.warning("is_element_present empty selector."); return False
         driver = self._ensure_driver(); original_wait = self.implicit_wait_seconds; present = False
@@ -273,12 +412,12 @@ class SeleniumWebDriver(IWebDriver):
     @log_method_call(logger)
     @handle_driver_exceptions("Failed to switch to frame: {frame_reference}")
     def switch_to_frame(self, frame_reference: Union[str, int, WebElement]) -> None:
-        driver = self._ensure_driver(); driver.switch_to.frame(frame_reference)
+        driver = self._ensure_driver(); self.invalidate_element_cache(); driver.switch_to.frame(frame_reference)
 
     @log_method_call(logger)
     @handle_driver_exceptions("Failed to switch to default content")
     def switch_to_default_content(self) -> None:
-        driver = self._ensure_driver(); driver.switch_to.default_content()
+        driver = self._ensure_driver(); self.invalidate_element_cache(); driver.switch_to.default_content()
 
     @log_method_call(logger)
     @handle_driver_exceptions("Failed to accept alert")
@@ -338,6 +477,7 @@ class SeleniumWebDriver(IWebDriver):
     def refresh(self) -> None:
         """Refresh the current page."""
         driver = self._ensure_driver()
+        self.invalidate_element_cache()
         driver.refresh()
 
     @log_method_call(logger)
@@ -345,6 +485,7 @@ class SeleniumWebDriver(IWebDriver):
     def back(self) -> None:
         """Navigate back to the previous page."""
         driver = self._ensure_driver()
+        self.invalidate_element_cache()
         driver.back()
 
     @log_method_call(logger)
@@ -352,7 +493,106 @@ class SeleniumWebDriver(IWebDriver):
     def forward(self) -> None:
         """Navigate forward to the next page."""
         driver = self._ensure_driver()
+        self.invalidate_element_cache()
         driver.forward()
 
+    # Executes a list of batch operations in the page and reports either all results
+    # or the index of the first failing operation. 'locate' returns the element so the
+    # caller can type into it natively; 'type' (script typing, opt-in) sets the value and
+    # fires 'input'/'change' events instead of synthesising individual key presses.
+    _BATCH_SCRIPT = """
+        var ops = arguments[0], results = [];
+        for (var i = 0; i < ops.length; i++) {
+            var op = ops[i];
+            try {
+                var el = document.querySelector(op.selector);
+                if (op.op === 'is_present') { results.push(el !== null); continue; }
+                if (el === null) { return {error: 'Element not found for selector: ' + op.selector, index: i}; }
+                if (op.op === 'locate') { results.push(el); }
+                else if (op.op === 'click') { el.click(); results.push(null); }
+                else if (op.op === 'type') {
+                    el.focus(); el.value = op.text;
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                    results.push(null);
+                }
+                else if (op.op === 'get_text') { results.push(el.innerText); }
+                else if (op.op === 'get_attribute') {
+                    var value = (op.name in el) ? el[op.name] : el.getAttribute(op.name);
+                    results.push(value === undefined ? null : value);
+                }
+            } catch (e) { return {error: String(e), index: i}; }
+        }
+        return {results: results};
+    """
+
+    @log_method_call(logger, log_args=False, log_result=False)
+    def run_batch(self, operations: List[Dict[str, Any]], script_typing: bool = False) -> List[Any]:
+        """Execute independent element operations in as few execute_script round trips as possible.
+
+        By default 'type' operations keep clear()+send_keys() semantics: each run
+        of consecutive 'type' operations is located in one script call and then
+        typed into natively, element by element. With script_typing the values
+        are set from the script instead (one round trip for the whole batch, but
+        no key events are fired). Falls back to per-operation execution for the
+        remaining operations if a batch script cannot be run at all (e.g.
+        scripting blocked by the page). No implicit wait is applied to elements
+        located inside the batch.
+
+        Raises:
+            ValidationError: If an operation is malformed (nothing is sent).
+            WebDriverError: If any operation fails.
+        """
+        if not isinstance(operations, list): raise ValidationError("Operations must be a list.", field_name="operations")
+        payload = [self._validate_batch_operation(op) for op in operations]
+        return self._run_batch_payload(operations, payload, script_typing) if payload else []
+
+    @handle_driver_exceptions("Failed to run batch of element operations")
+    def _run_batch_payload(self, operations: List[Dict[str, Any]], payload: List[Dict[str, Any]], script_typing: bool) -> List[Any]:
+        """Runs validated operations, splitting out native typing unless script_typing."""
+        if script_typing or all(op["op"] != "type" for op in payload):
+            segments = [(0, len(payload))]
+        else: # Alternate script segments and runs of consecutive 'type' operations
+            segments, start = [], 0
+            for index in range(1, len(payload) + 1):
+                if index == len(payload) or (payload[index]["op"] == "type") != (payload[start]["op"] == "type"):
+                    segments.append((start, index)); start = index
+        results: List[Any] = []
+        for start, end in segments:
+            native_typing = not script_typing and payload[start]["op"] == "type"
+            script_ops = [{"op": "locate", "selector": op["selector"]} for op in payload[start:end]] if native_typing else payload[start:end]
+            outcome = self._run_batch_script(script_ops, payload, start)
+            if outcome is None: return results + super().run_batch(operations[start:])
+            if native_typing:
+                for element, op in zip(outcome, payload[start:end]):
+                    element.clear(); element.send_keys(op["text"]); results.append(None)
+            else:
+                results.extend(outcome)
+        logger.debug(f"Executed batch of {len(payload)} operations in {len(segments)} round trip(s).")
+        return results
+
+    def _run_batch_script(self, script_ops: List[Dict[str, Any]], payload: List[Dict[str, Any]], offset: int) -> Optional[List[Any]]:
+        """Runs one batch script; returns its results, or None if the script could not run at all."""
+        try:
+            outcome = self._ensure_driver().execute_script(self._BATCH_SCRIPT, script_ops)
+        except JavascriptException as e:
+            logger.warning(f"Batch script failed ({e.msg}); falling back to per-operation execution.")
+            return None
+        if not isinstance(outcome, dict) or ("results" not in outcome and "error" not in outcome):
+            logger.warning("Batch script returned unexpected payload; falling back to per-operation execution.")
+            return None
+        if "error" in outcome:
+            index = offset + outcome.get("index", 0)
+            raise WebDriverError(f"Batch operation {index} ({payload[index]['op']} '{payload[index]['selector']}') failed: {outcome['error']}")
+        return outcome["results"]
+
+    def _validate_batch_operation(self, operation: Any) -> Dict[str, Any]:
+        """Validates a batch operation and returns the JSON payload sent to the browser."""
+        self._check_batch_operation(operation)
+        payload = {"op": operation["op"], "selector": operation["selector"]}
+        if operation["op"] == "type": payload["text"] = operation.get("text", "")
+        elif operation["op"] == "get_attribute": payload["name"] = operation["name"]
+        return payload
+
     def __enter__(self): return self
     def __exit__(self, exc_type, exc_val, exc_tb): self.quit()
\ No newline at end of file
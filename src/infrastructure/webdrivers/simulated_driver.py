@@ -0,0 +1,472 @@
+"""Simulated browser for load and capacity testing.
+
+SimulatedWebDriver implements the full IWebDriver interface against an
+in-memory DOM built from page fixtures, without launching a browser. Every
+operation waits for a latency drawn from a per-operation distribution and
+may fail at random or find that an element has gone stale, so driver
+pooling, concurrency and retry behaviour can be load-tested locally. The
+waits are plain sleeps, which release the GIL, so hundreds of virtual
+browsers can run as threads of one process.
+
+Fixtures map URLs to pages:
+
+    {
+        "https://example.com/login": {
+            "title": "Login",
+            "elements": [
+                {"tag": "input", "id": "user", "attributes": {"name": "user"}},
+                {"tag": "button", "id": "submit", "text": "Sign in", "navigates_to": "https://example.com/home"},
+                {"tag": "div", "classes": ["banner"], "appear_after_ms": 500},
+                {"tag": "a", "id": "help", "frame": "sidebar"}
+            ],
+            "frames": ["sidebar"],
+            "alert": "Cookies?",
+            "scripts": {"return document.readyState": "complete"}
+        }
+    }
+
+Elements are matched by simple CSS selectors (`tag`, `#id`, `.class`,
+`[attr=value]` and combinations); for descendant selectors only the last
+compound part is matched. URLs without a fixture load an empty page.
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from src.core.interfaces import IWebDriver
+from src.core.exceptions import ConfigError, ValidationError, WebDriverError
+
+logger = logging.getLogger(__name__)
+
+# Operations with their own latency distribution and failure rate.
+OPERATIONS = ("navigate", "find", "click", "type", "script", "screenshot", "frame", "alert", "batch")
+
+# 1x1 transparent PNG returned by simulated screenshots.
+_PNG_PIXEL = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082")
+
+_COMPOUND_RE = re.compile(r"([#.]?[\w-]+|\[[^\]]+\]|\*)")
+
+
+class LatencyDistribution:
+    """
+    Latency of one simulated operation.
+
+    Attributes:
+        kind (str): 'fixed', 'uniform', 'normal' or 'lognormal'.
+        params (Dict[str, float]): Distribution parameters in milliseconds -
+            'ms' (fixed), 'low_ms'/'high_ms' (uniform), 'mean_ms'/'stddev_ms' (normal),
+            'median_ms'/'sigma' (lognormal, sigma is unitless).
+    """
+
+    KINDS = {
+        "fixed": ("ms",),
+        "uniform": ("low_ms", "high_ms"),
+        "normal": ("mean_ms", "stddev_ms"),
+        "lognormal": ("median_ms", "sigma"),
+    }
+
+    def __init__(self, kind: str = "fixed", **params: float):
+        """Initialize a LatencyDistribution, validating its parameters."""
+        if kind not in self.KINDS: raise ConfigError(f"Unknown latency distribution: '{kind}'. Choose from {sorted(self.KINDS)}")
+        missing = set(self.KINDS[kind]) - set(params)
+        if missing: raise ConfigError(f"Latency distribution '{kind}' is missing: {sorted(missing)}")
+        if any(not isinstance(value, (int, float)) or value < 0 for value in params.values()):
+            raise ConfigError(f"Latency distribution '{kind}' parameters must be non-negative numbers.")
+        self.kind = kind
+        self.params = {key: float(params[key]) for key in self.KINDS[kind]}
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency in seconds."""
+        p = self.params
+        if self.kind == "fixed": ms = p["ms"]
+        elif self.kind == "uniform": ms = rng.uniform(p["low_ms"], p["high_ms"])
+        elif self.kind == "normal": ms = max(0.0, rng.gauss(p["mean_ms"], p["stddev_ms"]))
+        else: ms = rng.lognormvariate(0.0, p["sigma"]) * p["median_ms"]
+        return ms / 1000.0
+
+    @classmethod
+    def resolve(cls, value: Union[None, int, float, Dict[str, Any], "LatencyDistribution"]) -> "LatencyDistribution":
+        """Resolve a fixed latency in ms, a distribution dict or a LatencyDistribution (None is zero latency)."""
+        if isinstance(value, LatencyDistribution): return value
+        if value is None: return cls("fixed", ms=0)
+        if isinstance(value, (int, float)): return cls("fixed", ms=value)
+        if isinstance(value, dict):
+            params = dict(value); kind = params.pop("distribution", "fixed")
+            return cls(kind, **params)
+        raise ConfigError(f"Invalid latency distribution: {value!r}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.params, distribution=self.kind)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.kind!r}, {self.params})"
+
+
+class SimulationProfile:
+    """
+    Describes how a simulated browser behaves.
+
+    Attributes:
+        name (str): Profile name, used in logs.
+        latency (Dict[str, LatencyDistribution]): Latency per operation (keys of OPERATIONS).
+        failure_rates (Dict[str, float]): Probability that an operation fails with a WebDriverError.
+        stale_element_rate (float): Probability that an element interaction finds the element stale.
+        time_scale (float): Multiplier applied to every latency (e.g. 0.1 runs ten times faster).
+    """
+
+    def __init__(self,
+                 name: str,
+                 latency: Optional[Dict[str, Any]] = None,
+                 failure_rates: Optional[Dict[str, float]] = None,
+                 stale_element_rate: float = 0.0,
+                 time_scale: float = 1.0):
+        """Initialize a SimulationProfile, validating operations and rates."""
+        unknown = (set(latency or {}) | set(failure_rates or {})) - set(OPERATIONS)
+        if unknown: raise ConfigError(f"Unknown operations in simulation profile '{name}': {sorted(unknown)}. Choose from {list(OPERATIONS)}")
+        rates = dict(failure_rates or {}); rates["stale"] = stale_element_rate
+        if any(not isinstance(rate, (int, float)) or not 0 <= rate <= 1 for rate in rates.values()):
+            raise ConfigError(f"Failure rates in simulation profile '{name}' must be between 0 and 1.")
+        if not isinstance(time_scale, (int, float)) or time_scale < 0: raise ConfigError("Time scale must be a non-negative number.")
+        self.name = name
+        self.latency = {op: LatencyDistribution.resolve((latency or {}).get(op)) for op in OPERATIONS}
+        self.failure_rates = {op: float((failure_rates or {}).get(op, 0.0)) for op in OPERATIONS}
+        self.stale_element_rate = float(stale_element_rate)
+        self.time_scale = float(time_scale)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SimulationProfile":
+        """Create a profile from configuration data."""
+        if not isinstance(data, dict): raise ConfigError(f"Simulation profile must be a dict, got {type(data).__name__}")
+        return cls(name=data.get("name", "custom"),
+                   latency=data.get("latency"),
+                   failure_rates=data.get("failure_rates"),
+                   stale_element_rate=data.get("stale_element_rate", 0.0),
+                   time_scale=data.get("time_scale", 1.0))
+
+    @classmethod
+    def resolve(cls, value: Union[None, str, Dict[str, Any], "SimulationProfile"]) -> "SimulationProfile":
+        """Resolve a profile name, dict or SimulationProfile (None is the 'instant' profile)."""
+        if isinstance(value, SimulationProfile): return value
+        if value is None: return SIMULATION_PROFILES["instant"]
+        if isinstance(value, dict): return cls.from_dict(value)
+        if isinstance(value, str):
+            profile = SIMULATION_PROFILES.get(value.lower())
+            if profile is None: raise ConfigError(f"Unknown simulation profile: '{value}'. Choose from {sorted(SIMULATION_PROFILES)}")
+            return profile
+        raise ConfigError(f"Invalid simulation profile: {value!r}")
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(name='{self.name}', stale_element_rate={self.stale_element_rate}, "
+                f"time_scale={self.time_scale})")
+
+
+_REALISTIC_LATENCY = {
+    "navigate": {"distribution": "lognormal", "median_ms": 800, "sigma": 0.6},
+    "find": {"distribution": "lognormal", "median_ms": 15, "sigma": 0.5},
+    "click": {"distribution": "lognormal", "median_ms": 40, "sigma": 0.5},
+    "type": {"distribution": "lognormal", "median_ms": 60, "sigma": 0.5},
+    "script": {"distribution": "lognormal", "median_ms": 10, "sigma": 0.5},
+    "screenshot": {"distribution": "normal", "mean_ms": 150, "stddev_ms": 40},
+    "frame": {"distribution": "fixed", "ms": 5},
+    "alert": {"distribution": "fixed", "ms": 5},
+    "batch": {"distribution": "lognormal", "median_ms": 20, "sigma": 0.5},
+}
+
+SIMULATION_PROFILES: Dict[str, SimulationProfile] = {
+    "instant": SimulationProfile("instant"),
+    "lan": SimulationProfile("lan", latency={op: {"distribution": "uniform", "low_ms": 1, "high_ms": 5} for op in OPERATIONS}),
+    "realistic": SimulationProfile("realistic", latency=_REALISTIC_LATENCY),
+    "flaky": SimulationProfile("flaky", latency=_REALISTIC_LATENCY, stale_element_rate=0.02,
+                               failure_rates={"navigate": 0.01, "find": 0.01, "click": 0.02, "type": 0.01}),
+}
+
+
+def load_fixtures(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load page fixtures from a JSON file."""
+    try:
+        with open(path, "r", encoding="utf-8") as f: fixtures = json.load(f)
+    except (OSError, json.JSONDecodeError) as e: raise ConfigError(f"Could not load simulated page fixtures from {path}: {e}", cause=e) from e
+    if not isinstance(fixtures, dict): raise ConfigError(f"Simulated page fixtures must map URLs to pages: {path}")
+    return fixtures
+
+
+def _matches_compound(compound: str, spec: Dict[str, Any]) -> bool:
+    """Checks a single compound CSS selector (e.g. 'input#user.wide[name=user]') against an element fixture."""
+    parts = _COMPOUND_RE.findall(compound)
+    if not parts or "".join(parts) != compound: return False
+    attributes = spec.get("attributes", {})
+    for part in parts:
+        if part == "*": continue
+        if part.startswith("#"):
+            if spec.get("id") != part[1:]: return False
+        elif part.startswith("."):
+            if part[1:] not in spec.get("classes", ()): return False
+        elif part.startswith("["):
+            name, _, value = part[1:-1].partition("=")
+            name = name.strip(); value = value.strip().strip("'\"")
+            actual = spec.get("id") if name == "id" else attributes.get(name)
+            if actual is None or (value and str(actual) != value): return False
+        elif spec.get("tag", "div") != part.lower(): return False
+    return True
+
+
+class SimulatedElement:
+    """An element of a simulated page; interactions go through the owning driver's latency and failure model."""
+
+    def __init__(self, driver: "SimulatedWebDriver", spec: Dict[str, Any], generation: int):
+        self._driver = driver
+        self._spec = spec
+        self._generation = generation
+        self.tag_name = spec.get("tag", "div")
+        self.value = str(spec.get("attributes", {}).get("value", ""))
+
+    def _check(self, operation: str) -> None:
+        self._driver._simulate(operation)
+        self._driver._check_stale(self)
+
+    @property
+    def text(self) -> str:
+        self._driver._check_stale(self)
+        return self._spec.get("text", "")
+
+    def click(self) -> None:
+        self._check("click")
+        if not self._spec.get("enabled", True): raise WebDriverError(f"Element is not clickable: {self.tag_name}", driver_type="simulated")
+        target = self._spec.get("navigates_to")
+        if target: self._driver._load(target)
+
+    def clear(self) -> None:
+        self._check("type"); self.value = ""
+
+    def send_keys(self, text: str) -> None:
+        self._check("type"); self.value += text
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        self._driver._check_stale(self)
+        if name == "value": return self.value
+        if name == "id": return self._spec.get("id")
+        if name == "class": return " ".join(self._spec.get("classes", ())) or None
+        value = self._spec.get("attributes", {}).get(name)
+        return None if value is None else str(value)
+
+    def is_displayed(self) -> bool:
+        self._driver._check_stale(self); return self._spec.get("visible", True)
+
+    def is_enabled(self) -> bool:
+        self._driver._check_stale(self); return self._spec.get("enabled", True)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(tag='{self.tag_name}', id={self._spec.get('id')!r})"
+
+
+class SimulatedWebDriver(IWebDriver):
+    """
+    IWebDriver implementation backed by an in-memory DOM with injected latency and failures.
+
+    Each instance models one browser and is meant to be used by one thread at a
+    time, like a real WebDriver session. Fixtures are shared read-only between
+    instances; typed values and other page state are per instance.
+
+    Attributes:
+        fixtures (Dict[str, Dict[str, Any]]): Pages by URL.
+        profile (SimulationProfile): Latency distributions and failure rates.
+    """
+    _DEFAULT_WAIT_TIMEOUT = 10 # Default explicit wait timeout in seconds
+    SUPPORTS_SCREENSHOT_BYTES = True
+
+    def __init__(self,
+                 fixtures: Optional[Union[str, Dict[str, Dict[str, Any]]]] = None,
+                 profile: Optional[Union[str, Dict[str, Any], SimulationProfile]] = None,
+                 seed: Optional[int] = None,
+                 start_url: str = "about:blank"):
+        """Initialize a SimulatedWebDriver.
+
+        Args:
+            fixtures: Pages by URL, or the path of a JSON fixtures file.
+            profile: Simulation profile name (see SIMULATION_PROFILES), profile dict or SimulationProfile.
+            seed: Seed for latency and failure sampling, for reproducible runs.
+            start_url: URL loaded (without latency) when the browser starts.
+        """
+        self.fixtures = load_fixtures(fixtures) if isinstance(fixtures, str) else dict(fixtures or {})
+        self.profile = SimulationProfile.resolve(profile)
+        self._rng = random.Random(seed)
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {"operations": {op: 0 for op in OPERATIONS}, "simulated_seconds": 0.0,
+                                       "failures": 0, "stale": 0}
+        self._open = True
+        self._in_batch = False
+        self._load(start_url, simulate=False)
+        logger.debug(f"SimulatedWebDriver started with profile '{self.profile.name}' and {len(self.fixtures)} fixture pages.")
+
+    # --- Simulation ---
+
+    def _ensure_open(self) -> None:
+        if not self._open: raise WebDriverError("WebDriver not initialized or has been quit.", driver_type="simulated")
+
+    def _simulate(self, operation: str) -> None:
+        """Waits for the operation's latency, then fails it at the configured rate (not inside a batch)."""
+        self._ensure_open()
+        delay = 0.0 if self._in_batch else self.profile.latency[operation].sample(self._rng) * self.profile.time_scale
+        failed = not self._in_batch and self._rng.random() < self.profile.failure_rates[operation]
+        with self._stats_lock:
+            self._stats["operations"][operation] += 1
+            self._stats["simulated_seconds"] += delay
+            if failed: self._stats["failures"] += 1
+        if delay > 0: time.sleep(delay)
+        if failed: raise WebDriverError(f"Simulated {operation} failure", driver_type="simulated")
+
+    def _check_stale(self, element: SimulatedElement) -> None:
+        """Raises if the element belongs to an earlier page, or at the configured stale element rate."""
+        stale = element._generation != self._generation or self._rng.random() < self.profile.stale_element_rate
+        if stale:
+            with self._stats_lock: self._stats["stale"] += 1
+            raise WebDriverError("stale element reference: element is not attached to the page document", driver_type="simulated")
+
+    def _load(self, url: str, simulate: bool = True) -> None:
+        """Loads a page from the fixtures, invalidating all elements of the previous page."""
+        if simulate: self._simulate("navigate")
+        page = self.fixtures.get(url, {})
+        self.current_url = url
+        self._page = page
+        self._generation = getattr(self, "_generation", 0) + 1
+        self._loaded_at = time.monotonic()
+        self._frame: Optional[str] = None
+        self._alert: Optional[str] = page.get("alert")
+        self._elements = [SimulatedElement(self, spec, self._generation) for spec in page.get("elements", [])]
+
+    def _candidates(self, selector: str) -> List[SimulatedElement]:
+        """Elements of the current frame matching the selector, whether or not they have appeared yet."""
+        if not isinstance(selector, str) or not selector.strip(): raise ValidationError("Selector must be non-empty string.", field_name="selector")
+        compound = selector.split()[-1].split(">")[-1]
+        return [element for element in self._elements
+                if element._spec.get("frame") == self._frame and _matches_compound(compound, element._spec)]
+
+    def _appears_at(self, element: SimulatedElement) -> float:
+        return self._loaded_at + element._spec.get("appear_after_ms", 0) / 1000.0 * self.profile.time_scale
+
+    def _match(self, selector: str) -> List[SimulatedElement]:
+        now = time.monotonic()
+        return [element for element in self._candidates(selector) if self._appears_at(element) <= now]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns operation counts, total injected latency (seconds), injected failures and stale element errors."""
+        with self._stats_lock:
+            return dict(self._stats, operations=dict(self._stats["operations"]))
+
+    # --- IWebDriver ---
+
+    def get(self, url: str) -> None:
+        if not isinstance(url, str) or not url: raise ValidationError("URL must be non-empty string.", field_name="url")
+        self._load(url)
+
+    def quit(self) -> None:
+        self._open = False
+
+    def find_element(self, selector: str) -> SimulatedElement:
+        self._simulate("find")
+        elements = self._match(selector)
+        if not elements: raise WebDriverError(f"Element not found for selector: {selector}", driver_type="simulated")
+        return elements[0]
+
+    def find_elements(self, selector: str) -> List[SimulatedElement]:
+        self._simulate("find")
+        return self._match(selector)
+
+    def click_element(self, selector: str) -> None:
+        self.find_element(selector).click()
+
+    def type_text(self, selector: str, text: str) -> None:
+        if not isinstance(text, str): raise ValidationError("Text must be string.", field_name="text")
+        element = self.find_element(selector); element.clear(); element.send_keys(text)
+
+    def take_screenshot(self, file_path: str) -> None:
+        if not isinstance(file_path, str) or not file_path: raise ValidationError("File path must be non-empty string.", field_name="file_path")
+        data = self.get_screenshot_bytes()
+        try:
+            with open(file_path, "wb") as f: f.write(data)
+        except OSError as e: raise WebDriverError(f"File system error saving screenshot to {file_path}: {e}", driver_type="simulated", cause=e) from e
+
+    def get_screenshot_bytes(self, image_format: str = "png", quality: Optional[int] = None) -> bytes:
+        if image_format != "png": raise WebDriverError(f"Simulated screenshots support PNG only, not {image_format}.", driver_type="simulated")
+        self._simulate("screenshot")
+        return _PNG_PIXEL
+
+    def is_element_present(self, selector: str) -> bool:
+        if not isinstance(selector, str) or not selector: logger.warning("is_element_present empty selector."); return False
+        try: self._simulate("find")
+        except WebDriverError: return False
+        return bool(self._match(selector))
+
+    def get_current_url(self) -> str:
+        self._ensure_open(); return self.current_url
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        if not isinstance(script, str): raise ValidationError("Script must be a string.", field_name="script")
+        self._simulate("script")
+        return self._page.get("scripts", {}).get(script)
+
+    def wait_for_element(self, selector: str, timeout: int = _DEFAULT_WAIT_TIMEOUT) -> SimulatedElement:
+        """Waits until a matching element has appeared, sleeping until its appear_after_ms has passed."""
+        if not isinstance(timeout, (int, float)) or timeout <= 0: timeout = self._DEFAULT_WAIT_TIMEOUT
+        self._simulate("find")
+        deadline = time.monotonic() + timeout
+        for element in self._candidates(selector):
+            appears_at = self._appears_at(element)
+            if appears_at <= deadline:
+                time.sleep(max(0.0, appears_at - time.monotonic()))
+                return element
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        raise WebDriverError(f"Timeout waiting for element: {selector}", driver_type="simulated")
+
+    def switch_to_frame(self, frame_reference: Union[str, int, Any]) -> None:
+        self._simulate("frame")
+        frames = self._page.get("frames", [])
+        if isinstance(frame_reference, int) and not isinstance(frame_reference, bool) and 0 <= frame_reference < len(frames):
+            self._frame = frames[frame_reference]
+        elif frame_reference in frames:
+            self._frame = frame_reference
+        else:
+            raise WebDriverError(f"No such frame: {frame_reference}", driver_type="simulated")
+
+    def switch_to_default_content(self) -> None:
+        self._simulate("frame"); self._frame = None
+
+    def _take_alert(self) -> str:
+        self._simulate("alert")
+        if self._alert is None: raise WebDriverError("No alert is present", driver_type="simulated")
+        return self._alert
+
+    def accept_alert(self) -> None:
+        self._take_alert(); self._alert = None
+
+    def dismiss_alert(self) -> None:
+        self._take_alert(); self._alert = None
+
+    def get_alert_text(self) -> str:
+        return self._take_alert()
+
+    def get_page_source(self) -> str:
+        self._ensure_open()
+        return f"<html><head><title>{self._page.get('title', '')}</title></head><body></body></html>"
+
+    def get_title(self) -> str:
+        self._ensure_open(); return self._page.get("title", "")
+
+    def run_batch(self, operations: List[Dict[str, Any]], script_typing: bool = False) -> List[Any]:
+        """Executes the batch in a single simulated round trip, like SeleniumWebDriver's batch script."""
+        if not isinstance(operations, list): raise ValidationError("Operations must be a list.", field_name="operations")
+        if not operations: return []
+        self._simulate("batch")
+        self._in_batch = True # Operations inside the round trip add no latency or failures of their own
+        try: return super().run_batch(operations)
+        finally: self._in_batch = False
+
+    def __enter__(self): return self
+    def __exit__(self, exc_type, exc_val, exc_tb): self.quit()
@@ -10,11 +10,16 @@ import threading
 import time
 from typing import Dict, Any, Optional
 
+# Start of the application imports, for the startup timing breakdown
+_IMPORT_START = time.perf_counter()
+
 # Configuration
 from src.config import config
 
 # Core components
 from src.core.exceptions import AutoQliqError, UIError, ConfigError
+from src.core.workflow.run_queue import RunQueue
+from src.core.workflow.screenshot_writer import ScreenshotWriter
 
 # Infrastructure components
 from src.infrastructure.repositories.factory import RepositoryFactory
@@ -26,6 +31,7 @@ from src.infrastructure.webdrivers import WebDriverFactory
 # Error handling and recovery
 from src.infrastructure.common.error_recovery import recovery_manager, with_error_recovery
 from src.infrastructure.common.error_monitoring import error_monitor, monitor_errors
+from src.infrastructure.common.metrics import MetricsServer, REGISTRY, register_run_queue_metrics
 
 # Application Services
 from src.application.services import (
@@ -39,8 +45,8 @@ from src.ui.presenters.workflow_editor_presenter_enhanced import WorkflowEditorP
 from src.ui.presenters.workflow_runner_presenter_enhanced import WorkflowRunnerPresenterEnhanced
 from src.ui.factories.enhanced_ui_factory import EnhancedUIFactory
 from src.ui.common.status_bar import StatusBar
-from src.ui.dialogs.credential_manager_dialog import CredentialManagerDialog
-from src.ui.dialogs.diagnostics_dialog import DiagnosticsDialog
+from src.ui.common.startup import BackgroundLoader, StartupTimer
+# Dialogs are imported when first opened (see create_menu)
 
 # Original UI components (for compatibility)
 from src.ui.views.workflow_editor_view import WorkflowEditorView
@@ -207,8 +213,33 @@ def create_services(repositories: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # Initialize placeholder services
-        scheduler_service = SchedulerService()
+        # Scheduled runs share one queue: limits per site/workflow, interactive runs first
+        run_queue = RunQueue(
+            max_workers=config.run_queue_max_workers,
+            workflow_limit=config.run_queue_workflow_limit,
+            site_limit=config.run_queue_site_limit
+        )
+        register_run_queue_metrics(REGISTRY, run_queue)
+        scheduler_service = SchedulerService(
+            workflow_service,
+            job_store_path=config.scheduler_job_store_path,
+            max_workers=config.scheduler_max_workers,
+            misfire_policy=config.scheduler_misfire_policy,
+            misfire_grace_seconds=config.scheduler_misfire_grace_seconds,
+            lease_seconds=config.scheduler_lease_seconds,
+            run_queue=run_queue
+        )
         reporting_service = ReportingService()
+        # Screenshot actions of every run hand their frames to one background writer
+        screenshot_writer = ScreenshotWriter()
+
+        # Serve service metrics (runs, actions, drivers, scheduler) if enabled in config
+        metrics_server = None
+        if config.metrics_enabled:
+            try:
+                metrics_server = MetricsServer(REGISTRY, host=config.metrics_host, port=config.metrics_port).start()
+            except OSError as e:
+                logger.error(f"Could not start metrics endpoint on {config.metrics_host}:{config.metrics_port}: {e}")
 
         logger.info("Application services created successfully")
         return {
@@ -216,7 +247,10 @@ def create_services(repositories: Dict[str, Any]) -> Dict[str, Any]:
             'webdriver_service': webdriver_service,
             'workflow_service': workflow_service,
             'scheduler_service': scheduler_service,
-            'reporting_service': reporting_service
+            'reporting_service': reporting_service,
+            'metrics_server': metrics_server,
+            'run_queue': run_queue,
+            'screenshot_writer': screenshot_writer
         }
     except Exception as e:
         logger.exception(f"Failed to create application services: {e}")
@@ -226,9 +260,15 @@ def create_services(repositories: Dict[str, Any]) -> Dict[str, Any]:
 def create_enhanced_ui(
     root: tk.Tk,
     repositories: Dict[str, Any],
-    services: Dict[str, Any]
+    services: Dict[str, Any],
+    load_lists: bool = True
 ) -> Dict[str, Any]:
-    """Create the enhanced UI components."""
+    """
+    Create the enhanced UI components.
+
+    With load_lists=False the workflow and credential lists start empty; fill
+    them with start_background_loading once the window is up.
+    """
     try:
         logger.info("Creating enhanced UI components")
 
@@ -257,14 +297,18 @@ def create_enhanced_ui(
         workflow_runner_presenter = WorkflowRunnerPresenterEnhanced(
             repositories['workflow_repository'],
             repositories['credential_repository'],
-            repositories['webdriver_factory']
+            repositories['webdriver_factory'],
+            run_queue=services.get('run_queue'),
+            run_options=config.runner_options,
+            screenshot_writer=services.get('screenshot_writer'),
+            reporting_service=services.get('reporting_service')
         )
 
         settings_presenter = SettingsPresenter(config)
 
         # Create the views
         workflow_editor_view = WorkflowEditorView(editor_frame, workflow_editor_presenter)
-        workflow_runner_view = WorkflowRunnerViewEnhanced(runner_frame, workflow_runner_presenter)
+        workflow_runner_view = WorkflowRunnerViewEnhanced(runner_frame, workflow_runner_presenter, load_lists=load_lists)
         settings_view = SettingsView(settings_frame, settings_presenter)
 
         # Link views and presenters
@@ -315,6 +359,7 @@ def create_menu(
         # Add credential manager command
         def open_credential_manager():
             try:
+                from src.ui.dialogs.credential_manager_dialog import CredentialManagerDialog
                 dialog = CredentialManagerDialog(
                     root,
                     credential_service=services['credential_service']
@@ -341,6 +386,7 @@ def create_menu(
         # Add diagnostics command
         def open_diagnostics():
             try:
+                from src.ui.dialogs.diagnostics_dialog import DiagnosticsDialog
                 dialog = DiagnosticsDialog(
                     root,
                     repositories=repositories,
@@ -443,6 +489,46 @@ def create_menu(
         raise UIError(f"Failed to create application menu: {e}", cause=e) from e
 
 
+def start_background_loading(
+    root: tk.Tk,
+    ui_components: Dict[str, Any],
+    repositories: Dict[str, Any],
+    timer: Optional[StartupTimer] = None
+) -> BackgroundLoader:
+    """Load the workflow and credential lists off the Tk thread, showing progress in the status bar."""
+    status_bar = ui_components['status_bar']
+
+    def show_workflows(workflow_names):
+        ui_components['workflow_editor_view'].set_workflow_list(workflow_names)
+        ui_components['workflow_runner_view'].set_workflow_list(workflow_names)
+
+    def on_progress(label: str, done: int, total: int) -> None:
+        status_bar.set_message(f"Loaded {label} ({done}/{total})")
+        status_bar.set_progress(100.0 * done / total)
+
+    def on_done() -> None:
+        status_bar.stop_progress()
+        failed = [label for label, _ in loader.errors]
+        status_bar.set_message(f"Failed to load: {', '.join(failed)}" if failed else "Ready")
+        if timer:
+            timer.mark("lists loaded")
+            logger.info(f"Startup timing:\n{timer.report()}")
+
+    loader = BackgroundLoader(
+        root,
+        [
+            ("workflows", repositories['workflow_repository'].list_workflows, show_workflows),
+            ("credentials", repositories['credential_repository'].list_credentials,
+             ui_components['workflow_runner_view'].set_credential_list),
+        ],
+        on_progress=on_progress,
+        on_done=on_done,
+        timer=timer
+    )
+    status_bar.set_message("Loading workflows and credentials...")
+    return loader.start()
+
+
 def setup_error_handlers(root: tk.Tk, ui_components: Dict[str, Any]) -> None:
     """Set up global error handlers."""
     try:
@@ -544,30 +630,42 @@ def main() -> None:
     logger = setup_logging()
     logger.info(f"--- Starting {config.WINDOW_TITLE} ---")
 
+    # Staged startup: build the window, show it, then fill the lists in the background
+    timer = StartupTimer(start=_IMPORT_START)
+    timer.record("imports", time.perf_counter() - _IMPORT_START)
+
     # Create the root window
-    root = tk.Tk()
-    root.title(config.WINDOW_TITLE)
-    root.geometry(config.WINDOW_GEOMETRY)
+    with timer.stage("window"):
+        root = tk.Tk()
+        root.title(config.WINDOW_TITLE)
+        root.geometry(config.WINDOW_GEOMETRY)
 
     try:
         # Create the repositories
-        repositories = create_repositories()
+        with timer.stage("repositories"):
+            repositories = create_repositories()
 
         # Create the services
-        services = create_services(repositories)
+        with timer.stage("services"):
+            services = create_services(repositories)
 
         # Create the enhanced UI components
-        ui_components = create_enhanced_ui(root, repositories, services)
+        with timer.stage("views"):
+            ui_components = create_enhanced_ui(root, repositories, services, load_lists=False)
 
         # Create the menu
-        menu = create_menu(root, ui_components, repositories, services)
+        with timer.stage("menu"):
+            menu = create_menu(root, ui_components, repositories, services)
 
         # Set up error handlers
         setup_error_handlers(root, ui_components)
 
-        # Set the initial status
-        if 'status_bar' in ui_components:
-            ui_components['status_bar'].set_message("Ready")
+        # Once the main loop runs, the window is on screen: start loading the lists
+        def on_window_shown():
+            timer.mark("window shown")
+            start_background_loading(root, ui_components, repositories, timer)
+
+        root.after(0, on_window_shown)
 
         # Start the main loop
         logger.info("Starting main loop")
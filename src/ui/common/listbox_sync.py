@@ -0,0 +1,39 @@
+"""Incremental listbox updates for AutoQliq UI lists."""
+
+import tkinter as tk
+from typing import List, Sequence, Tuple
+
+
+def sync_listbox(listbox: tk.Listbox, shown: List[str], items: Sequence[str]) -> Tuple[int, int, int]:
+    """
+    Make a listbox that currently shows `shown` show `items`, touching only the rows that changed.
+
+    The rows between the common prefix and the common suffix are replaced with
+    one delete and one insert call, so an edit, insert, delete or move costs a
+    couple of Tk calls instead of one per row, and a full load is a single
+    insert. Tk's Listbox only draws the visible rows, so per-row Tcl calls
+    are what makes large lists slow. `shown` is updated in place.
+
+    Args:
+        listbox: The listbox to update
+        shown: The rows the listbox currently shows (kept in sync by the caller)
+        items: The rows to show
+
+    Returns:
+        (first changed row, rows removed, rows inserted)
+    """
+    prefix = 0
+    limit = min(len(shown), len(items))
+    while prefix < limit and shown[prefix] == items[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and shown[-1 - suffix] == items[-1 - suffix]:
+        suffix += 1
+    removed = len(shown) - prefix - suffix
+    new_rows = list(items[prefix:len(items) - suffix])
+    if removed:
+        listbox.delete(prefix, prefix + removed - 1)
+    if new_rows:
+        listbox.insert(prefix, *new_rows)
+    shown[prefix:prefix + removed] = new_rows
+    return prefix, removed, len(new_rows)
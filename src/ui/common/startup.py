@@ -0,0 +1,155 @@
+"""Staged application startup: timing breakdown and background data loading."""
+
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A load step: (label shown in the status bar, fetch on the worker thread, apply the result on the Tk thread)
+LoadStep = Tuple[str, Callable[[], Any], Callable[[Any], None]]
+
+
+class StartupTimer:
+    """
+    Records how long each startup stage takes, measured from `start`.
+
+    Attributes:
+        start: time.perf_counter() at which startup began
+        stages: (stage name, seconds) in the order the stages finished
+        marks: (milestone name, seconds since start), e.g. when the window first appeared
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self.start = time.perf_counter() if start is None else start
+        self.stages: List[Tuple[str, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+        self._lock = threading.Lock() # Background stages finish on another thread
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name` (recorded even if it raises)."""
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - began)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a stage timed elsewhere."""
+        with self._lock:
+            self.stages.append((name, seconds))
+
+    def mark(self, name: str) -> float:
+        """Record a milestone; returns the seconds since start."""
+        elapsed = time.perf_counter() - self.start
+        with self._lock:
+            self.marks.append((name, elapsed))
+        return elapsed
+
+    def summary(self) -> Dict[str, Any]:
+        """Stage durations and milestones, in milliseconds."""
+        with self._lock:
+            return {
+                "stages_ms": {name: round(seconds * 1000, 1) for name, seconds in self.stages},
+                "marks_ms": {name: round(seconds * 1000, 1) for name, seconds in self.marks},
+            }
+
+    def report(self) -> str:
+        """The breakdown as aligned text lines, for the log."""
+        summary = self.summary()
+        rows = [(f"{name}", ms) for name, ms in summary["stages_ms"].items()]
+        rows += [(f"@ {name}", ms) for name, ms in summary["marks_ms"].items()]
+        width = max((len(name) for name, _ in rows), default=0)
+        return "\n".join(f"  {name:<{width}}  {ms:8.1f} ms" for name, ms in rows)
+
+
+class BackgroundLoader:
+    """
+    Runs data loading steps on a worker thread and applies their results on the Tk thread.
+
+    Each step's fetch runs on the worker (it must not touch widgets); its result
+    is queued and applied by a `root.after()` poll, since Tk calls are only safe
+    from the thread running the main loop. A fetch that raises is logged and
+    its step skipped, so one broken repository doesn't block the other lists.
+
+    Attributes:
+        root: Any widget; used for `after()`
+        steps: The load steps, run in order
+        timer: Records each fetch as stage 'load: <label>' if given
+        errors: (label, exception) for each failed step
+    """
+
+    def __init__(self, root: Any, steps: List[LoadStep],
+                 on_progress: Optional[Callable[[str, int, int], None]] = None,
+                 on_done: Optional[Callable[[], None]] = None,
+                 timer: Optional[StartupTimer] = None, poll_ms: int = 20):
+        """
+        Args:
+            root: Any widget; used for `after()`
+            steps: (label, fetch, apply) load steps, run in order
+            on_progress: Called on the Tk thread before each step is applied, with (label, done, total)
+            on_done: Called on the Tk thread once every step has been applied
+            timer: Startup timer to record the fetch durations in
+            poll_ms: How often the Tk thread checks for finished steps
+        """
+        self.root = root
+        self.steps = list(steps)
+        self.timer = timer
+        self.errors: List[Tuple[str, BaseException]] = []
+        self._on_progress = on_progress
+        self._on_done = on_done
+        self._poll_ms = poll_ms
+        self._results: "queue.Queue[Tuple[int, bool, Any]]" = queue.Queue()
+        self._applied = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BackgroundLoader":
+        """Start fetching and polling for results."""
+        self._thread = threading.Thread(target=self._fetch_all, name="StartupLoader", daemon=True)
+        self._thread.start()
+        self.root.after(self._poll_ms, self.poll)
+        return self
+
+    @property
+    def done(self) -> bool:
+        return self._applied == len(self.steps)
+
+    def poll(self) -> None:
+        """Apply finished steps (Tk thread), then reschedule until every step is applied."""
+        while True:
+            try:
+                index, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            label, _, apply = self.steps[index]
+            self._applied += 1
+            if self._on_progress:
+                self._on_progress(label, self._applied, len(self.steps))
+            if ok:
+                try:
+                    apply(value)
+                except Exception as e:
+                    logger.exception(f"Failed to show {label}")
+                    self.errors.append((label, e))
+        if self.done:
+            if self._on_done:
+                self._on_done()
+        else:
+            self.root.after(self._poll_ms, self.poll)
+
+    def _fetch_all(self) -> None:
+        for index, (label, fetch, _) in enumerate(self.steps):
+            began = time.perf_counter()
+            try:
+                self._results.put((index, True, fetch()))
+            except Exception as e:
+                logger.error(f"Failed to load {label}: {e}")
+                self.errors.append((label, e))
+                self._results.put((index, False, None))
+            finally:
+                if self.timer:
+                    self.timer.record(f"load: {label}", time.perf_counter() - began)
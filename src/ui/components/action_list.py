@@ -7,6 +7,7 @@ from typing import List, Optional, Callable, Any, Dict
 
 from src.core.exceptions import UIError
 from src.ui.components.ui_component import UIComponent
+from src.ui.common.listbox_sync import sync_listbox
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,9 @@ class ActionList(UIComponent):
     
     This component provides a listbox with a scrollbar for displaying actions,
     along with buttons for common operations like adding, editing, and deleting actions.
+
+    Display strings are kept alongside the action data, so edits and moves
+    reformat only the actions they touch and update only the affected rows.
     
     Attributes:
         frame: The main frame containing all widgets
@@ -145,8 +149,9 @@ class ActionList(UIComponent):
             # Bind the selection event
             self.listbox.bind("<<ListboxSelect>>", self._on_selection_changed)
             
-            # Store the action data for each item
+            # Store the action data and display string for each item
             self._action_data = []
+            self._display_texts: List[str] = []
             
             self.logger.debug("ActionList component initialized")
         except Exception as e:
@@ -165,17 +170,11 @@ class ActionList(UIComponent):
             UIError: If the actions cannot be set
         """
         try:
-            # Clear the listbox
-            self.listbox.delete(0, tk.END)
-            
             # Store the action data
             self._action_data = actions
             
-            # Add the actions
-            for action in actions:
-                # Format the action for display
-                display_text = self._format_action_for_display(action)
-                self.listbox.insert(tk.END, display_text)
+            # Replace only the rows whose text changed
+            sync_listbox(self.listbox, self._display_texts, [self._format_action_for_display(action) for action in actions])
             
             # Disable the buttons
             self._update_button_states()
@@ -275,9 +274,7 @@ class ActionList(UIComponent):
             self._action_data[index] = action
             
             # Update the display
-            display_text = self._format_action_for_display(action)
-            self.listbox.delete(index)
-            self.listbox.insert(index, display_text)
+            self._replace_rows(index, [self._format_action_for_display(action)])
             
             # Reselect the action
             self.select_action(index)
@@ -306,6 +303,7 @@ class ActionList(UIComponent):
             
             # Add the action to the listbox
             display_text = self._format_action_for_display(action)
+            self._display_texts.append(display_text)
             self.listbox.insert(tk.END, display_text)
             
             # Select the new action
@@ -337,6 +335,7 @@ class ActionList(UIComponent):
             del self._action_data[index]
             
             # Delete the action from the listbox
+            del self._display_texts[index]
             self.listbox.delete(index)
             
             # Select the next action if available
@@ -370,13 +369,8 @@ class ActionList(UIComponent):
             # Swap the action data
             self._action_data[index], self._action_data[index - 1] = self._action_data[index - 1], self._action_data[index]
             
-            # Update the display
-            display_text1 = self._format_action_for_display(self._action_data[index - 1])
-            display_text2 = self._format_action_for_display(self._action_data[index])
-            self.listbox.delete(index - 1)
-            self.listbox.insert(index - 1, display_text1)
-            self.listbox.delete(index)
-            self.listbox.insert(index, display_text2)
+            # Update the display (the cached strings move with their actions)
+            self._replace_rows(index - 1, [self._display_texts[index], self._display_texts[index - 1]])
             
             # Select the moved action
             self.select_action(index - 1)
@@ -404,13 +398,8 @@ class ActionList(UIComponent):
             # Swap the action data
             self._action_data[index], self._action_data[index + 1] = self._action_data[index + 1], self._action_data[index]
             
-            # Update the display
-            display_text1 = self._format_action_for_display(self._action_data[index])
-            display_text2 = self._format_action_for_display(self._action_data[index + 1])
-            self.listbox.delete(index)
-            self.listbox.insert(index, display_text1)
-            self.listbox.delete(index + 1)
-            self.listbox.insert(index + 1, display_text2)
+            # Update the display (the cached strings move with their actions)
+            self._replace_rows(index, [self._display_texts[index + 1], self._display_texts[index]])
             
             # Select the moved action
             self.select_action(index + 1)
@@ -420,6 +409,12 @@ class ActionList(UIComponent):
             self.logger.error(f"Failed to move action down at index {index}: {e}")
             return False
     
+    def _replace_rows(self, index: int, display_texts: List[str]) -> None:
+        """Replace the rows starting at index with one delete and one insert call."""
+        self.listbox.delete(index, index + len(display_texts) - 1)
+        self.listbox.insert(index, *display_texts)
+        self._display_texts[index:index + len(display_texts)] = display_texts
+    
     def _format_action_for_display(self, action: Dict[str, Any]) -> str:
         """
         Format an action for display in the listbox.
@@ -3,13 +3,64 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Optional, Callable, Any
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Callable, Any, Tuple
 
 from src.core.exceptions import UIError
 from src.ui.components.ui_component import UIComponent
 
 logger = logging.getLogger(__name__)
 
+LogLine = Tuple[str, str] # (message, level)
+
+
+class LogLineBuffer:
+    """
+    Log lines waiting to be shown, and the history of lines already shown.
+
+    `append` may be called from any thread; `drain` and the history are used
+    by the Tk thread only. The history is a ring buffer: beyond `history_limit`
+    lines, the oldest are dropped.
+
+    Attributes:
+        history: The most recent drained lines, oldest first
+    """
+
+    def __init__(self, history_limit: int = 100_000):
+        if history_limit < 1: raise ValueError("history_limit must be at least 1.")
+        self._pending: Deque[LogLine] = deque()
+        self.history: Deque[LogLine] = deque(maxlen=history_limit)
+        self._pending_lock = threading.Lock() # Serializes drain against clear
+
+    def append(self, message: str, level: str = "INFO") -> None:
+        """Queue a line (thread-safe, never blocks on the UI)."""
+        self._pending.append((message, level))
+
+    def drain(self) -> List[LogLine]:
+        """Move every queued line into the history and return them."""
+        with self._pending_lock:
+            lines = [self._pending.popleft() for _ in range(len(self._pending))]
+        self.history.extend(lines)
+        return lines
+
+    def older(self, count: int, shown: int) -> List[LogLine]:
+        """Up to `count` history lines preceding the `shown` most recent ones, oldest first."""
+        available = len(self.history) - shown
+        if count <= 0 or available <= 0: return []
+        start = max(0, available - count)
+        return [self.history[i] for i in range(start, available)]
+
+    def clear(self) -> None:
+        """Drop queued lines and the history."""
+        with self._pending_lock:
+            self._pending.clear()
+        self.history.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
 
 class ExecutionLog(UIComponent):
     """
@@ -17,6 +68,16 @@ class ExecutionLog(UIComponent):
     
     This component provides a scrolled text widget for displaying logs,
     along with buttons for clearing the log and saving it to a file.
+
+    `log` can be called from any thread: lines are queued and a Tk `after()`
+    pump inserts them in one batch per `flush_interval_ms`, so chatty runs
+    can't stall the UI. The widget keeps the newest `max_lines` text lines
+    (whole messages; a multi-line message counts once per line); older
+    messages stay in a bounded history (`history_lines` messages) and are
+    brought back, about `page_lines` text lines at a time, with the
+    "Show Older" button, up to `max_older_lines` lines beyond `max_lines`.
+    Once the user scrolls back to the bottom, the next flush trims the
+    widget to `max_lines` again.
     
     Attributes:
         frame: The main frame containing all widgets
@@ -25,6 +86,8 @@ class ExecutionLog(UIComponent):
         button_frame: The frame containing the buttons
         clear_button: Button for clearing the log
         save_button: Button for saving the log to a file
+        older_button: Button for showing lines trimmed from the widget
+        buffer: Queued lines and history
     """
     
     def __init__(
@@ -33,7 +96,12 @@ class ExecutionLog(UIComponent):
         on_clear: Optional[Callable[[], None]] = None,
         on_save: Optional[Callable[[], None]] = None,
         height: int = 15,
-        width: int = 80
+        width: int = 80,
+        max_lines: int = 2000,
+        history_lines: int = 100_000,
+        page_lines: int = 1000,
+        max_older_lines: int = 20_000,
+        flush_interval_ms: int = 50
     ):
         """
         Initialize an ExecutionLog component.
@@ -44,12 +112,30 @@ class ExecutionLog(UIComponent):
             on_save: Callback when the save button is clicked
             height: Height of the text widget in lines
             width: Width of the text widget in characters
+            max_lines: Text lines kept in the widget
+            history_lines: Messages kept in total (shown or not)
+            page_lines: Text lines of older messages shown per click on "Show Older"
+            max_older_lines: Text lines "Show Older" may add beyond max_lines
+            flush_interval_ms: Time between batched inserts (caps the redraw rate)
             
         Raises:
             UIError: If the component cannot be created
         """
         super().__init__(parent)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if max_lines < 1 or page_lines < 1 or max_older_lines < 0 or flush_interval_ms < 1:
+            raise UIError("max_lines, page_lines and flush_interval_ms must be positive and max_older_lines "
+                          "non-negative", component_name="ExecutionLog")
+        self.max_lines = max_lines
+        self.page_lines = page_lines
+        self.max_older_lines = max_older_lines
+        self.flush_interval_ms = flush_interval_ms
+        self.buffer = LogLineBuffer(max(history_lines, max_lines))
+        self._line_limit = max_lines # Raised by show_older until the user scrolls back to the bottom
+        # Text line count of each message in the widget (the newest of the history), oldest first
+        self._shown_lines: Deque[int] = deque()
+        self._shown_line_total = 0
+        self._pump_id: Optional[str] = None
         
         try:
             # Create the main frame
@@ -97,6 +183,14 @@ class ExecutionLog(UIComponent):
                 command=self._on_save if on_save else lambda: None
             )
             self.save_button.pack(side=tk.LEFT)
+
+            self.older_button = ttk.Button(
+                self.button_frame,
+                text="Show Older",
+                command=self.show_older,
+                state=tk.DISABLED
+            )
+            self.older_button.pack(side=tk.LEFT, padx=(5, 0))
             
             # Store the callbacks
             self._on_clear_callback = on_clear
@@ -108,6 +202,9 @@ class ExecutionLog(UIComponent):
             self.text.tag_configure("WARNING", foreground="orange")
             self.text.tag_configure("ERROR", foreground="red")
             self.text.tag_configure("CRITICAL", foreground="red", font=("TkDefaultFont", 0, "bold"))
+
+            self._schedule_pump()
+            self.frame.bind("<Destroy>", self._on_destroy, add="+")
             
             self.logger.debug("ExecutionLog component initialized")
         except Exception as e:
@@ -117,31 +214,119 @@ class ExecutionLog(UIComponent):
     
     def log(self, message: str, level: str = "INFO") -> None:
         """
-        Add a message to the log.
+        Add a message to the log. Safe to call from any thread.
+
+        The message is shown by the next pump (within `flush_interval_ms`).
         
         Args:
             message: The message to add
             level: The log level (INFO, DEBUG, WARNING, ERROR, CRITICAL)
-            
+        """
+        self.buffer.append(message, level)
+
+    def flush(self) -> None:
+        """
+        Insert all queued messages now, as one batch (Tk thread only).
+
         Raises:
-            UIError: If the message cannot be added
+            UIError: If the messages cannot be added
         """
+        lines = self.buffer.drain()
+        if not lines: return
         try:
-            # Enable editing
+            at_bottom = self.text.yview()[1] >= 0.999 # Only follow new lines if the user hasn't scrolled up
+            if at_bottom: self._line_limit = self.max_lines # Done reading older lines
+            lines = lines[-self._line_limit:] # Lines that would be trimmed at once are never inserted
             self.text.config(state=tk.NORMAL)
-            
-            # Add the message with the appropriate tag
-            self.text.insert(tk.END, message + "\n", level)
-            
-            # Scroll to the end
-            self.text.see(tk.END)
-            
-            # Disable editing
+            self.text.insert(tk.END, *self._insert_args(lines))
+            for message, _ in lines: self._add_shown(self._line_count(message))
+            self._trim()
+            if at_bottom: self.text.see(tk.END)
+            self.text.config(state=tk.DISABLED)
+            self._update_older_button()
+        except Exception as e:
+            error_msg = f"Failed to add {len(lines)} messages to ExecutionLog"
+            self.logger.exception(error_msg)
+            raise UIError(error_msg, component_name="ExecutionLog", cause=e) from e
+
+    def show_older(self) -> None:
+        """Show up to `page_lines` more of the lines trimmed from the top of the widget."""
+        page_lines = min(self.page_lines, self._older_line_budget())
+        if page_lines < 1: return
+        lines = self.buffer.older(page_lines, len(self._shown_lines))
+        if not lines: return
+        counts = [self._line_count(message) for message, _ in lines]
+        keep, total = 1, counts[-1] # At least one message, even if it is longer than a page
+        while keep < len(counts) and total + counts[-1 - keep] <= page_lines:
+            total += counts[-1 - keep]
+            keep += 1
+        lines, counts = lines[-keep:], counts[-keep:]
+        try:
+            self.text.config(state=tk.NORMAL)
+            self.text.insert("1.0", *self._insert_args(lines))
             self.text.config(state=tk.DISABLED)
+            for count in reversed(counts): self._add_shown(count, oldest=True)
+            self._line_limit = max(self._line_limit, self._shown_line_total)
+            self.text.see(f"{total}.0")
+            self._update_older_button()
         except Exception as e:
-            error_msg = f"Failed to add message to ExecutionLog: {message}"
+            error_msg = "Failed to show older lines in ExecutionLog"
             self.logger.exception(error_msg)
             raise UIError(error_msg, component_name="ExecutionLog", cause=e) from e
+
+    @staticmethod
+    def _insert_args(lines: List[LogLine]) -> List[str]:
+        """Text/tag pairs for one Text.insert call, joining consecutive lines of the same level."""
+        args: List[str] = []
+        for message, level in lines:
+            if args and args[-1] == level: args[-2] += message + "\n"
+            else: args += [message + "\n", level]
+        return args
+
+    @staticmethod
+    def _line_count(message: str) -> int:
+        """Text lines a message occupies in the widget."""
+        return message.count("\n") + 1
+
+    def _add_shown(self, count: int, oldest: bool = False) -> None:
+        if oldest: self._shown_lines.appendleft(count)
+        else: self._shown_lines.append(count)
+        self._shown_line_total += count
+
+    def _trim(self) -> None:
+        """Delete whole messages from the top until the widget is within the line limit."""
+        removed = 0
+        while self._shown_line_total - removed > self._line_limit and len(self._shown_lines) > 1:
+            removed += self._shown_lines.popleft()
+        if not removed: return
+        self.text.delete("1.0", f"{removed + 1}.0")
+        self._shown_line_total -= removed
+
+    def _older_line_budget(self) -> int:
+        """Text lines "Show Older" may still add before the widget reaches its cap."""
+        return self.max_lines + self.max_older_lines - self._shown_line_total
+
+    def _update_older_button(self) -> None:
+        more = len(self.buffer.history) > len(self._shown_lines) and self._older_line_budget() > 0
+        self.older_button.config(state=tk.NORMAL if more else tk.DISABLED)
+
+    def _schedule_pump(self) -> None:
+        self._pump_id = self.frame.after(self.flush_interval_ms, self._pump)
+
+    def _pump(self) -> None:
+        try:
+            self.flush()
+        except UIError:
+            pass # Already logged; keep pumping
+        try:
+            self._schedule_pump()
+        except tk.TclError:
+            self._pump_id = None # Widget destroyed
+
+    def _on_destroy(self, event: Any) -> None:
+        if event.widget is self.frame and self._pump_id is not None:
+            self.frame.after_cancel(self._pump_id)
+            self._pump_id = None
     
     def clear(self) -> None:
         """
@@ -151,6 +336,11 @@ class ExecutionLog(UIComponent):
             UIError: If the log cannot be cleared
         """
         try:
+            self.buffer.clear()
+            self._shown_lines.clear()
+            self._shown_line_total = 0
+            self._line_limit = self.max_lines
+
             # Enable editing
             self.text.config(state=tk.NORMAL)
             
@@ -159,6 +349,7 @@ class ExecutionLog(UIComponent):
             
             # Disable editing
             self.text.config(state=tk.DISABLED)
+            self._update_older_button()
             
             self.logger.debug("Cleared ExecutionLog")
         except Exception as e:
@@ -168,7 +359,7 @@ class ExecutionLog(UIComponent):
     
     def get_log_text(self) -> str:
         """
-        Get the current log text.
+        Get the log text, including queued lines and lines trimmed from the widget.
         
         Returns:
             The log text
@@ -177,7 +368,8 @@ class ExecutionLog(UIComponent):
             UIError: If the log text cannot be retrieved
         """
         try:
-            return self.text.get(1.0, tk.END)
+            self.flush()
+            return "".join(message + "\n" for message, _ in self.buffer.history) + "\n"
         except Exception as e:
             error_msg = "Failed to get log text from ExecutionLog"
             self.logger.exception(error_msg)
@@ -1,7 +1,7 @@
 """Enhanced workflow editor presenter implementation for AutoQliq."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 # Core dependencies
 from src.core.interfaces import IWorkflowRepository, IAction
@@ -36,6 +36,8 @@ class WorkflowEditorPresenterEnhanced(BasePresenter[IWorkflowEditorView], IWorkf
         # Store the currently loaded workflow actions in memory
         self._current_workflow_name: Optional[str] = None
         self._current_actions: List[IAction] = []
+        # Display strings by action identity; edits replace the action object, so entries never go stale
+        self._display_cache: Dict[int, Tuple[IAction, str]] = {}
         
         self.logger.info("WorkflowEditorPresenterEnhanced initialized")
     
@@ -358,11 +360,15 @@ class WorkflowEditorPresenterEnhanced(BasePresenter[IWorkflowEditorView], IWorkf
         """Update the action list in the view."""
         if self.view:
             try:
-                # Convert actions to display strings
+                # Convert actions to display strings, formatting only actions not seen before
                 action_displays = []
+                cache: Dict[int, Tuple[IAction, str]] = {}
                 for action in self._current_actions:
-                    display = self._format_action_for_display(action)
+                    cached = self._display_cache.get(id(action))
+                    display = cached[1] if cached and cached[0] is action else self._format_action_for_display(action)
+                    cache[id(action)] = (action, display)
                     action_displays.append(display)
+                self._display_cache = cache
                 
                 self.view.set_action_list(action_displays)
             except Exception as e:
@@ -7,8 +7,14 @@ from typing import List, Optional, Dict, Any
 
 # Core dependencies
 from src.core.interfaces import IWorkflowRepository, ICredentialRepository
+from src.core.interfaces.service import IReportingService
 from src.core.exceptions import WorkflowError, CredentialError, WebDriverError, AutoQliqError
+from src.core.workflow.run_queue import RunQueue, QueuedRun, PRIORITY_INTERACTIVE, workflow_site
+from src.core.workflow.runner import WorkflowRunner
+from src.core.workflow.screenshot_writer import ScreenshotWriter
 from src.infrastructure.webdrivers import WebDriverFactory, BrowserType
+from src.infrastructure.common.metrics import MetricsRegistry
+from src.infrastructure.common.service_metrics import ServiceMetrics
 
 # UI dependencies
 from src.ui.interfaces.presenter import IWorkflowRunnerPresenter
@@ -17,11 +23,22 @@ from src.ui.presenters.base_presenter import BasePresenter
 
 logger = logging.getLogger(__name__)
 
+# Run options a workflow's metadata may set, overriding the presenter's run_options
+RUN_OPTION_KEYS = ("batch_operations", "script_typing", "load_profile", "trace", "profile")
+
 
 class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkflowRunnerPresenter):
     """
     Enhanced presenter for the workflow runner view. Handles logic for listing workflows/credentials,
     initiating, and stopping workflow execution.
+
+    With a shared `run_queue`, runs are queued at interactive priority (ahead of scheduled
+    runs, within the queue's per-workflow and per-site limits) instead of starting on a
+    thread of their own.
+
+    Runs are executed by a WorkflowRunner configured from `run_options` (see RUN_OPTION_KEYS),
+    which the workflow's repository metadata may override per workflow. Runs, driver launches
+    and repository calls are recorded in `metrics` (source "manual").
     """
     
     def __init__(
@@ -29,7 +46,12 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
         workflow_repository: IWorkflowRepository,
         credential_repository: ICredentialRepository,
         webdriver_factory: WebDriverFactory,
-        view: Optional[IWorkflowRunnerView] = None
+        view: Optional[IWorkflowRunnerView] = None,
+        run_queue: Optional[RunQueue] = None,
+        run_options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        screenshot_writer: Optional[ScreenshotWriter] = None,
+        reporting_service: Optional[IReportingService] = None
     ):
         """
         Initialize the presenter.
@@ -39,15 +61,26 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
             credential_repository: Repository for credential persistence
             webdriver_factory: Factory for creating WebDriver instances
             view: The associated view instance (optional)
+            run_queue: Queue shared with scheduled runs (default: run on a thread of its own)
+            run_options: Default WorkflowRunner options for every run (e.g. from config.runner_options)
+            metrics: Registry to record run metrics in (default: the shared REGISTRY)
+            screenshot_writer: Writes screenshots in the background (default: actions save them synchronously)
+            reporting_service: Saves each run's execution log (and its trace or profile stacks, if recorded)
         """
         super().__init__(view)
         self.workflow_repository = workflow_repository
         self.credential_repository = credential_repository
         self.webdriver_factory = webdriver_factory
+        self.run_queue = run_queue
+        self.run_options = dict(run_options or {})
+        self.metrics = ServiceMetrics(metrics)
+        self.screenshot_writer = screenshot_writer
+        self.reporting_service = reporting_service
         
         # Execution state
         self._execution_thread: Optional[threading.Thread] = None
-        self._stop_requested: bool = False
+        self._queued_run: Optional[QueuedRun] = None
+        self._stop_event = threading.Event()
         
         self.logger.info("WorkflowRunnerPresenterEnhanced initialized")
     
@@ -97,13 +130,13 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
             self.logger.info(f"Running workflow: {workflow_name} with credential: {credential_name}")
             
             # Check if a workflow is already running
-            if self._execution_thread and self._execution_thread.is_alive():
+            if self._is_busy():
                 self.logger.warning("Cannot start workflow: Another workflow is already running")
                 self._set_view_status("Cannot start workflow: Another workflow is already running")
                 return
             
             # Reset the stop flag
-            self._stop_requested = False
+            self._stop_event.clear()
             
             # Update the view
             if self.view:
@@ -113,15 +146,24 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
                 if credential_name:
                     self.view.log_message(f"Using credential: {credential_name}")
             
-            # Start the execution thread
-            self._execution_thread = threading.Thread(
-                target=self._execute_workflow,
-                args=(workflow_name, credential_name),
-                daemon=True
-            )
-            self._execution_thread.start()
+            # Queue the run behind other runs, or start the execution thread
+            if self.run_queue:
+                actions = self._load_actions(workflow_name)
+                self._queued_run = self.run_queue.submit(
+                    workflow_name, lambda: self._execute_workflow(workflow_name, credential_name, actions),
+                    priority=PRIORITY_INTERACTIVE, tenant=credential_name,
+                    site=workflow_site(actions), source="manual"
+                )
+                self._log_message(f"Queued workflow: {workflow_name}")
+            else:
+                self._execution_thread = threading.Thread(
+                    target=self._execute_workflow,
+                    args=(workflow_name, credential_name),
+                    daemon=True
+                )
+                self._execution_thread.start()
             
-            self.logger.info(f"Started execution thread for workflow: {workflow_name}")
+            self.logger.info(f"Started execution of workflow: {workflow_name}")
         except Exception as e:
             self.logger.error(f"Failed to run workflow '{workflow_name}': {e}")
             self._handle_view_error(e, f"running workflow '{workflow_name}'")
@@ -134,9 +176,15 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
         """Stop the currently running workflow execution (if any)."""
         try:
             self.logger.info("Stopping workflow execution")
+
+            # A run still waiting in the queue is simply dropped
+            if self.run_queue and self._queued_run and self.run_queue.cancel(self._queued_run):
+                self._log_message("Queued workflow cancelled before it started")
+                self._update_view_on_completion()
+                return
             
-            # Set the stop flag
-            self._stop_requested = True
+            # Set the stop flag; the runner checks it before each action
+            self._stop_event.set()
             
             # Log the stop request
             if self.view:
@@ -150,19 +198,26 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
     
     # --- BasePresenter Implementation ---
     
-    def initialize_view(self) -> None:
-        """Initialize the associated view with necessary data."""
+    def initialize_view(self, load_lists: bool = True) -> None:
+        """
+        Initialize the associated view with necessary data.
+        
+        Args:
+            load_lists: Fill the workflow and credential lists now. Pass False when
+                        they are loaded in the background (see src.ui.common.startup).
+        """
         if self.view:
             try:
                 self.logger.debug("Initializing view")
                 
-                # Set the workflow list
-                workflow_names = self.get_workflow_list()
-                self.view.set_workflow_list(workflow_names)
-                
-                # Set the credential list
-                credential_names = self.get_credential_list()
-                self.view.set_credential_list(credential_names)
+                if load_lists:
+                    # Set the workflow list
+                    workflow_names = self.get_workflow_list()
+                    self.view.set_workflow_list(workflow_names)
+                    
+                    # Set the credential list
+                    credential_names = self.get_credential_list()
+                    self.view.set_credential_list(credential_names)
                 
                 # Clear the log
                 self.view.clear_log()
@@ -176,16 +231,26 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
                 self._handle_view_error(e, "initializing view")
     
     # --- Helper Methods ---
+
+    def _is_busy(self) -> bool:
+        """Whether a run is queued or executing."""
+        if self._queued_run and not self._queued_run.future.done(): return True
+        return bool(self._execution_thread and self._execution_thread.is_alive())
     
-    def _execute_workflow(self, workflow_name: str, credential_name: Optional[str]) -> None:
+    def _execute_workflow(self, workflow_name: str, credential_name: Optional[str], actions: Optional[List[Any]] = None) -> None:
         """
         Execute a workflow in a background thread.
         
         Args:
             workflow_name: The name of the workflow to execute
             credential_name: The name of the credential to use (optional)
+            actions: The workflow's actions, if already loaded (queued runs)
         """
         driver = None
+        metrics = self.metrics
+        metrics.runs_in_progress.labels(source="manual").inc()
+        run_started = time.perf_counter()
+        final_status: Optional[str] = None # Set once the runner returns
         try:
             self.logger.info(f"Executing workflow: {workflow_name}")
             
@@ -194,7 +259,7 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
             
             # Load the workflow
             try:
-                actions = self.workflow_repository.load(workflow_name)
+                if actions is None: actions = self._load_actions(workflow_name)
                 self._log_message(f"Loaded workflow with {len(actions)} actions")
             except Exception as e:
                 self.logger.error(f"Failed to load workflow '{workflow_name}': {e}")
@@ -205,7 +270,8 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
             credential = None
             if credential_name:
                 try:
-                    credential = self.credential_repository.get_by_name(credential_name)
+                    with metrics.repository_seconds.labels(repository="credential", operation="get").time():
+                        credential = self.credential_repository.get_by_name(credential_name)
                     if credential:
                         self._log_message(f"Loaded credential: {credential_name}")
                     else:
@@ -214,58 +280,68 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
                     self.logger.error(f"Failed to load credential '{credential_name}': {e}")
                     self._log_message(f"WARNING: Failed to load credential: {e}")
             
+            # Runner options from config, overridden by the workflow's metadata
+            options = self._run_options(workflow_name)
+            
             # Create the WebDriver
             try:
                 self._log_message("Initializing WebDriver...")
-                driver = self.webdriver_factory.create_driver(
-                    browser_type=BrowserType.CHROME,
-                    implicit_wait_seconds=5,
-                    headless=False
-                )
-                self._log_message("WebDriver initialized")
+                # A page load profile (LOAD_PROFILES name or profile dict) blocks resources at launch
+                load_profile = options.get("load_profile")
+                try:
+                    with metrics.driver_launch_seconds.time():
+                        driver = self.webdriver_factory.create_driver(
+                            browser_type=BrowserType.CHROME,
+                            implicit_wait_seconds=5,
+                            headless=False,
+                            **({"load_profile": load_profile} if load_profile else {})
+                        )
+                except Exception:
+                    metrics.driver_launches.labels(result="failure").inc()
+                    raise
+                metrics.driver_launches.labels(result="success").inc()
+                metrics.drivers_active.inc()
+                self._log_message(f"WebDriver initialized (load profile: {load_profile})" if load_profile else "WebDriver initialized")
             except Exception as e:
                 self.logger.error(f"Failed to create WebDriver: {e}")
                 self._log_message(f"ERROR: Failed to create WebDriver: {e}")
                 return
             
-            # Execute each action
-            for i, action in enumerate(actions):
-                # Check if stop was requested
-                if self._stop_requested:
-                    self._log_message("Execution stopped by user")
-                    break
-                
+            # Execute the actions; the runner stops at the first failure or when stop is requested
+            runner = WorkflowRunner(
+                driver, self.credential_repository, self.workflow_repository,
+                stop_event=self._stop_event,
+                screenshot_writer=self.screenshot_writer,
+                trace=bool(options.get("trace")),
+                profile=bool(options.get("profile")),
+                batch_operations=bool(options.get("batch_operations")),
+                script_typing=bool(options.get("script_typing"))
+            )
+            self._log_message(f"Executing {len(actions)} actions...")
+            execution_log = runner.run(actions, workflow_name=workflow_name)
+            final_status = execution_log.get("final_status", "UNKNOWN")
+            metrics.record_run("manual", final_status, time.perf_counter() - run_started,
+                               [result.get("status") for result in execution_log.get("action_results", [])])
+            self._log_execution_log(execution_log)
+            if self.reporting_service:
                 try:
-                    # Log the action
-                    self._log_message(f"Executing action {i+1}/{len(actions)}: {action.name} ({action.action_type})")
-                    
-                    # Execute the action
-                    result = action.execute(driver, self.credential_repository)
-                    
-                    # Log the result
-                    if result.success:
-                        self._log_message(f"Action completed: {result.message}")
-                    else:
-                        self._log_message(f"ERROR: Action failed: {result.message}")
-                        # Stop execution on failure
-                        break
+                    self.reporting_service.save_execution_log(execution_log)
                 except Exception as e:
-                    self.logger.error(f"Failed to execute action {action.name}: {e}")
-                    self._log_message(f"ERROR: Failed to execute action {action.name}: {e}")
-                    # Stop execution on error
-                    break
-            
-            # Log the completion of execution
-            if not self._stop_requested:
-                self._log_message("Workflow execution completed")
+                    self.logger.error(f"Failed to save execution log for {workflow_name}: {e}")
+                    self._log_message(f"WARNING: Failed to save execution log: {e}")
             
             self.logger.info(f"Workflow execution completed: {workflow_name}")
         except Exception as e:
             self.logger.error(f"Error during workflow execution: {e}")
             self._log_message(f"ERROR: Workflow execution failed: {e}")
         finally:
+            # Runs that never reached the runner (load or launch failures) count as errors
+            if final_status is None: metrics.record_run("manual", "ERROR", time.perf_counter() - run_started)
+            metrics.runs_in_progress.labels(source="manual").dec()
+            
             # Clean up the WebDriver
             if driver:
+                metrics.drivers_active.dec()
                 try:
                     self._log_message("Closing WebDriver...")
                     driver.quit()
@@ -277,6 +353,59 @@ class WorkflowRunnerPresenterEnhanced(BasePresenter[IWorkflowRunnerView], IWorkf
             # Reset the view
             self._update_view_on_completion()
     
+    def _load_actions(self, workflow_name: str) -> List[Any]:
+        """
+        Load a workflow's actions, timing the repository call.
+        
+        Args:
+            workflow_name: The name of the workflow
+            
+        Returns:
+            The workflow's actions
+        """
+        with self.metrics.repository_seconds.labels(repository="workflow", operation="load").time():
+            return self.workflow_repository.load(workflow_name)
+    
+    def _run_options(self, workflow_name: str) -> Dict[str, Any]:
+        """
+        Get the runner options for a workflow: the presenter's run_options, overridden
+        by any RUN_OPTION_KEYS in the workflow's repository metadata.
+        
+        Args:
+            workflow_name: The name of the workflow
+            
+        Returns:
+            The options for this run
+        """
+        options = dict(self.run_options)
+        try:
+            metadata = self.workflow_repository.get_metadata(workflow_name) or {}
+        except Exception as e:
+            self.logger.warning(f"Could not read metadata of workflow '{workflow_name}': {e}")
+            metadata = {}
+        options.update((key, metadata[key]) for key in RUN_OPTION_KEYS if key in metadata)
+        return options
+    
+    def _log_execution_log(self, execution_log: Dict[str, Any]) -> None:
+        """
+        Log each action result and the final status of a run to the view.
+        
+        Args:
+            execution_log: The execution log returned by WorkflowRunner.run
+        """
+        results = execution_log.get("action_results", [])
+        for i, result in enumerate(results):
+            prefix = "Action completed" if result.get("status") == "success" else "ERROR: Action failed"
+            self._log_message(f"{prefix} ({i+1}/{len(results)}): {result.get('message')}")
+        
+        final_status = execution_log.get("final_status")
+        if final_status == "STOPPED":
+            self._log_message("Execution stopped by user")
+        elif final_status == "SUCCESS":
+            self._log_message(f"Workflow execution completed in {execution_log.get('duration_seconds')}s")
+        else:
+            self._log_message(f"ERROR: Workflow execution failed: {execution_log.get('error_message')}")
+    
     def _log_message(self, message: str) -> None:
         """
         Log a message to the view.
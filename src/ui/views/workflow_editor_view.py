@@ -13,6 +13,7 @@ from src.ui.interfaces.presenter import IWorkflowEditorPresenter
 from src.ui.interfaces.view import IWorkflowEditorView
 from src.ui.views.base_view import BaseView
 from src.ui.common.ui_factory import UIFactory
+from src.ui.common.listbox_sync import sync_listbox
 # Import the new dialog
 from src.ui.dialogs.action_editor_dialog import ActionEditorDialog
 
@@ -44,6 +45,7 @@ class WorkflowEditorView(BaseView, IWorkflowEditorView):
         self.add_action_button: Optional[ttk.Button] = None
         self.edit_action_button: Optional[ttk.Button] = None
         self.delete_action_button: Optional[ttk.Button] = None
+        self._action_rows: List[str] = [] # What action_list_widget shows, for incremental updates
 
         try:
             self._create_widgets()
@@ -138,15 +140,14 @@ class WorkflowEditorView(BaseView, IWorkflowEditorView):
 
 
     def set_action_list(self, actions_display: List[str]) -> None:
-        """Display the actions for the current workflow."""
+        """Display the actions for the current workflow, updating only the rows that changed."""
         if not self.action_list_widget: return
-        self.logger.debug(f"Setting action list with {len(actions_display)} items.")
         selected_index = self.get_selected_action_index()
-        self.action_list_widget.delete(0, tk.END)
-        for display_text in actions_display:
-            self.action_list_widget.insert(tk.END, display_text)
+        start, removed, inserted = sync_listbox(self.action_list_widget, self._action_rows, actions_display)
+        self.logger.debug(f"Set action list with {len(actions_display)} items ({removed} rows replaced by {inserted} at {start}).")
         if selected_index is not None and selected_index < len(actions_display):
              try:
+                  self.action_list_widget.selection_clear(0, tk.END) # Kept rows keep their selection when rows above change
                   self.action_list_widget.selection_set(selected_index)
                   self.action_list_widget.activate(selected_index)
                   self.action_list_widget.see(selected_index)
@@ -188,6 +189,7 @@ class WorkflowEditorView(BaseView, IWorkflowEditorView):
         self.logger.debug("Clearing editor view.")
         if self.workflow_list_widget: self.workflow_list_widget.delete(0, tk.END)
         if self.action_list_widget: self.action_list_widget.delete(0, tk.END)
+        self._action_rows = []
         self._update_workflow_button_states()
         self._update_action_button_states()
         super().clear() # Call base clear for status bar etc.
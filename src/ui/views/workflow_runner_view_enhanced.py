@@ -26,13 +26,15 @@ class WorkflowRunnerViewEnhanced(BaseView, IWorkflowRunnerView):
     to the WorkflowRunnerPresenter.
     """
     
-    def __init__(self, root: tk.Widget, presenter: IWorkflowRunnerPresenter):
+    def __init__(self, root: tk.Widget, presenter: IWorkflowRunnerPresenter, load_lists: bool = True):
         """
         Initialize the workflow runner view.
         
         Args:
             root: The parent widget (e.g., a frame in a notebook)
             presenter: The presenter handling the logic for this view
+            load_lists: Fill the workflow and credential lists now; pass False
+                        if the caller loads them in the background
         """
         super().__init__(root, presenter)
         self.presenter: IWorkflowRunnerPresenter  # Type hint
@@ -109,7 +111,7 @@ class WorkflowRunnerViewEnhanced(BaseView, IWorkflowRunnerView):
             self.execution_log.widget.pack(fill=tk.BOTH, expand=True)
             
             # Initialize the view
-            self.presenter.initialize_view()
+            self.presenter.initialize_view(load_lists=load_lists)
             
             self.logger.info("WorkflowRunnerViewEnhanced initialized")
         except Exception as e:
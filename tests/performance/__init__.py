@@ -0,0 +1 @@
+# This file makes the performance benchmarks directory a Python package
@@ -0,0 +1,181 @@
+"""Load test for AutoQliq workflow execution with simulated browsers.
+
+Runs many virtual browsers concurrently, each a SimulatedWebDriver created
+through WebDriverFactory and driven by WorkflowRunner through a small login
+site, and reports throughput, workflow latency percentiles and how many
+runs failed because of injected driver failures or stale elements:
+
+    python -m tests.performance.load_test --browsers 200 --runs 5 --profile flaky --time-scale 0.1
+
+With --driver-metrics the browsers share a DriverMetrics registry and the
+per-method call counts and latency percentiles are printed as well.
+"""
+
+import sys
+import time
+import logging
+import argparse
+import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from src.core.interfaces import IAction
+from src.core.actions import NavigateAction, ClickAction, TypeAction, ConditionalAction
+from src.core.workflow.runner import WorkflowRunner
+from src.infrastructure.webdrivers.factory import WebDriverFactory
+from src.infrastructure.webdrivers.simulated_driver import SIMULATION_PROFILES, SimulationProfile
+from src.infrastructure.webdrivers.instrumented_driver import DriverMetrics
+
+LOGIN_URL = "https://app.example.com/login"
+HOME_URL = "https://app.example.com/home"
+
+SITE_FIXTURES: Dict[str, Dict[str, Any]] = {
+    LOGIN_URL: {
+        "title": "Sign in",
+        "elements": [
+            {"tag": "input", "id": "username", "attributes": {"name": "username"}},
+            {"tag": "input", "id": "password", "attributes": {"name": "password", "type": "password"}},
+            {"tag": "div", "classes": ["cookie-banner"], "appear_after_ms": 300},
+            {"tag": "button", "id": "accept-cookies"},
+            {"tag": "button", "id": "login", "text": "Sign in", "navigates_to": HOME_URL},
+        ],
+    },
+    HOME_URL: {
+        "title": "Home",
+        "elements": [
+            {"tag": "a", "classes": ["nav-item"], "text": "Reports"},
+            {"tag": "input", "id": "search", "attributes": {"name": "q"}},
+            {"tag": "button", "id": "search-go"},
+        ],
+    },
+}
+
+
+def login_workflow() -> List[IAction]:
+    """Log in, dismiss the cookie banner if shown, then run a search."""
+    return [
+        NavigateAction(url=LOGIN_URL, name="open login"),
+        TypeAction(selector="#username", value_key="load-test-user", value_type="text", name="username"),
+        TypeAction(selector="#password", value_key="secret", value_type="text", name="password"),
+        ConditionalAction(condition_type="element_present", selector=".cookie-banner",
+                          true_branch=[ClickAction(selector="#accept-cookies", name="accept cookies")],
+                          name="cookie banner"),
+        ClickAction(selector="#login", name="sign in"),
+        TypeAction(selector="input[name=q]", value_key="quarterly report", value_type="text", name="search"),
+        ClickAction(selector="#search-go", name="search go"),
+    ]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_load_test(browsers: int, runs: int, profile: SimulationProfile, seed: int = 0,
+                  metrics: Optional[DriverMetrics] = None) -> Dict[str, Any]:
+    """Run `runs` workflows on each of `browsers` concurrent simulated browsers.
+
+    If `metrics` is given, every driver call is recorded in it.
+
+    Returns:
+        Totals, throughput, workflow latency percentiles (seconds), statuses and
+        the driver operation, failure and stale element counts
+    """
+    durations: List[float] = []
+    statuses: Dict[str, int] = {}
+    driver_totals: Dict[str, Any] = {"operations": {}, "failures": 0, "stale": 0}
+    lock = threading.Lock()
+
+    def virtual_browser(index: int) -> None:
+        driver = WebDriverFactory.create_driver(driver_type="simulated", simulation_options={
+            "fixtures": SITE_FIXTURES, "profile": profile, "seed": seed * 100_003 + index}, metrics=metrics)
+        try:
+            runner = WorkflowRunner(driver)
+            for _ in range(runs):
+                start = time.perf_counter()
+                status = runner.run(login_workflow(), "load test")["final_status"]
+                elapsed = time.perf_counter() - start
+                with lock:
+                    durations.append(elapsed)
+                    statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            stats = driver.get_stats()
+            driver.quit()
+            with lock:
+                for op, count in stats["operations"].items():
+                    driver_totals["operations"][op] = driver_totals["operations"].get(op, 0) + count
+                driver_totals["failures"] += stats["failures"]
+                driver_totals["stale"] += stats["stale"]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=browsers) as pool:
+        for future in [pool.submit(virtual_browser, i) for i in range(browsers)]:
+            future.result()
+    wall = time.perf_counter() - start
+
+    return {
+        "browsers": browsers,
+        "workflows": len(durations),
+        "wall_seconds": wall,
+        "workflows_per_second": len(durations) / wall if wall else 0.0,
+        "latency_seconds": {
+            "median": statistics.median(durations),
+            "p95": _percentile(durations, 0.95),
+            "p99": _percentile(durations, 0.99),
+            "max": max(durations),
+        },
+        "statuses": statuses,
+        "driver": driver_totals,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Load-test workflow execution with simulated browsers')
+    parser.add_argument('--browsers', type=int, default=100,
+                        help='Number of concurrent virtual browsers (default: 100)')
+    parser.add_argument('--runs', type=int, default=3,
+                        help='Workflows run by each browser (default: 3)')
+    parser.add_argument('--profile', choices=sorted(SIMULATION_PROFILES), default='realistic',
+                        help='Simulation profile (default: realistic)')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='Multiplier for all simulated latencies (default: 1.0)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed (default: 0)')
+    parser.add_argument('--driver-metrics', action='store_true',
+                        help='Record and print per-method driver call latencies')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the load test from the command line."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('src').setLevel(logging.CRITICAL)
+
+    base = SIMULATION_PROFILES[args.profile]
+    profile = SimulationProfile(base.name, latency=base.latency, failure_rates=base.failure_rates,
+                                stale_element_rate=base.stale_element_rate, time_scale=args.time_scale)
+    metrics = DriverMetrics() if args.driver_metrics else None
+    results = run_load_test(args.browsers, args.runs, profile, args.seed, metrics)
+
+    latency = results["latency_seconds"]
+    print(f"{results['workflows']} workflows on {results['browsers']} browsers in {results['wall_seconds']:.2f}s "
+          f"({results['workflows_per_second']:.1f}/s)")
+    print(f"Workflow latency: median {latency['median']:.3f}s, p95 {latency['p95']:.3f}s, "
+          f"p99 {latency['p99']:.3f}s, max {latency['max']:.3f}s")
+    print(f"Statuses: {results['statuses']}")
+    print(f"Driver: {sum(results['driver']['operations'].values())} operations, "
+          f"{results['driver']['failures']} injected failures, {results['driver']['stale']} stale elements")
+    if metrics:
+        print(f"{'method':<22}{'calls':>8}{'errors':>8}{'p50 ms':>9}{'p99 ms':>9}{'total s':>9}")
+        for method, stats in metrics.get_method_stats().items():
+            latency = stats["latency_us"]
+            print(f"{method:<22}{stats['calls']:>8}{stats['errors']:>8}{latency['p50'] / 1000:>9.1f}"
+                  f"{latency['p99'] / 1000:>9.1f}{stats['total_us'] / 1e6:>9.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Micro-benchmark for the overhead of the log_method_call decorator.
+
+Times a trivial method undecorated and decorated in each logging mode and
+reports the added cost per call in nanoseconds:
+
+    python -m tests.performance.logging_benchmark --calls 200000
+
+disabled   - DEBUG not enabled on the logger (the production default); the
+             decorator must short-circuit. Its overhead is checked against
+             MAX_DISABLED_OVERHEAD_NS by test_logging_benchmark.
+filtered   - DEBUG enabled on the logger but every handler is at INFO: records
+             are created but arguments and results are never formatted.
+sampled    - DEBUG enabled and emitted, sample_rate=0.01.
+emitted    - DEBUG enabled and emitted to a NullFormatter handler (full cost).
+"""
+
+import sys
+import time
+import logging
+import argparse
+import statistics
+from typing import Any, Callable, Dict, List, Optional
+
+from src.infrastructure.common.logging_utils import log_method_call
+
+MAX_DISABLED_OVERHEAD_NS = 1_000 # Added cost per call with DEBUG disabled
+
+
+class _DiscardHandler(logging.Handler):
+    """Formats every record (as a real handler would) and throws it away."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+class _Element:
+    """Stands in for an argument whose repr is expensive (e.g. a WebElement)."""
+
+    def __repr__(self) -> str:
+        time.sleep(0) # Yield, as a remote call would
+        return "<element>"
+
+
+def _make_logger(name: str, logger_level: int, handler_level: Optional[int]) -> logging.Logger:
+    logger = logging.getLogger(f"autoqliq.benchmark.{name}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logger_level)
+    if handler_level is not None:
+        handler = _DiscardHandler(handler_level)
+        logger.addHandler(handler)
+    return logger
+
+
+def _build_scenarios() -> Dict[str, Callable[..., Any]]:
+    def target(self: Any, selector: str, element: Any) -> bool:
+        return True
+
+    class Plain:
+        find = target
+
+    scenarios: Dict[str, Callable[..., Any]] = {"plain": Plain().find}
+    configurations = {
+        "disabled": (logging.WARNING, logging.DEBUG, 1.0),
+        "filtered": (logging.DEBUG, logging.INFO, 1.0),
+        "sampled": (logging.DEBUG, logging.DEBUG, 0.01),
+        "emitted": (logging.DEBUG, logging.DEBUG, 1.0),
+    }
+    for name, (logger_level, handler_level, sample_rate) in configurations.items():
+        logger = _make_logger(name, logger_level, handler_level)
+        decorated = type(f"Decorated_{name}", (), {"find": log_method_call(logger, sample_rate=sample_rate)(target)})
+        scenarios[name] = decorated().find
+    return scenarios
+
+
+def _time_calls(method: Callable[..., Any], calls: int, element: Any) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(calls): method("#login", element)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def run_benchmark(calls: int = 100_000, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Median nanoseconds per call for each scenario, and the overhead over the plain method."""
+    element = _Element()
+    scenarios = _build_scenarios()
+    timings: Dict[str, List[float]] = {name: [] for name in scenarios}
+    for _ in range(repeat):
+        for name, method in scenarios.items():
+            timings[name].append(_time_calls(method, calls if name != "emitted" else max(1, calls // 20), element))
+    plain = statistics.median(timings["plain"])
+    return {name: {"ns_per_call": statistics.median(values), "overhead_ns": statistics.median(values) - plain}
+            for name, values in timings.items()}
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Measure log_method_call overhead per call')
+    parser.add_argument('--calls', type=int, default=100_000, help='Calls per measurement (default: 100000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Measurements per scenario (default: 5)')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line; exits 1 if the disabled overhead exceeds its bound."""
+    args = parse_args(argv)
+    results = run_benchmark(args.calls, args.repeat)
+    print(f"{'scenario':<10}{'ns/call':>10}{'overhead ns':>13}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['ns_per_call']:>10.0f}{result['overhead_ns']:>13.0f}")
+    if results["disabled"]["overhead_ns"] > MAX_DISABLED_OVERHEAD_NS:
+        print(f"Disabled overhead exceeds {MAX_DISABLED_OVERHEAD_NS} ns per call.")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
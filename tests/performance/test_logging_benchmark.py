@@ -0,0 +1,19 @@
+"""Overhead bound for the log_method_call decorator."""
+
+import unittest
+
+from tests.performance.logging_benchmark import run_benchmark, MAX_DISABLED_OVERHEAD_NS
+
+
+class TestLoggingBenchmark(unittest.TestCase):
+    """Runs the decorator micro-benchmark with few calls."""
+
+    def test_disabled_decorator_overhead_is_bounded(self):
+        """With DEBUG disabled the decorator adds less than MAX_DISABLED_OVERHEAD_NS per call."""
+        results = run_benchmark(calls=20_000, repeat=3)
+        self.assertLess(results["disabled"]["overhead_ns"], MAX_DISABLED_OVERHEAD_NS)
+        self.assertLess(results["sampled"]["ns_per_call"], results["emitted"]["ns_per_call"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Smoke tests for the workflow execution benchmark."""
+
+import copy
+import unittest
+
+from tests.performance.workflow_benchmark import run_benchmark, compare_results
+
+
+class TestWorkflowBenchmark(unittest.TestCase):
+    """Runs the benchmark on tiny workflows."""
+
+    PARAMS = {"chain_length": 10, "nesting_depth": 3, "loop_iterations": 5,
+              "template_uses": 2, "template_size": 3}
+
+    def test_every_scenario_completes_on_the_mock_driver(self):
+        """Each synthetic workflow succeeds and reports its per-action overhead."""
+        results = run_benchmark(self.PARAMS, repeat=1, memory=False, runner_names=["runner"])
+        scenarios = results["runners"]["runner"]
+        self.assertEqual(set(scenarios), {"linear_chain", "nested_conditionals", "count_loop",
+                                          "for_each_loop", "template_heavy"})
+        for name, measurement in scenarios.items():
+            self.assertEqual(measurement["final_status"], "SUCCESS", name)
+            self.assertGreater(measurement["per_action_us"], 0)
+        self.assertEqual(scenarios["count_loop"]["actions"], 11)
+        self.assertEqual(scenarios["template_heavy"]["actions"], 8)
+
+    def test_compare_flags_slowdowns_and_new_failures(self):
+        """Slower per-action overhead and workflows that stop succeeding are regressions."""
+        baseline = {"runners": {"runner": {
+            "linear_chain": {"per_action_us": 10.0, "final_status": "SUCCESS"},
+            "count_loop": {"per_action_us": 10.0, "final_status": "SUCCESS"},
+            "template_heavy": {"per_action_us": 10.0, "final_status": "SUCCESS"},
+        }}}
+        current = copy.deepcopy(baseline)
+        current["runners"]["runner"]["linear_chain"]["per_action_us"] = 11.0
+        current["runners"]["runner"]["count_loop"]["per_action_us"] = 20.0
+        current["runners"]["runner"]["template_heavy"]["final_status"] = "FAILED"
+        lines, regressions = compare_results(baseline, current, threshold=1.2)
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(regressions, ["runner.count_loop", "runner.template_heavy"])
+
+
+if __name__ == '__main__':
+    unittest.main()
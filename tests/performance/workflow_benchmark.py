@@ -0,0 +1,405 @@
+"""Workflow execution benchmark for AutoQliq.
+
+Builds synthetic workflows (long linear chains, deeply nested conditionals,
+count and for_each loops with thousands of iterations, and heavy template
+use) and runs them through runner.WorkflowRunner (also with tracing
+enabled, as "runner_traced"), runner_refactored.WorkflowRunner and
+ExecutionService against the zero-latency MockWebDriver. Since the driver
+does no work, all of the measured time is runner overhead; it is reported
+in total and per executed action, together with the peak Python memory of
+a traced run.
+
+Results are stored as JSON so runs on different commits can be compared.
+In CI, compare against a stored baseline; the command exits with status 1
+on a regression:
+
+    python -m tests.performance.workflow_benchmark --preset small --output baseline.json
+    python -m tests.performance.workflow_benchmark --preset small --compare baseline.json
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.interfaces import IAction, IWebDriver, ICredentialRepository
+from src.core.action_result import ActionResult
+from src.core.actions import (ActionBase, NavigateAction, ClickAction, TypeAction, ScreenshotAction,
+                              ConditionalAction, LoopAction, TemplateAction)
+from src.core.workflow.workflow_entity import Workflow
+from src.core.workflow.runner import WorkflowRunner
+from src.core.workflow.runner_refactored import WorkflowRunner as RefactoredWorkflowRunner
+from src.infrastructure.webdrivers.mock_driver import MockWebDriver
+
+# Named workflow sizes for the command line
+PRESETS: Dict[str, Dict[str, int]] = {
+    "small": {"chain_length": 200, "nesting_depth": 20, "loop_iterations": 200,
+              "template_uses": 50, "template_size": 5},
+    "medium": {"chain_length": 2000, "nesting_depth": 50, "loop_iterations": 2000,
+               "template_uses": 200, "template_size": 10},
+    "large": {"chain_length": 10000, "nesting_depth": 100, "loop_iterations": 10000,
+              "template_uses": 1000, "template_size": 10},
+}
+
+# Default slowdown ratio of per-action overhead reported as a regression by --compare
+DEFAULT_THRESHOLD = 1.2
+
+# Per-action overheads below this (microseconds) are too noisy to flag as regressions
+MIN_COMPARED_MICROSECONDS = 1.0
+
+TEMPLATE_NAME = "benchmark_form"
+
+
+class SetVariableAction(ActionBase):
+    """Stores a value in the execution context, so for_each loops have a list to iterate."""
+    action_type = "SetVariable"
+
+    def __init__(self, variable_name: str, value: Any, name: Optional[str] = None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.variable_name = variable_name
+        self.value = value
+
+    def execute(self, driver: IWebDriver, credential_repo: Optional[ICredentialRepository] = None,
+                context: Optional[Dict[str, Any]] = None) -> ActionResult:
+        if context is not None:
+            context[self.variable_name] = self.value
+        return ActionResult.success(f"Set '{self.variable_name}'.")
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update({"variable_name": self.variable_name, "value": self.value})
+        return data
+
+
+class InMemoryWorkflowRepository:
+    """Workflow and template store backing the benchmark runs."""
+
+    def __init__(self, templates: Dict[str, List[Dict[str, Any]]]):
+        self.templates = templates
+        self.workflows: Dict[str, Workflow] = {}
+
+    def load_template(self, name: str) -> List[Dict[str, Any]]:
+        return self.templates[name]
+
+    def get(self, workflow_id: str) -> Optional[Workflow]:
+        return self.workflows.get(workflow_id)
+
+
+class MockDriverFactory:
+    """WebDriver factory handing out MockWebDrivers, for ExecutionService."""
+
+    def create_driver(self, **kwargs: Any) -> MockWebDriver:
+        return MockWebDriver()
+
+
+def _form_actions(prefix: str) -> List[IAction]:
+    """A short navigate/click/type/screenshot sequence (4 actions)."""
+    return [
+        NavigateAction(url=f"https://example.com/{prefix}", name=f"{prefix} open"),
+        ClickAction(selector=f"#{prefix}-field", name=f"{prefix} focus"),
+        TypeAction(selector=f"#{prefix}-field", value_key="benchmark", value_type="text", name=f"{prefix} type"),
+        ScreenshotAction(file_path=f"{prefix}.png", name=f"{prefix} capture"),
+    ]
+
+
+def linear_chain(chain_length: int) -> Tuple[List[IAction], int]:
+    """A flat sequence of chain_length simple actions."""
+    actions: List[IAction] = []
+    while len(actions) < chain_length:
+        actions.extend(_form_actions(f"step{len(actions)}"))
+    return actions[:chain_length], chain_length
+
+
+def nested_conditionals(nesting_depth: int) -> Tuple[List[IAction], int]:
+    """Conditionals nested nesting_depth deep, each taking its true branch."""
+    branch: List[IAction] = [ClickAction(selector="#innermost", name="innermost")]
+    for level in range(nesting_depth, 0, -1):
+        branch = [
+            ClickAction(selector=f"#level{level}", name=f"level {level}"),
+            ConditionalAction(condition_type="element_present", selector=f"#level{level}",
+                              true_branch=branch, false_branch=[ClickAction(selector="#never")],
+                              name=f"if level {level}"),
+        ]
+    return branch, 2 * nesting_depth + 1
+
+
+def count_loop(loop_iterations: int) -> Tuple[List[IAction], int]:
+    """A count loop over a click and a type action."""
+    body: List[IAction] = [ClickAction(selector="#row"), TypeAction(selector="#row", value_key="x", value_type="text")]
+    return [LoopAction(loop_type="count", count=loop_iterations, loop_actions=body, name="count loop")], 1 + 2 * loop_iterations
+
+
+def for_each_loop(loop_iterations: int) -> Tuple[List[IAction], int]:
+    """A for_each loop over a click and a type action."""
+    body: List[IAction] = [ClickAction(selector="#row"), TypeAction(selector="#row", value_key="x", value_type="text")]
+    actions: List[IAction] = [
+        SetVariableAction("items", list(range(loop_iterations)), name="set items"),
+        LoopAction(loop_type="for_each", list_variable_name="items", loop_actions=body, name="for_each loop"),
+    ]
+    return actions, 2 + 2 * loop_iterations
+
+
+def template_heavy(template_uses: int, template_size: int) -> Tuple[List[IAction], int]:
+    """Repeated uses of a template of template_size actions."""
+    actions: List[IAction] = [TemplateAction(template_name=TEMPLATE_NAME, name=f"use {i}") for i in range(template_uses)]
+    return actions, template_uses * (1 + template_size)
+
+
+def build_templates(template_size: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Serialized template definitions referenced by template_heavy."""
+    actions: List[IAction] = []
+    while len(actions) < template_size:
+        actions.extend(_form_actions(f"tpl{len(actions)}"))
+    return {TEMPLATE_NAME: [action.to_dict() for action in actions[:template_size]]}
+
+
+def build_scenarios(params: Dict[str, int]) -> Dict[str, Tuple[List[IAction], int]]:
+    """Build every synthetic workflow as (top-level actions, number of executed actions)."""
+    return {
+        "linear_chain": linear_chain(params["chain_length"]),
+        "nested_conditionals": nested_conditionals(params["nesting_depth"]),
+        "count_loop": count_loop(params["loop_iterations"]),
+        "for_each_loop": for_each_loop(params["loop_iterations"]),
+        "template_heavy": template_heavy(params["template_uses"], params["template_size"]),
+    }
+
+
+def _run_workflow_runner(actions: List[IAction], repo: InMemoryWorkflowRepository) -> str:
+    return WorkflowRunner(MockWebDriver(), None, repo).run(actions, "benchmark")["final_status"]
+
+
+def _run_traced_runner(actions: List[IAction], repo: InMemoryWorkflowRepository) -> str:
+    return WorkflowRunner(MockWebDriver(), None, repo, trace=True).run(actions, "benchmark")["final_status"]
+
+
+def _run_refactored_runner(actions: List[IAction], repo: InMemoryWorkflowRepository) -> str:
+    return RefactoredWorkflowRunner(MockWebDriver(), None, repo).run(actions, "benchmark")["final_status"]
+
+
+def _load_execution_service() -> Callable[[List[IAction], InMemoryWorkflowRepository], str]:
+    """Get a runner function for ExecutionService."""
+    from src.application.services.execution_service import ExecutionService
+
+    def run(actions: List[IAction], repo: InMemoryWorkflowRepository) -> str:
+        repo.workflows["benchmark"] = Workflow(name="benchmark", actions=actions, workflow_id="benchmark")
+        service = ExecutionService(repo, None, MockDriverFactory())
+        service.execute_workflow("benchmark")
+        service._execution_thread.join()
+        return service.get_execution_status().get("final_status") or "FAILED"
+
+    return run
+
+
+def get_runners() -> Tuple[Dict[str, Callable[[List[IAction], InMemoryWorkflowRepository], str]], Dict[str, str]]:
+    """Get the runners to benchmark, and the reasons any of them are unavailable.
+
+    A runner is unavailable when it cannot be imported or constructed.
+    """
+    runners = {}
+    unavailable = {}
+    candidates = {
+        "runner": lambda: (WorkflowRunner(MockWebDriver()), _run_workflow_runner),
+        "runner_traced": lambda: (WorkflowRunner(MockWebDriver(), trace=True), _run_traced_runner),
+        "runner_refactored": lambda: (RefactoredWorkflowRunner(MockWebDriver()), _run_refactored_runner),
+        "execution_service": lambda: (None, _load_execution_service()),
+    }
+    for name, probe in candidates.items():
+        try:
+            runners[name] = probe()[1]
+        except Exception as e:
+            unavailable[name] = f"{type(e).__name__}: {e}"
+    return runners, unavailable
+
+
+def measure(run: Callable[[], Any], repeat: int, memory: bool = True) -> Dict[str, Any]:
+    """Time a callable and measure its peak memory.
+
+    Timing runs are not traced; peak memory comes from one extra traced run.
+
+    Args:
+        run: The callable to measure; it must do the same work on every call
+        repeat: Number of timed runs
+        memory: Whether to measure peak memory (None is recorded otherwise)
+
+    Returns:
+        Best and median seconds, peak traced memory in bytes, and the last run's return value
+    """
+    timings = []
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {"seconds": min(timings), "median_seconds": statistics.median(timings),
+            "peak_memory_bytes": peak, "result": result}
+
+
+def run_benchmark(params: Dict[str, int], repeat: int = 3, memory: bool = True,
+                  runner_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run every scenario through every available runner.
+
+    Args:
+        params: Workflow sizes (see PRESETS)
+        repeat: Number of timed runs per measurement
+        memory: Whether to measure peak memory
+        runner_names: Runners to benchmark (default: all available)
+
+    Returns:
+        Per runner and scenario: total seconds, per-action microseconds,
+        peak memory and the final workflow status; plus unavailable runners
+    """
+    runners, unavailable = get_runners()
+    if runner_names:
+        runners = {name: run for name, run in runners.items() if name in runner_names}
+    scenarios = build_scenarios(params)
+    templates = build_templates(params["template_size"])
+
+    results: Dict[str, Any] = {}
+    for runner_name, run in runners.items():
+        results[runner_name] = {}
+        for scenario_name, (actions, executed) in scenarios.items():
+            repo = InMemoryWorkflowRepository(templates)
+            measurement = measure(lambda: run(actions, repo), repeat, memory)
+            peak = measurement["peak_memory_bytes"]
+            results[runner_name][scenario_name] = {
+                "actions": executed,
+                "seconds": measurement["seconds"],
+                "median_seconds": measurement["median_seconds"],
+                "per_action_us": measurement["seconds"] / executed * 1e6,
+                "peak_memory_bytes": peak,
+                "peak_memory_per_action_bytes": None if peak is None else peak / executed,
+                "final_status": measurement["result"],
+            }
+    return {"runners": results, "unavailable": unavailable}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> Tuple[List[str], List[str]]:
+    """Compare the per-action overhead of two benchmark results.
+
+    A measurement regresses when it is more than threshold times slower
+    than the baseline, or when a workflow that succeeded no longer does.
+
+    Returns:
+        Report lines for every measurement in both results, and the names of the regressions
+    """
+    lines = []
+    regressions = []
+    for runner_name, scenarios in current["runners"].items():
+        for scenario_name, measurement in scenarios.items():
+            name = f"{runner_name}.{scenario_name}"
+            before = baseline.get("runners", {}).get(runner_name, {}).get(scenario_name)
+            if before is None:
+                continue
+            ratio = measurement["per_action_us"] / before["per_action_us"] if before["per_action_us"] else 1.0
+            regressed = ratio > threshold and measurement["per_action_us"] >= MIN_COMPARED_MICROSECONDS
+            if before["final_status"] == "SUCCESS" and measurement["final_status"] != "SUCCESS":
+                regressed = True
+            if regressed:
+                regressions.append(name)
+            lines.append(f"{name}: {before['per_action_us']:.1f} -> {measurement['per_action_us']:.1f} us/action "
+                         f"({ratio:.2f}x){'  REGRESSION' if regressed else ''}")
+    return lines, regressions
+
+
+def format_results(results: Dict[str, Any]) -> List[str]:
+    """Format benchmark results as a table."""
+    lines = [f"{'runner':<20}{'scenario':<22}{'actions':>9}{'total s':>10}{'us/action':>11}{'peak KiB':>10}  status"]
+    for runner_name, scenarios in results["runners"].items():
+        for scenario_name, m in scenarios.items():
+            peak = "-" if m["peak_memory_bytes"] is None else f"{m['peak_memory_bytes'] / 1024:.0f}"
+            lines.append(f"{runner_name:<20}{scenario_name:<22}{m['actions']:>9}{m['seconds']:>10.3f}"
+                         f"{m['per_action_us']:>11.1f}{peak:>10}  {m['final_status']}")
+    for runner_name, reason in results["unavailable"].items():
+        lines.append(f"{runner_name}: unavailable ({reason})")
+    return lines
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark workflow runner overhead with a zero-latency driver')
+    parser.add_argument('--preset', choices=list(PRESETS), default='small',
+                        help='Workflow sizes (default: small)')
+    for key in PRESETS['small']:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, dest=key,
+                            help=f'Override the preset {key.replace("_", " ")}')
+    parser.add_argument('--runners', nargs='+', choices=['runner', 'runner_traced', 'runner_refactored', 'execution_service'],
+                        help='Runners to benchmark (default: all available)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of timed runs per measurement (default: 3)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the traced run that measures peak memory')
+    parser.add_argument('--output', '-o',
+                        help='Write the results to this JSON file')
+    parser.add_argument('--compare',
+                        help='Compare against a previous results JSON file; exit with status 1 on regression')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Slowdown ratio reported as a regression (default: {DEFAULT_THRESHOLD})')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    args = parse_args(argv)
+    # Runner progress is logged at INFO; keep it out of the output (the calls themselves are still timed)
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('src').setLevel(logging.ERROR)
+
+    params = dict(PRESETS[args.preset])
+    params.update({key: getattr(args, key) for key in params if getattr(args, key) is not None})
+
+    results = run_benchmark(params, args.repeat, not args.no_memory, args.runners)
+    results.update({
+        "preset": args.preset,
+        "params": params,
+        "timestamp": datetime.now().isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    })
+    print("\n".join(format_results(results)))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressions = compare_results(baseline, results, args.threshold)
+        print(f"\nComparison with {args.compare} (commit {baseline.get('commit')}):")
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
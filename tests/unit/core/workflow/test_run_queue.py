@@ -0,0 +1,137 @@
+"""Unit tests for the priority- and fairness-aware RunQueue."""
+
+import time
+import threading
+import unittest
+
+from src.core.workflow.run_queue import (
+    RunQueue, PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITY_NORMAL, workflow_site
+)
+from src.core.exceptions import WorkflowError
+from src.core.actions.interaction import ClickAction
+from src.core.actions.navigation import NavigateAction
+from src.core.actions.loop_action import LoopAction
+
+
+class TestRunQueue(unittest.TestCase):
+    """Test cases for RunQueue ordering, limits and lifecycle."""
+
+    def setUp(self):
+        self.order = []
+        self.lock = threading.Lock()
+        self.gate = threading.Event()
+        self.queues = []
+
+    def tearDown(self):
+        self.gate.set()
+        for queue in self.queues: queue.shutdown(cancel_pending=True)
+
+    def _queue(self, **kwargs):
+        queue = RunQueue(**kwargs)
+        self.queues.append(queue)
+        return queue
+
+    def _record(self, label, duration=0.0):
+        def run():
+            with self.lock: self.order.append(label)
+            time.sleep(duration)
+            return label
+        return run
+
+    def _block_worker(self, queue):
+        """Occupy the queue's only worker until the gate opens, so later submissions pile up."""
+        started = threading.Event()
+        blocker = queue.submit("blocker", lambda: (started.set(), self.gate.wait()), site="blocker.test")
+        started.wait(2)
+        return blocker
+
+    def _drain(self, runs):
+        self.gate.set()
+        return [run.future.result(timeout=5) for run in runs]
+
+    def test_interactive_runs_jump_the_batch(self):
+        """Runs start in priority order, whatever the submission order."""
+        queue = self._queue(max_workers=1)
+        self._block_worker(queue)
+        runs = [queue.submit(f"nightly-{n}", self._record(f"batch-{n}"), priority=PRIORITY_BATCH) for n in range(3)]
+        runs.append(queue.submit("report", self._record("normal"), priority=PRIORITY_NORMAL))
+        runs.append(queue.submit("manual", self._record("interactive"), priority=PRIORITY_INTERACTIVE))
+        self._drain(runs)
+        self.assertEqual(self.order, ["interactive", "normal", "batch-0", "batch-1", "batch-2"])
+
+    def test_site_and_workflow_limits(self):
+        """No more than the site limit run against one host, or one run per workflow at a time."""
+        queue = self._queue(max_workers=6, site_limit=2, site_limits={"slow.test": 1})
+        running = {"busy.test": 0, "slow.test": 0, "Login": 0}
+        peaks = dict(running)
+
+        def tracked(*keys):
+            def run():
+                with self.lock:
+                    for key in keys: running[key] += 1; peaks[key] = max(peaks[key], running[key])
+                time.sleep(0.05)
+                with self.lock:
+                    for key in keys: running[key] -= 1
+            return run
+
+        runs = [queue.submit(f"wf-{n}", tracked("busy.test"), site="BUSY.test") for n in range(5)]
+        runs += [queue.submit(f"slow-{n}", tracked("slow.test"), site="slow.test") for n in range(3)]
+        runs += [queue.submit("Login", tracked("Login")) for _ in range(3)]
+        self._drain(runs)
+        self.assertEqual(peaks, {"busy.test": 2, "slow.test": 1, "Login": 1})
+        self.assertEqual(queue.stats()["running"], 0)
+
+    def test_tenants_share_workers_fairly(self):
+        """Tenants alternate (by weight) instead of one tenant's backlog running first."""
+        queue = self._queue(max_workers=1, workflow_limit=10, tenant_weights={"gold": 2})
+        self._block_worker(queue)
+        runs = [queue.submit("wf", self._record(f"a{n}"), tenant="alice") for n in range(4)]
+        runs += [queue.submit("wf", self._record(f"b{n}"), tenant="bob") for n in range(2)]
+        runs += [queue.submit("wf", self._record(f"g{n}"), tenant="gold") for n in range(4)]
+        self._drain(runs)
+        self.assertEqual(self.order[:4], ["a0", "b0", "g0", "g1"])
+        self.assertEqual(set(self.order[4:7]), {"a1", "b1", "g2"})
+        self.assertEqual(sorted(self.order), sorted(f"{t}{n}" for t, c in (("a", 4), ("b", 2), ("g", 4)) for n in range(c)))
+
+    def test_deadlines(self):
+        """Earlier deadlines run first; runs whose deadline passed while queued fail instead of starting."""
+        queue = self._queue(max_workers=1, workflow_limit=10)
+        self._block_worker(queue)
+        now = time.time()
+        late = queue.submit("wf", self._record("late"), deadline=now + 60)
+        soon = queue.submit("wf", self._record("soon"), deadline=now + 30)
+        whenever = queue.submit("wf", self._record("whenever"))
+        expired = queue.submit("wf", self._record("expired"), deadline=now + 0.05)
+        time.sleep(0.2)
+        self._drain([late, soon, whenever])
+        self.assertIsInstance(expired.future.exception(timeout=1), WorkflowError)
+        self.assertEqual(self.order, ["soon", "late", "whenever"])
+        self.assertEqual(queue.stats()["expired"], 1)
+
+    def test_cancel_errors_and_shutdown(self):
+        """Pending runs can be cancelled; run exceptions reach the future; shutdown refuses new runs."""
+        queue = self._queue(max_workers=1)
+        blocker = self._block_worker(queue)
+        pending = queue.submit("wf", self._record("cancelled"))
+        failing = queue.submit("broken", lambda: 1 / 0)
+        self.assertTrue(queue.cancel(pending))
+        self.assertFalse(queue.cancel(blocker))
+        self.assertEqual(queue.stats()["pending"], 1)
+        self.gate.set()
+        self.assertIsInstance(failing.future.exception(timeout=5), ZeroDivisionError)
+        self.assertTrue(pending.future.cancelled())
+        queue.shutdown()
+        with self.assertRaises(WorkflowError): queue.submit("wf", self._record("refused"))
+        self.assertEqual(self.order, [])
+
+    def test_workflow_site(self):
+        """The site is the host of the first URL, searching nested actions."""
+        nested = [ClickAction(selector="#go", name="Go"),
+                  LoopAction(loop_type="count", count=1, name="Rows",
+                             loop_actions=[NavigateAction(url="https://Shop.Example.com/cart", name="Cart")])]
+        self.assertEqual(workflow_site(nested), "shop.example.com")
+        self.assertIsNone(workflow_site([ClickAction(selector="#go", name="Go")]))
+
+
+if __name__ == "__main__":
+    unittest.main()
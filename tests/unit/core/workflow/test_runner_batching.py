@@ -0,0 +1,71 @@
+"""Unit tests for coalescing TypeActions into driver batches in WorkflowRunner."""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.workflow.runner import WorkflowRunner
+from src.core.interfaces import IWebDriver
+from src.core.actions.interaction import TypeAction
+from src.core.actions.utility import WaitAction
+from src.core.exceptions import WebDriverError, WorkflowError
+
+
+class TestRunnerBatching(unittest.TestCase):
+    """Test cases for WorkflowRunner(batch_operations=True)."""
+
+    def setUp(self):
+        """Set up a mocked driver and a small form-filling workflow."""
+        self.driver = MagicMock(spec=IWebDriver)
+        self.actions = [
+            TypeAction(selector="#first", value_key="Ada", value_type="text"),
+            TypeAction(selector="#last", value_key="Lovelace", value_type="text"),
+            WaitAction(duration_seconds=0),
+            TypeAction(selector="#city", value_key="London", value_type="text"),
+        ]
+
+    def test_consecutive_type_actions_are_batched(self):
+        """Two adjacent TypeActions become one run_batch call; the lone one runs normally."""
+        runner = WorkflowRunner(self.driver, batch_operations=True)
+        log = runner.run(self.actions, "Form")
+        self.assertEqual(log["final_status"], "SUCCESS")
+        self.assertEqual(len(log["action_results"]), 4)
+        self.driver.run_batch.assert_called_once_with([
+            {"op": "type", "selector": "#first", "text": "Ada"},
+            {"op": "type", "selector": "#last", "text": "Lovelace"},
+        ])
+        self.driver.type_text.assert_called_once_with("#city", "London")
+
+    def test_batch_failure_falls_back_to_single_actions(self):
+        """A failing batch is retried one action at a time."""
+        self.driver.run_batch.side_effect = WebDriverError("grid hiccup")
+        runner = WorkflowRunner(self.driver, batch_operations=True)
+        log = runner.run(self.actions, "Form")
+        self.assertEqual(log["final_status"], "SUCCESS")
+        self.assertEqual(self.driver.type_text.call_count, 3)
+
+    def test_script_typing_is_opt_in(self):
+        """The runner only asks the driver for script typing when configured to."""
+        WorkflowRunner(self.driver, batch_operations=True, script_typing=True).run(self.actions, "Form")
+        self.assertEqual(self.driver.run_batch.call_args[1], {"script_typing": True})
+
+    def test_stop_is_honoured_between_fallback_actions(self):
+        """A stop requested while the batch is retried one by one stops the run before the next action."""
+        stop_event = threading.Event()
+        self.driver.run_batch.side_effect = WebDriverError("grid hiccup")
+        self.driver.type_text.side_effect = lambda selector, text: stop_event.set()
+        runner = WorkflowRunner(self.driver, stop_event=stop_event, batch_operations=True)
+        with self.assertRaises(WorkflowError):
+            runner._execute_type_batch(self.actions[:2], {}, "Step 1")
+        self.driver.type_text.assert_called_once_with("#first", "Ada")
+
+    def test_batching_disabled_by_default(self):
+        """Without batch_operations the driver is called per action."""
+        runner = WorkflowRunner(self.driver)
+        runner.run(self.actions, "Form")
+        self.driver.run_batch.assert_not_called()
+        self.assertEqual(self.driver.type_text.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
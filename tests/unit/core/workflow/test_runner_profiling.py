@@ -0,0 +1,93 @@
+"""Unit tests for the sampling profiler and profiled WorkflowRunner runs."""
+
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.workflow.runner import WorkflowRunner
+from src.core.workflow.profiling import NO_ACTION, SamplingProfiler, write_collapsed_stacks
+from src.core.interfaces import IWebDriver
+from src.core.actions.interaction import ClickAction
+from src.core.actions.navigation import NavigateAction
+from src.core.actions.loop_action import LoopAction
+
+
+def _slow_click(*args, **kwargs):
+    time.sleep(0.05)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test cases for SamplingProfiler."""
+
+    def test_samples_the_target_thread(self):
+        """Stacks are taken from the sampled thread and end in the running function."""
+        def sleeper():
+            time.sleep(0.15)
+
+        with SamplingProfiler(interval_seconds=0.005) as profiler:
+            sleeper()
+        profile = profiler.to_dict()
+        self.assertGreater(profile["samples"], 5)
+        self.assertEqual(profile["by_action"][NO_ACTION]["self_samples"], profile["samples"])
+        self.assertTrue(any(stack.endswith("sleeper") for stack in profile["collapsed"]))
+        self.assertEqual(sum(profile["collapsed"].values()), profile["samples"])
+
+    def test_sampler_thread_is_stopped(self):
+        """stop() joins the sampler thread; stopping twice is harmless."""
+        profiler = SamplingProfiler(interval_seconds=0.005).start()
+        profiler.stop(); profiler.stop()
+        self.assertNotIn("SamplingProfiler", [thread.name for thread in threading.enumerate()])
+
+    def test_invalid_interval(self):
+        """The interval must be positive."""
+        with self.assertRaises(ValueError): SamplingProfiler(interval_seconds=0)
+
+
+class TestRunnerProfiling(unittest.TestCase):
+    """Test cases for WorkflowRunner(profile=True)."""
+
+    def setUp(self):
+        """Set up a driver whose clicks are slow and a workflow with a two-iteration loop."""
+        self.driver = MagicMock(spec=IWebDriver)
+        self.driver.click_element.side_effect = _slow_click
+        self.actions = [
+            NavigateAction(url="https://example.com", name="Open"),
+            LoopAction(loop_type="count", count=2, name="Rows",
+                       loop_actions=[ClickAction(selector="#row", name="Select row")]),
+        ]
+
+    def test_unprofiled_runs_have_no_profile(self):
+        """The profile is only recorded on request."""
+        log = WorkflowRunner(self.driver).run(self.actions, "Plain")
+        self.assertNotIn("profile", log)
+
+    def test_samples_are_attributed_to_the_innermost_action(self):
+        """Time in the slow click is attributed to 'Select row' and, inclusively, to its loop."""
+        log = WorkflowRunner(self.driver, profile=True, profile_interval=0.005).run(self.actions, "Profiled")
+        self.assertEqual(log["final_status"], "SUCCESS")
+        profile = log["profile"]
+        select_row = profile["by_action"]["Select row"]
+        self.assertGreater(select_row["self_samples"], profile["samples"] // 2)
+        self.assertEqual(next(iter(profile["by_action"])), "Select row")
+        self.assertGreaterEqual(profile["by_action"]["Rows"]["total_samples"], select_row["self_samples"])
+        self.assertTrue(any("[action] Rows;" in stack and "[action] Select row;" in stack and stack.endswith("_slow_click")
+                            for stack in profile["collapsed"]))
+        self.assertEqual(profile["top_functions"][0]["function"], f"{__name__}._slow_click")
+
+    def test_write_collapsed_stacks(self):
+        """Collapsed stacks are written one 'stack count' line per stack."""
+        profile = WorkflowRunner(self.driver, profile=True, profile_interval=0.005).run(self.actions, "Profiled")["profile"]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.folded")
+            write_collapsed_stacks(profile, path)
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        self.assertEqual(len(lines), len(profile["collapsed"]))
+        self.assertEqual(sum(int(line.rsplit(" ", 1)[1]) for line in lines), profile["samples"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Unit tests for tracing spans in WorkflowRunner execution logs."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.workflow.runner import WorkflowRunner
+from src.core.workflow.tracing import chrome_trace_events, write_chrome_trace
+from src.core.interfaces import IWebDriver
+from src.core.actions.interaction import ClickAction
+from src.core.actions.navigation import NavigateAction
+from src.core.actions.loop_action import LoopAction
+from src.core.exceptions import WebDriverError
+
+
+class TestRunnerTracing(unittest.TestCase):
+    """Test cases for WorkflowRunner(trace=True)."""
+
+    def setUp(self):
+        """Set up a mocked driver and a workflow with a two-iteration loop."""
+        self.driver = MagicMock(spec=IWebDriver)
+        self.actions = [
+            NavigateAction(url="https://example.com", name="Open"),
+            LoopAction(loop_type="count", count=2, name="Rows",
+                       loop_actions=[ClickAction(selector="#row", name="Select row")]),
+        ]
+
+    def test_untraced_runs_have_no_trace(self):
+        """The trace is only recorded on request."""
+        log = WorkflowRunner(self.driver).run(self.actions, "Plain")
+        self.assertNotIn("trace", log)
+
+    def test_span_tree_nests_blocks_iterations_actions_and_driver_calls(self):
+        """workflow -> block -> action -> iteration -> action -> driver call."""
+        runner = WorkflowRunner(self.driver, trace=True)
+        log = runner.run(self.actions, "Traced")
+        self.assertEqual(log["final_status"], "SUCCESS")
+        root = log["trace"]["spans"]
+        self.assertEqual((root["kind"], root["name"], root["attributes"]["status"]), ("workflow", "Traced", "SUCCESS"))
+        block = root["children"][0]
+        self.assertEqual(block["kind"], "block")
+        navigate, loop = block["children"]
+        self.assertEqual(navigate["children"][0]["attributes"], {"url": "https://example.com"})
+        self.assertEqual(loop["attributes"], {"action_type": "Loop", "status": "success"})
+        iterations = loop["children"]
+        self.assertEqual([span["kind"] for span in iterations], ["iteration", "iteration"])
+        click = iterations[1]["children"][0]
+        self.assertEqual((click["kind"], click["name"]), ("action", "Select row"))
+        self.assertEqual(click["children"][0]["name"], "click_element")
+        for parent in (root, block, loop):
+            for child in parent["children"]:
+                self.assertGreaterEqual(child["start_us"], parent["start_us"])
+                self.assertLessEqual(child["start_us"] + child["duration_us"], parent["start_us"] + parent["duration_us"] + 1)
+        self.assertIs(runner.driver, self.driver)
+
+    def test_summary_splits_driver_and_engine_time(self):
+        """Driver calls are totalled per selector; engine time is the remainder."""
+        summary = WorkflowRunner(self.driver, trace=True).run(self.actions, "Traced")["trace"]["summary"]
+        self.assertEqual(summary["driver_calls"], 3)
+        self.assertEqual(summary["by_selector"]["#row"]["calls"], 2)
+        self.assertEqual(summary["driver_us"] + summary["engine_us"], summary["total_us"])
+        self.assertEqual(len(summary["slowest_actions"]), 4)
+
+    def test_failed_driver_calls_record_the_error(self):
+        """A failing driver call marks its span, and the action is marked failed."""
+        self.driver.click_element.side_effect = WebDriverError("gone")
+        log = WorkflowRunner(self.driver, trace=True).run(self.actions, "Failing")
+        self.assertEqual(log["final_status"], "FAILED")
+        loop = log["trace"]["spans"]["children"][0]["children"][1]
+        click = loop["children"][0]["children"][0]
+        self.assertEqual(click["attributes"]["status"], "failure")
+        self.assertIn("gone", click["children"][0]["attributes"]["error"])
+
+    def test_chrome_trace_export(self):
+        """The trace converts to Chrome 'complete' events, one per span."""
+        trace = WorkflowRunner(self.driver, trace=True).run(self.actions, "Traced")["trace"]
+        events = chrome_trace_events(trace)
+        complete = [event for event in events if event["ph"] == "X"]
+        self.assertEqual(complete[0]["name"], "Traced")
+        self.assertEqual({event["cat"] for event in complete}, {"workflow", "block", "action", "iteration", "driver"})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            write_chrome_trace(trace, path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)["traceEvents"]), len(events))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""Unit tests for the background ScreenshotWriter and its use by the runner."""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.workflow.screenshot_writer import ScreenshotWriter
+from src.core.workflow.runner import WorkflowRunner
+from src.core.actions.utility import ScreenshotAction
+from src.core.interfaces import IWebDriver
+
+
+class TestScreenshotWriter(unittest.TestCase):
+    """Test cases for ScreenshotWriter."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, "shots", name)
+
+    def test_writes_and_dedupes_identical_frames(self):
+        """Identical bytes are written once and linked/copied for later paths."""
+        with ScreenshotWriter(max_workers=2, max_pending=2) as writer:
+            writer.submit(b"frame-a", self._path("1.png"))
+            writer.submit(b"frame-a", self._path("2.png"))
+            writer.submit(b"frame-b", self._path("3.png"))
+            stats = writer.flush()
+        self.assertEqual((stats["submitted"], stats["written"], stats["deduplicated"], stats["failed"]), (3, 2, 1, 0))
+        for name, content in (("1.png", b"frame-a"), ("2.png", b"frame-a"), ("3.png", b"frame-b")):
+            with open(self._path(name), "rb") as handle:
+                self.assertEqual(handle.read(), content)
+
+    def test_overwritten_source_is_not_reused(self):
+        """A frame is never linked to a file that has since been overwritten with other content."""
+        with ScreenshotWriter(max_workers=1) as writer:
+            writer.submit(b"frame-a", self._path("a.png"))
+            writer.submit(b"frame-b", self._path("a.png"))
+            writer.submit(b"frame-a", self._path("final.png"))
+            stats = writer.flush()
+        for name, content in (("a.png", b"frame-b"), ("final.png", b"frame-a")):
+            with open(self._path(name), "rb") as handle:
+                self.assertEqual(handle.read(), content)
+        self.assertEqual((stats["written"], stats["deduplicated"]), (3, 0))
+        self.assertEqual([name for name in os.listdir(self._path("")) if name.endswith(".tmp")], [])
+
+    def test_dedupe_cache_is_bounded(self):
+        """Only the most recently written frames are remembered."""
+        with ScreenshotWriter(max_workers=1, dedupe_cache_size=2) as writer:
+            for n in range(5): writer.submit(f"frame-{n}".encode(), self._path(f"{n}.png"))
+            writer.submit(b"frame-4", self._path("again-4.png"))
+            writer.submit(b"frame-0", self._path("again-0.png"))
+            stats = writer.flush()
+            self.assertEqual(len(writer._written_by_hash), 2)
+            self.assertEqual(len(writer._hash_by_path), 2)
+            self.assertEqual(writer._in_progress, {})
+        self.assertEqual((stats["written"], stats["deduplicated"]), (6, 1))
+
+    def test_same_path_queued_twice(self):
+        """Frames queued for the same path use separate temp files; the last one wins."""
+        with ScreenshotWriter(max_workers=4, dedupe=False) as writer:
+            for n in range(20): writer.submit(b"x" * 100000, self._path("same.png"))
+            stats = writer.flush()
+        self.assertEqual((stats["written"], stats["failed"]), (20, 0))
+
+    def test_submit_blocks_when_queue_is_full(self):
+        """A full queue applies backpressure until a worker frees a slot."""
+        writer = ScreenshotWriter(max_workers=1, max_pending=1, dedupe=False)
+        started, release = threading.Event(), threading.Event()
+        original_write = writer._write
+        writer._write = lambda data, path: (started.set(), release.wait(), original_write(data, path))
+        writer.submit(b"1", self._path("1.png"))
+        self.assertTrue(started.wait(2))  # taken by the worker, blocked in _write
+        writer.submit(b"2", self._path("2.png"))  # fills the queue
+        blocked = threading.Thread(target=writer.submit, args=(b"3", self._path("3.png")))
+        blocked.start()
+        blocked.join(0.2)
+        self.assertTrue(blocked.is_alive())
+        release.set()
+        blocked.join(2)
+        self.assertFalse(blocked.is_alive())
+        self.assertEqual(writer.close()["written"], 3)
+
+    def test_failures_are_reported(self):
+        """Write errors are counted and listed instead of raised."""
+        blocker = os.path.join(self.tmp.name, "file")
+        open(blocker, "w").close()
+        with ScreenshotWriter() as writer:
+            writer.submit(b"x", os.path.join(blocker, "shot.png"))
+            stats = writer.flush()
+        self.assertEqual(stats["failed"], 1)
+        self.assertEqual(stats["errors"][0]["file_path"], os.path.join(blocker, "shot.png"))
+
+    def test_runs_are_flushed_and_counted_separately(self):
+        """A run's flush waits only for its own screenshots and reports only its own stats."""
+        writer = ScreenshotWriter(max_workers=2, dedupe=False)
+        self.addCleanup(writer.close)
+        release = threading.Event()
+        original_write = writer._write
+        writer._write = lambda data, path: (release.wait() if data == b"slow" else None, original_write(data, path))
+        slow_run, fast_run = writer.open_run(), writer.open_run()
+        slow_run.submit(b"slow", self._path("slow.png"))
+        fast_run.submit(b"fast", self._path("fast.png"))
+        fast_run.submit(b"fast", self._path("fast2.png"))
+        stats = fast_run.flush()
+        self.assertEqual((stats["submitted"], stats["written"]), (2, 2))
+        self.assertEqual(slow_run.get_stats()["pending"], 1)
+        release.set()
+        self.assertEqual(slow_run.flush()["written"], 1)
+        self.assertEqual(writer.flush()["written"], 3)
+
+
+class TestRunnerScreenshotWriter(unittest.TestCase):
+    """Test cases for WorkflowRunner with a screenshot writer."""
+
+    def test_run_queues_screenshots_and_logs_flush(self):
+        """Screenshots go through the writer and its stats land in the execution log."""
+        with tempfile.TemporaryDirectory() as tmp:
+            driver = MagicMock(spec=IWebDriver)
+            driver.get_screenshot_bytes.return_value = b"png-bytes"
+            with ScreenshotWriter() as writer:
+                runner = WorkflowRunner(driver, screenshot_writer=writer)
+                actions = [ScreenshotAction(file_path=os.path.join(tmp, f"{i}.png")) for i in range(3)]
+                log = runner.run(actions, "Audit")
+            self.assertEqual(log["final_status"], "SUCCESS")
+            self.assertEqual(log["screenshots"]["submitted"], 3)
+            self.assertEqual(log["screenshots"]["written"] + log["screenshots"]["deduplicated"], 3)
+            driver.take_screenshot.assert_not_called()
+            self.assertTrue(all(os.path.exists(os.path.join(tmp, f"{i}.png")) for i in range(3)))
+
+    def test_driver_without_memory_capture_saves_synchronously(self):
+        """Drivers that cannot return bytes keep the synchronous path."""
+        driver = MagicMock(spec=IWebDriver)
+        driver.SUPPORTS_SCREENSHOT_BYTES = False
+        with ScreenshotWriter() as writer:
+            log = WorkflowRunner(driver, screenshot_writer=writer).run([ScreenshotAction(file_path="shot.png")], "Audit")
+        driver.take_screenshot.assert_called_once_with("shot.png")
+        driver.get_screenshot_bytes.assert_not_called()
+        self.assertEqual(log["screenshots"]["submitted"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
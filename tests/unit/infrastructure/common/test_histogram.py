@@ -0,0 +1,58 @@
+"""Unit tests for the fixed-memory latency histogram."""
+
+import random
+import unittest
+
+from src.infrastructure.common.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test cases for LatencyHistogram."""
+
+    def test_small_values_are_exact(self):
+        """Values below 2**precision_bits are counted in their own bucket."""
+        histogram = LatencyHistogram(precision_bits=7)
+        for value in range(1, 101): histogram.record(value)
+        self.assertEqual(histogram.value_at_percentile(50), 50)
+        self.assertEqual(histogram.percentiles([90, 99]), {"p90": 90, "p99": 99})
+        self.assertEqual((histogram.count, histogram.min, histogram.max, histogram.mean), (100, 1, 100, 50.5))
+
+    def test_percentiles_are_within_the_relative_error(self):
+        """Large values are reported to within 2**-(precision_bits - 1)."""
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(9, 1.5)) for _ in range(20_000))
+        histogram = LatencyHistogram(precision_bits=7)
+        for value in values: histogram.record(value)
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[int(percentile / 100 * len(values) + 0.5) - 1]
+            self.assertLessEqual(abs(histogram.value_at_percentile(percentile) - exact), exact / 64 + 1)
+
+    def test_memory_is_bounded_and_large_values_are_clamped(self):
+        """Buckets are allocated up to the highest value recorded, never past max_value's; larger values land in the last bucket."""
+        histogram = LatencyHistogram(max_value=1_000_000)
+        self.assertEqual(len(histogram._counts), 0)
+        histogram.record(1_000)
+        self.assertEqual(len(histogram._counts), histogram._index(1_000) + 1)
+        buckets = histogram.bucket_count
+        histogram.record(5_000_000)
+        histogram.record(-3)
+        self.assertEqual(len(histogram._counts), buckets)
+        self.assertEqual((histogram.min, histogram.max), (0, 5_000_000))
+        self.assertEqual(histogram.value_at_percentile(100), histogram._bucket_bounds(buckets - 1)[1])
+
+    def test_merge_copy_and_reset(self):
+        """Histograms with the same layout merge; copies are independent."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(10); second.record(1_000, count=3)
+        merged = first.copy()
+        merged.merge(second)
+        self.assertEqual((merged.count, merged.total, first.count), (4, 3_010, 1))
+        with self.assertRaises(ValueError):
+            merged.merge(LatencyHistogram(precision_bits=5))
+        merged.reset()
+        self.assertEqual(merged.to_dict(), {"count": 0, "min": 0, "max": 0, "mean": 0.0,
+                                            "p50": 0, "p90": 0, "p99": 0, "p99.9": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
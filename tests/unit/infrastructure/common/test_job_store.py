@@ -0,0 +1,156 @@
+"""Unit tests for the SQLite job store, job leases and the leased executor."""
+
+import os
+import time
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.infrastructure.common.job_store import (
+    APS_AVAILABLE, JobLeases, LeasedThreadPoolExecutor, SQLiteJobStore, misfire_job_options
+)
+
+if APS_AVAILABLE:
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.jobstores.base import ConflictingIdError
+
+_runs = []
+_runs_lock = threading.Lock()
+
+
+def record_run(label):
+    """Job function, referenced by name so it can be stored."""
+    with _runs_lock: _runs.append(label)
+    time.sleep(0.05)
+
+
+@unittest.skipUnless(APS_AVAILABLE, "APScheduler not installed")
+class TestSQLiteJobStore(unittest.TestCase):
+    """Test cases for SQLiteJobStore."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "jobs.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _scheduler(self):
+        scheduler = BackgroundScheduler(jobstores={"default": SQLiteJobStore(self.db_path)}, timezone="UTC")
+        scheduler.start(paused=True)
+        return scheduler
+
+    def test_jobs_survive_a_restart(self):
+        """Jobs added by one scheduler are loaded, with their next run time, by the next."""
+        first = self._scheduler()
+        first.add_job(f"{__name__}:record_run", "interval", minutes=5, args=["a"], id="later")
+        first.add_job(f"{__name__}:record_run", "interval", minutes=1, args=["b"], id="sooner")
+        expected = {job.id: job.next_run_time for job in first.get_jobs()}
+        first.shutdown()
+        second = self._scheduler()
+        try:
+            jobs = second.get_jobs()
+            self.assertEqual([job.id for job in jobs], ["sooner", "later"])
+            self.assertEqual({job.id: job.next_run_time for job in jobs}, expected)
+            self.assertEqual(second.get_job("later").args, ("a",))
+        finally:
+            second.shutdown()
+
+    def test_store_operations(self):
+        """Duplicate ids conflict; removing a job another process already removed is not an error."""
+        scheduler = self._scheduler()
+        try:
+            store = scheduler._lookup_jobstore("default")
+            scheduler.add_job(f"{__name__}:record_run", "interval", minutes=1, args=["x"], id="job")
+            job = store.lookup_job("job")
+            with self.assertRaises(ConflictingIdError): store.add_job(job)
+            self.assertEqual(store.get_due_jobs(job.next_run_time), [job])
+            self.assertEqual(store.get_due_jobs(job.next_run_time - timedelta(seconds=1)), [])
+            self.assertEqual(store.get_next_run_time(), job.next_run_time)
+            store.remove_job("job")
+            store.remove_job("job")
+            store.update_job(job)
+            self.assertIsNone(store.lookup_job("job"))
+            self.assertIsNone(store.get_next_run_time())
+        finally:
+            scheduler.shutdown()
+
+    def test_misfire_policies(self):
+        """Each policy maps to APScheduler's coalesce/misfire_grace_time options."""
+        self.assertEqual(misfire_job_options("skip", 30), {"coalesce": True, "misfire_grace_time": 30})
+        self.assertEqual(misfire_job_options("run_once"), {"coalesce": True, "misfire_grace_time": None})
+        self.assertEqual(misfire_job_options("run_all"), {"coalesce": False, "misfire_grace_time": None})
+        with self.assertRaises(ValueError): misfire_job_options("sometimes")
+
+
+class TestJobLeases(unittest.TestCase):
+    """Test cases for JobLeases shared by two owners."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmp.name, "jobs.db")
+        self.first = JobLeases(db_path, lease_seconds=60, owner="first")
+        self.second = JobLeases(db_path, lease_seconds=60, owner="second")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_each_occurrence_is_claimed_once(self):
+        """An occurrence (or an earlier one) can't be claimed twice; a running job blocks the next."""
+        self.assertTrue(self.first.try_acquire("job", 100.0))
+        self.assertFalse(self.second.try_acquire("job", 100.0))
+        self.assertFalse(self.second.try_acquire("job", 200.0)) # Still running under first's lease
+        self.first.release("job")
+        self.assertFalse(self.second.try_acquire("job", 100.0))
+        self.assertTrue(self.second.try_acquire("job", 200.0))
+        self.assertTrue(self.first.try_acquire("other", 200.0))
+
+    def test_expired_leases_can_be_taken_over(self):
+        """A lease that is not renewed (e.g. its process died) stops blocking other owners."""
+        self.first.lease_seconds = 0.01
+        self.assertTrue(self.first.try_acquire("job", 100.0))
+        time.sleep(0.05)
+        self.assertTrue(self.second.try_acquire("job", 200.0))
+        self.assertEqual(self.first.renew(), 0)
+        self.assertEqual(self.second.renew(), 1)
+
+
+@unittest.skipUnless(APS_AVAILABLE, "APScheduler not installed")
+class TestSharedJobStore(unittest.TestCase):
+    """Test cases for two schedulers sharing one SQLite job store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "jobs.db")
+        del _runs[:]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _scheduler(self, owner):
+        leases = JobLeases(self.db_path, lease_seconds=5, owner=owner)
+        return BackgroundScheduler(jobstores={"default": SQLiteJobStore(self.db_path)},
+                                   executors={"default": LeasedThreadPoolExecutor(leases, max_workers=4)},
+                                   job_defaults={"coalesce": True, "misfire_grace_time": None}, timezone="UTC")
+
+    def test_jobs_run_once_per_occurrence(self):
+        """Every job runs exactly once although both schedulers see it due."""
+        first, second = self._scheduler("first"), self._scheduler("second")
+        first.start(paused=True)
+        run_date = datetime.now(timezone.utc) + timedelta(seconds=0.3)
+        labels = [f"job-{n}" for n in range(6)]
+        for label in labels: first.add_job(f"{__name__}:record_run", "date", run_date=run_date, args=[label], id=label)
+        second.start()
+        first.resume()
+        try:
+            deadline = time.time() + 5
+            while len(_runs) < len(labels) and time.time() < deadline: time.sleep(0.05)
+            time.sleep(0.3)
+        finally:
+            first.shutdown(); second.shutdown()
+        self.assertEqual(sorted(_runs), labels)
+
+
+if __name__ == "__main__":
+    unittest.main()
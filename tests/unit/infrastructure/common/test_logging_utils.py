@@ -1,7 +1,7 @@
 """Tests for the logging_utils module."""
 import unittest
 import logging
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.infrastructure.common.logging_utils import log_method_call
 
@@ -102,5 +102,77 @@ class TestLoggingUtils(unittest.TestCase):
         info_calls = [call for call in self.mock_logger.log.call_args_list if call[0][0] == logging.INFO]
         self.assertGreaterEqual(len(info_calls), 2)
 
+
+class TestLogMethodCallOverhead(unittest.TestCase):
+    """Test cases for the short-circuit, lazy formatting and sampling of log_method_call."""
+
+    def setUp(self):
+        """Set up a real (unregistered, so unshared) logger with a capturing handler."""
+        self.logger = logging.Logger("autoqliq.tests.log_method_call")
+        self.records = []
+        handler = logging.Handler()
+        handler.emit = lambda record: self.records.append(record.getMessage())
+        self.handler = handler
+        self.logger.addHandler(handler)
+        self.repr_calls = 0
+        test = self
+
+        class Element:
+            def __repr__(self):
+                test.repr_calls += 1
+                return "<element>"
+        self.element = Element()
+
+    def test_disabled_level_skips_formatting(self):
+        """Nothing is logged or formatted when the level is disabled."""
+        self.logger.setLevel(logging.INFO)
+        @log_method_call(self.logger)
+        def find(element):
+            return element
+        self.assertIs(find(self.element), self.element)
+        self.assertEqual((self.records, self.repr_calls), ([], 0))
+
+    def test_messages_are_formatted_only_when_emitted(self):
+        """Arguments are formatted by the handler, not by the decorator."""
+        self.logger.setLevel(logging.DEBUG)
+        self.handler.setLevel(logging.INFO)
+        class Driver:
+            @log_method_call(self.logger)
+            def click(self, element, force=False):
+                return True
+        Driver().click(self.element, force=True)
+        self.assertEqual(self.repr_calls, 0)
+        self.handler.setLevel(logging.DEBUG)
+        Driver().click(self.element, force=True)
+        self.assertEqual(self.records, ["Calling: Driver.click(<element>, force=True)", "Finished: Driver.click -> True"])
+        self.assertEqual(self.repr_calls, 1)
+
+    def test_exceptions_are_logged_when_level_disabled_or_not_sampled(self):
+        """Failures are always logged, even on the fast path."""
+        self.logger.setLevel(logging.WARNING)
+        @log_method_call(self.logger, sample_rate=0.5)
+        def fail():
+            raise ValueError("boom")
+        with self.assertRaises(ValueError):
+            fail()
+        self.assertEqual(self.records, ["Exception in fail: ValueError - boom"])
+
+    def test_sampling_and_structured_records(self):
+        """Only sampled calls are logged; structured records carry call attributes."""
+        self.logger.setLevel(logging.DEBUG)
+        captured = []
+        self.handler.emit = captured.append
+        @log_method_call(self.logger, sample_rate=0.25, structured=True)
+        def poll(value):
+            return value * 2
+        with patch("src.infrastructure.common.logging_utils.random.random", side_effect=[0.1, 0.9, 0.9, 0.9]):
+            for value in range(4): poll(value)
+        self.assertEqual([record.call_event for record in captured], ["call", "return"])
+        self.assertEqual((captured[1].call_method, str(captured[1].call_result)), ("poll", "0"))
+        self.assertGreaterEqual(captured[1].call_duration_ms, 0)
+        with self.assertRaises(ValueError):
+            log_method_call(self.logger, sample_rate=0)
+
+
 if __name__ == "__main__":
     unittest.main()
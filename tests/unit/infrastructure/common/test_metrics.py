@@ -0,0 +1,104 @@
+"""Unit tests for the Prometheus-style metrics registry and endpoint."""
+
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+from src.infrastructure.common.metrics import MetricsRegistry, MetricsServer, register_driver_metrics, register_run_queue_metrics, CONTENT_TYPE
+from src.infrastructure.webdrivers.instrumented_driver import DriverMetrics
+from src.core.workflow.run_queue import PRIORITY_BATCH
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for counters, gauges, histograms and text rendering."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counters_and_gauges_render_with_labels(self):
+        """Labelled samples render in the Prometheus text format, with escaped label values."""
+        runs = self.registry.counter("runs_total", "Workflow runs", ["status"])
+        runs.labels(status="SUCCESS").inc()
+        runs.labels("SUCCESS").inc(2)
+        runs.labels(status='say "hi"\n').inc()
+        active = self.registry.gauge("drivers_active", "Open drivers")
+        active.inc(); active.inc(); active.dec()
+        text = self.registry.render()
+        self.assertIn("# HELP runs_total Workflow runs\n# TYPE runs_total counter\n", text)
+        self.assertIn('runs_total{status="SUCCESS"} 3\n', text)
+        self.assertIn('runs_total{status="say \\"hi\\"\\n"} 1\n', text)
+        self.assertIn("drivers_active 1\n", text)
+        with self.assertRaises(ValueError): runs.labels(state="x")
+        with self.assertRaises(ValueError): runs.inc()
+        with self.assertRaises(ValueError): runs.labels("SUCCESS").inc(-1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histograms render cumulative buckets, +Inf, sum and count."""
+        latency = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0): latency.observe(value)
+        with latency.time(): pass
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 2\n', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 3\n', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4\n', text)
+        self.assertIn("latency_seconds_count 4\n", text)
+
+    def test_get_or_create_and_collectors(self):
+        """Metrics are shared by name; collectors and gauge functions run at render time."""
+        first = self.registry.gauge("jobs", "Jobs")
+        self.assertIs(self.registry.gauge("jobs", "Jobs"), first)
+        with self.assertRaises(ValueError): self.registry.counter("jobs", "Jobs")
+        depth = [4]
+        self.registry.gauge("queue_depth", "Queued").set_function(lambda: depth[0])
+        collector = lambda: first.set(len(depth) * 7)
+        self.registry.register_collector(collector)
+        self.assertIn("jobs 7\n", self.registry.render())
+        depth[0] = 9
+        self.assertIn("queue_depth 9\n", self.registry.render())
+        self.registry.unregister_collector(collector)
+
+    def test_driver_metrics_export(self):
+        """DriverMetrics are exported as per-method gauges."""
+        driver_metrics = DriverMetrics()
+        driver_metrics.record("click_element", 2_000)
+        driver_metrics.record("click_element", 4_000, failed=True)
+        register_driver_metrics(self.registry, driver_metrics)
+        text = self.registry.render()
+        self.assertIn('autoqliq_driver_calls{method="click_element"} 2\n', text)
+        self.assertIn('autoqliq_driver_call_errors{method="click_element"} 1\n', text)
+        self.assertIn('autoqliq_driver_call_seconds_total{method="click_element"} 0.006\n', text)
+
+    def test_run_queue_metrics(self):
+        """Pending runs (by priority), running runs and expired runs are exported from RunQueue.stats."""
+        run_queue = MagicMock()
+        run_queue.stats.return_value = {"pending": 3, "running": 2, "expired": 1, "pending_by_priority": {PRIORITY_BATCH: 3}}
+        register_run_queue_metrics(self.registry, run_queue)
+        text = self.registry.render()
+        self.assertIn('autoqliq_run_queue_pending{priority="batch"} 3\n', text)
+        self.assertIn('autoqliq_run_queue_pending{priority="interactive"} 0\n', text)
+        self.assertIn("autoqliq_run_queue_running 2\n", text)
+        self.assertIn("autoqliq_run_queue_expired 1\n", text)
+
+
+class TestMetricsServer(unittest.TestCase):
+    """Test cases for the HTTP metrics endpoint."""
+
+    def test_serves_metrics_over_http(self):
+        """GET /metrics returns the rendered registry; other paths are 404."""
+        registry = MetricsRegistry()
+        registry.counter("scrapes_total", "Scrapes").inc()
+        server = MetricsServer(registry, port=0).start()
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE)
+                self.assertIn("scrapes_total 1", response.read().decode("utf-8"))
+            with self.assertRaises(urllib.error.HTTPError) as raised:
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+            self.assertEqual(raised.exception.code, 404)
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
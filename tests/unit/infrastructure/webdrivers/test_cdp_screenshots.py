@@ -0,0 +1,98 @@
+"""Unit tests for CDP-backed screenshot capture."""
+
+import base64
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.webdrivers import cdp
+from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+from src.infrastructure.webdrivers.base import BrowserType
+from src.core.exceptions import WebDriverError, ValidationError
+
+
+class TestCdpHelpers(unittest.TestCase):
+    """Test cases for the cdp helper module."""
+
+    def test_write_base64_file_streams_in_chunks(self):
+        """Decoded output matches the original bytes regardless of chunk size."""
+        payload = os.urandom(10_000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "nested", "shot.jpg")
+            written = cdp.write_base64_file(base64.b64encode(payload).decode(), path, chunk_size=64)
+            with open(path, "rb") as handle:
+                self.assertEqual(handle.read(), payload)
+            self.assertEqual(written, len(payload))
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["shot.jpg"])
+
+    def test_build_screenshot_params(self):
+        """Clip and quality are translated to Page.captureScreenshot parameters."""
+        params = cdp.build_screenshot_params("jpeg", 70, {"x": 1, "y": 2, "width": 3, "height": 4})
+        self.assertEqual(params["quality"], 70)
+        self.assertEqual(params["clip"]["scale"], 1)
+        self.assertTrue(params["captureBeyondViewport"])
+        with self.assertRaises(ValidationError):
+            cdp.build_screenshot_params("png", 50)
+
+    def test_full_page_clip_prefers_css_content_size(self):
+        """The clip uses cssContentSize, falling back to contentSize on older Chromium."""
+        metrics = {"contentSize": {"width": 2560, "height": 10800}, "cssContentSize": {"width": 1280, "height": 5400}}
+        self.assertEqual(cdp.full_page_clip(metrics), {"x": 0, "y": 0, "width": 1280, "height": 5400, "scale": 1})
+        del metrics["cssContentSize"]
+        self.assertEqual(cdp.full_page_clip(metrics)["height"], 10800)
+
+
+class TestSeleniumCaptureScreenshot(unittest.TestCase):
+    """Test cases for SeleniumWebDriver.capture_screenshot."""
+
+    def _make_driver(self, browser_type):
+        with patch('src.infrastructure.webdrivers.selenium_driver.webdriver') as mock_webdriver:
+            mock_selenium = MagicMock()
+            getattr(mock_webdriver, browser_type.value.capitalize()).return_value = mock_selenium
+            return SeleniumWebDriver(browser_type=browser_type), mock_selenium
+
+    def test_chrome_jpeg_uses_cdp(self):
+        """Chrome captures JPEG via CDP and writes the decoded bytes."""
+        driver, mock_selenium = self._make_driver(BrowserType.CHROME)
+        responses = {"Page.getLayoutMetrics": {"cssContentSize": {"x": 0, "y": 0, "width": 1280, "height": 5400}},
+                     "Page.captureScreenshot": {"data": base64.b64encode(b"jpeg-bytes").decode()}}
+        mock_selenium.execute_cdp_cmd.side_effect = lambda command, params: responses[command]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shot.jpg")
+            driver.capture_screenshot(path, image_format="jpeg", quality=60, full_page=True)
+            with open(path, "rb") as handle:
+                self.assertEqual(handle.read(), b"jpeg-bytes")
+        command, params = mock_selenium.execute_cdp_cmd.call_args[0]
+        self.assertEqual(command, "Page.captureScreenshot")
+        self.assertEqual((params["format"], params["quality"], params["captureBeyondViewport"]), ("jpeg", 60, True))
+        # Full-page captures clip to the page's content size, not the viewport
+        self.assertEqual(params["clip"], {"x": 0, "y": 0, "width": 1280, "height": 5400, "scale": 1})
+        mock_selenium.save_screenshot.assert_not_called()
+
+    def test_chrome_element_capture_clips_to_element(self):
+        """An element capture clips to the element's page rectangle."""
+        driver, mock_selenium = self._make_driver(BrowserType.CHROME)
+        mock_selenium.execute_script.return_value = {"x": 10, "y": 20, "width": 30, "height": 40}
+        mock_selenium.execute_cdp_cmd.return_value = {"data": base64.b64encode(b"png").decode()}
+        with tempfile.TemporaryDirectory() as tmp:
+            driver.capture_screenshot(os.path.join(tmp, "el.png"), selector="#logo")
+        params = mock_selenium.execute_cdp_cmd.call_args[0][1]
+        self.assertEqual(params["clip"], {"x": 10, "y": 20, "width": 30, "height": 40, "scale": 1})
+
+    def test_firefox_rejects_cdp_only_options(self):
+        """Non-Chromium browsers only support PNG output."""
+        driver, _ = self._make_driver(BrowserType.FIREFOX)
+        with self.assertRaises(WebDriverError):
+            driver.capture_screenshot("shot.webp", image_format="webp")
+
+    def test_firefox_full_page_png(self):
+        """Firefox full-page PNG uses the native full-page screenshot."""
+        driver, mock_selenium = self._make_driver(BrowserType.FIREFOX)
+        mock_selenium.get_full_page_screenshot_as_file.return_value = True
+        driver.capture_screenshot("shot.png", full_page=True)
+        mock_selenium.get_full_page_screenshot_as_file.assert_called_once_with("shot.png")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit tests for driver-call instrumentation."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.core.interfaces import IWebDriver
+from src.core.exceptions import WebDriverError
+from src.core.actions.interaction import ClickAction
+from src.core.actions.navigation import NavigateAction
+from src.core.actions.loop_action import LoopAction
+from src.core.workflow.runner import WorkflowRunner
+from src.infrastructure.webdrivers.factory import WebDriverFactory
+from src.infrastructure.webdrivers.instrumented_driver import (
+    InstrumentedWebDriver, DriverMetrics, MetricsDumper, OTHER_TAG
+)
+
+
+class TestInstrumentedWebDriver(unittest.TestCase):
+    """Test cases for InstrumentedWebDriver and DriverMetrics."""
+
+    def setUp(self):
+        self.mock_driver = MagicMock(spec=IWebDriver)
+        self.driver = InstrumentedWebDriver(self.mock_driver)
+
+    def test_calls_are_forwarded_and_counted(self):
+        """Every call reaches the wrapped driver and is recorded per method."""
+        self.mock_driver.get_current_url.return_value = "https://a.test/"
+        self.assertEqual(self.driver.get_current_url(), "https://a.test/")
+        self.driver.click_element("#a"); self.driver.click_element("#b")
+        self.mock_driver.click_element.assert_called_with("#b")
+        stats = self.driver.metrics.get_method_stats()
+        self.assertEqual((stats["click_element"]["calls"], stats["get_current_url"]["calls"]), (2, 1))
+        self.assertEqual(stats["click_element"]["latency_us"]["count"], 2)
+
+    def test_failures_are_counted_and_reraised(self):
+        """A failing call is recorded as an error and the exception propagates."""
+        self.mock_driver.click_element.side_effect = WebDriverError("gone")
+        with self.assertRaises(WebDriverError):
+            self.driver.click_element("#a")
+        self.assertEqual(self.driver.metrics.get_method_stats()["click_element"]["errors"], 1)
+
+    def test_tags_nest_and_restore(self):
+        """Calls are attributed to the innermost workflow/action tags."""
+        with self.driver.metric_tags(workflow="wf"):
+            with self.driver.metric_tags(action="outer"):
+                with self.driver.metric_tags(action="inner"):
+                    self.driver.click_element("#a")
+                self.driver.is_element_present("#b")
+        self.driver.get_current_url()
+        metrics = self.driver.metrics
+        self.assertEqual(list(metrics.get_method_stats(action="inner")), ["click_element"])
+        self.assertEqual(list(metrics.get_method_stats(action="outer")), ["is_element_present"])
+        actions = {(entry["workflow"], entry["action"]): entry["methods"] for entry in metrics.get_action_stats()}
+        self.assertEqual(actions[(None, None)], {"get_current_url": 1})
+        self.assertEqual(metrics.get_action_stats(workflow="wf")[0]["workflow"], "wf")
+
+    def test_series_are_bounded(self):
+        """Beyond max_series, new tag combinations are folded into OTHER_TAG."""
+        metrics = DriverMetrics(max_series=2)
+        for action in ("a", "b", "c", "d"): metrics.record("click_element", 10, action=action)
+        self.assertEqual(len(metrics._series), 3)
+        self.assertEqual(metrics.get_method_stats(action=OTHER_TAG)["click_element"]["calls"], 2)
+        self.assertEqual(metrics.snapshot()["total"]["calls"], 4)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["total"]["calls"], 0)
+
+    def test_runner_tags_calls_with_workflow_and_action(self):
+        """WorkflowRunner attributes driver calls to the running workflow and action."""
+        actions = [NavigateAction(url="https://example.com", name="Open"),
+                   LoopAction(loop_type="count", count=3, name="Rows",
+                              loop_actions=[ClickAction(selector="#row", name="Select row")])]
+        log = WorkflowRunner(self.driver, trace=True).run(actions, "Orders")
+        self.assertEqual(log["final_status"], "SUCCESS")
+        self.assertEqual(log["trace"]["summary"]["driver_calls"], 4)
+        stats = self.driver.metrics.get_method_stats(workflow="Orders", action="Select row")
+        self.assertEqual(stats["click_element"]["calls"], 3)
+        self.assertEqual((self.driver.workflow_tag, self.driver.action_tag), (None, None))
+
+    def test_factory_and_dumper(self):
+        """The factory wraps drivers when given metrics; the dumper writes JSON snapshots."""
+        metrics = DriverMetrics()
+        driver = WebDriverFactory.create_driver(driver_type="simulated", metrics=metrics,
+                                                simulation_options={"fixtures": {"https://a.test/": {"title": "A"}}})
+        self.assertIsInstance(driver, InstrumentedWebDriver)
+        driver.get("https://a.test/")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics", "driver.json")
+            dumper = MetricsDumper(metrics, interval_seconds=60, file_path=path, log=False).start()
+            dumper.stop()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["methods"]["get"]["calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
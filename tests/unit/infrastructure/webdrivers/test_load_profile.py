@@ -0,0 +1,89 @@
+"""Unit tests for page load profiles."""
+
+import re
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.webdrivers.load_profile import LoadProfile, LOAD_PROFILES, TRACKER_PATTERNS
+from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+from src.infrastructure.webdrivers.factory import WebDriverFactory
+from src.infrastructure.webdrivers.base import BrowserType
+from src.core.exceptions import ConfigError
+
+
+class TestLoadProfile(unittest.TestCase):
+    """Test cases for LoadProfile resolution and application."""
+
+    def test_resolve_by_name_dict_and_instance(self):
+        """Profiles resolve from names, metadata dicts and instances."""
+        self.assertIs(LoadProfile.resolve("minimal"), LOAD_PROFILES["minimal"])
+        custom = LoadProfile.resolve({"name": "forms", "block_resource_types": ["image"], "block_trackers": True})
+        self.assertEqual(custom.block_resource_types, ("image",))
+        self.assertTrue(set(TRACKER_PATTERNS) <= set(custom.url_patterns))
+        self.assertIs(LoadProfile.resolve(custom), custom)
+        self.assertIsNone(LoadProfile.resolve(None))
+
+    def test_resource_patterns_match_query_strings(self):
+        """Extension patterns also block URLs with a query string, but not other extensions that start alike."""
+        def blocked(url):
+            return any(re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+                       for pattern in LOAD_PROFILES["text_only"].url_patterns)
+        self.assertTrue(blocked("https://cdn.example.com/logo.png"))
+        self.assertTrue(blocked("https://cdn.example.com/logo.png?v=3&w=200"))
+        self.assertTrue(blocked("https://fonts.example.com/inter.woff2?display=swap"))
+        self.assertFalse(blocked("https://example.com/logo.pngx"))
+        self.assertFalse(blocked("https://example.com/app.js?v=3"))
+
+    def test_invalid_profiles_raise_config_error(self):
+        """Unknown names and resource types are rejected."""
+        with self.assertRaises(ConfigError):
+            LoadProfile.resolve("turbo")
+        with self.assertRaises(ConfigError):
+            LoadProfile("bad", block_resource_types=["video"])
+
+    def test_apply_to_driver_uses_cdp(self):
+        """Chromium drivers receive blocked URLs, cache policy and throttling via CDP."""
+        driver = MagicMock()
+        profile = LoadProfile("p", block_resource_types=["font"], disable_cache=True,
+                              throttling={"latency": 100, "download_throughput": 1000, "upload_throughput": 1000})
+        profile.apply_to_driver(driver, BrowserType.CHROME)
+        commands = [c[0][0] for c in driver.execute_cdp_cmd.call_args_list]
+        self.assertEqual(commands, ["Network.enable", "Network.setBlockedURLs", "Network.setCacheDisabled",
+                                    "Network.emulateNetworkConditions"])
+        self.assertIn("*.woff2", driver.execute_cdp_cmd.call_args_list[1][0][1]["urls"])
+
+    def test_apply_to_driver_ignores_firefox(self):
+        """Firefox has no CDP; nothing is sent."""
+        driver = MagicMock()
+        LOAD_PROFILES["minimal"].apply_to_driver(driver, BrowserType.FIREFOX)
+        driver.execute_cdp_cmd.assert_not_called()
+
+    @patch('src.infrastructure.webdrivers.selenium_driver.webdriver')
+    def test_selenium_driver_applies_profile(self, mock_webdriver):
+        """SeleniumWebDriver sets the image preference and applies CDP blocking after launch."""
+        mock_chrome = MagicMock()
+        mock_webdriver.Chrome.return_value = mock_chrome
+        SeleniumWebDriver(browser_type=BrowserType.CHROME, headless=True, load_profile=LOAD_PROFILES["text_only"])
+        options = mock_webdriver.Chrome.call_args[1]['options']
+        self.assertEqual(options.experimental_options["prefs"]["profile.managed_default_content_settings.images"], 2)
+        self.assertIn('--headless=new', options.arguments)
+        mock_chrome.execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": LOAD_PROFILES["text_only"].url_patterns})
+
+    @patch('src.infrastructure.webdrivers.selenium_driver.webdriver')
+    def test_firefox_profile_preferences(self, mock_webdriver):
+        """Firefox receives preference-based blocking."""
+        SeleniumWebDriver(browser_type=BrowserType.FIREFOX, load_profile=LoadProfile("p", ["image", "font"], disable_cache=True))
+        options = mock_webdriver.Firefox.call_args[1]['options']
+        self.assertEqual(options.preferences["permissions.default.image"], 2)
+        self.assertEqual(options.preferences["browser.display.use_document_fonts"], 0)
+        self.assertFalse(options.preferences["browser.cache.disk.enable"])
+
+    @patch('src.infrastructure.webdrivers.factory.SeleniumWebDriver')
+    def test_factory_resolves_profile_name(self, mock_selenium_driver):
+        """create_driver accepts a profile name and passes the resolved profile through."""
+        WebDriverFactory.create_driver(browser_type=BrowserType.CHROME, load_profile="minimal")
+        self.assertIs(mock_selenium_driver.call_args[1]['load_profile'], LOAD_PROFILES["minimal"])
+
+
+if __name__ == '__main__':
+    unittest.main()
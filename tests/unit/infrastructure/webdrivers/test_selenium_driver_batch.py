@@ -0,0 +1,86 @@
+"""Unit tests for batched element operations in SeleniumWebDriver."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from selenium.common.exceptions import JavascriptException
+
+from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+from src.infrastructure.webdrivers.base import BrowserType
+from src.core.exceptions import ValidationError, WebDriverError
+
+
+class TestSeleniumWebDriverBatch(unittest.TestCase):
+    """Test cases for SeleniumWebDriver.run_batch."""
+
+    @patch('src.infrastructure.webdrivers.selenium_driver.webdriver')
+    def setUp(self, mock_webdriver):
+        """Create a driver wrapping a mocked Selenium instance."""
+        self.mock_selenium = MagicMock()
+        mock_webdriver.Chrome.return_value = self.mock_selenium
+        self.driver = SeleniumWebDriver(browser_type=BrowserType.CHROME)
+
+    def test_batch_uses_single_script_call(self):
+        """With script typing, all operations are sent in one execute_script round trip."""
+        self.mock_selenium.execute_script.return_value = {"results": [None, None, "value"]}
+        results = self.driver.run_batch([
+            {"op": "type", "selector": "#user", "text": "alice"},
+            {"op": "click", "selector": "#agree"},
+            {"op": "get_attribute", "selector": "#user", "name": "value"},
+        ], script_typing=True)
+        self.assertEqual(results, [None, None, "value"])
+        self.mock_selenium.execute_script.assert_called_once()
+        payload = self.mock_selenium.execute_script.call_args[0][1]
+        self.assertEqual(payload[0], {"op": "type", "selector": "#user", "text": "alice"})
+        self.mock_selenium.find_element.assert_not_called()
+
+    def test_typing_is_native_by_default(self):
+        """Without script typing, runs of 'type' operations are located in one call and typed with clear()+send_keys()."""
+        first, last = MagicMock(), MagicMock()
+        self.mock_selenium.execute_script.side_effect = [{"results": [first, last]}, {"results": [None]}]
+        results = self.driver.run_batch([
+            {"op": "type", "selector": "#first", "text": "Ada"},
+            {"op": "type", "selector": "#last", "text": "Lovelace"},
+            {"op": "click", "selector": "#agree"},
+        ])
+        self.assertEqual(results, [None, None, None])
+        scripts = [call[0][1] for call in self.mock_selenium.execute_script.call_args_list]
+        self.assertEqual(scripts, [[{"op": "locate", "selector": "#first"}, {"op": "locate", "selector": "#last"}],
+                                   [{"op": "click", "selector": "#agree"}]])
+        first.clear.assert_called_once()
+        first.send_keys.assert_called_once_with("Ada")
+        last.send_keys.assert_called_once_with("Lovelace")
+
+    def test_batch_reports_failing_operation(self):
+        """A failure inside the script raises WebDriverError naming the operation."""
+        self.mock_selenium.execute_script.return_value = {"error": "Element not found for selector: #missing", "index": 1}
+        with self.assertRaises(WebDriverError) as ctx:
+            self.driver.run_batch([{"op": "click", "selector": "#ok"}, {"op": "click", "selector": "#missing"}])
+        self.assertIn("#missing", str(ctx.exception))
+
+    def test_batch_falls_back_when_script_unavailable(self):
+        """If the batch script cannot run, operations are executed one by one."""
+        self.mock_selenium.execute_script.side_effect = JavascriptException("scripting disabled")
+        element = MagicMock()
+        element.text = "Hello"
+        self.mock_selenium.find_element.return_value = element
+        results = self.driver.run_batch([{"op": "click", "selector": "#a"}, {"op": "get_text", "selector": "#b"}])
+        self.assertEqual(results, [None, "Hello"])
+        element.click.assert_called_once()
+
+    def test_batch_validates_operations(self):
+        """Malformed operations are rejected with ValidationError before anything is sent."""
+        with self.assertRaises(ValidationError):
+            self.driver.run_batch([{"op": "hover", "selector": "#a"}])
+        with self.assertRaises(ValidationError):
+            self.driver.run_batch([{"op": "get_attribute", "selector": "#a"}])
+        self.mock_selenium.execute_script.assert_not_called()
+
+    def test_empty_batch(self):
+        """An empty batch does not touch the browser."""
+        self.assertEqual(self.driver.run_batch([]), [])
+        self.mock_selenium.execute_script.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Unit tests for the SeleniumWebDriver element cache."""
+
+import unittest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.infrastructure.webdrivers.selenium_driver import SeleniumWebDriver
+from src.infrastructure.webdrivers.base import BrowserType
+
+
+class TestSeleniumElementCache(unittest.TestCase):
+    """Test cases for selector-keyed element caching."""
+
+    @patch('src.infrastructure.webdrivers.selenium_driver.webdriver')
+    def setUp(self, mock_webdriver):
+        """Create a caching driver wrapping a mocked Selenium instance."""
+        self.mock_selenium = MagicMock()
+        mock_webdriver.Chrome.return_value = self.mock_selenium
+        self.driver = SeleniumWebDriver(browser_type=BrowserType.CHROME, cache_elements=True)
+
+    def test_repeated_interactions_reuse_element(self):
+        """Clicking and typing into the same selector only locates it once."""
+        self.driver.click_element("#name")
+        self.driver.type_text("#name", "abc")
+        self.driver.click_element("#name")
+        self.assertEqual(self.mock_selenium.find_element.call_count, 1)
+        stats = self.driver.get_element_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 1))
+
+    def test_navigation_invalidates_cache(self):
+        """get, back, forward, refresh and frame switches drop cached elements."""
+        for navigate in (lambda: self.driver.get("https://example.com"), self.driver.back, self.driver.forward,
+                         self.driver.refresh, lambda: self.driver.switch_to_frame(0), self.driver.switch_to_default_content):
+            self.driver.click_element("#name")
+            navigate()
+            self.assertEqual(self.driver.get_element_cache_stats()["size"], 0)
+        self.assertEqual(self.mock_selenium.find_element.call_count, 6)
+
+    def test_stale_element_is_relocated(self):
+        """A stale cached element is evicted and the operation retried with a fresh lookup."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.click.side_effect = StaleElementReferenceException("stale")
+        self.mock_selenium.find_element.side_effect = [stale, fresh]
+        self.driver.click_element("#row")
+        fresh.click.assert_called_once()
+        self.driver.click_element("#row")
+        self.assertEqual(fresh.click.call_count, 2)
+        self.assertEqual(self.mock_selenium.find_element.call_count, 2)
+        self.assertEqual(self.driver.get_element_cache_stats()["stale"], 1)
+
+    def test_find_element_always_relocates(self):
+        """find_element hands out a freshly located element and refreshes the cache with it."""
+        first, second = MagicMock(), MagicMock()
+        self.mock_selenium.find_element.side_effect = [first, second]
+        self.assertIs(self.driver.find_element("#row"), first)
+        self.assertIs(self.driver.find_element("#row"), second)
+        self.driver.click_element("#row")
+        second.click.assert_called_once()
+        self.assertEqual(self.mock_selenium.find_element.call_count, 2)
+
+    def test_cache_hits_make_no_extra_round_trips(self):
+        """Clicks on cached elements neither re-validate them nor read the current URL."""
+        element = MagicMock()
+        self.mock_selenium.find_element.return_value = element
+        self.driver.click_element("#toggle")
+        current_url = PropertyMock(return_value="https://example.com/form")
+        type(self.mock_selenium).current_url = current_url
+        for _ in range(3): self.driver.click_element("#toggle")
+        element.is_enabled.assert_not_called()
+        current_url.assert_not_called()
+
+    def test_stale_element_after_navigation_drops_cache(self):
+        """A stale element on a different URL drops every cached element, not just the stale one."""
+        self.mock_selenium.current_url = "https://example.com/form"
+        name, submit = MagicMock(), MagicMock()
+        self.mock_selenium.find_element.side_effect = [name, submit, MagicMock()]
+        self.driver.type_text("#name", "abc")
+        self.driver.click_element("#submit")
+        self.assertEqual(self.driver.get_element_cache_stats()["size"], 2)
+
+        self.mock_selenium.current_url = "https://example.com/done"
+        submit.click.side_effect = StaleElementReferenceException("stale")
+        self.driver.click_element("#submit")
+        stats = self.driver.get_element_cache_stats()
+        self.assertEqual((stats["stale"], stats["invalidations"], stats["size"]), (1, 1, 1))
+
+    @patch('src.infrastructure.webdrivers.selenium_driver.webdriver')
+    def test_cache_disabled_by_default(self, mock_webdriver):
+        """Without cache_elements every interaction locates the element again."""
+        mock_selenium = MagicMock()
+        mock_webdriver.Chrome.return_value = mock_selenium
+        driver = SeleniumWebDriver(browser_type=BrowserType.CHROME)
+        driver.click_element("#name")
+        driver.click_element("#name")
+        self.assertEqual(mock_selenium.find_element.call_count, 2)
+        self.assertEqual(driver.get_element_cache_stats()["hits"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Unit tests for the simulated WebDriver."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.exceptions import ConfigError, WebDriverError
+from src.infrastructure.webdrivers.factory import WebDriverFactory
+from src.infrastructure.webdrivers.simulated_driver import (
+    SimulatedWebDriver, SimulationProfile, LatencyDistribution, SIMULATION_PROFILES, load_fixtures
+)
+
+FIXTURES = {
+    "https://example.com/login": {
+        "title": "Login",
+        "elements": [
+            {"tag": "input", "id": "user", "classes": ["field"], "attributes": {"name": "user"}},
+            {"tag": "button", "id": "submit", "text": "Sign in", "navigates_to": "https://example.com/home"},
+            {"tag": "div", "classes": ["banner"], "appear_after_ms": 60_000},
+            {"tag": "a", "id": "help", "frame": "sidebar"},
+        ],
+        "frames": ["sidebar"],
+        "alert": "Accept cookies?",
+        "scripts": {"return document.readyState": "complete"},
+    },
+    "https://example.com/home": {"title": "Home", "elements": [{"tag": "h1", "text": "Welcome"}]},
+}
+
+
+class TestSimulatedWebDriver(unittest.TestCase):
+    """Test cases for SimulatedWebDriver with the zero-latency 'instant' profile."""
+
+    def setUp(self):
+        self.driver = SimulatedWebDriver(FIXTURES, seed=1)
+        self.driver.get("https://example.com/login")
+
+    def test_models_the_fixture_dom(self):
+        """Selectors match by tag, id, class and attribute; clicks follow navigation links."""
+        self.assertEqual(self.driver.get_title(), "Login")
+        self.assertTrue(self.driver.is_element_present("input#user.field"))
+        self.assertTrue(self.driver.is_element_present("form input[name='user']"))
+        self.assertFalse(self.driver.is_element_present("#missing"))
+        self.driver.type_text("#user", "ada")
+        self.assertEqual(self.driver.find_element("#user").get_attribute("value"), "ada")
+        self.assertEqual(self.driver.execute_script("return document.readyState"), "complete")
+        self.driver.click_element("#submit")
+        self.assertEqual(self.driver.get_current_url(), "https://example.com/home")
+        self.assertEqual(self.driver.find_element("h1").text, "Welcome")
+
+    def test_elements_go_stale_after_navigation(self):
+        """Elements located on a previous page raise a stale element error."""
+        element = self.driver.find_element("#user")
+        self.driver.get("https://example.com/home")
+        with self.assertRaisesRegex(WebDriverError, "stale element"):
+            element.click()
+
+    def test_frames_alerts_and_delayed_elements(self):
+        """Frame-scoped elements, alerts and elements that have not appeared yet."""
+        self.assertFalse(self.driver.is_element_present("#help"))
+        self.driver.switch_to_frame("sidebar")
+        self.assertTrue(self.driver.is_element_present("#help"))
+        self.driver.switch_to_default_content()
+        with self.assertRaises(WebDriverError):
+            self.driver.switch_to_frame("missing")
+
+        self.assertEqual(self.driver.get_alert_text(), "Accept cookies?")
+        self.driver.accept_alert()
+        with self.assertRaises(WebDriverError):
+            self.driver.get_alert_text()
+
+        self.assertFalse(self.driver.is_element_present(".banner"))
+        with patch("src.infrastructure.webdrivers.simulated_driver.time.sleep") as sleep:
+            with self.assertRaisesRegex(WebDriverError, "Timeout"):
+                self.driver.wait_for_element(".banner", timeout=1)
+            sleep.assert_called()
+
+    def test_batch_is_one_round_trip(self):
+        """A batch is charged one 'batch' operation and returns per-operation results."""
+        results = self.driver.run_batch([{"op": "type", "selector": "#user", "text": "x"},
+                                         {"op": "is_present", "selector": "#submit"}])
+        self.assertEqual(results, [None, True])
+        self.assertEqual(self.driver.get_stats()["operations"]["batch"], 1)
+
+    def test_screenshots_and_quit(self):
+        """Screenshots produce a PNG in memory or on disk; a quit driver refuses operations."""
+        self.assertTrue(self.driver.get_screenshot_bytes().startswith(b"\x89PNG"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shot.png")
+            self.driver.take_screenshot(path)
+            self.assertTrue(os.path.getsize(path) > 0)
+        self.driver.quit()
+        with self.assertRaises(WebDriverError):
+            self.driver.get_current_url()
+
+
+class TestSimulationProfile(unittest.TestCase):
+    """Test cases for latency distributions, injected failures and profile resolution."""
+
+    def test_latency_is_injected_and_scaled(self):
+        """Each operation sleeps for its sampled latency times the time scale."""
+        profile = SimulationProfile("test", latency={"navigate": 200, "find": {"distribution": "uniform", "low_ms": 10, "high_ms": 20}},
+                                    time_scale=0.5)
+        driver = SimulatedWebDriver(FIXTURES, profile=profile, seed=3)
+        with patch("src.infrastructure.webdrivers.simulated_driver.time.sleep") as sleep:
+            driver.get("https://example.com/login")
+            driver.find_element("#user")
+        self.assertAlmostEqual(sleep.call_args_list[0].args[0], 0.1)
+        self.assertTrue(0.005 <= sleep.call_args_list[1].args[0] <= 0.01)
+        self.assertAlmostEqual(driver.get_stats()["simulated_seconds"], sum(c.args[0] for c in sleep.call_args_list))
+
+    def test_failures_and_stale_elements_are_injected(self):
+        """Failure and stale element rates of 1 make every operation fail."""
+        driver = SimulatedWebDriver(FIXTURES, profile={"failure_rates": {"click": 1.0}}, seed=0)
+        driver.get("https://example.com/login")
+        with self.assertRaisesRegex(WebDriverError, "Simulated click failure"):
+            driver.click_element("#submit")
+        stale = SimulatedWebDriver(FIXTURES, profile={"stale_element_rate": 1.0}, seed=0)
+        stale.get("https://example.com/login")
+        with self.assertRaisesRegex(WebDriverError, "stale element"):
+            stale.click_element("#submit")
+        self.assertEqual(stale.get_stats()["stale"], 1)
+
+    def test_sampling_is_reproducible_with_a_seed(self):
+        """Two drivers with the same seed draw the same latencies."""
+        samples = []
+        for _ in range(2):
+            driver = SimulatedWebDriver(FIXTURES, profile=SimulationProfile("t", latency={"find": {"distribution": "lognormal", "median_ms": 5, "sigma": 1}}), seed=42)
+            with patch("src.infrastructure.webdrivers.simulated_driver.time.sleep") as sleep:
+                for _ in range(5): driver.find_elements("input")
+            samples.append([c.args[0] for c in sleep.call_args_list])
+        self.assertEqual(samples[0], samples[1])
+
+    def test_invalid_configuration(self):
+        """Unknown operations, bad rates and unknown distributions are rejected."""
+        with self.assertRaises(ConfigError): SimulationProfile("bad", latency={"teleport": 1})
+        with self.assertRaises(ConfigError): SimulationProfile("bad", failure_rates={"click": 2})
+        with self.assertRaises(ConfigError): LatencyDistribution("zipf", ms=1)
+        with self.assertRaises(ConfigError): SimulationProfile.resolve("warp_speed")
+        self.assertIs(SimulationProfile.resolve("flaky"), SIMULATION_PROFILES["flaky"])
+
+    def test_fixture_file_and_factory(self):
+        """Fixtures load from JSON files and the factory creates simulated drivers."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "site.json")
+            with open(path, "w", encoding="utf-8") as f: f.write('{"https://a.test/": {"title": "A"}}')
+            self.assertEqual(load_fixtures(path), {"https://a.test/": {"title": "A"}})
+            driver = WebDriverFactory.create_driver(driver_type="simulated",
+                                                    simulation_options={"fixtures": path, "start_url": "https://a.test/"})
+        self.assertIsInstance(driver, SimulatedWebDriver)
+        self.assertEqual(driver.get_title(), "A")
+
+
+if __name__ == '__main__':
+    unittest.main()
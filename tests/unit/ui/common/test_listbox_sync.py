@@ -0,0 +1,58 @@
+"""Unit tests for incremental listbox updates."""
+
+import unittest
+
+from src.ui.common.listbox_sync import sync_listbox
+
+
+class FakeListbox:
+    """List-backed stand-in for tk.Listbox that counts calls."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.calls = 0
+
+    def delete(self, first, last=None):
+        self.calls += 1
+        del self.rows[first:(first if last is None else last) + 1]
+
+    def insert(self, index, *items):
+        self.calls += 1
+        self.rows[index:index] = items
+
+
+class TestSyncListbox(unittest.TestCase):
+    """Test cases for sync_listbox."""
+
+    def _sync(self, shown, items):
+        listbox = FakeListbox(shown)
+        mirror = list(shown)
+        result = sync_listbox(listbox, mirror, items)
+        self.assertEqual(listbox.rows, list(items))
+        self.assertEqual(mirror, list(items))
+        return result, listbox.calls
+
+    def test_full_load_is_one_insert(self):
+        """Loading a list into an empty listbox inserts every row with a single call."""
+        rows = [f"Action {n}" for n in range(5000)]
+        self.assertEqual(self._sync([], rows), ((0, 0, 5000), 1))
+
+    def test_only_changed_rows_are_touched(self):
+        """Edits, inserts, deletes and moves replace only the rows between the common prefix and suffix."""
+        rows = [f"Action {n}" for n in range(5000)]
+        edited = rows[:2500] + ["Edited"] + rows[2501:]
+        self.assertEqual(self._sync(rows, edited), ((2500, 1, 1), 2))
+        self.assertEqual(self._sync(rows, rows[:10] + ["New"] + rows[10:]), ((10, 0, 1), 1))
+        self.assertEqual(self._sync(rows, rows[:10] + rows[11:]), ((10, 1, 0), 1))
+        moved = rows[:99] + [rows[100], rows[99]] + rows[101:]
+        self.assertEqual(self._sync(rows, moved), ((99, 2, 2), 2))
+        self.assertEqual(self._sync(rows, rows), ((5000, 0, 0), 0))
+
+    def test_repeated_rows(self):
+        """Duplicate rows at the edges don't confuse the prefix and suffix match."""
+        self.assertEqual(self._sync(["a", "a"], ["a", "a", "a"])[0], (2, 0, 1))
+        self.assertEqual(self._sync(["a", "b", "a"], ["a"])[0], (1, 2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
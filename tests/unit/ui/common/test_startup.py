@@ -0,0 +1,94 @@
+"""Unit tests for the staged startup helpers."""
+
+import time
+import threading
+import unittest
+
+from src.ui.common.startup import BackgroundLoader, StartupTimer
+
+
+class FakeRoot:
+    """Stand-in for a Tk root: after() callbacks are run by pump() on the test thread."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def pump(self, timeout=5.0):
+        deadline = time.time() + timeout
+        while self.callbacks and time.time() < deadline:
+            self.callbacks.pop(0)()
+            time.sleep(0.005)
+
+
+class TestStartupTimer(unittest.TestCase):
+    """Test cases for StartupTimer."""
+
+    def test_stages_and_marks(self):
+        """Stages record their duration, marks the time since start; both appear in the report."""
+        timer = StartupTimer()
+        with timer.stage("views"):
+            time.sleep(0.02)
+        with self.assertRaises(RuntimeError):
+            with timer.stage("menu"):
+                raise RuntimeError("boom")
+        timer.mark("window shown")
+        summary = timer.summary()
+        self.assertEqual(list(summary["stages_ms"]), ["views", "menu"])
+        self.assertGreaterEqual(summary["stages_ms"]["views"], 20)
+        self.assertGreaterEqual(summary["marks_ms"]["window shown"], summary["stages_ms"]["views"])
+        self.assertIn("@ window shown", timer.report())
+
+
+class TestBackgroundLoader(unittest.TestCase):
+    """Test cases for BackgroundLoader."""
+
+    def test_fetch_in_background_and_apply_on_the_calling_thread(self):
+        """Fetches run on the worker; results, progress and completion are delivered via after()."""
+        root = FakeRoot()
+        main_thread = threading.current_thread()
+        fetched_on, applied_on, applied, progress, done = [], [], [], [], []
+
+        def fetch(value):
+            def run():
+                fetched_on.append(threading.current_thread())
+                return value
+            return run
+
+        def apply(value):
+            applied_on.append(threading.current_thread())
+            applied.append(value)
+
+        timer = StartupTimer()
+        loader = BackgroundLoader(root, [("workflows", fetch(["a", "b"]), apply), ("credentials", fetch(["c"]), apply)],
+                                  on_progress=lambda label, n, total: progress.append((label, n, total)),
+                                  on_done=lambda: done.append(True), timer=timer).start()
+        root.pump()
+        self.assertTrue(loader.done)
+        self.assertEqual(applied, [["a", "b"], ["c"]])
+        self.assertEqual(progress, [("workflows", 1, 2), ("credentials", 2, 2)])
+        self.assertEqual(done, [True])
+        self.assertNotIn(main_thread, fetched_on)
+        self.assertEqual(applied_on, [main_thread, main_thread])
+        self.assertEqual(list(timer.summary()["stages_ms"]), ["load: workflows", "load: credentials"])
+
+    def test_failed_step_does_not_block_the_others(self):
+        """A fetch that raises is recorded and skipped; later steps still load."""
+        root = FakeRoot()
+        applied = []
+
+        def broken():
+            raise OSError("disk gone")
+
+        loader = BackgroundLoader(root, [("workflows", broken, applied.append),
+                                         ("credentials", lambda: ["c"], applied.append)]).start()
+        root.pump()
+        self.assertTrue(loader.done)
+        self.assertEqual(applied, [["c"]])
+        self.assertEqual([label for label, _ in loader.errors], ["workflows"])
+
+
+if __name__ == "__main__":
+    unittest.main()
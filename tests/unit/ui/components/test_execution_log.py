@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ExecutionLog component in src/ui/components/execution_log.py.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+import tkinter as tk
+from tkinter import ttk
+
+from src.ui.components.execution_log import ExecutionLog, LogLineBuffer
+
+
+class FakeText:
+    """Minimal stand-in for tk.Text that keeps (line, tag) pairs, so no display is needed."""
+
+    def __init__(self, *args, **kwargs):
+        self.lines = []
+        self.insert_calls = 0
+        self.state = kwargs.get("state")
+        self.scrolled_to_bottom = True
+
+    def insert(self, index, *args):
+        self.insert_calls += 1
+        new = [(line, tag) for text, tag in zip(args[::2], args[1::2]) for line in text.splitlines()]
+        self.lines = self.lines + new if index == tk.END else new + self.lines
+
+    def delete(self, start, end=None):
+        if end == tk.END: self.lines = []
+        else: self.lines = self.lines[int(str(end).split(".")[0]) - 1:]
+
+    def config(self, **kwargs):
+        self.state = kwargs.get("state", self.state)
+
+    def yview(self, *args):
+        return (0.0, 1.0 if self.scrolled_to_bottom else 0.5)
+
+    def see(self, index):
+        self.scrolled_to_bottom = index == tk.END
+
+    def __getattr__(self, name):
+        return MagicMock()
+
+
+class TestLogLineBuffer(unittest.TestCase):
+    """Test cases for LogLineBuffer."""
+
+    def test_drain_moves_lines_into_bounded_history(self):
+        """Drained lines are returned once and kept in a history capped at its limit."""
+        buffer = LogLineBuffer(history_limit=3)
+        for n in range(5): buffer.append(f"line {n}", "INFO")
+        self.assertEqual(buffer.pending, 5)
+        self.assertEqual(len(buffer.drain()), 5)
+        self.assertEqual(buffer.drain(), [])
+        self.assertEqual([message for message, _ in buffer.history], ["line 2", "line 3", "line 4"])
+
+    def test_older_lines(self):
+        """older() pages backwards from the lines already shown."""
+        buffer = LogLineBuffer()
+        for n in range(10): buffer.append(str(n), "INFO")
+        buffer.drain()
+        self.assertEqual([m for m, _ in buffer.older(3, shown=4)], ["3", "4", "5"])
+        self.assertEqual([m for m, _ in buffer.older(5, shown=8)], ["0", "1"])
+        self.assertEqual(buffer.older(5, shown=10), [])
+
+    def test_append_from_many_threads(self):
+        """Lines appended concurrently are all drained."""
+        buffer = LogLineBuffer()
+        threads = [threading.Thread(target=lambda: [buffer.append("x") for _ in range(1000)]) for _ in range(4)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(len(buffer.drain()), 4000)
+
+
+class TestExecutionLog(unittest.TestCase):
+    """Test cases for ExecutionLog batching, trimming and older-line loading."""
+
+    def setUp(self):
+        """Replace the Tk widgets with fakes."""
+        patchers = [patch.object(tk, "Text", FakeText)]
+        patchers += [patch.object(ttk, name, MagicMock()) for name in ("Frame", "Label", "Scrollbar", "Button")]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.log = ExecutionLog(MagicMock(), max_lines=5, page_lines=3)
+
+    def _shown(self):
+        return [line for line, _ in self.log.text.lines]
+
+    def test_log_is_queued_until_flushed(self):
+        """log() only queues; the pump inserts everything pending with one insert call."""
+        for n in range(4): self.log.log(f"line {n}", "WARNING" if n == 2 else "INFO")
+        self.assertEqual(self.log.text.lines, [])
+        self.log.flush()
+        self.assertEqual(self.log.text.insert_calls, 1)
+        self.assertEqual(self.log.text.lines[2], ("line 2", "WARNING"))
+        self.assertEqual(self.log.text.state, tk.DISABLED)
+        self.log.frame.after.assert_called_with(50, self.log._pump)
+
+    def test_widget_keeps_newest_lines_and_shows_older_on_demand(self):
+        """Only max_lines stay in the widget; older ones come back a page at a time."""
+        for n in range(12): self.log.log(str(n))
+        self.log.flush()
+        self.assertEqual(self._shown(), ["7", "8", "9", "10", "11"])
+        self.log.show_older()
+        self.assertEqual(self._shown(), [str(n) for n in range(4, 12)])
+        self.log.log("12")
+        self.log.flush()
+        self.assertEqual(self._shown(), [str(n) for n in range(5, 13)])
+        self.assertEqual(self.log.get_log_text().split(), [str(n) for n in range(13)])
+
+    def test_multi_line_messages_are_trimmed_and_paged_whole(self):
+        """Trimming and "Show Older" count text lines, removing and restoring whole messages."""
+        for n in range(4): self.log.log(f"{n}a\n{n}b")
+        self.log.flush()
+        self.assertEqual(self._shown(), ["2a", "2b", "3a", "3b"])
+        self.log.log("4a\n4b\n4c")
+        self.log.flush()
+        self.assertEqual(self._shown(), ["3a", "3b", "4a", "4b", "4c"])
+        self.log.show_older()
+        self.assertEqual(self._shown(), ["2a", "2b", "3a", "3b", "4a", "4b", "4c"])
+        self.log.show_older()
+        self.assertEqual(self._shown()[:2], ["1a", "1b"])
+        self.log.log("5")
+        self.log.flush()
+        self.assertEqual(self._shown(), ["2a", "2b", "3a", "3b", "4a", "4b", "4c", "5"])
+
+    def test_scrolling_back_to_bottom_restores_max_lines(self):
+        """Older lines stay while the user reads them; the first flush at the bottom trims back to max_lines."""
+        for n in range(12): self.log.log(str(n))
+        self.log.flush()
+        self.log.show_older()
+        self.log.show_older()
+        self.assertEqual(len(self._shown()), 11)
+        self.log.text.scrolled_to_bottom = True
+        self.log.log("12")
+        self.log.flush()
+        self.assertEqual(self._shown(), ["8", "9", "10", "11", "12"])
+
+    def test_older_lines_are_capped(self):
+        """"Show Older" stops adding lines once max_older_lines are shown beyond max_lines."""
+        log = ExecutionLog(MagicMock(), max_lines=5, page_lines=3, max_older_lines=4)
+        for n in range(20): log.log(str(n))
+        log.flush()
+        for _ in range(3): log.show_older()
+        self.assertEqual([line for line, _ in log.text.lines], [str(n) for n in range(11, 20)])
+        log.older_button.config.assert_called_with(state=tk.DISABLED)
+
+    def test_clear(self):
+        """clear() empties the widget, the queue and the history."""
+        for n in range(8): self.log.log(str(n))
+        self.log.flush()
+        self.log.log("queued")
+        self.log.clear()
+        self.log.flush()
+        self.assertEqual(self._shown(), [])
+        self.assertEqual(self.log.get_log_text().strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for queueing manual runs in the enhanced workflow runner presenter."""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.core.workflow.run_queue import PRIORITY_INTERACTIVE
+from src.infrastructure.common.metrics import MetricsRegistry
+from src.ui.presenters.workflow_runner_presenter_enhanced import WorkflowRunnerPresenterEnhanced
+
+
+class ConcretePresenter(WorkflowRunnerPresenterEnhanced):
+    """Fills in the interface methods the enhanced presenter does not implement."""
+
+    def on_run_workflow(self, *args, **kwargs): pass
+    def on_stop_workflow(self): pass
+    def update_execution_status(self, *args, **kwargs): pass
+
+
+class TestWorkflowRunnerPresenterEnhancedQueue(unittest.TestCase):
+    """Test cases for routing manual runs through a RunQueue."""
+
+    def setUp(self):
+        """Create a presenter with a mocked queue and repositories."""
+        self.workflow_repo = MagicMock()
+        self.workflow_repo.load.return_value = []
+        self.run_queue = MagicMock()
+        self.presenter = ConcretePresenter(self.workflow_repo, MagicMock(), MagicMock(),
+                                           view=MagicMock(), run_queue=self.run_queue)
+
+    def test_manual_run_is_queued_at_interactive_priority(self):
+        """run_workflow submits to the queue instead of starting a thread, reusing the loaded actions."""
+        self.presenter.run_workflow("Login", "alice")
+        self.assertIsNone(self.presenter._execution_thread)
+        args, kwargs = self.run_queue.submit.call_args
+        self.assertEqual(args[0], "Login")
+        self.assertEqual((kwargs["priority"], kwargs["tenant"], kwargs["source"]), (PRIORITY_INTERACTIVE, "alice", "manual"))
+        args[1]()
+        self.workflow_repo.load.assert_called_once_with("Login")
+        self.presenter.webdriver_factory.create_driver.assert_called_once()
+
+    def test_stop_cancels_a_run_that_has_not_started(self):
+        """Stopping a still-queued run removes it from the queue without setting the stop flag."""
+        self.presenter.run_workflow("Login", None)
+        self.run_queue.cancel.return_value = True
+        self.presenter.stop_workflow()
+        self.run_queue.cancel.assert_called_once_with(self.run_queue.submit.return_value)
+        self.assertFalse(self.presenter._stop_event.is_set())
+
+    def test_busy_while_queued(self):
+        """A second run is refused while the first is still queued."""
+        self.run_queue.submit.return_value.future.done.return_value = False
+        self.presenter.run_workflow("Login", None)
+        self.presenter.run_workflow("Login", None)
+        self.assertEqual(self.run_queue.submit.call_count, 1)
+
+
+
+class TestWorkflowRunnerPresenterEnhancedRunOptions(unittest.TestCase):
+    """Test cases for running workflows through a WorkflowRunner configured from run options."""
+
+    def setUp(self):
+        """Create a presenter whose runner is mocked."""
+        self.workflow_repo = MagicMock()
+        self.workflow_repo.load.return_value = []
+        self.workflow_repo.get_metadata.return_value = {"name": "Login", "script_typing": True, "load_profile": "minimal",
+                                                        "trace": True, "profile": True}
+        self.registry = MetricsRegistry()
+        self.presenter = ConcretePresenter(self.workflow_repo, MagicMock(), MagicMock(), view=MagicMock(),
+                                           run_options={"batch_operations": True}, metrics=self.registry,
+                                           screenshot_writer=MagicMock(), reporting_service=MagicMock())
+        patcher = patch('src.ui.presenters.workflow_runner_presenter_enhanced.WorkflowRunner')
+        self.runner_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner_class.return_value.run.return_value = {"final_status": "SUCCESS",
+                                                           "action_results": [{"status": "success", "message": "ok"}]}
+
+    def test_options_come_from_config_and_workflow_metadata(self):
+        """The presenter's run options apply to every run; workflow metadata adds to or overrides them."""
+        self.presenter._execute_workflow("Login", None)
+        kwargs = self.runner_class.call_args[1]
+        self.assertEqual((kwargs["batch_operations"], kwargs["script_typing"]), (True, True))
+        self.assertIs(kwargs["stop_event"], self.presenter._stop_event)
+        self.assertIs(kwargs["screenshot_writer"], self.presenter.screenshot_writer)
+        self.assertTrue(kwargs["trace"] and kwargs["profile"])
+        self.runner_class.return_value.run.assert_called_once_with([], workflow_name="Login")
+        self.presenter.reporting_service.save_execution_log.assert_called_once_with(self.runner_class.return_value.run.return_value)
+        self.assertEqual(self.presenter.webdriver_factory.create_driver.call_args[1]["load_profile"], "minimal")
+        self.presenter.webdriver_factory.create_driver.return_value.quit.assert_called_once()
+
+    def test_runs_launches_and_repository_calls_are_recorded(self):
+        """Manual runs record run, action, driver and repository metrics; failed launches count as errors."""
+        self.presenter._execute_workflow("Login", None)
+        self.presenter.webdriver_factory.create_driver.side_effect = RuntimeError("no browser")
+        self.presenter._execute_workflow("Login", None)
+        text = self.registry.render()
+        self.assertIn('autoqliq_workflow_runs_total{source="manual",status="SUCCESS"} 1\n', text)
+        self.assertIn('autoqliq_workflow_runs_total{source="manual",status="ERROR"} 1\n', text)
+        self.assertIn('autoqliq_actions_total{status="success"} 1\n', text)
+        self.assertIn('autoqliq_driver_launches_total{result="failure"} 1\n', text)
+        self.assertIn('autoqliq_workflow_runs_in_progress{source="manual"} 0\n', text)
+        self.assertIn("autoqliq_drivers_active 0\n", text)
+        self.assertIn('autoqliq_repository_operation_duration_seconds_count{repository="workflow",operation="load"} 2\n', text)
+
+
+if __name__ == '__main__':
+    unittest.main()